@@ -0,0 +1,87 @@
+'''
+Measure the speedup from sending a batch of commands at once.
+
+``DOM.describeNode`` is run for many nodes against a fake browser (see
+``cdp.connection.FakeBrowser``) that delays each response to imitate the
+round trip time to a real browser. The commands are run in three ways:
+
+* ``execute``: one at a time, awaiting each response before sending the next
+  command.
+* ``gather``: ``Connection.execute()`` for every command with
+  ``asyncio.gather()``.
+* ``execute_many``: ``Connection.execute_many()``, which sends all of the
+  commands back to back.
+
+Usage::
+
+    $ python benchmarks/bench_batch.py [--nodes N] [--rtt MS]
+'''
+import argparse
+import asyncio
+import time
+
+from cdp import dom
+from cdp.connection import Connection, FakeBrowser
+
+
+def describe_node(params):
+    return {'node': {'nodeId': params['nodeId'], 'backendNodeId':
+        params['nodeId'] + 1000, 'nodeType': 1, 'nodeName': 'DIV',
+        'localName': 'div', 'nodeValue': '', 'childNodeCount': 0,
+        'attributes': ['class', 'item']}}
+
+
+def commands(nodes):
+    return [dom.describe_node(node_id=dom.NodeId(i)) for i in range(nodes)]
+
+
+async def sequential(conn, nodes):
+    return [await conn.execute(cmd) for cmd in commands(nodes)]
+
+
+async def gather(conn, nodes):
+    return await asyncio.gather(*(conn.execute(cmd)
+        for cmd in commands(nodes)))
+
+
+async def batch(conn, nodes):
+    return await conn.execute_many(commands(nodes))
+
+
+async def measure(case, nodes, rtt):
+    fake = FakeBrowser(latency=rtt)
+    fake.handle('DOM.describeNode', describe_node)
+    async with Connection(fake.connect()) as conn:
+        start = time.perf_counter()
+        results = await case(conn, nodes)
+        elapsed = time.perf_counter() - start
+    await fake.close()
+    assert len(results) == nodes
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=1000,
+        help='number of nodes to describe')
+    parser.add_argument('--rtt', type=float, default=2,
+        help='round trip time of the fake browser in milliseconds')
+    args = parser.parse_args()
+
+    cases = {
+        'execute': sequential,
+        'gather': gather,
+        'execute_many': batch,
+    }
+    print('{} commands, {}ms round trip'.format(args.nodes, args.rtt))
+    baseline = None
+    for name, case in cases.items():
+        elapsed = asyncio.run(measure(case, args.nodes, args.rtt / 1000))
+        if baseline is None:
+            baseline = elapsed
+        print('{:<14} {:>9.1f}ms {:>7.1f}x'.format(name, elapsed * 1000,
+            baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+'''
+Compare the installed JSON codecs on a corpus of CDP messages.
+
+For each codec, this measures decoding every frame of a synthetic page load
+(see ``corpus.py``), encoding every message, and decoding plus parsing every
+frame with ``parse_message()``.
+
+Usage::
+
+    $ python benchmarks/bench_codec.py [--requests N] [--repeat N]
+'''
+import argparse
+import timeit
+
+from cdp.codec import available_codecs, get_codec, parse_message
+
+import corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500,
+        help='number of resources in the synthetic page load')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    frames = corpus.page_load_frames(args.requests)
+    messages = corpus.page_load_messages(args.requests)
+    size = sum(len(frame) for frame in frames)
+    print('{} messages, {:.1f} MB'.format(len(frames), size / 1e6))
+    print('{:<8} {:>12} {:>12} {:>15}'.format('codec', 'loads MB/s',
+        'dumps MB/s', 'parse msg/s'))
+
+    def best(func):
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    for name in available_codecs():
+        codec = get_codec(name)
+        loads = best(lambda: [codec.loads(f) for f in frames])
+        dumps = best(lambda: [codec.dumps(m) for m in messages])
+        parse = best(lambda: [parse_message(f, codec) for f in frames])
+        print('{:<8} {:>12.1f} {:>12.1f} {:>15.0f}'.format(name,
+            size / loads / 1e6, size / dumps / 1e6, len(frames) / parse))
+
+
+if __name__ == '__main__':
+    main()
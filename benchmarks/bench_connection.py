@@ -0,0 +1,101 @@
+'''
+Measure the latency and throughput of commands on a connection.
+
+Commands are sent to a fake browser (see ``cdp.connection.FakeBrowser``) over
+an in-memory transport and over a socket with NUL framing, the same framing
+Chrome uses with ``--remote-debugging-pipe``. Both the client and the fake
+browser run in this process, so the numbers include the cost of both ends.
+
+* Latency: commands are sent one at a time, and each one waits for its
+  response before the next one is sent.
+* Throughput: ``--concurrency`` commands are in flight at once.
+
+Usage::
+
+    $ python benchmarks/bench_connection.py [--commands N] [--concurrency N]
+'''
+import argparse
+import asyncio
+import socket
+import time
+
+from cdp import browser
+from cdp.connection import Connection, FakeBrowser, StreamTransport
+
+
+VERSION = {
+    'protocolVersion': '1.3',
+    'product': 'HeadlessChrome/80.0.3987.0',
+    'revision': '@e2b4a8f2',
+    'userAgent': 'Mozilla/5.0',
+    'jsVersion': '8.0.426.1',
+}
+
+
+async def memory_transport(fake):
+    return fake.connect()
+
+
+async def stream_transport(fake):
+    client_sock, server_sock = socket.socketpair()
+    reader, writer = await asyncio.open_connection(sock=client_sock)
+    client = StreamTransport(reader, writer)
+    reader, writer = await asyncio.open_connection(sock=server_sock)
+    fake.serve(StreamTransport(reader, writer))
+    return client
+
+
+async def latency(conn, commands):
+    ''' Return the mean time per command when they are run one at a time. '''
+    start = time.perf_counter()
+    for _ in range(commands):
+        await conn.execute(browser.get_version())
+    return (time.perf_counter() - start) / commands
+
+
+async def throughput(conn, commands, concurrency):
+    ''' Return the number of commands per second with many in flight. '''
+    async def worker(count):
+        for _ in range(count):
+            await conn.execute(browser.get_version())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(commands // concurrency)
+        for _ in range(concurrency)))
+    return commands // concurrency * concurrency / (time.perf_counter() -
+        start)
+
+
+async def measure(make_transport, args):
+    fake = FakeBrowser()
+    fake.handle('Browser.getVersion', lambda params: VERSION)
+    async with Connection(await make_transport(fake)) as conn:
+        # Warm up.
+        await latency(conn, 100)
+        mean = await latency(conn, args.commands)
+        rate = await throughput(conn, args.commands, args.concurrency)
+    await fake.close()
+    return mean, rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--commands', type=int, default=10000,
+        help='number of commands to send for each measurement')
+    parser.add_argument('--concurrency', type=int, default=1000,
+        help='number of commands in flight for the throughput measurement')
+    args = parser.parse_args()
+
+    transports = {
+        'memory': memory_transport,
+        'stream': stream_transport,
+    }
+    print('{:<10} {:>12} {:>14}'.format('transport', 'latency',
+        'throughput'))
+    for name, make_transport in transports.items():
+        mean, rate = asyncio.run(measure(make_transport, args))
+        print('{:<10} {:>10.1f}us {:>10.0f}cmd/s'.format(name, mean * 1e6,
+            rate))
+
+
+if __name__ == '__main__':
+    main()
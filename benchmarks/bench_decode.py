@@ -0,0 +1,65 @@
+'''
+Measure how long it takes to decode some of the highest volume CDP events.
+
+Each event is decoded from a synthetic payload that fills in every field (see
+``cdp.synthetic``). To compare the default decoders with the strict ones, run
+this script, regenerate the modules with ``generator/generate.py --strict``,
+and run it again.
+
+Usage::
+
+    $ python benchmarks/bench_decode.py [--repeat N]
+'''
+import argparse
+import timeit
+
+from cdp import util
+from cdp.synthetic import PayloadFactory
+
+
+HIGH_VOLUME_EVENTS = [
+    'Network.requestWillBeSent',
+    'Network.requestWillBeSentExtraInfo',
+    'Network.responseReceived',
+    'Network.responseReceivedExtraInfo',
+    'Network.dataReceived',
+    'Network.loadingFinished',
+    'Network.loadingFailed',
+    'Network.requestServedFromCache',
+    'Network.webSocketFrameReceived',
+    'Page.frameNavigated',
+    'Page.lifecycleEvent',
+    'Page.screencastFrame',
+    'Runtime.consoleAPICalled',
+    'Runtime.executionContextCreated',
+    'Debugger.scriptParsed',
+    'Debugger.paused',
+    'DOM.setChildNodes',
+    'DOM.childNodeInserted',
+    'DOM.attributeModified',
+    'Log.entryAdded',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    factory = PayloadFactory()
+    total = 0.0
+    print('{:<38} {:>10}'.format('event', 'µs/decode'))
+    for method in HIGH_VOLUME_EVENTS:
+        from_json = util.get_event_class(method).from_json
+        params = factory.event_payload(method)
+        timer = timeit.Timer(lambda: from_json(params))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(number=number, repeat=args.repeat)) / number
+        total += best
+        print('{:<38} {:>10.2f}'.format(method, best * 1e6))
+    print('{:<38} {:>10.2f}'.format('total', total * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+'''
+Measure the cost of handling inbound events when a consumer only cares about
+some of them.
+
+A synthetic page load (see ``corpus.py``) is parsed in three ways:
+
+* ``parse_json_event`` decodes every event.
+* ``EventFilter`` decodes only the subscribed events.
+* ``EventDispatcher`` calls a handler for the subscribed events.
+
+Usage::
+
+    $ python benchmarks/bench_dispatch.py [--requests N] [--repeat N]
+'''
+import argparse
+import timeit
+
+from cdp import util
+from cdp.dispatch import EventDispatcher, EventFilter
+
+import corpus
+
+
+SUBSCRIBED = {'Network.loadingFinished', 'Page.lifecycleEvent'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500,
+        help='number of resources in the synthetic page load')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    messages = corpus.page_load_messages(args.requests)
+    events = EventFilter(SUBSCRIBED)
+    dispatcher = EventDispatcher()
+    for method in SUBSCRIBED:
+        dispatcher.register(method, lambda event: None)
+
+    cases = {
+        'parse_json_event': lambda: [util.parse_json_event(m)
+            for m in messages],
+        'EventFilter': lambda: [events.parse(m) for m in messages],
+        'EventDispatcher': lambda: [dispatcher.dispatch(m) for m in messages],
+    }
+    print('{} messages, subscribed to {}'.format(len(messages),
+        ', '.join(sorted(SUBSCRIBED))))
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print('{:<18} {:8.2f} ms  {:10.0f} msg/s'.format(name, best * 1000,
+            len(messages) / best))
+
+
+if __name__ == '__main__':
+    main()
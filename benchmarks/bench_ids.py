@@ -0,0 +1,112 @@
+'''
+Measure the cost of decoding identifiers in ID heavy workloads.
+
+By default, identifier types such as ``Network.RequestId`` and ``DOM.NodeId``
+are generated as subclasses of ``str`` and ``int``, so each ID in an event is
+copied into a wrapper object. With ``generator/generate.py --newtype-ids`` they
+are generated as ``typing.NewType`` aliases and the decoded JSON values are
+used as is. This script decodes two workloads and reports the time and the
+memory held by the decoded events:
+
+* a synthetic page load (see ``corpus.py``), which has a request ID, frame ID
+  and loader ID in most events.
+* ``DOM.setChildNodes`` events for a large DOM tree, which have a node ID,
+  backend node ID and parent ID for every node.
+
+To compare the two kinds of ID, run this script, regenerate the modules with
+``--newtype-ids``, and run it again.
+
+Usage::
+
+    $ python benchmarks/bench_ids.py [--requests N] [--nodes N] [--repeat N]
+'''
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from cdp import network, util
+
+import corpus
+
+
+def dom_messages(nodes, children=10):
+    '''
+    Return ``DOM.setChildNodes`` messages for a tree of ``nodes`` elements.
+
+    Each message sets the children of one parent node, like the messages that
+    Chrome sends after ``DOM.requestChildNodes``.
+    '''
+    messages = list()
+    node_id = 2
+    parent_id = 1
+    while node_id < nodes:
+        child_nodes = list()
+        for _ in range(min(children, nodes - node_id)):
+            child_nodes.append({
+                'nodeId': node_id,
+                'parentId': parent_id,
+                'backendNodeId': node_id + 1000,
+                'nodeType': 1,
+                'nodeName': 'DIV',
+                'localName': 'div',
+                'nodeValue': '',
+                'childNodeCount': children,
+                'attributes': ['class', 'item'],
+            })
+            node_id += 1
+        message = {'method': 'DOM.setChildNodes', 'params': {
+            'parentId': parent_id, 'nodes': child_nodes}}
+        # Encode and decode the message so that it owns its own values, just
+        # like a message from the browser.
+        messages.append(json.loads(json.dumps(message)))
+        parent_id += 1
+    return messages
+
+
+def decode(messages):
+    return [util.parse_json_event(message) for message in messages]
+
+
+def retained_bytes(messages):
+    ''' Return the memory allocated for the decoded events. '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = decode(messages)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500,
+        help='number of resources in the synthetic page load')
+    parser.add_argument('--nodes', type=int, default=20000,
+        help='number of nodes in the synthetic DOM tree')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    if isinstance(network.RequestId, type):
+        kind = 'subclasses of str and int'
+    else:
+        kind = 'typing.NewType'
+    print('Identifier types are generated as', kind)
+    workloads = {
+        'page load': corpus.page_load_messages(args.requests),
+        'DOM tree': dom_messages(args.nodes),
+    }
+    print('{:<10} {:>9} {:>10} {:>12}'.format('workload', 'messages', 'time',
+        'memory'))
+    for name, messages in workloads.items():
+        best = min(timeit.repeat(lambda: decode(messages), number=1,
+            repeat=args.repeat))
+        memory = retained_bytes(messages)
+        print('{:<10} {:>9} {:>8.2f}ms {:>10.0f}KB'.format(name,
+            len(messages), best * 1000, memory / 1024))
+
+
+if __name__ == '__main__':
+    main()
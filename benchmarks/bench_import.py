@@ -0,0 +1,59 @@
+'''
+Compare the cold start time of importing the ``cdp`` package.
+
+Each measurement runs in a fresh interpreter, so nothing is cached in
+``sys.modules``. The "eager" case imports every domain module up front, which
+is what ``import cdp`` used to do, while the "lazy" case imports the package
+and then touches a handful of commonly used domains.
+
+Usage::
+
+    $ python benchmarks/bench_import.py [--runs N]
+'''
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES = {
+    'eager': 'import cdp; cdp.import_all()',
+    'lazy': 'import cdp',
+    'lazy (5 domains)': 'import cdp; cdp.network; cdp.page; cdp.runtime; '
+        'cdp.target; cdp.dom',
+}
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(code, runs):
+    ''' Return a list of import times in seconds for ``code``. '''
+    times = list()
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-c', TIMER.format(code)],
+            cwd=ROOT, check=True, stdout=subprocess.PIPE)
+        times.append(float(proc.stdout))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--runs', type=int, default=20,
+        help='number of interpreters to start for each case')
+    args = parser.parse_args()
+    for name, code in CASES.items():
+        times = measure(code, args.runs)
+        print('{:<18} median {:7.2f} ms   min {:7.2f} ms'.format(name,
+            statistics.median(times) * 1000, min(times) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Measure the memory saved by interning repeated values in decoded events.
+
+A synthetic page load (see ``corpus.py``) is decoded with and without
+:func:`cdp.interning.enable_interning`, and the memory held by the decoded
+events is reported along with the time it took to decode them.
+
+Usage::
+
+    $ python benchmarks/bench_interning.py [--requests N] [--repeat N]
+'''
+import argparse
+import timeit
+import tracemalloc
+
+from cdp import interning, util
+
+import corpus
+
+
+def decode(messages):
+    return [util.parse_json_event(message) for message in messages]
+
+
+def retained_bytes(messages):
+    ''' Return the memory allocated for the decoded events. '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = decode(messages)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return after - before
+
+
+def measure(messages, repeat):
+    best = min(timeit.repeat(lambda: decode(messages), number=1,
+        repeat=repeat))
+    return best, retained_bytes(messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500,
+        help='number of resources in the synthetic page load')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    messages = corpus.page_load_messages(args.requests)
+    plain_time, plain_memory = measure(messages, args.repeat)
+    interner = interning.enable_interning()
+    try:
+        interned_time, interned_memory = measure(messages, args.repeat)
+    finally:
+        interning.disable_interning()
+
+    print('{} messages'.format(len(messages)))
+    print('{:<12} {:>10} {:>12}'.format('', 'time', 'memory'))
+    print('{:<12} {:>8.2f}ms {:>10.0f}KB'.format('plain', plain_time * 1000,
+        plain_memory / 1024))
+    print('{:<12} {:>8.2f}ms {:>10.0f}KB'.format('interned',
+        interned_time * 1000, interned_memory / 1024))
+    print('memory saved: {:.0%}'.format(1 - interned_memory / plain_memory))
+    print()
+    print('{:<20} {:>8}'.format('table', 'values'))
+    for name, table in sorted(interner.tables.items()):
+        print('{:<20} {:>8}'.format(name, len(table)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+'''
+Compare eager and lazy event decoding when a handler reads only a few fields.
+
+Every message in a synthetic page load (see ``corpus.py``) is parsed with
+``parse_json_event`` and then the handler reads the ``request_id`` and
+``timestamp`` fields, which all of the Network events have.
+
+Usage::
+
+    $ python benchmarks/bench_lazy.py [--requests N] [--repeat N]
+'''
+import argparse
+import timeit
+
+from cdp import util
+
+import corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500,
+        help='number of resources in the synthetic page load')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    messages = [m for m in corpus.page_load_messages(args.requests)
+        if m['method'].startswith('Network.')]
+
+    def handle(lazy):
+        for message in messages:
+            event = util.parse_json_event(message, lazy=lazy)
+            event.request_id
+            event.timestamp
+
+    print('{} Network messages, reading 2 fields each'.format(len(messages)))
+    for name, lazy in (('eager', False), ('lazy', True)):
+        best = min(timeit.repeat(lambda: handle(lazy), number=1,
+            repeat=args.repeat))
+        print('{:<6} {:8.2f} ms  {:10.0f} msg/s'.format(name, best * 1000,
+            len(messages) / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+'''
+Measure the memory used by each instance of some large CDP types.
+
+Generated dataclasses have ``__slots__`` unless the generator is run with
+``--no-slots``. For comparison, each type is also measured as an equivalent
+dataclass without slots, which is what the generator used to emit. Only the
+objects themselves are counted, not the field values.
+
+Usage::
+
+    $ python benchmarks/bench_memory.py [--count N]
+'''
+import argparse
+import dataclasses
+import tracemalloc
+
+from cdp import dom, dom_snapshot, network, runtime
+
+
+TYPES = [
+    dom.Node,
+    dom_snapshot.DOMNode,
+    runtime.RemoteObject,
+    network.Request,
+    network.Response,
+]
+
+
+def without_slots(cls):
+    ''' Return a dataclass with the same fields as ``cls`` but no slots. '''
+    fields = [field.name for field in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(cls.__name__, fields)
+
+
+def bytes_per_instance(cls, count):
+    ''' Return the number of bytes allocated for each instance of ``cls``. '''
+    kwargs = {field.name: None for field in dataclasses.fields(cls)}
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(**kwargs) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list that holds the instances.
+    list_size = 8 * len(instances)
+    return (after - before - list_size) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--count', type=int, default=10000,
+        help='number of instances to create for each type')
+    args = parser.parse_args()
+
+    print('{:<24} {:>7} {:>10} {:>10} {:>8}'.format('type', 'fields',
+        'no slots', 'generated', 'saved'))
+    for cls in TYPES:
+        name = '{}.{}'.format(cls.__module__.split('.')[-1], cls.__name__)
+        plain = bytes_per_instance(without_slots(cls), args.count)
+        generated = bytes_per_instance(cls, args.count)
+        print('{:<24} {:>7} {:>9.0f}B {:>9.0f}B {:>7.0%}'.format(name,
+            len(dataclasses.fields(cls)), plain, generated,
+            1 - generated / plain))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+'''
+Measure the overhead of instrumentation.
+
+Events from a synthetic page load (see ``corpus.py``) are decoded with
+``parse_json_event()``, and commands are run on a connection to a fake browser
+(see ``cdp.connection.FakeBrowser``), with instrumentation disabled and with
+``cdp.metrics.Metrics`` enabled.
+
+Usage::
+
+    $ python benchmarks/bench_metrics.py [--requests N] [--commands N]
+'''
+import argparse
+import asyncio
+import time
+
+from cdp import browser
+from cdp.connection import Connection, FakeBrowser
+from cdp.metrics import disable_instrumentation, enable_instrumentation, \
+    Metrics
+from cdp.util import parse_json_event
+
+from corpus import page_load_messages
+
+
+VERSION = {
+    'protocolVersion': '1.3',
+    'product': 'HeadlessChrome/80.0.3987.0',
+    'revision': '@e2b4a8f2',
+    'userAgent': 'Mozilla/5.0',
+    'jsVersion': '8.0.426.1',
+}
+
+
+def decode(messages, repeat):
+    ''' Return the best mean time to decode an event. '''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            parse_json_event(message)
+        best = min(best, time.perf_counter() - start)
+    return best / len(messages)
+
+
+async def run_commands(commands, repeat):
+    ''' Return the best mean time to run a command. '''
+    fake = FakeBrowser()
+    fake.handle('Browser.getVersion', lambda params: VERSION)
+    best = float('inf')
+    async with Connection(fake.connect()) as conn:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(commands):
+                await conn.execute(browser.get_version())
+            best = min(best, time.perf_counter() - start)
+    await fake.close()
+    return best / commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=1000,
+        help='number of network requests in the page load')
+    parser.add_argument('--commands', type=int, default=5000,
+        help='number of commands to run')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    messages = page_load_messages(args.requests)
+    print('{:<10} {:>12} {:>12}'.format('', 'per event', 'per command'))
+    for name in ('disabled', 'enabled'):
+        if name == 'enabled':
+            enable_instrumentation(Metrics())
+        event = decode(messages, args.repeat)
+        command = asyncio.run(run_commands(args.commands, args.repeat))
+        disable_instrumentation()
+        print('{:<10} {:>10.2f}us {:>10.1f}us'.format(name, event * 1e6,
+            command * 1e6))
+
+
+if __name__ == '__main__':
+    main()
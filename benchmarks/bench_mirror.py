@@ -0,0 +1,97 @@
+'''
+Measure the cost of keeping a copy of the DOM up to date.
+
+A synthetic document (see ``corpus.py``) is decoded from the JSON result of
+``DOM.getDocument`` and loaded into a ``cdp.mirror.DomMirror``, which is what
+it costs to request the whole document again, not counting the browser. Then
+DOM events that insert and remove nodes and change attributes and text are
+applied to the mirror one at a time.
+
+Usage::
+
+    $ python benchmarks/bench_mirror.py [--nodes N] [--events N]
+'''
+import argparse
+import json
+import random
+import time
+
+from cdp import dom
+from cdp.mirror import DomMirror
+
+from corpus import dom_document_result
+
+
+def refetch_time(frame, repeat):
+    ''' Return the best time to decode the document and load the mirror. '''
+    best = float('inf')
+    mirror = DomMirror()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        mirror.set_document(dom.Node.from_json(json.loads(frame)['root']))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def mutations(mirror, count, seed=0):
+    ''' Return a list of events that change the mirror's document. '''
+    rng = random.Random(seed)
+    nodes = list()
+    stack = [mirror.root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.children())
+    elements = [node.node_id for node in nodes if node.node_type == 1]
+    texts = [node.node_id for node in nodes if node.node_type == 3]
+    next_id = max(node.node_id for node in nodes) + 1
+    events = list()
+    for _ in range(count // 4):
+        parent = rng.choice(elements)
+        events.append(dom.ChildNodeInserted.from_json({
+            'parentNodeId': parent,
+            'previousNodeId': 0,
+            'node': {'nodeId': next_id, 'backendNodeId': next_id + 10 ** 6,
+                'nodeType': 1, 'nodeName': 'SPAN', 'localName': 'span',
+                'nodeValue': '', 'childNodeCount': 0, 'children': [],
+                'attributes': ['class', 'new']},
+        }))
+        events.append(dom.ChildNodeRemoved.from_json({
+            'parentNodeId': parent, 'nodeId': next_id}))
+        events.append(dom.AttributeModified.from_json({
+            'nodeId': rng.choice(elements), 'name': 'class',
+            'value': 'c{}'.format(rng.randrange(300))}))
+        events.append(dom.CharacterDataModified.from_json({
+            'nodeId': rng.choice(texts), 'characterData': 'changed'}))
+        next_id += 1
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=20000,
+        help='number of nodes in the document')
+    parser.add_argument('--events', type=int, default=100000,
+        help='number of events to apply')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to load the document')
+    args = parser.parse_args()
+
+    frame = json.dumps(dom_document_result(args.nodes)).encode('utf8')
+    elapsed = refetch_time(frame, args.repeat)
+    print('{} nodes: loading the document takes {:.1f}ms'.format(args.nodes,
+        elapsed * 1000))
+
+    mirror = DomMirror()
+    mirror.set_document(dom.Node.from_json(json.loads(frame)['root']))
+    events = mutations(mirror, args.events)
+    start = time.perf_counter()
+    for event in events:
+        mirror.apply(event)
+    elapsed = time.perf_counter() - start
+    print('{} events: applying an event takes {:.2f}µs'.format(len(events),
+        elapsed / len(events) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
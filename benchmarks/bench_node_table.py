@@ -0,0 +1,74 @@
+'''
+Measure the time and memory it takes to decode a large DOM tree.
+
+The result of ``DOM.getDocument`` for a synthetic page (see ``corpus.py``) is
+decoded from JSON by ``dom.Node.from_json()`` and into a
+``cdp.node_table.NodeTable``. The memory that is retained after decoding
+doesn't count the JSON, which is freed, and the peak does.
+
+Usage::
+
+    $ python benchmarks/bench_node_table.py [--nodes N]
+'''
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from cdp import dom
+from cdp.node_table import NodeTable
+
+from corpus import dom_document_result
+
+
+DECODERS = {
+    'dom.Node': dom.Node.from_json,
+    'NodeTable': NodeTable.from_json,
+}
+
+
+def decode_time(decode, frame, repeat):
+    ''' Return the best time to parse and decode the document. '''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(json.loads(frame)['root'])
+        best = min(best, time.perf_counter() - start)
+        gc.collect()
+    return best
+
+
+def decode_memory(decode, frame):
+    ''' Return the retained and peak memory of decoding the document. '''
+    gc.collect()
+    tracemalloc.start()
+    result = decode(json.loads(frame)['root'])
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=200000,
+        help='number of nodes in the document')
+    parser.add_argument('--repeat', type=int, default=3,
+        help='number of times to decode the document with each decoder')
+    args = parser.parse_args()
+
+    frame = json.dumps(dom_document_result(args.nodes)).encode('utf8')
+    print('{} nodes, {:.1f}MB of JSON'.format(args.nodes, len(frame) / 1e6))
+    print('{:<10} {:>9} {:>10} {:>10}'.format('decoder', 'time',
+        'retained', 'peak'))
+    for name, decode in DECODERS.items():
+        elapsed = decode_time(decode, frame, args.repeat)
+        retained, peak = decode_memory(decode, frame)
+        print('{:<10} {:>7.0f}ms {:>8.1f}MB {:>8.1f}MB'.format(name,
+            elapsed * 1000, retained / 1e6, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
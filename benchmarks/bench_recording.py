@@ -0,0 +1,85 @@
+'''
+Measure the size of recordings and how fast they are written and read.
+
+A synthetic page load (see ``corpus.py``) is written to a recording with each
+kind of compression, then read back three ways: iterating over the raw
+records, decoding the messages, and parsing the events with
+``parse_json_event()``. zstd is skipped if ``zstandard`` isn't installed.
+
+Usage::
+
+    $ python benchmarks/bench_recording.py [--requests N]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from cdp.recording import Direction, RecordingReader, RecordingWriter
+
+from corpus import page_load_frames
+
+
+def best_of(repeat, fn):
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(frames, compression, directory, repeat):
+    path = os.path.join(directory, f'recording-{compression}')
+
+    def write():
+        if os.path.exists(path):
+            os.remove(path)
+        with RecordingWriter(path, compression) as writer:
+            for frame in frames:
+                writer.write(Direction.RECEIVED, frame)
+
+    def read(method):
+        def read():
+            with RecordingReader(path) as reader:
+                for _ in method(reader):
+                    pass
+        return read
+
+    write_time = best_of(repeat, write)
+    return {
+        'size': os.path.getsize(path),
+        'write': write_time,
+        'records': best_of(repeat, read(iter)),
+        'messages': best_of(repeat, read(RecordingReader.messages)),
+        'events': best_of(repeat, read(RecordingReader.events)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=2000,
+        help='number of network requests in the page load')
+    parser.add_argument('--repeat', type=int, default=3,
+        help='number of times to repeat each measurement')
+    args = parser.parse_args()
+
+    frames = page_load_frames(args.requests)
+    raw = sum(len(frame) for frame in frames)
+    print('{} messages, {:.0f}KB'.format(len(frames), raw / 1024))
+    print('{:<8} {:>9} {:>9} {:>9} {:>9} {:>9}'.format('', 'size',
+        'write', 'records', 'messages', 'events'))
+    with tempfile.TemporaryDirectory() as directory:
+        for compression in (None, 'gzip', 'zstd'):
+            try:
+                result = measure(frames, compression, directory, args.repeat)
+            except ImportError:
+                continue
+            print('{:<8} {:>7.0f}KB {:>7.1f}ms {:>7.1f}ms {:>7.1f}ms '
+                '{:>7.1f}ms'.format(str(compression), result['size'] / 1024,
+                result['write'] * 1000, result['records'] * 1000,
+                result['messages'] * 1000, result['events'] * 1000))
+
+
+if __name__ == '__main__':
+    main()
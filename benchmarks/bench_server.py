@@ -0,0 +1,120 @@
+'''
+Measure the throughput of a connection to a fake browser over TCP.
+
+The fake browser (see ``cdp.connection.FakeBrowser``) listens on a local port
+and needs no real browser or network access, so this can run in CI. It
+measures:
+
+* events: a recorded mix of high volume events is replayed as fast as
+  possible and decoded by the client.
+* commands: commands are answered with synthetic results that match the
+  protocol specification (see ``cdp.synthetic``), sent in batches with
+  ``Connection.execute_many()``.
+
+Usage::
+
+    $ python benchmarks/bench_server.py [--events N] [--commands N]
+'''
+import argparse
+import asyncio
+import time
+
+from cdp import dom, network, page, runtime
+from cdp.connection import Connection, FakeBrowser, StreamTransport
+from cdp.synthetic import PayloadFactory
+
+
+EVENTS = [
+    'Network.requestWillBeSent',
+    'Network.responseReceived',
+    'Network.dataReceived',
+    'Network.loadingFinished',
+    'Page.lifecycleEvent',
+    'Runtime.consoleAPICalled',
+]
+
+
+def recording(factory, events):
+    ''' Return ``events`` event messages followed by a load event. '''
+    payloads = [(method, factory.event_payload(method)) for method in EVENTS]
+    messages = [{'method': payloads[i % len(payloads)][0], 'params':
+        payloads[i % len(payloads)][1]} for i in range(events)]
+    messages.append({'method': 'Page.loadEventFired', 'params':
+        {'timestamp': 0}})
+    return messages
+
+
+def commands(count):
+    for i in range(count):
+        if i % 2:
+            yield dom.describe_node(node_id=dom.NodeId(i))
+        else:
+            yield runtime.evaluate(expression='document.title')
+
+
+async def connect(fake):
+    server = await fake.start_server()
+    host, port = server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port,
+        limit=2 ** 20)
+    return server, Connection(StreamTransport(reader, writer))
+
+
+async def measure_events(factory, events):
+    fake = FakeBrowser()
+    server, conn = await connect(fake)
+    messages = recording(factory, events)
+    async with conn:
+        stream = conn.listen(network.RequestWillBeSent,
+            network.ResponseReceived, network.DataReceived,
+            network.LoadingFinished, page.LifecycleEvent,
+            runtime.ConsoleAPICalled, page.LoadEventFired)
+        start = time.perf_counter()
+        replay = asyncio.ensure_future(fake.replay(messages))
+        received = 0
+        async for event in stream:
+            received += 1
+            if isinstance(event, page.LoadEventFired):
+                break
+        elapsed = time.perf_counter() - start
+        await replay
+    server.close()
+    await fake.close()
+    assert received == len(messages)
+    return events / elapsed
+
+
+async def measure_commands(factory, count, batch):
+    fake = FakeBrowser(payloads=factory)
+    server, conn = await connect(fake)
+    async with conn:
+        cmds = list(commands(count))
+        start = time.perf_counter()
+        for i in range(0, count, batch):
+            results = await conn.execute_many(cmds[i:i + batch])
+            assert not any(isinstance(r, Exception) for r in results)
+        elapsed = time.perf_counter() - start
+    server.close()
+    await fake.close()
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--events', type=int, default=20000,
+        help='number of events to replay')
+    parser.add_argument('--commands', type=int, default=5000,
+        help='number of commands to run')
+    parser.add_argument('--batch', type=int, default=100,
+        help='number of commands in each batch')
+    args = parser.parse_args()
+
+    factory = PayloadFactory()
+    rate = asyncio.run(measure_events(factory, args.events))
+    print('{:<10} {:>10.0f}/s'.format('events', rate))
+    rate = asyncio.run(measure_commands(factory, args.commands, args.batch))
+    print('{:<10} {:>10.0f}/s'.format('commands', rate))
+
+
+if __name__ == '__main__':
+    main()
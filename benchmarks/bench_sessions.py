@@ -0,0 +1,80 @@
+'''
+Measure how the cost of routing events depends on the number of sessions.
+
+Events for many flattened sessions arrive on one connection. Each event is
+routed to its session with a dict lookup, so the time per event should not
+grow with the number of sessions. The browser side of the connection is an
+in-memory transport that the events are written to directly.
+
+Usage::
+
+    $ python benchmarks/bench_sessions.py [--events N] [--sessions N ...]
+'''
+import argparse
+import asyncio
+import json
+import time
+
+from cdp import page
+from cdp.connection import Connection, MemoryTransport
+
+
+def attached(session_id):
+    return json.dumps({'method': 'Target.attachedToTarget', 'params': {
+        'sessionId': session_id,
+        'targetInfo': {'targetId': session_id, 'type': 'page', 'title': '',
+            'url': 'about:blank', 'attached': True, 'canAccessOpener': False},
+        'waitingForDebugger': False,
+    }}).encode('utf8')
+
+
+def lifecycle_event(session_id, index):
+    return json.dumps({'method': 'Page.lifecycleEvent', 'sessionId':
+        session_id, 'params': {'frameId': session_id, 'loaderId': 'loader',
+        'name': 'load', 'timestamp': index}}).encode('utf8')
+
+
+async def measure(sessions, events):
+    ''' Return the mean time to route an event to one of ``sessions``. '''
+    client, browser = MemoryTransport.pair()
+    async with Connection(client) as conn:
+        session_ids = [f'session-{i}' for i in range(sessions)]
+        for session_id in session_ids:
+            await browser.send(attached(session_id))
+        done = conn.listen(page.LoadEventFired)
+        await browser.send(b'{"method":"Page.loadEventFired","params":'
+            b'{"timestamp":0}}')
+        await done.__anext__()
+        streams = [conn.sessions[session_id].listen(page.LifecycleEvent)
+            for session_id in session_ids]
+
+        frames = [lifecycle_event(session_ids[i % sessions], i)
+            for i in range(events)]
+        start = time.perf_counter()
+        for frame in frames:
+            await browser.send(frame)
+        await browser.send(b'{"method":"Page.loadEventFired","params":'
+            b'{"timestamp":1}}')
+        await done.__anext__()
+        elapsed = time.perf_counter() - start
+        assert sum(len(stream._queue) for stream in streams) == events
+    return elapsed / events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--events', type=int, default=30000,
+        help='number of events to route for each measurement')
+    parser.add_argument('--sessions', type=int, nargs='+',
+        default=[1, 10, 100, 300, 1000],
+        help='numbers of sessions to measure')
+    args = parser.parse_args()
+
+    print('{:>8} {:>12}'.format('sessions', 'per event'))
+    for sessions in args.sessions:
+        mean = asyncio.run(measure(sessions, args.events))
+        print('{:>8} {:>10.1f}us'.format(sessions, mean * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+'''
+Measure the time and memory it takes to decode a large DOM snapshot.
+
+The result of ``DOMSnapshot.captureSnapshot`` for a synthetic page (see
+``corpus.py``) is decoded from JSON by the generated classes in
+``cdp.dom_snapshot`` and into columns by ``cdp.snapshot``. The memory that is
+retained after decoding doesn't count the JSON, which is freed, and the peak
+does.
+
+Then the nodes named ``A`` are found by converting the node names to
+strings, and by comparing string indexes with ``cdp.snapshot.SnapshotStrings``.
+
+Usage::
+
+    $ python benchmarks/bench_snapshot.py [--nodes N]
+'''
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from cdp import dom_snapshot, snapshot
+from cdp.snapshot import SnapshotStrings
+
+from corpus import dom_snapshot_result
+
+
+def decode_generated(result):
+    return ([dom_snapshot.DocumentSnapshot.from_json(i)
+        for i in result['documents']], result['strings'])
+
+
+DECODERS = {
+    'generated': decode_generated,
+    'columns': snapshot.decode_snapshot,
+}
+
+
+def decode_time(decode, frame, repeat):
+    ''' Return the best time to parse and decode the snapshot. '''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(json.loads(frame))
+        best = min(best, time.perf_counter() - start)
+        gc.collect()
+    return best
+
+
+def decode_memory(decode, frame):
+    ''' Return the retained and peak memory of decoding the snapshot. '''
+    gc.collect()
+    tracemalloc.start()
+    result = decode(json.loads(frame))
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def find_converted(nodes, strings, name):
+    names = [strings[i] for i in nodes.node_name]
+    return [i for i, other in enumerate(names) if other == name]
+
+
+def find_compared(nodes, strings, name):
+    return SnapshotStrings(strings).column(nodes.node_name).positions(name)
+
+
+FINDERS = {
+    'convert': find_converted,
+    'compare': find_compared,
+}
+
+
+def find_time(find, nodes, strings, repeat):
+    ''' Return the best time to find the nodes named ``A``. '''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        find(nodes, strings, 'A')
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=50000,
+        help='number of nodes in the snapshot')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of times to decode the snapshot with each decoder')
+    args = parser.parse_args()
+
+    frame = json.dumps(dom_snapshot_result(args.nodes)).encode('utf8')
+    print('{} nodes, {:.1f}MB of JSON'.format(args.nodes, len(frame) / 1e6))
+    print('{:<10} {:>9} {:>10} {:>10}'.format('decoder', 'time',
+        'retained', 'peak'))
+    for name, decode in DECODERS.items():
+        elapsed = decode_time(decode, frame, args.repeat)
+        retained, peak = decode_memory(decode, frame)
+        print('{:<10} {:>7.0f}ms {:>8.1f}MB {:>8.1f}MB'.format(name,
+            elapsed * 1000, retained / 1e6, peak / 1e6))
+
+    documents, strings = snapshot.decode_snapshot(json.loads(frame))
+    print()
+    print('{:<10} {:>9}'.format('find', 'time'))
+    for name, find in FINDERS.items():
+        elapsed = find_time(find, documents[0].nodes, strings, args.repeat)
+        print('{:<10} {:>7.1f}ms'.format(name, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+'''
+Measure queries on a large DOM snapshot with and without an index.
+
+The result of ``DOMSnapshot.captureSnapshot`` for a synthetic page (see
+``corpus.py``) is decoded into columns, and each query is run for random nodes
+by scanning the columns, and with ``cdp.snapshot.SnapshotIndex``.
+
+Usage::
+
+    $ python benchmarks/bench_snapshot_index.py [--nodes N] [--queries N]
+'''
+import argparse
+import random
+import time
+
+from cdp.snapshot import decode_snapshot, SnapshotIndex
+
+from corpus import dom_snapshot_result
+
+
+def scan_children(document, strings, node):
+    return [i for i, parent in enumerate(document.nodes.parent_index)
+        if parent == node]
+
+
+def scan_ancestors(document, strings, node):
+    parents = document.nodes.parent_index
+    ancestors = list()
+    node = parents[node]
+    while node >= 0:
+        ancestors.append(node)
+        node = parents[node]
+    return ancestors
+
+
+def scan_bounds(document, strings, node):
+    try:
+        return document.layout.bounds[document.layout.node_index.index(node)]
+    except ValueError:
+        return None
+
+
+def scan_by_name(document, strings, node):
+    name = document.nodes.node_name[node]
+    return [i for i, other in enumerate(document.nodes.node_name)
+        if other == name]
+
+
+def scan_text(document, strings, node):
+    # Collect the descendants by scanning the parents once.
+    nodes = document.nodes
+    inside = {node}
+    for i in range(node + 1, len(nodes.parent_index)):
+        if nodes.parent_index[i] in inside:
+            inside.add(i)
+    pieces = list()
+    layout = document.layout
+    for i in sorted(inside):
+        if nodes.node_type[i] == 3 and i in layout.node_index:
+            text = layout.text[layout.node_index.index(i)]
+            if text >= 0:
+                pieces.append(strings[text])
+    return ''.join(pieces)
+
+
+QUERIES = {
+    'children': (scan_children, lambda index, node: index.children(node)),
+    'ancestors': (scan_ancestors,
+        lambda index, node: list(index.ancestors(node))),
+    'bounds': (scan_bounds, lambda index, node: index.bounds(node)),
+    'by name': (scan_by_name,
+        lambda index, node: index.nodes_by_name(index.node_name(node))),
+    'text': (scan_text, lambda index, node: index.text(node)),
+}
+
+
+def query_time(query, nodes):
+    ''' Return the mean time of a query. '''
+    start = time.perf_counter()
+    for node in nodes:
+        query(node)
+    return (time.perf_counter() - start) / len(nodes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=100000,
+        help='number of nodes in the snapshot')
+    parser.add_argument('--queries', type=int, default=20,
+        help='number of nodes to run each query for without an index')
+    args = parser.parse_args()
+
+    documents, strings = decode_snapshot(dom_snapshot_result(args.nodes))
+    document = documents[0]
+    start = time.perf_counter()
+    index = SnapshotIndex(document, strings)
+    index.nodes_by_name('DIV')
+    print('{} nodes, index built in {:.0f}ms'.format(args.nodes,
+        (time.perf_counter() - start) * 1000))
+
+    rng = random.Random(0)
+    # Query nodes near the end of the document, so that text queries don't
+    # cover the whole page.
+    nodes = [rng.randrange(args.nodes // 2, args.nodes)
+        for _ in range(args.queries)]
+    indexed_nodes = nodes * 100
+    print('{:<10} {:>12} {:>12}'.format('query', 'scan', 'index'))
+    for name, (scan, indexed) in QUERIES.items():
+        scanned = query_time(lambda node: scan(document, strings, node), nodes)
+        looked_up = query_time(lambda node: indexed(index, node),
+            indexed_nodes)
+        print('{:<10} {:>10.1f}µs {:>10.1f}µs'.format(name, scanned * 1e6,
+            looked_up * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+'''
+Measure the time and peak memory of reading a large IO stream.
+
+A fake browser (see ``cdp.connection.FakeBrowser``) serves a stream of
+``--megabytes`` of base64 encoded data with ``IO.read``, with a delay of
+``--rtt`` for each response. The stream is read three ways:
+
+* ``naive``: call ``io.read()`` until the end of the stream, join the chunks,
+  and decode the whole thing, which is how the stream is read without the
+  helpers in ``cdp.streams``.
+* ``file``: ``cdp.streams.read_stream_into()`` with a file as the sink.
+* ``buffer``: ``cdp.streams.read_stream_into()`` with a preallocated
+  ``bytearray`` as the sink.
+
+Each case runs in its own process, so that the peak memory of one case doesn't
+hide the peak memory of the next.
+
+Usage::
+
+    $ python benchmarks/bench_streams.py [--megabytes N] [--chunk BYTES]
+        [--rtt MS]
+'''
+import argparse
+import asyncio
+import base64
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from cdp import io
+from cdp.connection import Connection, FakeBrowser
+from cdp.streams import read_stream_into
+
+
+HANDLE = io.StreamHandle('stream-1')
+
+
+class FakeStream:
+    ''' Serve ``size`` bytes of data in chunks of ``chunk_size`` bytes. '''
+    def __init__(self, size, chunk_size):
+        self.remaining = size
+        self.chunk = base64.b64encode(os.urandom(chunk_size)).decode('ascii')
+        self.chunk_size = chunk_size
+
+    def read(self, params):
+        assert params.get('size', self.chunk_size) == self.chunk_size
+        data = self.chunk
+        if self.remaining < self.chunk_size:
+            data = data[:self.remaining // 3 * 4]
+        self.remaining -= self.chunk_size
+        return {'base64Encoded': True, 'data': data, 'eof': self.remaining <= 0}
+
+
+async def naive(conn, size, chunk_size):
+    chunks = list()
+    eof = False
+    while not eof:
+        _, data, eof = await conn.execute(io.read(HANDLE, size=chunk_size))
+        chunks.append(data)
+    await conn.execute(io.close(HANDLE))
+    return len(base64.b64decode(''.join(chunks)))
+
+
+async def to_file(conn, size, chunk_size):
+    with open(os.devnull, 'wb') as sink:
+        return await read_stream_into(conn.execute, HANDLE, sink, chunk_size)
+
+
+async def to_buffer(conn, size, chunk_size):
+    buffer = bytearray(size)
+    return await read_stream_into(conn.execute, HANDLE, buffer, chunk_size)
+
+
+CASES = {
+    'naive': naive,
+    'file': to_file,
+    'buffer': to_buffer,
+}
+
+
+async def measure(case, size, chunk_size, rtt):
+    fake = FakeBrowser(latency=rtt)
+    stream = FakeStream(size, chunk_size)
+    fake.handle('IO.read', stream.read)
+    fake.handle('IO.close', lambda params: {})
+    async with Connection(fake.connect()) as conn:
+        start = time.perf_counter()
+        read = await CASES[case](conn, size, chunk_size)
+        elapsed = time.perf_counter() - start
+    await fake.close()
+    assert read == size, read
+    return elapsed
+
+
+def run_case(args):
+    ''' Measure one case in this process and print the results. '''
+    # Round the size down to a whole number of base64 groups.
+    size = args.megabytes * 2 ** 20 // 3 * 3
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    elapsed = asyncio.run(measure(args.case, size, args.chunk, args.rtt / 1000))
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+    print('{:<8} {:>8.2f}s {:>8.0f}MB/s {:>8.0f}MB'.format(args.case,
+        elapsed, size / 2 ** 20 / elapsed, peak / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--megabytes', type=int, default=1024,
+        help='size of the stream in megabytes')
+    parser.add_argument('--chunk', type=int, default=3 * 2 ** 20,
+        help='size of each chunk in bytes, a multiple of 3')
+    parser.add_argument('--rtt', type=float, default=1,
+        help='round trip time of the fake browser in milliseconds')
+    parser.add_argument('--case', choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args)
+        return
+    print('{} MB in chunks of {} bytes, {}ms round trip'.format(
+        args.megabytes, args.chunk, args.rtt))
+    print('{:<8} {:>9} {:>10} {:>10}'.format('', 'time', 'rate', 'peak'))
+    for case in CASES:
+        subprocess.run([sys.executable, __file__, '--case', case,
+            '--megabytes', str(args.megabytes), '--chunk', str(args.chunk),
+            '--rtt', str(args.rtt)], check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+'''
+Measure the time and peak memory of reading the events in a large trace.
+
+A synthetic gzip compressed trace with ``--events`` events is read two ways:
+
+* ``json.load``: decompress and decode the whole trace, then iterate over its
+  ``traceEvents``.
+* ``iter_trace_events``: ``cdp.traces.iter_trace_events()``, which decodes
+  one event at a time.
+
+Each case runs in its own process, so that the peak memory of one case doesn't
+hide the peak memory of the next.
+
+Usage::
+
+    $ python benchmarks/bench_traces.py [--events N]
+'''
+import argparse
+import gzip
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from cdp.traces import iter_trace_events
+
+
+NAMES = ['RunTask', 'FunctionCall', 'Layout', 'Paint', 'ParseHTML',
+    'EvaluateScript', 'UpdateLayoutTree', 'v8.compile']
+
+
+def write_trace(path, events):
+    with gzip.open(path, 'wt', encoding='utf8', compresslevel=1) as trace:
+        trace.write('{"traceEvents":[')
+        for i in range(events):
+            if i:
+                trace.write(',\n')
+            json.dump({'args': {'data': {'frame': 'F1', 'url':
+                f'https://example.com/script-{i % 100}.js'}}, 'cat':
+                'devtools.timeline', 'dur': i % 997, 'name':
+                NAMES[i % len(NAMES)], 'ph': 'X', 'pid': 1, 'tid': i % 7,
+                'ts': 1000000 + i * 10, 'tts': i * 9}, trace)
+        trace.write('],"metadata":{}}')
+
+
+def load_all(path):
+    with gzip.open(path, 'rb') as trace:
+        events = json.load(trace)['traceEvents']
+    return sum(1 for event in events if event['ph'] == 'X')
+
+
+def load_incrementally(path):
+    return sum(1 for event in iter_trace_events(path) if event['ph'] == 'X')
+
+
+CASES = {
+    'json.load': load_all,
+    'iter_trace_events': load_incrementally,
+}
+
+
+def run_case(case, path, events):
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    count = CASES[case](path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+    assert count == events, count
+    print('{:<18} {:>8.2f}s {:>8.0f}MB'.format(case, elapsed, peak / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--events', type=int, default=1000000,
+        help='number of events in the trace')
+    parser.add_argument('--case', choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case, args.path, args.events)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'trace.json.gz')
+        write_trace(path, args.events)
+        print('{} events, {:.0f}MB compressed'.format(args.events,
+            os.path.getsize(path) / 2 ** 20))
+        print('{:<18} {:>9} {:>10}'.format('', 'time', 'peak'))
+        for case in CASES:
+            subprocess.run([sys.executable, __file__, '--case', case,
+                '--path', path, '--events', str(args.events)], check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+'''
+Measure decoding and encoding for every generated type and event.
+
+A payload is synthesized for each type and event in the protocol specification
+(see ``cdp.synthetic``). For each one, this measures:
+
+* ``decode_ns``: the time for ``from_json()``.
+* ``encode_ns``: the time for ``to_json()`` of the decoded object (events
+  don't have ``to_json()``).
+* ``decode_blocks``/``encode_blocks``: the number of memory blocks that the
+  result of each call keeps alive, from ``sys.getallocatedblocks()``.
+* ``decode_bytes``/``encode_bytes``: the number of bytes that the result of
+  each call keeps alive, from ``tracemalloc``.
+
+The types in ``TRACKED`` are also measured with larger payloads, since they
+are the ones that dominate real traffic.
+
+The results can be written to a JSON report. Pass a report from an earlier
+run, e.g. before changing ``generator/generate.py``, as ``--compare`` to list
+the types that got slower or use more memory; the script exits with status 1
+if there are any.
+
+Usage::
+
+    $ python benchmarks/bench_types.py [--output REPORT] [--compare REPORT]
+        [--match TEXT]
+'''
+import argparse
+import gc
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import cdp
+from cdp import util
+from cdp.synthetic import PayloadFactory
+
+
+#: The types and events that are reported separately, with the number of
+#: items in each array of their payloads.
+TRACKED = {
+    'DOMSnapshot.DocumentSnapshot': 200,
+    'Network.Response': 20,
+    'Debugger.paused': 20,
+}
+
+
+def python_name(cls):
+    return '{}.{}'.format(cls.__module__[len('cdp.'):], cls.__name__)
+
+
+def items(factory, names=None):
+    '''
+    Yield ``(name, kind, cls, payload)`` for each type and event in the
+    specification, or only the ones in ``names``.
+    '''
+    for ref, (domain, spec) in sorted(factory.types.items()):
+        if names is None or ref in names:
+            module = importlib.import_module('cdp.' +
+                cdp._domain_modules[domain])
+            cls = getattr(module, spec['id'])
+            yield python_name(cls), 'type', cls, factory.type_payload(ref)
+    for method in sorted(factory.events):
+        if names is None or method in names:
+            cls = util.get_event_class(method)
+            yield python_name(cls), 'event', cls, factory.event_payload(method)
+
+
+def time_per_call(fn, min_time, repeat):
+    ''' Return the best time per call of ``fn`` in nanoseconds. '''
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e9
+
+
+def retained(fn, count=50):
+    '''
+    Return the number of blocks and bytes that each result of ``fn`` keeps
+    alive.
+    '''
+    # The list is allocated up front so that it isn't counted.
+    results = [None] * count
+    gc.collect()
+    gc.disable()
+    try:
+        before = sys.getallocatedblocks()
+        for i in range(count):
+            results[i] = fn()
+        blocks = (sys.getallocatedblocks() - before) / count
+        results = [None] * count
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for i in range(count):
+                results[i] = fn()
+            size = (tracemalloc.get_traced_memory()[0] - before) / count
+        finally:
+            tracemalloc.stop()
+    finally:
+        gc.enable()
+    return round(blocks), round(size)
+
+
+def measure(kind, cls, payload, min_time, repeat):
+    from_json = cls.from_json
+    obj = from_json(payload)
+    result = {
+        'kind': kind,
+        'payload_bytes': len(json.dumps(payload)),
+        'decode_ns': round(time_per_call(lambda: from_json(payload), min_time,
+            repeat), 1),
+    }
+    result['decode_blocks'], result['decode_bytes'] = retained(
+        lambda: from_json(payload))
+    if kind == 'type':
+        if util.is_id_type(cls):
+            # A NewType ID is a plain value without a to_json() method.
+            to_json = lambda: cls.to_json(obj)
+        else:
+            to_json = obj.to_json
+        result['encode_ns'] = round(time_per_call(to_json, min_time, repeat),
+            1)
+        result['encode_blocks'], result['encode_bytes'] = retained(to_json)
+    return result
+
+
+def run(args):
+    factory = PayloadFactory()
+    report = {
+        'python': platform.python_implementation() + ' ' +
+            platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'results': dict(),
+        'tracked': dict(),
+    }
+    for name, kind, cls, payload in items(factory):
+        if args.match and args.match not in name:
+            continue
+        report['results'][name] = measure(kind, cls, payload, args.min_time,
+            args.repeat)
+    for ref, array_length in TRACKED.items():
+        large = PayloadFactory(array_length=array_length)
+        for name, kind, cls, payload in items(large, {ref}):
+            if args.match and args.match not in name:
+                continue
+            report['tracked'][name] = measure(kind, cls, payload,
+                args.min_time, args.repeat * 3)
+    return report
+
+
+def print_table(results):
+    print('{:<48} {:>8} {:>10} {:>10} {:>8}'.format('', 'payload',
+        'decode', 'encode', 'blocks'))
+    for name, result in results.items():
+        encode = result.get('encode_ns')
+        print('{:<48} {:>7}B {:>8.0f}ns {:>10} {:>8}'.format(name,
+            result['payload_bytes'], result['decode_ns'],
+            '-' if encode is None else '{:.0f}ns'.format(encode),
+            result['decode_blocks']))
+
+
+def compare(report, baseline, threshold):
+    '''
+    Return a description of each measurement in ``report`` that is worse than
+    in ``baseline``: times that are more than ``threshold`` slower, and any
+    increase in retained blocks.
+    '''
+    regressions = list()
+    for section in ('results', 'tracked'):
+        for name, result in report[section].items():
+            old = baseline.get(section, dict()).get(name)
+            if old is None:
+                continue
+            for key in ('decode_ns', 'encode_ns'):
+                if key in result and key in old and \
+                        result[key] > old[key] * (1 + threshold):
+                    regressions.append('{} {}: {:.0f} -> {:.0f} ({:+.0%})'
+                        .format(name, key, old[key], result[key],
+                        result[key] / old[key] - 1))
+            for key in ('decode_blocks', 'encode_blocks'):
+                if key in result and key in old and result[key] > old[key]:
+                    regressions.append('{} {}: {} -> {}'.format(name, key,
+                        old[key], result[key]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--output', help='write a JSON report to this file')
+    parser.add_argument('--compare', help='a JSON report to compare with')
+    parser.add_argument('--threshold', type=float, default=0.25,
+        help='how much slower a measurement must be to count as a '
+        'regression, e.g. 0.25 for 25%% (default)')
+    parser.add_argument('--match', help='only measure the types and events '
+        'whose names contain this text')
+    parser.add_argument('--min-time', type=float, default=0.005,
+        help='the minimum time in seconds for each timing')
+    parser.add_argument('--repeat', type=int, default=3,
+        help='number of times to repeat each timing')
+    parser.add_argument('--quiet', action='store_true',
+        help="don't print the results for every type and event")
+    args = parser.parse_args()
+
+    report = run(args)
+    if not args.quiet:
+        print_table(report['results'])
+        print()
+    print_table(report['tracked'])
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        print()
+        print('{} regressions compared to {}'.format(len(regressions),
+            args.compare))
+        for regression in regressions:
+            print('  ' + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
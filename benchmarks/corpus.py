@@ -0,0 +1,316 @@
+'''
+A synthetic corpus of CDP messages for benchmarks.
+
+The corpus imitates the traffic that a browser emits while loading a page with
+the Network and Page domains enabled: every resource gets a
+``requestWillBeSent``, a ``responseReceived``, a few ``dataReceived`` and a
+``loadingFinished`` event. Messages are returned as encoded WebSocket frames,
+so that every decoded message owns its own strings, just like real traffic.
+
+It also includes the results of ``DOMSnapshot.captureSnapshot`` and
+``DOM.getDocument`` for a large page.
+'''
+import json
+import random
+
+
+RESOURCE_TYPES = ['Document', 'Stylesheet', 'Script', 'Image', 'Font', 'XHR']
+PRIORITIES = ['VeryHigh', 'High', 'Medium', 'Low']
+MIME_TYPES = {
+    'Document': 'text/html',
+    'Stylesheet': 'text/css',
+    'Script': 'application/javascript',
+    'Image': 'image/png',
+    'Font': 'font/woff2',
+    'XHR': 'application/json',
+}
+
+FRAME_ID = '6D1C2CA1F1B8E5E2C1A3DE0C6F5E6E21'
+LOADER_ID = '3B4E1B0FBCE2A3C0B95BA4D5C87D04BB'
+
+
+def _headers(rng, count):
+    names = ['accept', 'accept-encoding', 'accept-language', 'cache-control',
+        'content-type', 'content-length', 'cookie', 'date', 'etag',
+        'last-modified', 'server', 'user-agent', 'vary', 'x-request-id']
+    return {name: 'value-{}'.format(rng.randrange(1000))
+        for name in rng.sample(names, count)}
+
+
+def _timing(rng, start):
+    timing = {'requestTime': start}
+    keys = ['proxyStart', 'proxyEnd', 'dnsStart', 'dnsEnd', 'connectStart',
+        'connectEnd', 'sslStart', 'sslEnd', 'workerStart', 'workerReady',
+        'sendStart', 'sendEnd', 'pushStart', 'pushEnd', 'receiveHeadersEnd']
+    for key in keys:
+        timing[key] = rng.random() * 100
+    return timing
+
+
+def page_load_events(requests=200, chunks=3, seed=0):
+    '''
+    Return a list of event messages (as dicts) for a single page load.
+
+    :param int requests: the number of resources loaded by the page
+    :param int chunks: the number of ``dataReceived`` events per resource
+    :param int seed: seed for the random number generator
+    '''
+    rng = random.Random(seed)
+    host = 'https://www.example.com'
+    events = [{
+        'method': 'Page.frameNavigated',
+        'params': {'frame': {
+            'id': FRAME_ID,
+            'loaderId': LOADER_ID,
+            'url': host + '/',
+            'securityOrigin': host,
+            'mimeType': 'text/html',
+        }},
+    }]
+    timestamp = 1000.0
+    for n in range(requests):
+        request_id = '1000.{}'.format(n)
+        type_ = RESOURCE_TYPES[0] if n == 0 else rng.choice(RESOURCE_TYPES)
+        url = '{}/{}/{}'.format(host, type_.lower(), n)
+        timestamp += rng.random()
+        events.append({'method': 'Network.requestWillBeSent', 'params': {
+            'requestId': request_id,
+            'loaderId': LOADER_ID,
+            'documentURL': host + '/',
+            'request': {
+                'url': url,
+                'method': 'GET',
+                'headers': _headers(rng, 6),
+                'initialPriority': rng.choice(PRIORITIES),
+                'referrerPolicy': 'no-referrer-when-downgrade',
+            },
+            'timestamp': timestamp,
+            'wallTime': 1570000000.0 + timestamp,
+            'initiator': {'type': 'parser', 'url': host + '/',
+                'lineNumber': rng.randrange(100)},
+            'type': type_,
+            'frameId': FRAME_ID,
+            'hasUserGesture': False,
+        }})
+        timestamp += rng.random()
+        events.append({'method': 'Network.responseReceived', 'params': {
+            'requestId': request_id,
+            'loaderId': LOADER_ID,
+            'timestamp': timestamp,
+            'type': type_,
+            'response': {
+                'url': url,
+                'status': 200,
+                'statusText': 'OK',
+                'headers': _headers(rng, 10),
+                'mimeType': MIME_TYPES[type_],
+                'connectionReused': True,
+                'connectionId': float(rng.randrange(50)),
+                'remoteIPAddress': '93.184.216.34',
+                'remotePort': 443,
+                'fromDiskCache': False,
+                'fromServiceWorker': False,
+                'encodedDataLength': float(rng.randrange(200, 2000)),
+                'timing': _timing(rng, timestamp),
+                'protocol': 'h2',
+                'securityState': 'secure',
+            },
+            'frameId': FRAME_ID,
+        }})
+        for _ in range(chunks):
+            timestamp += rng.random()
+            events.append({'method': 'Network.dataReceived', 'params': {
+                'requestId': request_id,
+                'timestamp': timestamp,
+                'dataLength': rng.randrange(65536),
+                'encodedDataLength': rng.randrange(65536),
+            }})
+        timestamp += rng.random()
+        events.append({'method': 'Network.loadingFinished', 'params': {
+            'requestId': request_id,
+            'timestamp': timestamp,
+            'encodedDataLength': float(rng.randrange(65536 * chunks)),
+        }})
+    for name in ('DOMContentLoaded', 'load'):
+        timestamp += rng.random()
+        events.append({'method': 'Page.lifecycleEvent', 'params': {
+            'frameId': FRAME_ID,
+            'loaderId': LOADER_ID,
+            'name': name,
+            'timestamp': timestamp,
+        }})
+    return events
+
+
+def page_load_frames(requests=200, chunks=3, seed=0):
+    ''' Like :func:`page_load_events` but each message is encoded as bytes. '''
+    return [json.dumps(event).encode('utf8')
+        for event in page_load_events(requests, chunks, seed)]
+
+
+def page_load_messages(requests=200, chunks=3, seed=0):
+    '''
+    Like :func:`page_load_events` but each message is decoded separately from
+    its own frame, so messages do not share any string objects.
+    '''
+    return [json.loads(frame)
+        for frame in page_load_frames(requests, chunks, seed)]
+
+
+TAGS = ['div'] * 8 + ['span'] * 4 + ['a'] * 3 + ['p', 'li', 'ul', 'img',
+    'button', 'input', 'td', 'tr', 'h2', 'section']
+
+
+def dom_snapshot_result(nodes=50000, seed=0):
+    '''
+    Return the result of ``DOMSnapshot.captureSnapshot`` for a page with one
+    document.
+
+    About 70% of the nodes are elements, which have a class and some have an
+    ID or a link, and the rest are text nodes. 80% of the nodes have a layout
+    object, and every text node with a layout object has a text box.
+
+    :param int nodes: the number of nodes in the document
+    :param int seed: seed for the random number generator
+    '''
+    rng = random.Random(seed)
+    strings = dict()
+
+    def string(value):
+        return strings.setdefault(value, len(strings))
+
+    empty = string('')
+    parent_index = [-1, 0, 1]
+    node_type = [9, 1, 1]
+    node_name = [string('#document'), string('HTML'), string('BODY')]
+    node_value = [empty] * 3
+    attributes = [[], [], []]
+    input_value = {'index': [], 'value': []}
+    clickable = []
+    # The nodes are created in document order: the stack holds the open
+    # elements, and closing elements at random keeps the tree shallow.
+    open_elements = [1, 2]
+    for index in range(3, nodes):
+        while len(open_elements) > 2 and (len(open_elements) > 30 or
+                rng.random() < 0.4):
+            open_elements.pop()
+        parent_index.append(open_elements[-1])
+        if rng.random() < 0.3:
+            node_type.append(3)
+            node_name.append(string('#text'))
+            node_value.append(string('Some text {}'.format(
+                rng.randrange(2000))))
+            attributes.append([])
+            continue
+        tag = rng.choice(TAGS)
+        node_type.append(1)
+        node_name.append(string(tag.upper()))
+        node_value.append(empty)
+        attrs = [string('class'), string('c{}'.format(rng.randrange(300)))]
+        if rng.random() < 0.1:
+            attrs += [string('id'), string('id{}'.format(index))]
+        if tag == 'a':
+            attrs += [string('href'), string('https://www.example.com/{}'
+                .format(rng.randrange(1000)))]
+            clickable.append(index)
+        elif tag == 'button':
+            clickable.append(index)
+        elif tag == 'input':
+            input_value['index'].append(index)
+            input_value['value'].append(string('value {}'.format(index)))
+        attributes.append(attrs)
+        if tag not in ('img', 'input'):
+            open_elements.append(index)
+
+    layout = {'nodeIndex': [], 'styles': [], 'bounds': [], 'text': [],
+        'stackingContexts': {'index': []}}
+    text_boxes = {'layoutIndex': [], 'bounds': [], 'start': [], 'length': []}
+    displays = [string('block'), string('inline'), string('flex')]
+    colors = [string('rgb(0, 0, 0)'), string('rgb(51, 51, 51)')]
+    for index in range(nodes):
+        if index > 0 and rng.random() >= 0.8:
+            continue
+        layout_index = len(layout['nodeIndex'])
+        bounds = [rng.randrange(1280) * 1.0, rng.randrange(20000) * 1.0,
+            rng.randrange(1, 600) * 1.0, rng.randrange(1, 200) * 1.0]
+        layout['nodeIndex'].append(index)
+        layout['styles'].append([rng.choice(displays), rng.choice(colors)])
+        layout['bounds'].append(bounds)
+        if node_type[index] == 3:
+            layout['text'].append(node_value[index])
+            text_boxes['layoutIndex'].append(layout_index)
+            text_boxes['bounds'].append(bounds)
+            text_boxes['start'].append(0)
+            text_boxes['length'].append(12)
+        else:
+            layout['text'].append(-1)
+        if rng.random() < 0.05:
+            layout['stackingContexts']['index'].append(layout_index)
+
+    document = {
+        'documentURL': string('https://www.example.com/'),
+        'baseURL': string('https://www.example.com/'),
+        'contentLanguage': empty,
+        'encodingName': string('UTF-8'),
+        'publicId': empty,
+        'systemId': empty,
+        'frameId': string(FRAME_ID),
+        'nodes': {
+            'parentIndex': parent_index,
+            'nodeType': node_type,
+            'nodeName': node_name,
+            'nodeValue': node_value,
+            'backendNodeId': [i + 10 for i in range(nodes)],
+            'attributes': attributes,
+            'inputValue': input_value,
+            'isClickable': {'index': clickable},
+        },
+        'layout': layout,
+        'textBoxes': text_boxes,
+        'scrollOffsetX': 0,
+        'scrollOffsetY': 0,
+    }
+    return {'documents': [document], 'strings': list(strings)}
+
+
+def dom_document_result(nodes=20000, seed=0):
+    '''
+    Return the result of ``DOM.getDocument`` with ``depth=-1`` for a page
+    with one document.
+
+    The nodes are the same as in :func:`dom_snapshot_result`, and node IDs
+    are assigned in document order starting at 1.
+
+    :param int nodes: the number of nodes in the document
+    :param int seed: seed for the random number generator
+    '''
+    result = dom_snapshot_result(nodes, seed)
+    strings = result['strings']
+    snapshot = result['documents'][0]['nodes']
+    json_nodes = list()
+    for index in range(nodes):
+        name = strings[snapshot['nodeName'][index]]
+        node = {
+            'nodeId': index + 1,
+            'backendNodeId': snapshot['backendNodeId'][index],
+            'nodeType': snapshot['nodeType'][index],
+            'nodeName': name,
+            'localName': name.lower() if snapshot['nodeType'][index] == 1
+                else '',
+            'nodeValue': strings[snapshot['nodeValue'][index]],
+        }
+        if node['nodeType'] != 3:
+            node['childNodeCount'] = 0
+            node['children'] = list()
+        if node['nodeType'] == 1:
+            node['attributes'] = [strings[i]
+                for i in snapshot['attributes'][index]]
+        parent = snapshot['parentIndex'][index]
+        if parent >= 0:
+            node['parentId'] = parent + 1
+            json_nodes[parent]['children'].append(node)
+            json_nodes[parent]['childNodeCount'] += 1
+        json_nodes.append(node)
+    json_nodes[0]['documentURL'] = 'https://www.example.com/'
+    json_nodes[0]['baseURL'] = 'https://www.example.com/'
+    return {'root': json_nodes[0]}
@@ -3,49 +3,265 @@
 # This file is generated from the CDP specification. If you need to make
 # changes, edit the generator and regenerate all of the modules.
 
+import importlib
+import typing
+
 import cdp.util
 
-import cdp.accessibility
-import cdp.animation
-import cdp.application_cache
-import cdp.audits
-import cdp.background_service
-import cdp.browser
-import cdp.css
-import cdp.cache_storage
-import cdp.cast
-import cdp.console
-import cdp.dom
-import cdp.dom_debugger
-import cdp.dom_snapshot
-import cdp.dom_storage
-import cdp.database
-import cdp.debugger
-import cdp.device_orientation
-import cdp.emulation
-import cdp.fetch
-import cdp.headless_experimental
-import cdp.heap_profiler
-import cdp.io
-import cdp.indexed_db
-import cdp.input_
-import cdp.inspector
-import cdp.layer_tree
-import cdp.log
-import cdp.memory
-import cdp.network
-import cdp.overlay
-import cdp.page
-import cdp.performance
-import cdp.profiler
-import cdp.runtime
-import cdp.schema
-import cdp.security
-import cdp.service_worker
-import cdp.storage
-import cdp.system_info
-import cdp.target
-import cdp.tethering
-import cdp.tracing
-import cdp.web_audio
-import cdp.web_authn
+if typing.TYPE_CHECKING:
+    from . import accessibility
+    from . import animation
+    from . import application_cache
+    from . import audits
+    from . import background_service
+    from . import browser
+    from . import css
+    from . import cache_storage
+    from . import cast
+    from . import console
+    from . import dom
+    from . import dom_debugger
+    from . import dom_snapshot
+    from . import dom_storage
+    from . import database
+    from . import debugger
+    from . import device_orientation
+    from . import emulation
+    from . import fetch
+    from . import headless_experimental
+    from . import heap_profiler
+    from . import io
+    from . import indexed_db
+    from . import input_
+    from . import inspector
+    from . import layer_tree
+    from . import log
+    from . import memory
+    from . import network
+    from . import overlay
+    from . import page
+    from . import performance
+    from . import profiler
+    from . import runtime
+    from . import schema
+    from . import security
+    from . import service_worker
+    from . import storage
+    from . import system_info
+    from . import target
+    from . import tethering
+    from . import tracing
+    from . import web_audio
+    from . import web_authn
+
+
+#: Maps each CDP domain name to the name of its Python module.
+_domain_modules = {
+    'Accessibility': 'accessibility',
+    'Animation': 'animation',
+    'ApplicationCache': 'application_cache',
+    'Audits': 'audits',
+    'BackgroundService': 'background_service',
+    'Browser': 'browser',
+    'CSS': 'css',
+    'CacheStorage': 'cache_storage',
+    'Cast': 'cast',
+    'Console': 'console',
+    'DOM': 'dom',
+    'DOMDebugger': 'dom_debugger',
+    'DOMSnapshot': 'dom_snapshot',
+    'DOMStorage': 'dom_storage',
+    'Database': 'database',
+    'Debugger': 'debugger',
+    'DeviceOrientation': 'device_orientation',
+    'Emulation': 'emulation',
+    'Fetch': 'fetch',
+    'HeadlessExperimental': 'headless_experimental',
+    'HeapProfiler': 'heap_profiler',
+    'IO': 'io',
+    'IndexedDB': 'indexed_db',
+    'Input': 'input_',
+    'Inspector': 'inspector',
+    'LayerTree': 'layer_tree',
+    'Log': 'log',
+    'Memory': 'memory',
+    'Network': 'network',
+    'Overlay': 'overlay',
+    'Page': 'page',
+    'Performance': 'performance',
+    'Profiler': 'profiler',
+    'Runtime': 'runtime',
+    'Schema': 'schema',
+    'Security': 'security',
+    'ServiceWorker': 'service_worker',
+    'Storage': 'storage',
+    'SystemInfo': 'system_info',
+    'Target': 'target',
+    'Tethering': 'tethering',
+    'Tracing': 'tracing',
+    'WebAudio': 'web_audio',
+    'WebAuthn': 'web_authn',
+}
+
+#: Maps each CDP event name to the module and class that implement it.
+_event_classes = {
+    'Animation.animationCanceled': ('animation', 'AnimationCanceled'),
+    'Animation.animationCreated': ('animation', 'AnimationCreated'),
+    'Animation.animationStarted': ('animation', 'AnimationStarted'),
+    'ApplicationCache.applicationCacheStatusUpdated': ('application_cache', 'ApplicationCacheStatusUpdated'),
+    'ApplicationCache.networkStateUpdated': ('application_cache', 'NetworkStateUpdated'),
+    'BackgroundService.recordingStateChanged': ('background_service', 'RecordingStateChanged'),
+    'BackgroundService.backgroundServiceEventReceived': ('background_service', 'BackgroundServiceEventReceived'),
+    'CSS.fontsUpdated': ('css', 'FontsUpdated'),
+    'CSS.mediaQueryResultChanged': ('css', 'MediaQueryResultChanged'),
+    'CSS.styleSheetAdded': ('css', 'StyleSheetAdded'),
+    'CSS.styleSheetChanged': ('css', 'StyleSheetChanged'),
+    'CSS.styleSheetRemoved': ('css', 'StyleSheetRemoved'),
+    'Cast.sinksUpdated': ('cast', 'SinksUpdated'),
+    'Cast.issueUpdated': ('cast', 'IssueUpdated'),
+    'Console.messageAdded': ('console', 'MessageAdded'),
+    'DOM.attributeModified': ('dom', 'AttributeModified'),
+    'DOM.attributeRemoved': ('dom', 'AttributeRemoved'),
+    'DOM.characterDataModified': ('dom', 'CharacterDataModified'),
+    'DOM.childNodeCountUpdated': ('dom', 'ChildNodeCountUpdated'),
+    'DOM.childNodeInserted': ('dom', 'ChildNodeInserted'),
+    'DOM.childNodeRemoved': ('dom', 'ChildNodeRemoved'),
+    'DOM.distributedNodesUpdated': ('dom', 'DistributedNodesUpdated'),
+    'DOM.documentUpdated': ('dom', 'DocumentUpdated'),
+    'DOM.inlineStyleInvalidated': ('dom', 'InlineStyleInvalidated'),
+    'DOM.pseudoElementAdded': ('dom', 'PseudoElementAdded'),
+    'DOM.pseudoElementRemoved': ('dom', 'PseudoElementRemoved'),
+    'DOM.setChildNodes': ('dom', 'SetChildNodes'),
+    'DOM.shadowRootPopped': ('dom', 'ShadowRootPopped'),
+    'DOM.shadowRootPushed': ('dom', 'ShadowRootPushed'),
+    'DOMStorage.domStorageItemAdded': ('dom_storage', 'DomStorageItemAdded'),
+    'DOMStorage.domStorageItemRemoved': ('dom_storage', 'DomStorageItemRemoved'),
+    'DOMStorage.domStorageItemUpdated': ('dom_storage', 'DomStorageItemUpdated'),
+    'DOMStorage.domStorageItemsCleared': ('dom_storage', 'DomStorageItemsCleared'),
+    'Database.addDatabase': ('database', 'AddDatabase'),
+    'Debugger.breakpointResolved': ('debugger', 'BreakpointResolved'),
+    'Debugger.paused': ('debugger', 'Paused'),
+    'Debugger.resumed': ('debugger', 'Resumed'),
+    'Debugger.scriptFailedToParse': ('debugger', 'ScriptFailedToParse'),
+    'Debugger.scriptParsed': ('debugger', 'ScriptParsed'),
+    'Emulation.virtualTimeBudgetExpired': ('emulation', 'VirtualTimeBudgetExpired'),
+    'Fetch.requestPaused': ('fetch', 'RequestPaused'),
+    'Fetch.authRequired': ('fetch', 'AuthRequired'),
+    'HeadlessExperimental.needsBeginFramesChanged': ('headless_experimental', 'NeedsBeginFramesChanged'),
+    'HeapProfiler.addHeapSnapshotChunk': ('heap_profiler', 'AddHeapSnapshotChunk'),
+    'HeapProfiler.heapStatsUpdate': ('heap_profiler', 'HeapStatsUpdate'),
+    'HeapProfiler.lastSeenObjectId': ('heap_profiler', 'LastSeenObjectId'),
+    'HeapProfiler.reportHeapSnapshotProgress': ('heap_profiler', 'ReportHeapSnapshotProgress'),
+    'HeapProfiler.resetProfiles': ('heap_profiler', 'ResetProfiles'),
+    'Inspector.detached': ('inspector', 'Detached'),
+    'Inspector.targetCrashed': ('inspector', 'TargetCrashed'),
+    'Inspector.targetReloadedAfterCrash': ('inspector', 'TargetReloadedAfterCrash'),
+    'LayerTree.layerPainted': ('layer_tree', 'LayerPainted'),
+    'LayerTree.layerTreeDidChange': ('layer_tree', 'LayerTreeDidChange'),
+    'Log.entryAdded': ('log', 'EntryAdded'),
+    'Network.dataReceived': ('network', 'DataReceived'),
+    'Network.eventSourceMessageReceived': ('network', 'EventSourceMessageReceived'),
+    'Network.loadingFailed': ('network', 'LoadingFailed'),
+    'Network.loadingFinished': ('network', 'LoadingFinished'),
+    'Network.requestIntercepted': ('network', 'RequestIntercepted'),
+    'Network.requestServedFromCache': ('network', 'RequestServedFromCache'),
+    'Network.requestWillBeSent': ('network', 'RequestWillBeSent'),
+    'Network.resourceChangedPriority': ('network', 'ResourceChangedPriority'),
+    'Network.signedExchangeReceived': ('network', 'SignedExchangeReceived'),
+    'Network.responseReceived': ('network', 'ResponseReceived'),
+    'Network.webSocketClosed': ('network', 'WebSocketClosed'),
+    'Network.webSocketCreated': ('network', 'WebSocketCreated'),
+    'Network.webSocketFrameError': ('network', 'WebSocketFrameError'),
+    'Network.webSocketFrameReceived': ('network', 'WebSocketFrameReceived'),
+    'Network.webSocketFrameSent': ('network', 'WebSocketFrameSent'),
+    'Network.webSocketHandshakeResponseReceived': ('network', 'WebSocketHandshakeResponseReceived'),
+    'Network.webSocketWillSendHandshakeRequest': ('network', 'WebSocketWillSendHandshakeRequest'),
+    'Network.requestWillBeSentExtraInfo': ('network', 'RequestWillBeSentExtraInfo'),
+    'Network.responseReceivedExtraInfo': ('network', 'ResponseReceivedExtraInfo'),
+    'Overlay.inspectNodeRequested': ('overlay', 'InspectNodeRequested'),
+    'Overlay.nodeHighlightRequested': ('overlay', 'NodeHighlightRequested'),
+    'Overlay.screenshotRequested': ('overlay', 'ScreenshotRequested'),
+    'Overlay.inspectModeCanceled': ('overlay', 'InspectModeCanceled'),
+    'Page.domContentEventFired': ('page', 'DomContentEventFired'),
+    'Page.fileChooserOpened': ('page', 'FileChooserOpened'),
+    'Page.frameAttached': ('page', 'FrameAttached'),
+    'Page.frameClearedScheduledNavigation': ('page', 'FrameClearedScheduledNavigation'),
+    'Page.frameDetached': ('page', 'FrameDetached'),
+    'Page.frameNavigated': ('page', 'FrameNavigated'),
+    'Page.frameResized': ('page', 'FrameResized'),
+    'Page.frameRequestedNavigation': ('page', 'FrameRequestedNavigation'),
+    'Page.frameScheduledNavigation': ('page', 'FrameScheduledNavigation'),
+    'Page.frameStartedLoading': ('page', 'FrameStartedLoading'),
+    'Page.frameStoppedLoading': ('page', 'FrameStoppedLoading'),
+    'Page.downloadWillBegin': ('page', 'DownloadWillBegin'),
+    'Page.interstitialHidden': ('page', 'InterstitialHidden'),
+    'Page.interstitialShown': ('page', 'InterstitialShown'),
+    'Page.javascriptDialogClosed': ('page', 'JavascriptDialogClosed'),
+    'Page.javascriptDialogOpening': ('page', 'JavascriptDialogOpening'),
+    'Page.lifecycleEvent': ('page', 'LifecycleEvent'),
+    'Page.loadEventFired': ('page', 'LoadEventFired'),
+    'Page.navigatedWithinDocument': ('page', 'NavigatedWithinDocument'),
+    'Page.screencastFrame': ('page', 'ScreencastFrame'),
+    'Page.screencastVisibilityChanged': ('page', 'ScreencastVisibilityChanged'),
+    'Page.windowOpen': ('page', 'WindowOpen'),
+    'Page.compilationCacheProduced': ('page', 'CompilationCacheProduced'),
+    'Performance.metrics': ('performance', 'Metrics'),
+    'Profiler.consoleProfileFinished': ('profiler', 'ConsoleProfileFinished'),
+    'Profiler.consoleProfileStarted': ('profiler', 'ConsoleProfileStarted'),
+    'Runtime.bindingCalled': ('runtime', 'BindingCalled'),
+    'Runtime.consoleAPICalled': ('runtime', 'ConsoleAPICalled'),
+    'Runtime.exceptionRevoked': ('runtime', 'ExceptionRevoked'),
+    'Runtime.exceptionThrown': ('runtime', 'ExceptionThrown'),
+    'Runtime.executionContextCreated': ('runtime', 'ExecutionContextCreated'),
+    'Runtime.executionContextDestroyed': ('runtime', 'ExecutionContextDestroyed'),
+    'Runtime.executionContextsCleared': ('runtime', 'ExecutionContextsCleared'),
+    'Runtime.inspectRequested': ('runtime', 'InspectRequested'),
+    'Security.certificateError': ('security', 'CertificateError'),
+    'Security.securityStateChanged': ('security', 'SecurityStateChanged'),
+    'ServiceWorker.workerErrorReported': ('service_worker', 'WorkerErrorReported'),
+    'ServiceWorker.workerRegistrationUpdated': ('service_worker', 'WorkerRegistrationUpdated'),
+    'ServiceWorker.workerVersionUpdated': ('service_worker', 'WorkerVersionUpdated'),
+    'Storage.cacheStorageContentUpdated': ('storage', 'CacheStorageContentUpdated'),
+    'Storage.cacheStorageListUpdated': ('storage', 'CacheStorageListUpdated'),
+    'Storage.indexedDBContentUpdated': ('storage', 'IndexedDBContentUpdated'),
+    'Storage.indexedDBListUpdated': ('storage', 'IndexedDBListUpdated'),
+    'Target.attachedToTarget': ('target', 'AttachedToTarget'),
+    'Target.detachedFromTarget': ('target', 'DetachedFromTarget'),
+    'Target.receivedMessageFromTarget': ('target', 'ReceivedMessageFromTarget'),
+    'Target.targetCreated': ('target', 'TargetCreated'),
+    'Target.targetDestroyed': ('target', 'TargetDestroyed'),
+    'Target.targetCrashed': ('target', 'TargetCrashed'),
+    'Target.targetInfoChanged': ('target', 'TargetInfoChanged'),
+    'Tethering.accepted': ('tethering', 'Accepted'),
+    'Tracing.bufferUsage': ('tracing', 'BufferUsage'),
+    'Tracing.dataCollected': ('tracing', 'DataCollected'),
+    'Tracing.tracingComplete': ('tracing', 'TracingComplete'),
+    'WebAudio.contextCreated': ('web_audio', 'ContextCreated'),
+    'WebAudio.contextDestroyed': ('web_audio', 'ContextDestroyed'),
+    'WebAudio.contextChanged': ('web_audio', 'ContextChanged'),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    '''
+    Import a domain module the first time it is accessed as an attribute of
+    this package, e.g. ``cdp.network``.
+    '''
+    if name in _domain_modules.values():
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_domain_modules.values()))
+
+
+def import_all() -> None:
+    '''
+    Import every domain module.
+
+    Domain modules are normally imported lazily. Call this function to import
+    all of them up front, for example before forking worker processes.
+    '''
+    for module in _domain_modules.values():
+        importlib.import_module(f'{__name__}.{module}')
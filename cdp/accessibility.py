@@ -6,7 +6,7 @@
 # CDP domain: Accessibility (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -57,7 +57,14 @@ class AXValueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class AXValueSourceType(enum.Enum):
@@ -76,7 +83,14 @@ class AXValueSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class AXValueNativeSourceType(enum.Enum):
@@ -97,9 +111,17 @@ class AXValueNativeSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueNativeSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class AXValueSource:
     '''
@@ -158,16 +180,17 @@ class AXValueSource:
         return cls(
             type_=AXValueSourceType.from_json(json['type']),
             value=AXValue.from_json(json['value']) if 'value' in json else None,
-            attribute=str(json['attribute']) if 'attribute' in json else None,
+            attribute=json.get('attribute'),
             attribute_value=AXValue.from_json(json['attributeValue']) if 'attributeValue' in json else None,
-            superseded=bool(json['superseded']) if 'superseded' in json else None,
+            superseded=json.get('superseded'),
             native_source=AXValueNativeSourceType.from_json(json['nativeSource']) if 'nativeSource' in json else None,
             native_source_value=AXValue.from_json(json['nativeSourceValue']) if 'nativeSourceValue' in json else None,
-            invalid=bool(json['invalid']) if 'invalid' in json else None,
-            invalid_reason=str(json['invalidReason']) if 'invalidReason' in json else None,
+            invalid=json.get('invalid'),
+            invalid_reason=json.get('invalidReason'),
         )
 
 
+@add_slots
 @dataclass
 class AXRelatedNode:
     #: The BackendNodeId of the related DOM node.
@@ -191,12 +214,13 @@ class AXRelatedNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXRelatedNode:
         return cls(
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']),
-            idref=str(json['idref']) if 'idref' in json else None,
-            text=str(json['text']) if 'text' in json else None,
+            backend_dom_node_id=dom.BackendNodeId(json['backendDOMNodeId']),
+            idref=json.get('idref'),
+            text=json.get('text'),
         )
 
 
+@add_slots
 @dataclass
 class AXProperty:
     #: The name of this property.
@@ -219,6 +243,7 @@ class AXProperty:
         )
 
 
+@add_slots
 @dataclass
 class AXValue:
     '''
@@ -251,7 +276,7 @@ class AXValue:
     def from_json(cls, json: T_JSON_DICT) -> AXValue:
         return cls(
             type_=AXValueType.from_json(json['type']),
-            value=json['value'] if 'value' in json else None,
+            value=json.get('value'),
             related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if 'relatedNodes' in json else None,
             sources=[AXValueSource.from_json(i) for i in json['sources']] if 'sources' in json else None,
         )
@@ -311,9 +336,17 @@ class AXPropertyName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXPropertyName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class AXNode:
     '''
@@ -374,16 +407,16 @@ class AXNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXNode:
         return cls(
-            node_id=AXNodeId.from_json(json['nodeId']),
-            ignored=bool(json['ignored']),
+            node_id=AXNodeId(json['nodeId']),
+            ignored=json['ignored'],
             ignored_reasons=[AXProperty.from_json(i) for i in json['ignoredReasons']] if 'ignoredReasons' in json else None,
             role=AXValue.from_json(json['role']) if 'role' in json else None,
             name=AXValue.from_json(json['name']) if 'name' in json else None,
             description=AXValue.from_json(json['description']) if 'description' in json else None,
             value=AXValue.from_json(json['value']) if 'value' in json else None,
             properties=[AXProperty.from_json(i) for i in json['properties']] if 'properties' in json else None,
-            child_ids=[AXNodeId.from_json(i) for i in json['childIds']] if 'childIds' in json else None,
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']) if 'backendDOMNodeId' in json else None,
+            child_ids=[AXNodeId(i) for i in json['childIds']] if 'childIds' in json else None,
+            backend_dom_node_id=dom.BackendNodeId(json['backendDOMNodeId']) if 'backendDOMNodeId' in json else None,
         )
 
 
@@ -6,7 +6,7 @@
 # CDP domain: Animation (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -15,6 +15,7 @@ from . import dom
 from . import runtime
 
 
+@add_slots
 @dataclass
 class Animation:
     '''
@@ -70,19 +71,20 @@ class Animation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Animation:
         return cls(
-            id_=str(json['id']),
-            name=str(json['name']),
-            paused_state=bool(json['pausedState']),
-            play_state=str(json['playState']),
+            id_=json['id'],
+            name=json['name'],
+            paused_state=json['pausedState'],
+            play_state=json['playState'],
             playback_rate=float(json['playbackRate']),
             start_time=float(json['startTime']),
             current_time=float(json['currentTime']),
-            type_=str(json['type']),
+            type_=json['type'],
             source=AnimationEffect.from_json(json['source']) if 'source' in json else None,
-            css_id=str(json['cssId']) if 'cssId' in json else None,
+            css_id=json.get('cssId'),
         )
 
 
+@add_slots
 @dataclass
 class AnimationEffect:
     '''
@@ -142,14 +144,15 @@ class AnimationEffect:
             iteration_start=float(json['iterationStart']),
             iterations=float(json['iterations']),
             duration=float(json['duration']),
-            direction=str(json['direction']),
-            fill=str(json['fill']),
-            easing=str(json['easing']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if 'backendNodeId' in json else None,
+            direction=json['direction'],
+            fill=json['fill'],
+            easing=json['easing'],
+            backend_node_id=dom.BackendNodeId(json['backendNodeId']) if 'backendNodeId' in json else None,
             keyframes_rule=KeyframesRule.from_json(json['keyframesRule']) if 'keyframesRule' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class KeyframesRule:
     '''
@@ -172,10 +175,11 @@ class KeyframesRule:
     def from_json(cls, json: T_JSON_DICT) -> KeyframesRule:
         return cls(
             keyframes=[KeyframeStyle.from_json(i) for i in json['keyframes']],
-            name=str(json['name']) if 'name' in json else None,
+            name=json.get('name'),
         )
 
 
+@add_slots
 @dataclass
 class KeyframeStyle:
     '''
@@ -196,8 +200,8 @@ class KeyframeStyle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframeStyle:
         return cls(
-            offset=str(json['offset']),
-            easing=str(json['easing']),
+            offset=json['offset'],
+            easing=json['easing'],
         )
 
 
@@ -370,6 +374,7 @@ def set_timing(
 
 
 @event_class('Animation.animationCanceled')
+@add_slots
 @dataclass
 class AnimationCanceled:
     '''
@@ -378,14 +383,17 @@ class AnimationCanceled:
     #: Id of the animation that was cancelled.
     id_: str
 
+    _json_names = ('id',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCanceled:
         return cls(
-            id_=str(json['id'])
+            id_=json['id']
         )
 
 
 @event_class('Animation.animationCreated')
+@add_slots
 @dataclass
 class AnimationCreated:
     '''
@@ -394,14 +402,17 @@ class AnimationCreated:
     #: Id of the animation that was created.
     id_: str
 
+    _json_names = ('id',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCreated:
         return cls(
-            id_=str(json['id'])
+            id_=json['id']
         )
 
 
 @event_class('Animation.animationStarted')
+@add_slots
 @dataclass
 class AnimationStarted:
     '''
@@ -410,6 +421,8 @@ class AnimationStarted:
     #: Animation that was started.
     animation: Animation
 
+    _json_names = ('animation',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationStarted:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: ApplicationCache (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -14,6 +14,7 @@ import typing
 from . import page
 
 
+@add_slots
 @dataclass
 class ApplicationCacheResource:
     '''
@@ -38,12 +39,13 @@ class ApplicationCacheResource:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ApplicationCacheResource:
         return cls(
-            url=str(json['url']),
-            size=int(json['size']),
-            type_=str(json['type']),
+            url=json['url'],
+            size=json['size'],
+            type_=json['type'],
         )
 
 
+@add_slots
 @dataclass
 class ApplicationCache:
     '''
@@ -76,7 +78,7 @@ class ApplicationCache:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ApplicationCache:
         return cls(
-            manifest_url=str(json['manifestURL']),
+            manifest_url=json['manifestURL'],
             size=float(json['size']),
             creation_time=float(json['creationTime']),
             update_time=float(json['updateTime']),
@@ -84,6 +86,7 @@ class ApplicationCache:
         )
 
 
+@add_slots
 @dataclass
 class FrameWithManifest:
     '''
@@ -108,9 +111,9 @@ class FrameWithManifest:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameWithManifest:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            manifest_url=str(json['manifestURL']),
-            status=int(json['status']),
+            frame_id=page.FrameId(json['frameId']),
+            manifest_url=json['manifestURL'],
+            status=json['status'],
         )
 
 
@@ -173,10 +176,11 @@ def get_manifest_for_frame(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['manifestURL'])
+    return json['manifestURL']
 
 
 @event_class('ApplicationCache.applicationCacheStatusUpdated')
+@add_slots
 @dataclass
 class ApplicationCacheStatusUpdated:
     #: Identifier of the frame containing document whose application cache updated status.
@@ -186,22 +190,27 @@ class ApplicationCacheStatusUpdated:
     #: Updated application cache status.
     status: int
 
+    _json_names = ('frameId', 'manifestURL', 'status')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ApplicationCacheStatusUpdated:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            manifest_url=str(json['manifestURL']),
-            status=int(json['status'])
+            frame_id=page.FrameId(json['frameId']),
+            manifest_url=json['manifestURL'],
+            status=json['status']
         )
 
 
 @event_class('ApplicationCache.networkStateUpdated')
+@add_slots
 @dataclass
 class NetworkStateUpdated:
     is_now_online: bool
 
+    _json_names = ('isNowOnline',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NetworkStateUpdated:
         return cls(
-            is_now_online=bool(json['isNowOnline'])
+            is_now_online=json['isNowOnline']
         )
@@ -6,7 +6,7 @@
 # CDP domain: Audits (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -47,7 +47,7 @@ def get_encoded_response(
     }
     json = yield cmd_dict
     return (
-        str(json['body']) if 'body' in json else None,
-        int(json['originalSize']),
-        int(json['encodedSize'])
+        json.get('body'),
+        json['originalSize'],
+        json['encodedSize']
     )
@@ -6,7 +6,7 @@
 # CDP domain: BackgroundService (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -32,9 +32,17 @@ class ServiceName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class EventMetadata:
     '''
@@ -53,11 +61,12 @@ class EventMetadata:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventMetadata:
         return cls(
-            key=str(json['key']),
-            value=str(json['value']),
+            key=json['key'],
+            value=json['value'],
         )
 
 
+@add_slots
 @dataclass
 class BackgroundServiceEvent:
     #: Timestamp of the event (in seconds).
@@ -95,12 +104,12 @@ class BackgroundServiceEvent:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEvent:
         return cls(
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']),
-            origin=str(json['origin']),
-            service_worker_registration_id=service_worker.RegistrationID.from_json(json['serviceWorkerRegistrationId']),
+            timestamp=network.TimeSinceEpoch(json['timestamp']),
+            origin=json['origin'],
+            service_worker_registration_id=service_worker.RegistrationID(json['serviceWorkerRegistrationId']),
             service=ServiceName.from_json(json['service']),
-            event_name=str(json['eventName']),
-            instance_id=str(json['instanceId']),
+            event_name=json['eventName'],
+            instance_id=json['instanceId'],
             event_metadata=[EventMetadata.from_json(i) for i in json['eventMetadata']],
         )
 
@@ -177,6 +186,7 @@ def clear_events(
 
 
 @event_class('BackgroundService.recordingStateChanged')
+@add_slots
 @dataclass
 class RecordingStateChanged:
     '''
@@ -185,15 +195,18 @@ class RecordingStateChanged:
     is_recording: bool
     service: ServiceName
 
+    _json_names = ('isRecording', 'service')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
         return cls(
-            is_recording=bool(json['isRecording']),
+            is_recording=json['isRecording'],
             service=ServiceName.from_json(json['service'])
         )
 
 
 @event_class('BackgroundService.backgroundServiceEventReceived')
+@add_slots
 @dataclass
 class BackgroundServiceEventReceived:
     '''
@@ -202,6 +215,8 @@ class BackgroundServiceEventReceived:
     '''
     background_service_event: BackgroundServiceEvent
 
+    _json_names = ('backgroundServiceEvent',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEventReceived:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: Browser
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -40,9 +40,17 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class Bounds:
     '''
@@ -80,10 +88,10 @@ class Bounds:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bounds:
         return cls(
-            left=int(json['left']) if 'left' in json else None,
-            top=int(json['top']) if 'top' in json else None,
-            width=int(json['width']) if 'width' in json else None,
-            height=int(json['height']) if 'height' in json else None,
+            left=json.get('left'),
+            top=json.get('top'),
+            width=json.get('width'),
+            height=json.get('height'),
             window_state=WindowState.from_json(json['windowState']) if 'windowState' in json else None,
         )
 
@@ -115,9 +123,17 @@ class PermissionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class Bucket:
     '''
@@ -142,12 +158,13 @@ class Bucket:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bucket:
         return cls(
-            low=int(json['low']),
-            high=int(json['high']),
-            count=int(json['count']),
+            low=json['low'],
+            high=json['high'],
+            count=json['count'],
         )
 
 
+@add_slots
 @dataclass
 class Histogram:
     '''
@@ -176,9 +193,9 @@ class Histogram:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Histogram:
         return cls(
-            name=str(json['name']),
-            sum_=int(json['sum']),
-            count=int(json['count']),
+            name=json['name'],
+            sum_=json['sum'],
+            count=json['count'],
             buckets=[Bucket.from_json(i) for i in json['buckets']],
         )
 
@@ -280,11 +297,11 @@ def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str,
     }
     json = yield cmd_dict
     return (
-        str(json['protocolVersion']),
-        str(json['product']),
-        str(json['revision']),
-        str(json['userAgent']),
-        str(json['jsVersion'])
+        json['protocolVersion'],
+        json['product'],
+        json['revision'],
+        json['userAgent'],
+        json['jsVersion']
     )
 
 
@@ -301,7 +318,7 @@ def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
         'method': 'Browser.getBrowserCommandLine',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['arguments']]
+    return json['arguments']
 
 
 def get_histograms(
@@ -399,7 +416,7 @@ def get_window_for_target(
     }
     json = yield cmd_dict
     return (
-        WindowID.from_json(json['windowId']),
+        WindowID(json['windowId']),
         Bounds.from_json(json['bounds'])
     )
 
@@ -6,7 +6,7 @@
 # CDP domain: CacheStorage (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -43,9 +43,17 @@ class CachedResponseType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CachedResponseType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class DataEntry:
     '''
@@ -90,17 +98,18 @@ class DataEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataEntry:
         return cls(
-            request_url=str(json['requestURL']),
-            request_method=str(json['requestMethod']),
+            request_url=json['requestURL'],
+            request_method=json['requestMethod'],
             request_headers=[Header.from_json(i) for i in json['requestHeaders']],
             response_time=float(json['responseTime']),
-            response_status=int(json['responseStatus']),
-            response_status_text=str(json['responseStatusText']),
+            response_status=json['responseStatus'],
+            response_status_text=json['responseStatusText'],
             response_type=CachedResponseType.from_json(json['responseType']),
             response_headers=[Header.from_json(i) for i in json['responseHeaders']],
         )
 
 
+@add_slots
 @dataclass
 class Cache:
     '''
@@ -125,12 +134,13 @@ class Cache:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cache:
         return cls(
-            cache_id=CacheId.from_json(json['cacheId']),
-            security_origin=str(json['securityOrigin']),
-            cache_name=str(json['cacheName']),
+            cache_id=CacheId(json['cacheId']),
+            security_origin=json['securityOrigin'],
+            cache_name=json['cacheName'],
         )
 
 
+@add_slots
 @dataclass
 class Header:
     name: str
@@ -146,11 +156,12 @@ class Header:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Header:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
+@add_slots
 @dataclass
 class CachedResponse:
     '''
@@ -167,7 +178,7 @@ class CachedResponse:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResponse:
         return cls(
-            body=str(json['body']),
+            body=json['body'],
         )
 
 
@@ -6,12 +6,13 @@
 # CDP domain: Cast (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class Sink:
     name: str
@@ -33,9 +34,9 @@ class Sink:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Sink:
         return cls(
-            name=str(json['name']),
-            id_=str(json['id']),
-            session=str(json['session']) if 'session' in json else None,
+            name=json['name'],
+            id_=json['id'],
+            session=json.get('session'),
         )
 
 
@@ -124,6 +125,7 @@ def stop_casting(
 
 
 @event_class('Cast.sinksUpdated')
+@add_slots
 @dataclass
 class SinksUpdated:
     '''
@@ -132,6 +134,8 @@ class SinksUpdated:
     '''
     sinks: typing.List[Sink]
 
+    _json_names = ('sinks',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SinksUpdated:
         return cls(
@@ -140,6 +144,7 @@ class SinksUpdated:
 
 
 @event_class('Cast.issueUpdated')
+@add_slots
 @dataclass
 class IssueUpdated:
     '''
@@ -148,8 +153,10 @@ class IssueUpdated:
     '''
     issue_message: str
 
+    _json_names = ('issueMessage',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IssueUpdated:
         return cls(
-            issue_message=str(json['issueMessage'])
+            issue_message=json['issueMessage']
         )
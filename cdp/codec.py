@@ -0,0 +1,181 @@
+'''
+JSON codecs for the boundary between CDP messages and the wire.
+
+This library doesn't do any I/O, but whoever does has to decode each WebSocket
+frame into JSON before it can be parsed. The standard library's ``json`` module
+is always available, and faster third party codecs (``orjson``, ``msgspec``,
+``ujson``) are used if they are installed and requested. All codecs accept
+``bytes`` as well as ``str``, so a frame doesn't need to be decoded to a string
+first.
+
+.. code-block:: python
+
+    codec = get_codec('auto')
+    message = parse_message(frame, codec)
+    if isinstance(message, Response):
+        ...
+    else:
+        ...  # message is an event object
+'''
+from dataclasses import dataclass
+import importlib
+import json
+import typing
+
+from cdp.util import parse_json_event, T_JSON_DICT
+
+
+T_DATA = typing.Union[bytes, str]
+
+
+@dataclass(frozen=True)
+class Codec:
+    ''' A JSON codec. '''
+    #: The name of the codec, e.g. ``orjson``.
+    name: str
+
+    #: Decode ``bytes`` or ``str`` into a JSON object.
+    loads: typing.Callable[[T_DATA], typing.Any]
+
+    #: Encode a JSON object as UTF-8 ``bytes``.
+    dumps: typing.Callable[[typing.Any], bytes]
+
+
+def _json_codec() -> Codec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    def dumps(obj):
+        return encoder.encode(obj).encode('utf8')
+    return Codec('json', json.loads, dumps)
+
+
+def _orjson_codec() -> Codec:
+    orjson = importlib.import_module('orjson')
+    return Codec('orjson', orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> Codec:
+    msgspec_json = importlib.import_module('msgspec.json')
+    return Codec('msgspec', msgspec_json.decode, msgspec_json.encode)
+
+
+def _ujson_codec() -> Codec:
+    ujson = importlib.import_module('ujson')
+    def dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf8')
+    return Codec('ujson', ujson.loads, dumps)
+
+
+# The codecs in order of preference for ``get_codec('auto')``.
+_codec_factories = {
+    'orjson': _orjson_codec,
+    'msgspec': _msgspec_codec,
+    'ujson': _ujson_codec,
+    'json': _json_codec,
+}
+_codecs: typing.Dict[str, Codec] = dict()
+_default_codec = 'json'
+
+
+def get_codec(name: typing.Optional[str] = None) -> Codec:
+    '''
+    Return a codec.
+
+    :param name: the name of a codec (``json``, ``orjson``, ``msgspec`` or
+        ``ujson``), or ``auto`` for the fastest codec that is installed. If
+        omitted, the default codec is returned, see :func:`set_default_codec`.
+    :raises ValueError: if there is no codec with that name
+    :raises ImportError: if the codec's package is not installed
+    '''
+    if name is None:
+        name = _default_codec
+    elif name == 'auto':
+        name = available_codecs()[0]
+    try:
+        return _codecs[name]
+    except KeyError:
+        pass
+    try:
+        factory = _codec_factories[name]
+    except KeyError:
+        raise ValueError(f'Unknown codec: {name!r}') from None
+    codec = factory()
+    _codecs[name] = codec
+    return codec
+
+
+def available_codecs() -> typing.List[str]:
+    ''' Return the names of the installed codecs, fastest first. '''
+    names = list()
+    for name in _codec_factories:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def set_default_codec(name: str) -> None:
+    '''
+    Set the codec that is used when no codec is specified.
+
+    The default is the standard library's ``json`` module.
+
+    :param name: a codec name, as accepted by :func:`get_codec`
+    '''
+    global _default_codec
+    _default_codec = get_codec(name).name
+
+
+@dataclass
+class Response:
+    ''' A response to a command. '''
+    #: The ID of the command.
+    id_: int
+
+    #: The result of the command, which is passed back into the command's
+    #: generator. This is ``None`` if the command failed.
+    result: typing.Optional[T_JSON_DICT] = None
+
+    #: The error that the command failed with, if any.
+    error: typing.Optional[T_JSON_DICT] = None
+
+    #: The session that the command was sent to, if any.
+    session_id: typing.Optional[str] = None
+
+
+def parse_message(data: T_DATA, codec: typing.Optional[Codec] = None,
+        lazy: bool = False) -> typing.Any:
+    '''
+    Decode a raw message from the browser.
+
+    :param data: the message, e.g. a WebSocket frame
+    :param codec: the codec to decode the message with, or the default codec
+    :param lazy: if true, events are returned as lazy events, see
+        :func:`cdp.util.lazy_event_class`
+    :returns: a :class:`Response` if the message is a response to a command,
+        otherwise an event object
+    '''
+    message = (codec or get_codec()).loads(data)
+    if 'method' in message:
+        return parse_json_event(message, lazy=lazy)
+    return Response(message['id'], message.get('result'), message.get('error'),
+        message.get('sessionId'))
+
+
+def encode_command(cmd_dict: T_JSON_DICT, id_: int,
+        session_id: typing.Optional[str] = None,
+        codec: typing.Optional[Codec] = None) -> bytes:
+    '''
+    Encode a command to send to the browser.
+
+    :param cmd_dict: the dictionary yielded by a command generator
+    :param id_: a unique ID for the command
+    :param session_id: the session to send the command to, if any
+    :param codec: the codec to encode the message with, or the default codec
+    '''
+    message = dict(cmd_dict)
+    message['id'] = id_
+    if session_id is not None:
+        message['sessionId'] = session_id
+    return (codec or get_codec()).dumps(message)
@@ -0,0 +1,26 @@
+'''
+An asyncio driver for the command generators in the ``cdp`` domain modules.
+
+The rest of this library doesn't do any I/O. This subpackage is optional: it
+sends commands over a :class:`Transport`, assigns message IDs, matches
+responses to commands, and delivers events to listeners. The only transport
+that needs a third party package is :class:`WebSocketTransport`, which uses
+``websockets``.
+
+.. code-block:: python
+
+    from cdp import page
+    from cdp.connection import Connection, WebSocketTransport
+
+    transport = await WebSocketTransport.connect(url)
+    async with Connection(transport) as conn:
+        await conn.execute(page.navigate('https://example.com'))
+'''
+from cdp.connection.connection import CommandError, Connection
+from cdp.connection.events import EventStream
+from cdp.connection.fake import FakeBrowser
+from cdp.connection.session import Session
+from cdp.connection.tracing import TraceRecorder
+from cdp.connection.transport import ConnectionClosed, MemoryTransport, \
+    RecordingTransport, StreamTransport, Transport, WebSocketTransport
+
@@ -0,0 +1,348 @@
+'''
+A connection that runs CDP commands and receives events over a transport.
+'''
+import asyncio
+import itertools
+from time import perf_counter
+import types
+import typing
+
+from cdp import target, util
+from cdp.codec import Codec, encode_command, get_codec
+from cdp.connection.events import EventStream, Listeners
+from cdp.connection.session import Session
+from cdp.connection.transport import ConnectionClosed, Transport
+from cdp.dispatch import QueuePolicy
+from cdp.util import T_JSON_DICT
+
+
+T = typing.TypeVar('T')
+
+
+class CommandError(Exception):
+    ''' Raised when the browser responds to a command with an error. '''
+    def __init__(self, error: T_JSON_DICT):
+        '''
+        Constructor.
+
+        :param error: the ``error`` object of the response
+        '''
+        super().__init__(error.get('message', ''))
+        #: The JSON-RPC error code, e.g. ``-32601`` for an unknown method.
+        self.code: int = error.get('code', 0)
+        #: The error message.
+        self.message: str = error.get('message', '')
+        #: Additional information about the error, if any.
+        self.data: typing.Optional[str] = error.get('data')
+
+    def __repr__(self):
+        return f'CommandError(code={self.code}, message={self.message!r})'
+
+
+class Connection:
+    '''
+    Run CDP commands and receive events over a :class:`Transport`.
+
+    Commands are the generators in the ``cdp`` domain modules. Each command is
+    assigned a message ID, and its response is matched to it by that ID, so
+    any number of commands can be in flight at once.
+
+    A connection to the browser's WebSocket is the browser session. Targets
+    that are attached with ``flatten=True`` share the connection and each get
+    a :class:`Session`, which receives the events that are tagged with its
+    session ID.
+
+    .. code-block:: python
+
+        transport = await WebSocketTransport.connect(url)
+        async with Connection(transport) as conn:
+            version = await conn.execute(cdp.browser.get_version())
+            page = await conn.attach(target_id)
+            await page.execute(cdp.page.navigate(url))
+    '''
+    def __init__(self, transport: Transport, codec: typing.Optional[Codec] =
+            None, lazy: bool = False):
+        '''
+        Constructor.
+
+        :param transport: the transport to send and receive messages on
+        :param codec: the codec that encodes and decodes messages, or the
+            default codec
+        :param lazy: if true, events are decoded as lazy events, see
+            :func:`cdp.util.lazy_event_class`
+        '''
+        self._transport = transport
+        self._codec = codec or get_codec()
+        self._lazy = lazy
+        self._ids = itertools.count()
+        self._pending: typing.Dict[int, asyncio.Future] = dict()
+        # The method, start time and size of each pending command, while
+        # instrumentation is enabled.
+        self._timings: typing.Dict[int, typing.Tuple[str, float, int]] = \
+            dict()
+        self._listeners = Listeners(lazy)
+        self._sessions: typing.Dict[str, Session] = dict()
+        self._reader: typing.Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def __aenter__(self) -> 'Connection':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        ''' True if the connection is closed. '''
+        return self._closed
+
+    def start(self) -> None:
+        ''' Start receiving messages. This must be called in a running loop. '''
+        if self._reader is None:
+            self._reader = asyncio.ensure_future(self._read_loop())
+
+    async def close(self) -> None:
+        ''' Close the connection and its transport. '''
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        self._shutdown()
+        await self._transport.close()
+
+    async def execute(self, cmd: typing.Generator[T_JSON_DICT, T_JSON_DICT, T],
+            session_id: typing.Optional[str] = None) -> T:
+        '''
+        Run a command and return its result.
+
+        :param cmd: a command generator, e.g. ``cdp.page.navigate(url)``
+        :param session_id: the session to run the command in, if any
+        :raises CommandError: if the browser responds with an error
+        :raises ConnectionClosed: if the connection is closed before the
+            command has a response
+        '''
+        if self._closed:
+            raise ConnectionClosed()
+        request = cmd.send(None)
+        id_ = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[id_] = future
+        try:
+            data = encode_command(request, id_, session_id, self._codec)
+            if util._instrumentation is not None:
+                self._timings[id_] = (request['method'], perf_counter(),
+                    len(data))
+            await self._transport.send(data)
+            result = await future
+        finally:
+            self._pending.pop(id_, None)
+            if self._timings:
+                self._timings.pop(id_, None)
+        try:
+            cmd.send(result)
+        except StopIteration as exit:
+            return exit.value
+        raise RuntimeError(f'Command generator for {request["method"]} did '
+            'not return')
+
+    async def execute_many(self, cmds: typing.Iterable[typing.Generator[
+            T_JSON_DICT, T_JSON_DICT, typing.Any]],
+            session_id: typing.Optional[str] = None) -> typing.List[
+            typing.Any]:
+        '''
+        Run many commands at once and return their results in order.
+
+        All of the commands are sent back to back before any response is
+        awaited, so the whole batch takes about one round trip instead of one
+        round trip per command.
+
+        :param cmds: command generators, e.g. ``[cdp.dom.describe_node(node_id)
+            for node_id in node_ids]``
+        :param session_id: the session to run the commands in, if any
+        :returns: a list with the result of each command, or the exception
+            that it failed with, e.g. a :class:`CommandError`,
+            :class:`ConnectionClosed` or an error from building the command
+        :raises ConnectionClosed: if the connection is closed before the
+            commands are sent
+        '''
+        if self._closed:
+            raise ConnectionClosed()
+        cmds = list(cmds)
+        loop = asyncio.get_running_loop()
+        results: typing.List[typing.Any] = [None] * len(cmds)
+        sent = list()
+        messages = list()
+        instrumented = util._instrumentation is not None
+        try:
+            for index, cmd in enumerate(cmds):
+                try:
+                    request = cmd.send(None)
+                except Exception as exc:
+                    # The command couldn't be built, e.g. a bad argument.
+                    results[index] = exc
+                    continue
+                id_ = next(self._ids)
+                future = loop.create_future()
+                self._pending[id_] = future
+                sent.append((index, id_, cmd, future))
+                data = encode_command(request, id_, session_id, self._codec)
+                messages.append(data)
+                if instrumented:
+                    self._timings[id_] = (request['method'], perf_counter(),
+                        len(data))
+            if messages:
+                await self._transport.send_many(messages)
+            # Each command's result is decoded as soon as its response
+            # arrives, rather than after the whole batch has responded.
+            responses = await asyncio.gather(*(self._finish(cmd, future)
+                for _, _, cmd, future in sent), return_exceptions=True)
+        finally:
+            for _, id_, _, _ in sent:
+                self._pending.pop(id_, None)
+            if self._timings:
+                for _, id_, _, _ in sent:
+                    self._timings.pop(id_, None)
+        for (index, _, _, _), response in zip(sent, responses):
+            results[index] = response
+        return results
+
+    @staticmethod
+    async def _finish(cmd: typing.Generator[T_JSON_DICT, T_JSON_DICT, T],
+            future: 'asyncio.Future[T_JSON_DICT]') -> T:
+        ''' Wait for a command's response and decode its result. '''
+        response = await future
+        try:
+            cmd.send(response)
+        except StopIteration as exit:
+            return exit.value
+        raise RuntimeError('Command generator did not return')
+
+    def listen(self, *events: typing.Any, policies: typing.Optional[
+            typing.Mapping[typing.Any, QueuePolicy]] = None,
+            default_policy: QueuePolicy = QueuePolicy()) -> EventStream:
+        '''
+        Return a stream of events for the browser session. Events from other
+        sessions are delivered to :meth:`Session.listen` instead.
+
+        :param events: the event names or classes to receive, e.g.
+            ``cdp.target.TargetCreated``. If none are given, all events are
+            received.
+        :param policies: bounds and overflow policies for the stream's
+            buffer, keyed by event class, event name or domain, see
+            :class:`cdp.dispatch.EventQueue`
+        :param default_policy: the policy for events that aren't in
+            ``policies``. By default, the buffer is unbounded.
+        '''
+        return self._listeners.listen(events, policies, default_policy)
+
+    @property
+    def sessions(self) -> typing.Mapping[str, Session]:
+        ''' The attached sessions, keyed by session ID. '''
+        return types.MappingProxyType(self._sessions)
+
+    async def attach(self, target_id: target.TargetID) -> Session:
+        '''
+        Attach to a target with ``flatten=True`` and return its session.
+
+        :param target_id: the target to attach to
+        '''
+        session_id = await self.execute(target.attach_to_target(target_id,
+            flatten=True))
+        # The session is usually created by the attachedToTarget event, which
+        # Chrome sends before the response.
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            return self._add_session(session_id, None, None)
+
+    def _add_session(self, session_id: target.SessionID,
+            target_info: typing.Optional[target.TargetInfo],
+            parent: typing.Optional[Session]) -> Session:
+        session = Session(self, session_id, target_info, parent, self._lazy)
+        self._sessions[session_id] = session
+        if parent is not None:
+            parent.children[session_id] = session
+        return session
+
+    def _remove_session(self, session: Session) -> None:
+        for child in list(session.children.values()):
+            self._remove_session(child)
+        self._sessions.pop(session.session_id, None)
+        if session.parent is not None:
+            session.parent.children.pop(session.session_id, None)
+        session._detach()
+
+    async def _read_loop(self) -> None:
+        loads = self._codec.loads
+        pending = self._pending
+        sessions = self._sessions
+        timings = self._timings
+        try:
+            while True:
+                data = await self._transport.recv()
+                message = loads(data)
+                instrumentation = util._instrumentation
+                if 'id' in message:
+                    if instrumentation is not None:
+                        timing = timings.pop(message['id'], None)
+                        if timing is not None:
+                            instrumentation.command_completed(timing[0],
+                                perf_counter() - timing[1], timing[2],
+                                len(data), 'error' in message)
+                    future = pending.pop(message['id'], None)
+                    if future is None or future.done():
+                        # The command was cancelled.
+                        continue
+                    if 'error' in message:
+                        future.set_exception(CommandError(message['error']))
+                    else:
+                        future.set_result(message.get('result', {}))
+                    continue
+                if instrumentation is not None:
+                    instrumentation.event_received(message['method'],
+                        len(data))
+                session_id = message.get('sessionId')
+                if session_id is None:
+                    session = None
+                    listeners = self._listeners
+                else:
+                    session = sessions.get(session_id)
+                    if session is None:
+                        # The session was detached or never attached.
+                        continue
+                    listeners = session._listeners
+                method = message['method']
+                if method == 'Target.attachedToTarget':
+                    params = message['params']
+                    self._add_session(target.SessionID(params['sessionId']),
+                        target.TargetInfo.from_json(params['targetInfo']),
+                        session)
+                blocked = listeners.dispatch(message)
+                if blocked is not None:
+                    # Stop reading until the consumers make room.
+                    for stream, event in blocked:
+                        await stream._put(method, event)
+                if method == 'Target.detachedFromTarget':
+                    detached = sessions.get(message['params']['sessionId'])
+                    if detached is not None:
+                        self._remove_session(detached)
+        except ConnectionClosed:
+            pass
+        finally:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionClosed())
+        self._pending.clear()
+        self._listeners.close()
+        for session in self._sessions.values():
+            session._detach()
+        self._sessions.clear()
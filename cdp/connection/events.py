@@ -0,0 +1,185 @@
+'''
+Deliver events that are received on a connection to listeners.
+'''
+import asyncio
+import typing
+
+from cdp.dispatch import event_method, EventQueue, QueuePolicy
+from cdp.util import get_event_class, parse_json_event, T_JSON_DICT
+
+
+class EventStream:
+    '''
+    An asynchronous iterator over events that are received on a connection or
+    session.
+
+    Use ``listen()`` on a :class:`~cdp.connection.Connection` or a
+    :class:`~cdp.connection.Session` to create one. Events are buffered from
+    the moment the stream is created, so none are missed between creating the
+    stream and iterating over it. Iteration stops when the stream is closed,
+    which happens when its connection is closed or its session is detached.
+
+    The buffer is a :class:`cdp.dispatch.EventQueue`, which is unbounded
+    unless policies are passed to ``listen()``. If the buffer is full for an
+    event whose policy is :attr:`~cdp.dispatch.Overflow.BLOCK`, the connection
+    stops reading messages until the consumer makes room, which pushes back
+    on the browser. Note that this also delays command responses and events
+    for other streams.
+    '''
+    def __init__(self, listeners: 'Listeners',
+            methods: typing.FrozenSet[str],
+            policies: typing.Optional[typing.Mapping[typing.Any,
+            QueuePolicy]] = None, default_policy: QueuePolicy = QueuePolicy()):
+        self._listeners = listeners
+        self._queue = EventQueue(policies, default_policy)
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._closed = False
+        #: The event names that this stream receives, or an empty set if it
+        #: receives all events.
+        self.methods = methods
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> typing.Any:
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration()
+            self._readable.clear()
+            await self._readable.wait()
+        event = self._queue.get()
+        self._writable.set()
+        return event
+
+    @property
+    def dropped(self) -> typing.Counter[str]:
+        ''' The number of events that were dropped, keyed by event name. '''
+        return self._queue.dropped
+
+    @property
+    def coalesced(self) -> typing.Counter[str]:
+        '''
+        The number of events that were replaced by a newer event of the same
+        type, keyed by event name.
+        '''
+        return self._queue.coalesced
+
+    def close(self) -> None:
+        ''' Stop receiving events. Buffered events can still be read. '''
+        self._listeners.remove(self)
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
+
+    def _put_nowait(self, method: str, event: typing.Any) -> bool:
+        if not self._queue.put(method, event):
+            return False
+        self._readable.set()
+        return True
+
+    async def _put(self, method: str, event: typing.Any) -> None:
+        while not self._closed and not self._queue.put(method, event):
+            self._writable.clear()
+            await self._writable.wait()
+        self._readable.set()
+
+
+class Listeners:
+    '''
+    The event streams of one connection or session, indexed by event name so
+    that finding the streams for an event is a single dict lookup.
+    '''
+    def __init__(self, lazy: bool):
+        '''
+        Constructor.
+
+        :param lazy: if true, events are decoded as lazy events
+        '''
+        self._lazy = lazy
+        self._closed = False
+        # Streams that receive all events.
+        self._all: typing.List[EventStream] = list()
+        # Streams for each event name, including the streams in _all.
+        self._by_method: typing.Dict[str, typing.List[EventStream]] = dict()
+
+    def listen(self, events: typing.Iterable[typing.Any],
+            policies: typing.Optional[typing.Mapping[typing.Any,
+            QueuePolicy]] = None, default_policy: QueuePolicy = QueuePolicy()
+            ) -> EventStream:
+        ''' Create a stream for events, see ``Connection.listen()``. '''
+        stream = EventStream(self, frozenset(event_method(e) for e in events),
+            policies, default_policy)
+        if self._closed:
+            stream.close()
+            return stream
+        if stream.methods:
+            for method in stream.methods:
+                self._by_method.setdefault(method, list(self._all)).append(
+                    stream)
+        else:
+            self._all.append(stream)
+            for streams in self._by_method.values():
+                streams.append(stream)
+        return stream
+
+    def remove(self, stream: EventStream) -> None:
+        ''' Remove a stream. '''
+        if stream.methods:
+            for method in stream.methods:
+                streams = self._by_method.get(method, [])
+                if stream in streams:
+                    streams.remove(stream)
+                if streams == self._all:
+                    self._by_method.pop(method, None)
+        elif stream in self._all:
+            self._all.remove(stream)
+            for streams in self._by_method.values():
+                streams.remove(stream)
+
+    def dispatch(self, message: T_JSON_DICT) -> typing.Optional[typing.List[
+            typing.Tuple[EventStream, typing.Any]]]:
+        '''
+        Decode an event once and put it in every stream that wants it.
+
+        Events that aren't in this version of the protocol are skipped. Events
+        that fail to decode are reported to the event loop's exception
+        handler and skipped.
+
+        :returns: ``None``, or a list of streams that are full and must be
+            given the event with ``await stream._put()``
+        '''
+        method = message['method']
+        try:
+            streams = self._by_method[method]
+        except KeyError:
+            streams = self._all
+        if not streams:
+            return None
+        try:
+            get_event_class(method)
+        except KeyError:
+            # An event that isn't in this version of the protocol.
+            return None
+        try:
+            event = parse_json_event(message, lazy=self._lazy)
+        except Exception as exc:
+            # Report the error without stopping the connection's read loop.
+            asyncio.get_event_loop().call_exception_handler({
+                'message': 'Failed to decode event {}'.format(method),
+                'exception': exc,
+            })
+            return None
+        blocked = None
+        for stream in streams:
+            if not stream._put_nowait(method, event):
+                if blocked is None:
+                    blocked = list()
+                blocked.append((stream, event))
+        return blocked
+
+    def close(self) -> None:
+        ''' Close all streams. '''
+        self._closed = True
+        for stream in set(self._all).union(*self._by_method.values()):
+            stream.close()
@@ -0,0 +1,270 @@
+'''
+A fake browser for testing code that uses a CDP connection, and for load
+testing it without a real browser.
+'''
+import asyncio
+import inspect
+import typing
+
+from cdp.codec import Codec, get_codec
+from cdp.connection.connection import CommandError
+from cdp.connection.transport import ConnectionClosed, MemoryTransport, \
+    StreamTransport, Transport
+from cdp.recording import Direction, Record
+from cdp.synthetic import PayloadFactory
+from cdp.util import T_JSON_DICT
+
+
+T_HANDLER = typing.Callable[[T_JSON_DICT], typing.Any]
+
+
+class FakeBrowser:
+    '''
+    Respond to CDP commands with canned results, and emit events on demand.
+
+    A handler is registered for each command that the fake browser supports.
+    It is called with the command's ``params`` and returns the ``result``, or
+    raises :class:`CommandError` to respond with an error. A handler may also
+    be a coroutine function. If the fake browser has a
+    :class:`~cdp.synthetic.PayloadFactory`, commands without a handler get a
+    synthetic result that matches the protocol specification; otherwise they
+    get the same error that Chrome returns for an unknown method.
+
+    .. code-block:: python
+
+        browser = FakeBrowser()
+        browser.handle('Browser.getVersion', lambda params: VERSION)
+        async with Connection(browser.connect()) as conn:
+            version = await conn.execute(cdp.browser.get_version())
+    '''
+    def __init__(self, codec: typing.Optional[Codec] = None,
+            latency: float = 0,
+            payloads: typing.Optional[PayloadFactory] = None):
+        '''
+        Constructor.
+
+        :param codec: the codec to encode and decode messages with, or the
+            default codec
+        :param latency: a delay in seconds before each response is sent, to
+            imitate the round trip time to a real browser. Commands that are
+            received during the delay are handled concurrently.
+        :param payloads: synthesizes the results of commands that don't have
+            a handler
+        '''
+        self._codec = codec or get_codec()
+        self._latency = latency
+        self._payloads = payloads
+        self._synthetic: typing.Dict[str, T_JSON_DICT] = dict()
+        self._handlers: typing.Dict[str, T_HANDLER] = dict()
+        self._transports: typing.List[Transport] = list()
+        self._tasks: typing.Set[asyncio.Future] = set()
+        #: The number of commands that have been received.
+        self.command_count = 0
+
+    def handle(self, method: str, handler: T_HANDLER) -> None:
+        '''
+        Register a handler for a command, replacing any previous handler.
+
+        :param method: a command name, e.g. ``Page.navigate``
+        :param handler: a function that is called with the command's
+            ``params`` and returns its ``result``
+        '''
+        self._handlers[method] = handler
+
+    def connect(self) -> MemoryTransport:
+        '''
+        Return a transport for a client that is served by this browser. This
+        must be called in a running loop.
+        '''
+        client, server = MemoryTransport.pair()
+        self.serve(server)
+        return client
+
+    def serve(self, transport: Transport) -> None:
+        '''
+        Serve commands that are received on ``transport`` until it is closed.
+        This must be called in a running loop.
+        '''
+        self._transports.append(transport)
+        self._start(self._serve(transport))
+
+    async def start_server(self, host: str = '127.0.0.1',
+            port: int = 0) -> asyncio.AbstractServer:
+        '''
+        Serve clients that connect over TCP, with each message terminated by
+        a NUL byte as in :class:`StreamTransport`.
+
+        :param host: the address to listen on
+        :param port: the port to listen on, or 0 to pick a free port
+        :returns: the server, whose ``sockets`` have the address that it is
+            listening on. Closing the server stops accepting clients; call
+            :meth:`close` to disconnect the clients too.
+        '''
+        def connected(reader: asyncio.StreamReader,
+                writer: asyncio.StreamWriter) -> None:
+            self.serve(StreamTransport(reader, writer))
+        # Screenshots and other large results can exceed the default limit.
+        return await asyncio.start_server(connected, host, port,
+            limit=2 ** 20)
+
+    async def emit(self, method: str, params: T_JSON_DICT,
+            session_id: typing.Optional[str] = None) -> None:
+        '''
+        Send an event to every connected client.
+
+        :param method: an event name, e.g. ``Page.loadEventFired``
+        :param params: the event's parameters
+        :param session_id: the session that the event belongs to, if any
+        '''
+        message: T_JSON_DICT = {'method': method, 'params': params}
+        if session_id is not None:
+            message['sessionId'] = session_id
+        await self._broadcast(self._codec.dumps(message))
+
+    async def replay(self, messages: typing.Iterable[T_JSON_DICT],
+            rate: typing.Optional[float] = None) -> int:
+        '''
+        Send recorded events to every connected client.
+
+        The events are sent on a fixed schedule, so a slow client or a slow
+        loop doesn't lower the average rate: events that are behind schedule
+        are sent without waiting.
+
+        :param messages: event messages, each with a ``method``, ``params``
+            and optionally a ``sessionId``
+        :param rate: the number of events to send per second, or ``None`` to
+            send them as fast as possible
+        :returns: the number of events sent
+        '''
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        count = 0
+        for message in messages:
+            if rate is not None:
+                delay = start + count / rate - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await self._broadcast(self._codec.dumps(message))
+            count += 1
+        return count
+
+    async def replay_recording(self, records: typing.Iterable[Record],
+            speed: typing.Optional[float] = 1.0) -> int:
+        '''
+        Send the events in a recording to every connected client.
+
+        The events are sent exactly as they were recorded. Commands and
+        responses in the recording are skipped, since the clients' own
+        commands are answered by this browser.
+
+        :param records: the records of a recording, e.g. a
+            :class:`~cdp.recording.RecordingReader`
+        :param speed: a multiple of the recorded rate, e.g. 1 to send the
+            events at the times that they were recorded, or ``None`` to send
+            them as fast as possible
+        :returns: the number of events sent
+        '''
+        loop = asyncio.get_running_loop()
+        loads = self._codec.loads
+        start = loop.time()
+        first: typing.Optional[float] = None
+        count = 0
+        for record in records:
+            if record.direction != Direction.RECEIVED or \
+                    'id' in loads(record.data):
+                continue
+            if speed is not None:
+                if first is None:
+                    first = record.timestamp
+                delay = start + (record.timestamp - first) / speed - \
+                    loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await self._broadcast(record.data)
+            count += 1
+        return count
+
+    async def close(self) -> None:
+        ''' Disconnect all clients. '''
+        for task in list(self._tasks):
+            task.cancel()
+        for transport in self._transports:
+            await transport.close()
+        self._tasks.clear()
+        self._transports.clear()
+
+    async def _broadcast(self, data: bytes) -> None:
+        for transport in self._transports:
+            try:
+                await transport.send(data)
+            except ConnectionClosed:
+                pass
+
+    def _synthetic_result(self, method: str) -> T_JSON_DICT:
+        # The results are the same every time, and they are only encoded, so
+        # each one is synthesized once.
+        try:
+            return self._synthetic[method]
+        except KeyError:
+            assert self._payloads is not None
+            result = self._payloads.command_result(method)
+            self._synthetic[method] = result
+            return result
+
+    def _start(self, coro: typing.Awaitable) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _serve(self, transport: Transport) -> None:
+        try:
+            while True:
+                request = self._codec.loads(await transport.recv())
+                self.command_count += 1
+                if self._latency:
+                    self._start(self._respond_later(transport, request))
+                else:
+                    response = await self._respond(request)
+                    await transport.send(self._codec.dumps(response))
+        except ConnectionClosed:
+            pass
+
+    async def _respond_later(self, transport: Transport,
+            request: T_JSON_DICT) -> None:
+        await asyncio.sleep(self._latency)
+        response = await self._respond(request)
+        try:
+            await transport.send(self._codec.dumps(response))
+        except ConnectionClosed:
+            pass
+
+    async def _respond(self, request: T_JSON_DICT) -> T_JSON_DICT:
+        response: T_JSON_DICT = {'id': request['id']}
+        if 'sessionId' in request:
+            response['sessionId'] = request['sessionId']
+        method = request['method']
+        try:
+            handler = self._handlers[method]
+        except KeyError:
+            if self._payloads is not None and \
+                    method in self._payloads.commands:
+                response['result'] = self._synthetic_result(method)
+            else:
+                response['error'] = {'code': -32601,
+                    'message': f"'{method}' wasn't found"}
+            return response
+        try:
+            result = handler(request.get('params', {}))
+            if inspect.isawaitable(result):
+                result = await result
+        except CommandError as exc:
+            response['error'] = {'code': exc.code, 'message': exc.message}
+            if exc.data is not None:
+                response['error']['data'] = exc.data
+            return response
+        except Exception as exc:
+            # Like the browser, report a failed handler as an internal error.
+            response['error'] = {'code': -32603, 'message': str(exc)}
+            return response
+        response['result'] = result if result is not None else {}
+        return response
@@ -0,0 +1,80 @@
+'''
+Sessions for targets that are attached with ``flatten=True``.
+'''
+import typing
+
+from cdp import target
+from cdp.connection.events import EventStream, Listeners
+from cdp.dispatch import QueuePolicy
+from cdp.util import T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from cdp.connection.connection import Connection
+
+
+T = typing.TypeVar('T')
+
+
+class Session:
+    '''
+    A session with one target, such as a page, an iframe or a worker.
+
+    Commands that are run in a session are tagged with its session ID, and
+    events from the target are delivered to the session's listeners. Sessions
+    are created by the :class:`~cdp.connection.Connection` when it receives a
+    ``Target.attachedToTarget`` event, including for targets that are attached
+    automatically (see ``cdp.target.set_auto_attach()``), so the sessions form
+    a tree: e.g. a page session is the parent of the sessions of its iframes
+    and workers.
+    '''
+    def __init__(self, connection: 'Connection', session_id: target.SessionID,
+            target_info: typing.Optional[target.TargetInfo],
+            parent: typing.Optional['Session'], lazy: bool):
+        self._connection = connection
+        self._listeners = Listeners(lazy)
+        #: The session ID.
+        self.session_id = session_id
+        #: The target, if it is known.
+        self.target_info = target_info
+        #: The session that this session was attached from, or ``None`` if it
+        #: was attached from the browser.
+        self.parent = parent
+        #: The sessions that were attached from this session, keyed by ID.
+        self.children: typing.Dict[target.SessionID, 'Session'] = dict()
+        self._detached = False
+
+    def __repr__(self):
+        return f'Session({self.session_id!r})'
+
+    @property
+    def detached(self) -> bool:
+        ''' True if the target has been detached or the connection closed. '''
+        return self._detached
+
+    async def execute(self, cmd: typing.Generator[T_JSON_DICT, T_JSON_DICT,
+            T]) -> T:
+        ''' Run a command in this session, see ``Connection.execute()``. '''
+        return await self._connection.execute(cmd, self.session_id)
+
+    async def execute_many(self, cmds: typing.Iterable[typing.Generator[
+            T_JSON_DICT, T_JSON_DICT, typing.Any]]) -> typing.List[typing.Any]:
+        '''
+        Run many commands at once in this session, see
+        ``Connection.execute_many()``.
+        '''
+        return await self._connection.execute_many(cmds, self.session_id)
+
+    def listen(self, *events: typing.Any, policies: typing.Optional[
+            typing.Mapping[typing.Any, QueuePolicy]] = None,
+            default_policy: QueuePolicy = QueuePolicy()) -> EventStream:
+        '''
+        Return a stream of events from this session's target, see
+        ``Connection.listen()``.
+        '''
+        return self._listeners.listen(events, policies, default_policy)
+
+    def _detach(self) -> None:
+        self._detached = True
+        self._listeners.close()
+        for child in self.children.values():
+            child._detach()
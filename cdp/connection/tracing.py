@@ -0,0 +1,120 @@
+'''
+Record traces straight to disk.
+'''
+from pathlib import Path
+import typing
+
+from cdp import io, tracing
+from cdp.connection.transport import ConnectionClosed
+from cdp.streams import read_stream_into
+
+
+class TraceRecorder:
+    '''
+    Record a trace and save it to a file.
+
+    Tracing is started with ``transfer_mode='ReturnAsStream'``, so the browser
+    keeps the trace until tracing is stopped instead of sending it in
+    ``Tracing.dataCollected`` events, and then the trace is copied to the file
+    one chunk at a time. The browser compresses the trace with gzip by
+    default, and it is saved compressed. Use
+    :func:`cdp.traces.iter_trace_events` to read the events of a JSON trace.
+
+    .. code-block:: python
+
+        async with TraceRecorder(conn, 'trace.json.gz') as recorder:
+            await page_session.execute(cdp.page.navigate(url))
+        for event in iter_trace_events('trace.json.gz'):
+            ...
+    '''
+    def __init__(self, target: typing.Any,
+            sink: typing.Union[str, Path, typing.BinaryIO],
+            trace_config: typing.Optional[tracing.TraceConfig] = None,
+            stream_format: tracing.StreamFormat = tracing.StreamFormat.JSON,
+            stream_compression: tracing.StreamCompression =
+            tracing.StreamCompression.GZIP,
+            chunk_size: typing.Optional[int] = None):
+        '''
+        Constructor.
+
+        :param target: the :class:`Connection` or :class:`Session` to trace
+        :param sink: the path of the file to save the trace to, or a binary
+            file-like object to write it to
+        :param trace_config: which categories to trace, or the browser's
+            default
+        :param stream_format: the format of the trace
+        :param stream_compression: the compression of the trace
+        :param chunk_size: the size of the chunks to read the trace in, or the
+            browser's default
+        '''
+        self._target = target
+        self._sink = sink
+        self._trace_config = trace_config
+        self._stream_format = stream_format
+        self._stream_compression = stream_compression
+        self._chunk_size = chunk_size
+        #: The event that the browser sent when tracing stopped, which says
+        #: whether any data was lost and what format the trace is in.
+        self.complete: typing.Optional[tracing.TracingComplete] = None
+        #: The number of bytes that were saved.
+        self.size = 0
+
+    async def __aenter__(self) -> 'TraceRecorder':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.stop()
+            return
+        # Stop tracing and release the trace stream without saving it, and
+        # don't hide the exception.
+        events = self._target.listen(tracing.TracingComplete)
+        try:
+            await self._target.execute(tracing.end())
+            complete = await events.__anext__()
+            if complete.stream is not None:
+                await self._target.execute(io.close(complete.stream))
+        except Exception:
+            pass
+        finally:
+            events.close()
+
+    async def start(self) -> None:
+        ''' Start tracing. '''
+        await self._target.execute(tracing.start(
+            transfer_mode='ReturnAsStream',
+            stream_format=self._stream_format,
+            stream_compression=self._stream_compression,
+            trace_config=self._trace_config))
+
+    async def stop(self) -> tracing.TracingComplete:
+        '''
+        Stop tracing and save the trace.
+
+        :returns: the event that the browser sent when tracing stopped
+        :raises RuntimeError: if the browser didn't return the trace as a
+            stream
+        :raises ConnectionClosed: if the connection is closed or the session
+            is detached before the trace is saved
+        '''
+        events = self._target.listen(tracing.TracingComplete)
+        try:
+            await self._target.execute(tracing.end())
+            complete = await events.__anext__()
+        except StopAsyncIteration:
+            raise ConnectionClosed() from None
+        finally:
+            events.close()
+        self.complete = complete
+        if complete.stream is None:
+            raise RuntimeError('The browser did not return the trace as a '
+                'stream')
+        if isinstance(self._sink, (str, Path)):
+            with open(self._sink, 'wb') as trace_file:
+                self.size = await read_stream_into(self._target.execute,
+                    complete.stream, trace_file, self._chunk_size)
+        else:
+            self.size = await read_stream_into(self._target.execute,
+                complete.stream, self._sink, self._chunk_size)
+        return complete
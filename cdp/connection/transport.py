@@ -0,0 +1,240 @@
+'''
+Transports carry encoded CDP messages between a client and a browser.
+'''
+import asyncio
+import importlib
+import typing
+
+from cdp.codec import T_DATA
+from cdp.recording import Direction, RecordingWriter
+
+
+class ConnectionClosed(Exception):
+    ''' Raised when a message is sent or received on a closed connection. '''
+
+
+class Transport:
+    '''
+    The interface for a bidirectional channel of CDP messages.
+
+    Each message is one complete JSON document; the transport is responsible
+    for framing.
+    '''
+    async def send(self, data: bytes) -> None:
+        '''
+        Send a message.
+
+        :raises ConnectionClosed: if the transport is closed
+        '''
+        raise NotImplementedError()
+
+    async def send_many(self, messages: typing.Iterable[bytes]) -> None:
+        '''
+        Send several messages back to back.
+
+        Transports can override this to send the messages in fewer writes.
+
+        :raises ConnectionClosed: if the transport is closed
+        '''
+        for data in messages:
+            await self.send(data)
+
+    async def recv(self) -> T_DATA:
+        '''
+        Receive the next message.
+
+        :raises ConnectionClosed: if the transport is closed
+        '''
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        ''' Close the transport. '''
+        raise NotImplementedError()
+
+
+class MemoryTransport(Transport):
+    '''
+    One end of an in-process pair of transports, which is mostly useful for
+    testing.
+    '''
+    def __init__(self, incoming: asyncio.Queue, outgoing: asyncio.Queue):
+        '''
+        Constructor.
+
+        :param incoming: the queue to receive messages from
+        :param outgoing: the queue to send messages to
+        '''
+        self._incoming = incoming
+        self._outgoing = outgoing
+        self._closed = False
+
+    @classmethod
+    def pair(cls) -> typing.Tuple['MemoryTransport', 'MemoryTransport']:
+        ''' Return two transports that are connected to each other. '''
+        first: asyncio.Queue = asyncio.Queue()
+        second: asyncio.Queue = asyncio.Queue()
+        return cls(first, second), cls(second, first)
+
+    async def send(self, data: bytes) -> None:
+        if self._closed:
+            raise ConnectionClosed()
+        self._outgoing.put_nowait(data)
+
+    async def recv(self) -> T_DATA:
+        if self._closed:
+            raise ConnectionClosed()
+        data = await self._incoming.get()
+        if data is None:
+            self._closed = True
+            raise ConnectionClosed()
+        return data
+
+    async def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            # Wake up the peer and any pending recv() on this end.
+            self._outgoing.put_nowait(None)
+            self._incoming.put_nowait(None)
+
+
+class StreamTransport(Transport):
+    '''
+    A transport for asyncio streams where each message is terminated by a NUL
+    byte, which is the framing Chrome uses with ``--remote-debugging-pipe``.
+    '''
+    def __init__(self, reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter):
+        '''
+        Constructor.
+
+        Messages may be larger than the reader's buffer limit.
+
+        :param reader: the stream to receive messages from
+        :param writer: the stream to send messages to
+        '''
+        self._reader = reader
+        self._writer = writer
+
+    async def send(self, data: bytes) -> None:
+        if self._writer.is_closing():
+            raise ConnectionClosed()
+        self._writer.write(data + b'\0')
+        try:
+            await self._writer.drain()
+        except ConnectionError as exc:
+            raise ConnectionClosed() from exc
+
+    async def send_many(self, messages: typing.Iterable[bytes]) -> None:
+        if self._writer.is_closing():
+            raise ConnectionClosed()
+        self._writer.writelines(data + b'\0' for data in messages)
+        try:
+            await self._writer.drain()
+        except ConnectionError as exc:
+            raise ConnectionClosed() from exc
+
+    async def recv(self) -> T_DATA:
+        chunks = list()
+        while True:
+            try:
+                data = await self._reader.readuntil(b'\0')
+            except asyncio.LimitOverrunError as exc:
+                # The message is larger than the buffer, so read what's in
+                # the buffer and keep looking for the end of the message.
+                chunks.append(await self._reader.readexactly(exc.consumed))
+                continue
+            except (asyncio.IncompleteReadError, ConnectionError) as exc:
+                raise ConnectionClosed() from exc
+            if chunks:
+                chunks.append(data[:-1])
+                return b''.join(chunks)
+            return data[:-1]
+
+    async def close(self) -> None:
+        self._writer.close()
+
+
+class RecordingTransport(Transport):
+    '''
+    A transport that records every message that it sends and receives to a
+    :class:`~cdp.recording.RecordingWriter`, and otherwise passes the messages
+    through to another transport.
+    '''
+    def __init__(self, transport: Transport, writer: RecordingWriter):
+        '''
+        Constructor.
+
+        :param transport: the transport to send and receive messages with
+        :param writer: the recording to append the messages to. The writer is
+            not closed when the transport is closed.
+        '''
+        self._transport = transport
+        self._writer = writer
+
+    async def send(self, data: bytes) -> None:
+        self._writer.write(Direction.SENT, data)
+        await self._transport.send(data)
+
+    async def send_many(self, messages: typing.Iterable[bytes]) -> None:
+        messages = list(messages)
+        for data in messages:
+            self._writer.write(Direction.SENT, data)
+        await self._transport.send_many(messages)
+
+    async def recv(self) -> T_DATA:
+        data = await self._transport.recv()
+        self._writer.write(Direction.RECEIVED, data)
+        return data
+
+    async def close(self) -> None:
+        await self._transport.close()
+        self._writer.flush()
+
+
+class WebSocketTransport(Transport):
+    '''
+    A transport for a WebSocket connection from the ``websockets`` package,
+    which is not a dependency of this library and must be installed
+    separately.
+    '''
+    def __init__(self, websocket: typing.Any):
+        '''
+        Constructor.
+
+        :param websocket: a connected ``websockets`` client
+        '''
+        self._websocket = websocket
+        exceptions = importlib.import_module('websockets.exceptions')
+        self._closed_error = exceptions.ConnectionClosed
+
+    @classmethod
+    async def connect(cls, url: str, **kwargs) -> 'WebSocketTransport':
+        '''
+        Connect to a browser's WebSocket URL, e.g.
+        ``ws://localhost:9222/devtools/browser/<id>``.
+
+        :param url: the WebSocket URL
+        :param kwargs: passed to ``websockets.connect()``
+        :raises ImportError: if ``websockets`` is not installed
+        '''
+        websockets = importlib.import_module('websockets')
+        # CDP messages can be many megabytes, e.g. screenshots.
+        kwargs.setdefault('max_size', None)
+        websocket = await websockets.connect(url, **kwargs)
+        return cls(websocket)
+
+    async def send(self, data: bytes) -> None:
+        # Chrome only accepts text frames.
+        try:
+            await self._websocket.send(data.decode('utf8'))
+        except self._closed_error as exc:
+            raise ConnectionClosed() from exc
+
+    async def recv(self) -> T_DATA:
+        try:
+            return await self._websocket.recv()
+        except self._closed_error as exc:
+            raise ConnectionClosed() from exc
+
+    async def close(self) -> None:
+        await self._websocket.close()
@@ -6,12 +6,13 @@
 # CDP domain: Console
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class ConsoleMessage:
     '''
@@ -51,12 +52,12 @@ class ConsoleMessage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleMessage:
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            url=str(json['url']) if 'url' in json else None,
-            line=int(json['line']) if 'line' in json else None,
-            column=int(json['column']) if 'column' in json else None,
+            source=json['source'],
+            level=json['level'],
+            text=json['text'],
+            url=json.get('url'),
+            line=json.get('line'),
+            column=json.get('column'),
         )
 
 
@@ -92,6 +93,7 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
 
 @event_class('Console.messageAdded')
+@add_slots
 @dataclass
 class MessageAdded:
     '''
@@ -100,6 +102,8 @@ class MessageAdded:
     #: Console message that has been added.
     message: ConsoleMessage
 
+    _json_names = ('message',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MessageAdded:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: CSS (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -43,9 +43,17 @@ class StyleSheetOrigin(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetOrigin:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class PseudoElementMatches:
     '''
@@ -71,6 +79,7 @@ class PseudoElementMatches:
         )
 
 
+@add_slots
 @dataclass
 class InheritedStyleEntry:
     '''
@@ -97,6 +106,7 @@ class InheritedStyleEntry:
         )
 
 
+@add_slots
 @dataclass
 class RuleMatch:
     '''
@@ -118,10 +128,11 @@ class RuleMatch:
     def from_json(cls, json: T_JSON_DICT) -> RuleMatch:
         return cls(
             rule=CSSRule.from_json(json['rule']),
-            matching_selectors=[int(i) for i in json['matchingSelectors']],
+            matching_selectors=json['matchingSelectors'],
         )
 
 
+@add_slots
 @dataclass
 class Value:
     '''
@@ -143,11 +154,12 @@ class Value:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Value:
         return cls(
-            text=str(json['text']),
+            text=json['text'],
             range_=SourceRange.from_json(json['range']) if 'range' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class SelectorList:
     '''
@@ -169,10 +181,11 @@ class SelectorList:
     def from_json(cls, json: T_JSON_DICT) -> SelectorList:
         return cls(
             selectors=[Value.from_json(i) for i in json['selectors']],
-            text=str(json['text']),
+            text=json['text'],
         )
 
 
+@add_slots
 @dataclass
 class CSSStyleSheetHeader:
     '''
@@ -241,22 +254,23 @@ class CSSStyleSheetHeader:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyleSheetHeader:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            source_url=str(json['sourceURL']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
+            frame_id=page.FrameId(json['frameId']),
+            source_url=json['sourceURL'],
             origin=StyleSheetOrigin.from_json(json['origin']),
-            title=str(json['title']),
-            disabled=bool(json['disabled']),
-            is_inline=bool(json['isInline']),
+            title=json['title'],
+            disabled=json['disabled'],
+            is_inline=json['isInline'],
             start_line=float(json['startLine']),
             start_column=float(json['startColumn']),
             length=float(json['length']),
-            source_map_url=str(json['sourceMapURL']) if 'sourceMapURL' in json else None,
-            owner_node=dom.BackendNodeId.from_json(json['ownerNode']) if 'ownerNode' in json else None,
-            has_source_url=bool(json['hasSourceURL']) if 'hasSourceURL' in json else None,
+            source_map_url=json.get('sourceMapURL'),
+            owner_node=dom.BackendNodeId(json['ownerNode']) if 'ownerNode' in json else None,
+            has_source_url=json.get('hasSourceURL'),
         )
 
 
+@add_slots
 @dataclass
 class CSSRule:
     '''
@@ -296,11 +310,12 @@ class CSSRule:
             selector_list=SelectorList.from_json(json['selectorList']),
             origin=StyleSheetOrigin.from_json(json['origin']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if 'styleSheetId' in json else None,
+            style_sheet_id=StyleSheetId(json['styleSheetId']) if 'styleSheetId' in json else None,
             media=[CSSMedia.from_json(i) for i in json['media']] if 'media' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class RuleUsage:
     '''
@@ -330,13 +345,14 @@ class RuleUsage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleUsage:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
             start_offset=float(json['startOffset']),
             end_offset=float(json['endOffset']),
-            used=bool(json['used']),
+            used=json['used'],
         )
 
 
+@add_slots
 @dataclass
 class SourceRange:
     '''
@@ -365,13 +381,14 @@ class SourceRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceRange:
         return cls(
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
         )
 
 
+@add_slots
 @dataclass
 class ShorthandEntry:
     #: Shorthand name.
@@ -394,12 +411,13 @@ class ShorthandEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShorthandEntry:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if 'important' in json else None,
+            name=json['name'],
+            value=json['value'],
+            important=json.get('important'),
         )
 
 
+@add_slots
 @dataclass
 class CSSComputedStyleProperty:
     #: Computed style property name.
@@ -417,11 +435,12 @@ class CSSComputedStyleProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
+@add_slots
 @dataclass
 class CSSStyle:
     '''
@@ -460,12 +479,13 @@ class CSSStyle:
         return cls(
             css_properties=[CSSProperty.from_json(i) for i in json['cssProperties']],
             shorthand_entries=[ShorthandEntry.from_json(i) for i in json['shorthandEntries']],
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if 'styleSheetId' in json else None,
-            css_text=str(json['cssText']) if 'cssText' in json else None,
+            style_sheet_id=StyleSheetId(json['styleSheetId']) if 'styleSheetId' in json else None,
+            css_text=json.get('cssText'),
             range_=SourceRange.from_json(json['range']) if 'range' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class CSSProperty:
     '''
@@ -516,17 +536,18 @@ class CSSProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if 'important' in json else None,
-            implicit=bool(json['implicit']) if 'implicit' in json else None,
-            text=str(json['text']) if 'text' in json else None,
-            parsed_ok=bool(json['parsedOk']) if 'parsedOk' in json else None,
-            disabled=bool(json['disabled']) if 'disabled' in json else None,
+            name=json['name'],
+            value=json['value'],
+            important=json.get('important'),
+            implicit=json.get('implicit'),
+            text=json.get('text'),
+            parsed_ok=json.get('parsedOk'),
+            disabled=json.get('disabled'),
             range_=SourceRange.from_json(json['range']) if 'range' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class CSSMedia:
     '''
@@ -571,15 +592,16 @@ class CSSMedia:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSMedia:
         return cls(
-            text=str(json['text']),
-            source=str(json['source']),
-            source_url=str(json['sourceURL']) if 'sourceURL' in json else None,
+            text=json['text'],
+            source=json['source'],
+            source_url=json.get('sourceURL'),
             range_=SourceRange.from_json(json['range']) if 'range' in json else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if 'styleSheetId' in json else None,
+            style_sheet_id=StyleSheetId(json['styleSheetId']) if 'styleSheetId' in json else None,
             media_list=[MediaQuery.from_json(i) for i in json['mediaList']] if 'mediaList' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class MediaQuery:
     '''
@@ -601,10 +623,11 @@ class MediaQuery:
     def from_json(cls, json: T_JSON_DICT) -> MediaQuery:
         return cls(
             expressions=[MediaQueryExpression.from_json(i) for i in json['expressions']],
-            active=bool(json['active']),
+            active=json['active'],
         )
 
 
+@add_slots
 @dataclass
 class MediaQueryExpression:
     '''
@@ -640,13 +663,14 @@ class MediaQueryExpression:
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryExpression:
         return cls(
             value=float(json['value']),
-            unit=str(json['unit']),
-            feature=str(json['feature']),
+            unit=json['unit'],
+            feature=json['feature'],
             value_range=SourceRange.from_json(json['valueRange']) if 'valueRange' in json else None,
             computed_length=float(json['computedLength']) if 'computedLength' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class PlatformFontUsage:
     '''
@@ -671,12 +695,13 @@ class PlatformFontUsage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlatformFontUsage:
         return cls(
-            family_name=str(json['familyName']),
-            is_custom_font=bool(json['isCustomFont']),
+            family_name=json['familyName'],
+            is_custom_font=json['isCustomFont'],
             glyph_count=float(json['glyphCount']),
         )
 
 
+@add_slots
 @dataclass
 class FontFace:
     '''
@@ -721,17 +746,18 @@ class FontFace:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFace:
         return cls(
-            font_family=str(json['fontFamily']),
-            font_style=str(json['fontStyle']),
-            font_variant=str(json['fontVariant']),
-            font_weight=str(json['fontWeight']),
-            font_stretch=str(json['fontStretch']),
-            unicode_range=str(json['unicodeRange']),
-            src=str(json['src']),
-            platform_font_family=str(json['platformFontFamily']),
+            font_family=json['fontFamily'],
+            font_style=json['fontStyle'],
+            font_variant=json['fontVariant'],
+            font_weight=json['fontWeight'],
+            font_stretch=json['fontStretch'],
+            unicode_range=json['unicodeRange'],
+            src=json['src'],
+            platform_font_family=json['platformFontFamily'],
         )
 
 
+@add_slots
 @dataclass
 class CSSKeyframesRule:
     '''
@@ -757,6 +783,7 @@ class CSSKeyframesRule:
         )
 
 
+@add_slots
 @dataclass
 class CSSKeyframeRule:
     '''
@@ -790,10 +817,11 @@ class CSSKeyframeRule:
             origin=StyleSheetOrigin.from_json(json['origin']),
             key_text=Value.from_json(json['keyText']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if 'styleSheetId' in json else None,
+            style_sheet_id=StyleSheetId(json['styleSheetId']) if 'styleSheetId' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class StyleDeclarationEdit:
     '''
@@ -818,9 +846,9 @@ class StyleDeclarationEdit:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleDeclarationEdit:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
             range_=SourceRange.from_json(json['range']),
-            text=str(json['text']),
+            text=json['text'],
         )
 
 
@@ -866,7 +894,7 @@ def collect_class_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    return json['classNames']
 
 
 def create_style_sheet(
@@ -885,7 +913,7 @@ def create_style_sheet(
         'params': params,
     }
     json = yield cmd_dict
-    return StyleSheetId.from_json(json['styleSheetId'])
+    return StyleSheetId(json['styleSheetId'])
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -949,9 +977,9 @@ def get_background_colors(
     }
     json = yield cmd_dict
     return (
-        [str(i) for i in json['backgroundColors']] if 'backgroundColors' in json else None,
-        str(json['computedFontSize']) if 'computedFontSize' in json else None,
-        str(json['computedFontWeight']) if 'computedFontWeight' in json else None
+        json.get('backgroundColors'),
+        json.get('computedFontSize'),
+        json.get('computedFontWeight')
     )
 
 
@@ -1082,7 +1110,7 @@ def get_style_sheet_text(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['text'])
+    return json['text']
 
 
 def set_effective_property_value_for_node(
@@ -1203,7 +1231,7 @@ def set_style_sheet_text(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['sourceMapURL']) if 'sourceMapURL' in json else None
+    return json.get('sourceMapURL')
 
 
 def set_style_texts(
@@ -1264,6 +1292,7 @@ def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Lis
 
 
 @event_class('CSS.fontsUpdated')
+@add_slots
 @dataclass
 class FontsUpdated:
     '''
@@ -1273,6 +1302,8 @@ class FontsUpdated:
     #: The web font that has loaded.
     font: typing.Optional[FontFace]
 
+    _json_names = ('font',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontsUpdated:
         return cls(
@@ -1281,6 +1312,7 @@ class FontsUpdated:
 
 
 @event_class('CSS.mediaQueryResultChanged')
+@add_slots
 @dataclass
 class MediaQueryResultChanged:
     '''
@@ -1289,6 +1321,8 @@ class MediaQueryResultChanged:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryResultChanged:
         return cls(
@@ -1297,6 +1331,7 @@ class MediaQueryResultChanged:
 
 
 @event_class('CSS.styleSheetAdded')
+@add_slots
 @dataclass
 class StyleSheetAdded:
     '''
@@ -1305,6 +1340,8 @@ class StyleSheetAdded:
     #: Added stylesheet metainfo.
     header: CSSStyleSheetHeader
 
+    _json_names = ('header',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetAdded:
         return cls(
@@ -1313,6 +1350,7 @@ class StyleSheetAdded:
 
 
 @event_class('CSS.styleSheetChanged')
+@add_slots
 @dataclass
 class StyleSheetChanged:
     '''
@@ -1320,14 +1358,17 @@ class StyleSheetChanged:
     '''
     style_sheet_id: StyleSheetId
 
+    _json_names = ('styleSheetId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetChanged:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            style_sheet_id=StyleSheetId(json['styleSheetId'])
         )
 
 
 @event_class('CSS.styleSheetRemoved')
+@add_slots
 @dataclass
 class StyleSheetRemoved:
     '''
@@ -1336,8 +1377,10 @@ class StyleSheetRemoved:
     #: Identifier of the removed stylesheet.
     style_sheet_id: StyleSheetId
 
+    _json_names = ('styleSheetId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetRemoved:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            style_sheet_id=StyleSheetId(json['styleSheetId'])
         )
@@ -6,7 +6,7 @@
 # CDP domain: Database (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -27,6 +27,7 @@ class DatabaseId(str):
         return 'DatabaseId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class Database:
     '''
@@ -55,13 +56,14 @@ class Database:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Database:
         return cls(
-            id_=DatabaseId.from_json(json['id']),
-            domain=str(json['domain']),
-            name=str(json['name']),
-            version=str(json['version']),
+            id_=DatabaseId(json['id']),
+            domain=json['domain'],
+            name=json['name'],
+            version=json['version'],
         )
 
 
+@add_slots
 @dataclass
 class Error:
     '''
@@ -82,8 +84,8 @@ class Error:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Error:
         return cls(
-            message=str(json['message']),
-            code=int(json['code']),
+            message=json['message'],
+            code=json['code'],
         )
 
 
@@ -129,8 +131,8 @@ def execute_sql(
     }
     json = yield cmd_dict
     return (
-        [str(i) for i in json['columnNames']] if 'columnNames' in json else None,
-        [i for i in json['values']] if 'values' in json else None,
+        json.get('columnNames'),
+        json.get('values'),
         Error.from_json(json['sqlError']) if 'sqlError' in json else None
     )
 
@@ -149,14 +151,17 @@ def get_database_table_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['tableNames']]
+    return json['tableNames']
 
 
 @event_class('Database.addDatabase')
+@add_slots
 @dataclass
 class AddDatabase:
     database: Database
 
+    _json_names = ('database',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddDatabase:
         return cls(
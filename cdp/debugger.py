@@ -6,7 +6,7 @@
 # CDP domain: Debugger
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -44,6 +44,7 @@ class CallFrameId(str):
         return 'CallFrameId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class Location:
     '''
@@ -69,12 +70,13 @@ class Location:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Location:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if 'columnNumber' in json else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json.get('columnNumber'),
         )
 
 
+@add_slots
 @dataclass
 class ScriptPosition:
     '''
@@ -93,11 +95,12 @@ class ScriptPosition:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptPosition:
         return cls(
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
+@add_slots
 @dataclass
 class CallFrame:
     '''
@@ -144,10 +147,10 @@ class CallFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
         return cls(
-            call_frame_id=CallFrameId.from_json(json['callFrameId']),
-            function_name=str(json['functionName']),
+            call_frame_id=CallFrameId(json['callFrameId']),
+            function_name=json['functionName'],
             location=Location.from_json(json['location']),
-            url=str(json['url']),
+            url=json['url'],
             scope_chain=[Scope.from_json(i) for i in json['scopeChain']],
             this=runtime.RemoteObject.from_json(json['this']),
             function_location=Location.from_json(json['functionLocation']) if 'functionLocation' in json else None,
@@ -155,6 +158,7 @@ class CallFrame:
         )
 
 
+@add_slots
 @dataclass
 class Scope:
     '''
@@ -191,14 +195,15 @@ class Scope:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Scope:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             object_=runtime.RemoteObject.from_json(json['object']),
-            name=str(json['name']) if 'name' in json else None,
+            name=json.get('name'),
             start_location=Location.from_json(json['startLocation']) if 'startLocation' in json else None,
             end_location=Location.from_json(json['endLocation']) if 'endLocation' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class SearchMatch:
     '''
@@ -220,10 +225,11 @@ class SearchMatch:
     def from_json(cls, json: T_JSON_DICT) -> SearchMatch:
         return cls(
             line_number=float(json['lineNumber']),
-            line_content=str(json['lineContent']),
+            line_content=json['lineContent'],
         )
 
 
+@add_slots
 @dataclass
 class BreakLocation:
     #: Script identifier as reported in the ``Debugger.scriptParsed``.
@@ -250,10 +256,10 @@ class BreakLocation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakLocation:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if 'columnNumber' in json else None,
-            type_=str(json['type']) if 'type' in json else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json.get('columnNumber'),
+            type_=json.get('type'),
         )
 
 
@@ -306,7 +312,7 @@ def enable(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.UniqueDebuggerId.from_json(json['debuggerId'])
+    return runtime.UniqueDebuggerId(json['debuggerId'])
 
 
 def evaluate_on_call_frame(
@@ -409,7 +415,7 @@ def get_script_source(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['scriptSource'])
+    return json['scriptSource']
 
 
 def get_stack_trace(
@@ -633,7 +639,7 @@ def set_breakpoint(
     }
     json = yield cmd_dict
     return (
-        BreakpointId.from_json(json['breakpointId']),
+        BreakpointId(json['breakpointId']),
         Location.from_json(json['actualLocation'])
     )
 
@@ -654,7 +660,7 @@ def set_instrumentation_breakpoint(
         'params': params,
     }
     json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return BreakpointId(json['breakpointId'])
 
 
 def set_breakpoint_by_url(
@@ -700,7 +706,7 @@ def set_breakpoint_by_url(
     }
     json = yield cmd_dict
     return (
-        BreakpointId.from_json(json['breakpointId']),
+        BreakpointId(json['breakpointId']),
         [Location.from_json(i) for i in json['locations']]
     )
 
@@ -729,7 +735,7 @@ def set_breakpoint_on_function_call(
         'params': params,
     }
     json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return BreakpointId(json['breakpointId'])
 
 
 def set_breakpoints_active(
@@ -817,7 +823,7 @@ def set_script_source(
     json = yield cmd_dict
     return (
         [CallFrame.from_json(i) for i in json['callFrames']] if 'callFrames' in json else None,
-        bool(json['stackChanged']) if 'stackChanged' in json else None,
+        json.get('stackChanged'),
         runtime.StackTrace.from_json(json['asyncStackTrace']) if 'asyncStackTrace' in json else None,
         runtime.StackTraceId.from_json(json['asyncStackTraceId']) if 'asyncStackTraceId' in json else None,
         runtime.ExceptionDetails.from_json(json['exceptionDetails']) if 'exceptionDetails' in json else None
@@ -907,6 +913,7 @@ def step_over() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
 
 @event_class('Debugger.breakpointResolved')
+@add_slots
 @dataclass
 class BreakpointResolved:
     '''
@@ -917,15 +924,18 @@ class BreakpointResolved:
     #: Actual breakpoint location.
     location: Location
 
+    _json_names = ('breakpointId', 'location')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakpointResolved:
         return cls(
-            breakpoint_id=BreakpointId.from_json(json['breakpointId']),
+            breakpoint_id=BreakpointId(json['breakpointId']),
             location=Location.from_json(json['location'])
         )
 
 
 @event_class('Debugger.paused')
+@add_slots
 @dataclass
 class Paused:
     '''
@@ -947,13 +957,15 @@ class Paused:
     #: This field is available only after ``Debugger.stepInto`` call with ``breakOnAsynCall`` flag.
     async_call_stack_trace_id: typing.Optional[runtime.StackTraceId]
 
+    _json_names = ('callFrames', 'reason', 'data', 'hitBreakpoints', 'asyncStackTrace', 'asyncStackTraceId', 'asyncCallStackTraceId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Paused:
         return cls(
             call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            reason=str(json['reason']),
-            data=dict(json['data']) if 'data' in json else None,
-            hit_breakpoints=[str(i) for i in json['hitBreakpoints']] if 'hitBreakpoints' in json else None,
+            reason=json['reason'],
+            data=json.get('data'),
+            hit_breakpoints=json.get('hitBreakpoints'),
             async_stack_trace=runtime.StackTrace.from_json(json['asyncStackTrace']) if 'asyncStackTrace' in json else None,
             async_stack_trace_id=runtime.StackTraceId.from_json(json['asyncStackTraceId']) if 'asyncStackTraceId' in json else None,
             async_call_stack_trace_id=runtime.StackTraceId.from_json(json['asyncCallStackTraceId']) if 'asyncCallStackTraceId' in json else None
@@ -961,6 +973,7 @@ class Paused:
 
 
 @event_class('Debugger.resumed')
+@add_slots
 @dataclass
 class Resumed:
     '''
@@ -968,6 +981,8 @@ class Resumed:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Resumed:
         return cls(
@@ -976,6 +991,7 @@ class Resumed:
 
 
 @event_class('Debugger.scriptFailedToParse')
+@add_slots
 @dataclass
 class ScriptFailedToParse:
     '''
@@ -1010,27 +1026,30 @@ class ScriptFailedToParse:
     #: JavaScript top stack frame of where the script parsed event was triggered if available.
     stack_trace: typing.Optional[runtime.StackTrace]
 
+    _json_names = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'sourceMapURL', 'hasSourceURL', 'isModule', 'length', 'stackTrace')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptFailedToParse:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if 'executionContextAuxData' in json else None,
-            source_map_url=str(json['sourceMapURL']) if 'sourceMapURL' in json else None,
-            has_source_url=bool(json['hasSourceURL']) if 'hasSourceURL' in json else None,
-            is_module=bool(json['isModule']) if 'isModule' in json else None,
-            length=int(json['length']) if 'length' in json else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
+            execution_context_id=runtime.ExecutionContextId(json['executionContextId']),
+            hash_=json['hash'],
+            execution_context_aux_data=json.get('executionContextAuxData'),
+            source_map_url=json.get('sourceMapURL'),
+            has_source_url=json.get('hasSourceURL'),
+            is_module=json.get('isModule'),
+            length=json.get('length'),
             stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if 'stackTrace' in json else None
         )
 
 
 @event_class('Debugger.scriptParsed')
+@add_slots
 @dataclass
 class ScriptParsed:
     '''
@@ -1068,22 +1087,24 @@ class ScriptParsed:
     #: JavaScript top stack frame of where the script parsed event was triggered if available.
     stack_trace: typing.Optional[runtime.StackTrace]
 
+    _json_names = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'isLiveEdit', 'sourceMapURL', 'hasSourceURL', 'isModule', 'length', 'stackTrace')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptParsed:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if 'executionContextAuxData' in json else None,
-            is_live_edit=bool(json['isLiveEdit']) if 'isLiveEdit' in json else None,
-            source_map_url=str(json['sourceMapURL']) if 'sourceMapURL' in json else None,
-            has_source_url=bool(json['hasSourceURL']) if 'hasSourceURL' in json else None,
-            is_module=bool(json['isModule']) if 'isModule' in json else None,
-            length=int(json['length']) if 'length' in json else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
+            execution_context_id=runtime.ExecutionContextId(json['executionContextId']),
+            hash_=json['hash'],
+            execution_context_aux_data=json.get('executionContextAuxData'),
+            is_live_edit=json.get('isLiveEdit'),
+            source_map_url=json.get('sourceMapURL'),
+            has_source_url=json.get('hasSourceURL'),
+            is_module=json.get('isModule'),
+            length=json.get('length'),
             stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if 'stackTrace' in json else None
         )
@@ -0,0 +1,337 @@
+'''
+Helpers for handling inbound CDP events without decoding the ones you don't
+care about.
+
+Decoding an event builds the entire tree of dataclasses for it, which is
+wasted work if the event is going to be discarded anyway. The classes in this
+module look at the event's ``method`` first and only decode events that have
+been asked for. Each decision is made once per event name and cached, so the
+cost of an incoming event is a single dict lookup before it is decoded or
+dropped.
+
+:class:`EventQueue` buffers decoded events for a consumer, with a bound and an
+overflow policy for each event type or domain, so that a burst of events such
+as ``Network.dataReceived`` or ``Page.screencastFrame`` can't use up all of the
+memory.
+'''
+import collections
+from dataclasses import dataclass
+import enum
+import typing
+
+from cdp.util import decode_event, get_event_class, lazy_event_class, \
+    T_JSON_DICT, _event_parsers
+
+
+def event_method(event: typing.Any) -> str:
+    '''
+    Return the CDP event name for ``event``.
+
+    :param event: an event name such as ``Page.loadEventFired`` or an event
+        class such as :class:`cdp.page.LoadEventFired`, or a lazy variant of
+        one (see :func:`cdp.util.lazy_event_class`)
+    :raises ValueError: if ``event`` is a class that isn't a registered event
+    '''
+    if isinstance(event, str):
+        return event
+    # A lazy event class is a subclass of the registered class.
+    for base in getattr(event, '__mro__', (event,)):
+        for method, cls in _event_parsers.items():
+            if cls is base:
+                return method
+    raise ValueError(f'{event!r} is not a CDP event class')
+
+
+def _decoder(method: str, raw: bool, lazy: bool) -> typing.Callable[
+        [T_JSON_DICT], typing.Any]:
+    ''' Return a function that converts the params of a ``method`` event. '''
+    if raw:
+        return _identity
+    parser = get_event_class(method)
+    if lazy:
+        parser = lazy_event_class(parser)
+    # Decoding is instrumented like parse_json_event().
+    return lambda params: decode_event(method, parser, params)
+
+
+def _identity(params: T_JSON_DICT) -> T_JSON_DICT:
+    return params
+
+
+class EventFilter:
+    '''
+    Parse only the events that a consumer is subscribed to.
+
+    .. code-block:: python
+
+        events = EventFilter({'Network.responseReceived', 'Page.loadEventFired'})
+        for message in messages:
+            event = events.parse(message)
+            if event is not None:
+                ...
+    '''
+    def __init__(self, accept: typing.Union[typing.Iterable[str],
+            typing.Callable[[str], bool]], raw: bool = False,
+            lazy: bool = False):
+        '''
+        Constructor.
+
+        :param accept: a collection of event names to accept, or a predicate
+            that is called with an event name and returns ``True`` if the event
+            should be accepted. The predicate is called at most once per name.
+        :param raw: if true, accepted events are returned as their ``params``
+            dict instead of being decoded into an event object
+        :param lazy: if true, accepted events are returned as lazy events
+            that decode each field when it is first read, see
+            :func:`cdp.util.lazy_event_class`
+        '''
+        if callable(accept):
+            self._accept = accept
+        else:
+            self._accept = frozenset(accept).__contains__
+        self._raw = raw
+        self._lazy = lazy
+        self._decoders: typing.Dict[str, typing.Optional[typing.Callable]] = \
+            dict()
+
+    def accepts(self, method: str) -> bool:
+        ''' Return ``True`` if events named ``method`` are accepted. '''
+        try:
+            decoder = self._decoders[method]
+        except KeyError:
+            decoder = self._compile(method)
+        return decoder is not None
+
+    def parse(self, json: T_JSON_DICT) -> typing.Any:
+        '''
+        Parse a JSON event message if it is accepted.
+
+        :param json: a CDP event message with ``method`` and ``params`` keys
+        :returns: the event (or its ``params`` if ``raw`` is set), or ``None``
+            if the event is not accepted
+        '''
+        try:
+            decoder = self._decoders[json['method']]
+        except KeyError:
+            decoder = self._compile(json['method'])
+        if decoder is None:
+            return None
+        return decoder(json['params'])
+
+    def _compile(self, method):
+        if self._accept(method):
+            decoder = _decoder(method, self._raw, self._lazy)
+        else:
+            decoder = None
+        self._decoders[method] = decoder
+        return decoder
+
+
+class EventDispatcher:
+    '''
+    Route events to handlers that are registered per event name.
+
+    Events without a handler are not decoded at all.
+
+    .. code-block:: python
+
+        dispatcher = EventDispatcher()
+        dispatcher.register(network.ResponseReceived, on_response)
+        dispatcher.register('Network.dataReceived', on_data, raw=True)
+        for message in messages:
+            dispatcher.dispatch(message)
+    '''
+    def __init__(self):
+        self._handlers: typing.Dict[str, typing.Callable[[T_JSON_DICT],
+            typing.Any]] = dict()
+
+    def register(self, event: typing.Any, handler: typing.Callable,
+            raw: bool = False, lazy: bool = False) -> None:
+        '''
+        Register a handler for an event, replacing any previous handler.
+
+        :param event: an event name or event class
+        :param handler: a function that is called with the decoded event
+        :param raw: if true, the handler is called with the event's ``params``
+            dict instead of a decoded event
+        :param lazy: if true, the handler is called with a lazy event that
+            decodes each field when it is first read
+        '''
+        method = event_method(event)
+        decode = _decoder(method, raw, lazy)
+        if raw:
+            self._handlers[method] = handler
+        else:
+            self._handlers[method] = lambda params: handler(decode(params))
+
+    def unregister(self, event: typing.Any) -> None:
+        ''' Remove the handler for an event, if there is one. '''
+        self._handlers.pop(event_method(event), None)
+
+    @property
+    def methods(self) -> typing.FrozenSet[str]:
+        ''' The names of all events that have a handler. '''
+        return frozenset(self._handlers)
+
+    def dispatch(self, json: T_JSON_DICT) -> typing.Any:
+        '''
+        Call the handler for a JSON event message.
+
+        :param json: a CDP event message with ``method`` and ``params`` keys
+        :returns: the return value of the handler, or ``None`` if the event
+            doesn't have a handler
+        '''
+        try:
+            handler = self._handlers[json['method']]
+        except KeyError:
+            return None
+        return handler(json['params'])
+
+
+class Overflow(enum.Enum):
+    ''' What an :class:`EventQueue` does with an event when it is full. '''
+    #: Don't accept the event until the consumer makes room.
+    BLOCK = 'block'
+    #: Drop the oldest queued event of the same type.
+    DROP_OLDEST = 'drop-oldest'
+    #: Drop the new event.
+    DROP_NEWEST = 'drop-newest'
+    #: Replace the newest queued event of the same type with the new event,
+    #: which keeps its place in the queue.
+    COALESCE = 'coalesce'
+
+
+@dataclass(frozen=True)
+class QueuePolicy:
+    ''' The bound and overflow policy for one type of event. '''
+    #: The maximum number of queued events of this type, or 0 for no limit.
+    maxsize: int = 0
+
+    #: What to do with an event when there are already ``maxsize`` events of
+    #: its type in the queue.
+    overflow: Overflow = Overflow.BLOCK
+
+
+class _Entry:
+    __slots__ = ('method', 'event', 'live')
+
+    def __init__(self, method, event):
+        self.method = method
+        self.event = event
+        self.live = True
+
+
+class EventQueue:
+    '''
+    A first in, first out queue of events with a separate bound for each type
+    of event.
+
+    Policies are looked up by event name, then by domain, and the default
+    policy applies to the rest. Every operation takes constant time.
+
+    .. code-block:: python
+
+        queue = EventQueue({
+            page.ScreencastFrame: QueuePolicy(1, Overflow.COALESCE),
+            network.DataReceived: QueuePolicy(1000, Overflow.DROP_OLDEST),
+            'Network': QueuePolicy(10000, Overflow.BLOCK),
+        })
+    '''
+    def __init__(self, policies: typing.Optional[typing.Mapping[typing.Any,
+            QueuePolicy]] = None, default: QueuePolicy = QueuePolicy()):
+        '''
+        Constructor.
+
+        :param policies: policies keyed by event class, event name, or domain
+            name, e.g. ``network.DataReceived``, ``Network.dataReceived``, or
+            ``Network``
+        :param default: the policy for events that don't have one
+        '''
+        self._policies = {event_method(key): policy
+            for key, policy in (policies or dict()).items()}
+        self._default = default
+        self._resolved: typing.Dict[str, QueuePolicy] = dict()
+        self._entries: typing.Deque[_Entry] = collections.deque()
+        self._by_method: typing.Dict[str, typing.Deque[_Entry]] = \
+            collections.defaultdict(collections.deque)
+        self._size = 0
+        # Entries that were evicted but are still in ``_entries``.
+        self._dead = 0
+        #: The number of events that were dropped, keyed by event name.
+        self.dropped: typing.Counter[str] = collections.Counter()
+        #: The number of events that were replaced by a newer event of the
+        #: same type, keyed by event name.
+        self.coalesced: typing.Counter[str] = collections.Counter()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def policy(self, method: str) -> QueuePolicy:
+        ''' Return the policy for events named ``method``. '''
+        try:
+            return self._resolved[method]
+        except KeyError:
+            pass
+        policy = self._policies.get(method)
+        if policy is None:
+            policy = self._policies.get(method.split('.', 1)[0], self._default)
+        self._resolved[method] = policy
+        return policy
+
+    def put(self, method: str, event: typing.Any) -> bool:
+        '''
+        Add an event to the queue, applying the overflow policy if there are
+        already too many events of its type.
+
+        :param method: the event name
+        :param event: the event
+        :returns: ``False`` if the event was not added because the queue is
+            full and the policy is :attr:`Overflow.BLOCK`, otherwise ``True``,
+            even if the event was dropped
+        '''
+        policy = self.policy(method)
+        same_type = self._by_method[method]
+        if policy.maxsize and len(same_type) >= policy.maxsize:
+            overflow = policy.overflow
+            if overflow is Overflow.BLOCK:
+                return False
+            if overflow is Overflow.DROP_NEWEST:
+                self.dropped[method] += 1
+                return True
+            if overflow is Overflow.COALESCE:
+                same_type[-1].event = event
+                self.coalesced[method] += 1
+                return True
+            oldest = same_type.popleft()
+            oldest.live = False
+            oldest.event = None
+            self._size -= 1
+            self._dead += 1
+            self.dropped[method] += 1
+            if self._dead > self._size:
+                # Compact so a stalled consumer doesn't keep evicted entries
+                # alive. This happens at most once per ``_size`` evictions, so
+                # the cost is constant per event on average.
+                self._entries = collections.deque(entry
+                    for entry in self._entries if entry.live)
+                self._dead = 0
+        entry = _Entry(method, event)
+        self._entries.append(entry)
+        same_type.append(entry)
+        self._size += 1
+        return True
+
+    def get(self) -> typing.Any:
+        '''
+        Remove and return the oldest event.
+
+        :raises IndexError: if the queue is empty
+        '''
+        while True:
+            entry = self._entries.popleft()
+            if entry.live:
+                break
+            self._dead -= 1
+        self._by_method[entry.method].popleft()
+        self._size -= 1
+        return entry.event
@@ -6,7 +6,7 @@
 # CDP domain: DOM
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -46,6 +46,7 @@ class BackendNodeId(int):
         return 'BackendNodeId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class BackendNode:
     '''
@@ -69,9 +70,9 @@ class BackendNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackendNode:
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            backend_node_id=BackendNodeId(json['backendNodeId']),
         )
 
 
@@ -100,7 +101,14 @@ class PseudoType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PseudoType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class ShadowRootType(enum.Enum):
@@ -116,9 +124,17 @@ class ShadowRootType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ShadowRootType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class Node:
     '''
@@ -268,37 +284,38 @@ class Node:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Node:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            local_name=str(json['localName']),
-            node_value=str(json['nodeValue']),
-            parent_id=NodeId.from_json(json['parentId']) if 'parentId' in json else None,
-            child_node_count=int(json['childNodeCount']) if 'childNodeCount' in json else None,
+            node_id=NodeId(json['nodeId']),
+            backend_node_id=BackendNodeId(json['backendNodeId']),
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            local_name=json['localName'],
+            node_value=json['nodeValue'],
+            parent_id=NodeId(json['parentId']) if 'parentId' in json else None,
+            child_node_count=json.get('childNodeCount'),
             children=[Node.from_json(i) for i in json['children']] if 'children' in json else None,
-            attributes=[str(i) for i in json['attributes']] if 'attributes' in json else None,
-            document_url=str(json['documentURL']) if 'documentURL' in json else None,
-            base_url=str(json['baseURL']) if 'baseURL' in json else None,
-            public_id=str(json['publicId']) if 'publicId' in json else None,
-            system_id=str(json['systemId']) if 'systemId' in json else None,
-            internal_subset=str(json['internalSubset']) if 'internalSubset' in json else None,
-            xml_version=str(json['xmlVersion']) if 'xmlVersion' in json else None,
-            name=str(json['name']) if 'name' in json else None,
-            value=str(json['value']) if 'value' in json else None,
+            attributes=json.get('attributes'),
+            document_url=json.get('documentURL'),
+            base_url=json.get('baseURL'),
+            public_id=json.get('publicId'),
+            system_id=json.get('systemId'),
+            internal_subset=json.get('internalSubset'),
+            xml_version=json.get('xmlVersion'),
+            name=json.get('name'),
+            value=json.get('value'),
             pseudo_type=PseudoType.from_json(json['pseudoType']) if 'pseudoType' in json else None,
             shadow_root_type=ShadowRootType.from_json(json['shadowRootType']) if 'shadowRootType' in json else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None,
+            frame_id=page.FrameId(json['frameId']) if 'frameId' in json else None,
             content_document=Node.from_json(json['contentDocument']) if 'contentDocument' in json else None,
             shadow_roots=[Node.from_json(i) for i in json['shadowRoots']] if 'shadowRoots' in json else None,
             template_content=Node.from_json(json['templateContent']) if 'templateContent' in json else None,
             pseudo_elements=[Node.from_json(i) for i in json['pseudoElements']] if 'pseudoElements' in json else None,
             imported_document=Node.from_json(json['importedDocument']) if 'importedDocument' in json else None,
             distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']] if 'distributedNodes' in json else None,
-            is_svg=bool(json['isSVG']) if 'isSVG' in json else None,
+            is_svg=json.get('isSVG'),
         )
 
 
+@add_slots
 @dataclass
 class RGBA:
     '''
@@ -328,9 +345,9 @@ class RGBA:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RGBA:
         return cls(
-            r=int(json['r']),
-            g=int(json['g']),
-            b=int(json['b']),
+            r=json['r'],
+            g=json['g'],
+            b=json['b'],
             a=float(json['a']) if 'a' in json else None,
         )
 
@@ -350,6 +367,7 @@ class Quad(list):
         return 'Quad({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class BoxModel:
     '''
@@ -391,16 +409,17 @@ class BoxModel:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BoxModel:
         return cls(
-            content=Quad.from_json(json['content']),
-            padding=Quad.from_json(json['padding']),
-            border=Quad.from_json(json['border']),
-            margin=Quad.from_json(json['margin']),
-            width=int(json['width']),
-            height=int(json['height']),
+            content=Quad(json['content']),
+            padding=Quad(json['padding']),
+            border=Quad(json['border']),
+            margin=Quad(json['margin']),
+            width=json['width'],
+            height=json['height'],
             shape_outside=ShapeOutsideInfo.from_json(json['shapeOutside']) if 'shapeOutside' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class ShapeOutsideInfo:
     '''
@@ -425,12 +444,13 @@ class ShapeOutsideInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShapeOutsideInfo:
         return cls(
-            bounds=Quad.from_json(json['bounds']),
-            shape=[i for i in json['shape']],
-            margin_shape=[i for i in json['marginShape']],
+            bounds=Quad(json['bounds']),
+            shape=json['shape'],
+            margin_shape=json['marginShape'],
         )
 
 
+@add_slots
 @dataclass
 class Rect:
     '''
@@ -484,7 +504,7 @@ def collect_class_names_from_subtree(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    return json['classNames']
 
 
 def copy_to(
@@ -513,7 +533,7 @@ def copy_to(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def describe_node(
@@ -635,7 +655,7 @@ def get_attributes(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['attributes']]
+    return json['attributes']
 
 
 def get_box_model(
@@ -694,7 +714,7 @@ def get_content_quads(
         'params': params,
     }
     json = yield cmd_dict
-    return [Quad.from_json(i) for i in json['quads']]
+    return [Quad(i) for i in json['quads']]
 
 
 def get_document(
@@ -775,8 +795,8 @@ def get_node_for_location(
     }
     json = yield cmd_dict
     return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        NodeId.from_json(json['nodeId']) if 'nodeId' in json else None
+        BackendNodeId(json['backendNodeId']),
+        NodeId(json['nodeId']) if 'nodeId' in json else None
     )
 
 
@@ -805,7 +825,7 @@ def get_outer_html(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['outerHTML'])
+    return json['outerHTML']
 
 
 def get_relayout_boundary(
@@ -826,7 +846,7 @@ def get_relayout_boundary(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def get_search_results(
@@ -854,7 +874,7 @@ def get_search_results(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -922,7 +942,7 @@ def move_to(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def perform_search(
@@ -952,8 +972,8 @@ def perform_search(
     }
     json = yield cmd_dict
     return (
-        str(json['searchId']),
-        int(json['resultCount'])
+        json['searchId'],
+        json['resultCount']
     )
 
 
@@ -975,7 +995,7 @@ def push_node_by_path_to_frontend(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def push_nodes_by_backend_ids_to_frontend(
@@ -996,7 +1016,7 @@ def push_nodes_by_backend_ids_to_frontend(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def query_selector(
@@ -1018,7 +1038,7 @@ def query_selector(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def query_selector_all(
@@ -1040,7 +1060,7 @@ def query_selector_all(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1137,7 +1157,7 @@ def request_node(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def resolve_node(
@@ -1268,7 +1288,7 @@ def get_file_info(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['path'])
+    return json['path']
 
 
 def set_inspected_node(
@@ -1310,7 +1330,7 @@ def set_node_name(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return NodeId(json['nodeId'])
 
 
 def set_node_value(
@@ -1387,12 +1407,13 @@ def get_frame_owner(
     }
     json = yield cmd_dict
     return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        NodeId.from_json(json['nodeId']) if 'nodeId' in json else None
+        BackendNodeId(json['backendNodeId']),
+        NodeId(json['nodeId']) if 'nodeId' in json else None
     )
 
 
 @event_class('DOM.attributeModified')
+@add_slots
 @dataclass
 class AttributeModified:
     '''
@@ -1405,16 +1426,19 @@ class AttributeModified:
     #: Attribute value.
     value: str
 
+    _json_names = ('nodeId', 'name', 'value')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name']),
-            value=str(json['value'])
+            node_id=NodeId(json['nodeId']),
+            name=json['name'],
+            value=json['value']
         )
 
 
 @event_class('DOM.attributeRemoved')
+@add_slots
 @dataclass
 class AttributeRemoved:
     '''
@@ -1425,15 +1449,18 @@ class AttributeRemoved:
     #: A ttribute name.
     name: str
 
+    _json_names = ('nodeId', 'name')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeRemoved:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name'])
+            node_id=NodeId(json['nodeId']),
+            name=json['name']
         )
 
 
 @event_class('DOM.characterDataModified')
+@add_slots
 @dataclass
 class CharacterDataModified:
     '''
@@ -1444,15 +1471,18 @@ class CharacterDataModified:
     #: New text value.
     character_data: str
 
+    _json_names = ('nodeId', 'characterData')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CharacterDataModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            character_data=str(json['characterData'])
+            node_id=NodeId(json['nodeId']),
+            character_data=json['characterData']
         )
 
 
 @event_class('DOM.childNodeCountUpdated')
+@add_slots
 @dataclass
 class ChildNodeCountUpdated:
     '''
@@ -1463,15 +1493,18 @@ class ChildNodeCountUpdated:
     #: New node count.
     child_node_count: int
 
+    _json_names = ('nodeId', 'childNodeCount')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeCountUpdated:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            child_node_count=int(json['childNodeCount'])
+            node_id=NodeId(json['nodeId']),
+            child_node_count=json['childNodeCount']
         )
 
 
 @event_class('DOM.childNodeInserted')
+@add_slots
 @dataclass
 class ChildNodeInserted:
     '''
@@ -1484,16 +1517,19 @@ class ChildNodeInserted:
     #: Inserted node data.
     node: Node
 
+    _json_names = ('parentNodeId', 'previousNodeId', 'node')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeInserted:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            previous_node_id=NodeId.from_json(json['previousNodeId']),
+            parent_node_id=NodeId(json['parentNodeId']),
+            previous_node_id=NodeId(json['previousNodeId']),
             node=Node.from_json(json['node'])
         )
 
 
 @event_class('DOM.childNodeRemoved')
+@add_slots
 @dataclass
 class ChildNodeRemoved:
     '''
@@ -1504,15 +1540,18 @@ class ChildNodeRemoved:
     #: Id of the node that has been removed.
     node_id: NodeId
 
+    _json_names = ('parentNodeId', 'nodeId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeRemoved:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            node_id=NodeId.from_json(json['nodeId'])
+            parent_node_id=NodeId(json['parentNodeId']),
+            node_id=NodeId(json['nodeId'])
         )
 
 
 @event_class('DOM.distributedNodesUpdated')
+@add_slots
 @dataclass
 class DistributedNodesUpdated:
     '''
@@ -1525,15 +1564,18 @@ class DistributedNodesUpdated:
     #: Distributed nodes for given insertion point.
     distributed_nodes: typing.List[BackendNode]
 
+    _json_names = ('insertionPointId', 'distributedNodes')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DistributedNodesUpdated:
         return cls(
-            insertion_point_id=NodeId.from_json(json['insertionPointId']),
+            insertion_point_id=NodeId(json['insertionPointId']),
             distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']]
         )
 
 
 @event_class('DOM.documentUpdated')
+@add_slots
 @dataclass
 class DocumentUpdated:
     '''
@@ -1541,6 +1583,8 @@ class DocumentUpdated:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentUpdated:
         return cls(
@@ -1549,6 +1593,7 @@ class DocumentUpdated:
 
 
 @event_class('DOM.inlineStyleInvalidated')
+@add_slots
 @dataclass
 class InlineStyleInvalidated:
     '''
@@ -1559,14 +1604,17 @@ class InlineStyleInvalidated:
     #: Ids of the nodes for which the inline styles have been invalidated.
     node_ids: typing.List[NodeId]
 
+    _json_names = ('nodeIds',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineStyleInvalidated:
         return cls(
-            node_ids=[NodeId.from_json(i) for i in json['nodeIds']]
+            node_ids=[NodeId(i) for i in json['nodeIds']]
         )
 
 
 @event_class('DOM.pseudoElementAdded')
+@add_slots
 @dataclass
 class PseudoElementAdded:
     '''
@@ -1579,15 +1627,18 @@ class PseudoElementAdded:
     #: The added pseudo element.
     pseudo_element: Node
 
+    _json_names = ('parentId', 'pseudoElement')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementAdded:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
+            parent_id=NodeId(json['parentId']),
             pseudo_element=Node.from_json(json['pseudoElement'])
         )
 
 
 @event_class('DOM.pseudoElementRemoved')
+@add_slots
 @dataclass
 class PseudoElementRemoved:
     '''
@@ -1600,15 +1651,18 @@ class PseudoElementRemoved:
     #: The removed pseudo element id.
     pseudo_element_id: NodeId
 
+    _json_names = ('parentId', 'pseudoElementId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementRemoved:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
-            pseudo_element_id=NodeId.from_json(json['pseudoElementId'])
+            parent_id=NodeId(json['parentId']),
+            pseudo_element_id=NodeId(json['pseudoElementId'])
         )
 
 
 @event_class('DOM.setChildNodes')
+@add_slots
 @dataclass
 class SetChildNodes:
     '''
@@ -1620,15 +1674,18 @@ class SetChildNodes:
     #: Child nodes array.
     nodes: typing.List[Node]
 
+    _json_names = ('parentId', 'nodes')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SetChildNodes:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
+            parent_id=NodeId(json['parentId']),
             nodes=[Node.from_json(i) for i in json['nodes']]
         )
 
 
 @event_class('DOM.shadowRootPopped')
+@add_slots
 @dataclass
 class ShadowRootPopped:
     '''
@@ -1641,15 +1698,18 @@ class ShadowRootPopped:
     #: Shadow root id.
     root_id: NodeId
 
+    _json_names = ('hostId', 'rootId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPopped:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
-            root_id=NodeId.from_json(json['rootId'])
+            host_id=NodeId(json['hostId']),
+            root_id=NodeId(json['rootId'])
         )
 
 
 @event_class('DOM.shadowRootPushed')
+@add_slots
 @dataclass
 class ShadowRootPushed:
     '''
@@ -1662,9 +1722,11 @@ class ShadowRootPushed:
     #: Shadow root.
     root: Node
 
+    _json_names = ('hostId', 'root')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPushed:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
+            host_id=NodeId(json['hostId']),
             root=Node.from_json(json['root'])
         )
@@ -6,7 +6,7 @@
 # CDP domain: DOMDebugger
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -28,9 +28,17 @@ class DOMBreakpointType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DOMBreakpointType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class EventListener:
     '''
@@ -86,16 +94,16 @@ class EventListener:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventListener:
         return cls(
-            type_=str(json['type']),
-            use_capture=bool(json['useCapture']),
-            passive=bool(json['passive']),
-            once=bool(json['once']),
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            type_=json['type'],
+            use_capture=json['useCapture'],
+            passive=json['passive'],
+            once=json['once'],
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
             handler=runtime.RemoteObject.from_json(json['handler']) if 'handler' in json else None,
             original_handler=runtime.RemoteObject.from_json(json['originalHandler']) if 'originalHandler' in json else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if 'backendNodeId' in json else None,
+            backend_node_id=dom.BackendNodeId(json['backendNodeId']) if 'backendNodeId' in json else None,
         )
 
 
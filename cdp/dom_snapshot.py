@@ -6,7 +6,7 @@
 # CDP domain: DOMSnapshot (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -17,6 +17,7 @@ from . import page
 from deprecated.sphinx import deprecated # type: ignore
 
 
+@add_slots
 @dataclass
 class DOMNode:
     '''
@@ -170,37 +171,38 @@ class DOMNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DOMNode:
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            node_value=str(json['nodeValue']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']),
-            text_value=str(json['textValue']) if 'textValue' in json else None,
-            input_value=str(json['inputValue']) if 'inputValue' in json else None,
-            input_checked=bool(json['inputChecked']) if 'inputChecked' in json else None,
-            option_selected=bool(json['optionSelected']) if 'optionSelected' in json else None,
-            child_node_indexes=[int(i) for i in json['childNodeIndexes']] if 'childNodeIndexes' in json else None,
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            node_value=json['nodeValue'],
+            backend_node_id=dom.BackendNodeId(json['backendNodeId']),
+            text_value=json.get('textValue'),
+            input_value=json.get('inputValue'),
+            input_checked=json.get('inputChecked'),
+            option_selected=json.get('optionSelected'),
+            child_node_indexes=json.get('childNodeIndexes'),
             attributes=[NameValue.from_json(i) for i in json['attributes']] if 'attributes' in json else None,
-            pseudo_element_indexes=[int(i) for i in json['pseudoElementIndexes']] if 'pseudoElementIndexes' in json else None,
-            layout_node_index=int(json['layoutNodeIndex']) if 'layoutNodeIndex' in json else None,
-            document_url=str(json['documentURL']) if 'documentURL' in json else None,
-            base_url=str(json['baseURL']) if 'baseURL' in json else None,
-            content_language=str(json['contentLanguage']) if 'contentLanguage' in json else None,
-            document_encoding=str(json['documentEncoding']) if 'documentEncoding' in json else None,
-            public_id=str(json['publicId']) if 'publicId' in json else None,
-            system_id=str(json['systemId']) if 'systemId' in json else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None,
-            content_document_index=int(json['contentDocumentIndex']) if 'contentDocumentIndex' in json else None,
+            pseudo_element_indexes=json.get('pseudoElementIndexes'),
+            layout_node_index=json.get('layoutNodeIndex'),
+            document_url=json.get('documentURL'),
+            base_url=json.get('baseURL'),
+            content_language=json.get('contentLanguage'),
+            document_encoding=json.get('documentEncoding'),
+            public_id=json.get('publicId'),
+            system_id=json.get('systemId'),
+            frame_id=page.FrameId(json['frameId']) if 'frameId' in json else None,
+            content_document_index=json.get('contentDocumentIndex'),
             pseudo_type=dom.PseudoType.from_json(json['pseudoType']) if 'pseudoType' in json else None,
             shadow_root_type=dom.ShadowRootType.from_json(json['shadowRootType']) if 'shadowRootType' in json else None,
-            is_clickable=bool(json['isClickable']) if 'isClickable' in json else None,
+            is_clickable=json.get('isClickable'),
             event_listeners=[dom_debugger.EventListener.from_json(i) for i in json['eventListeners']] if 'eventListeners' in json else None,
-            current_source_url=str(json['currentSourceURL']) if 'currentSourceURL' in json else None,
-            origin_url=str(json['originURL']) if 'originURL' in json else None,
+            current_source_url=json.get('currentSourceURL'),
+            origin_url=json.get('originURL'),
             scroll_offset_x=float(json['scrollOffsetX']) if 'scrollOffsetX' in json else None,
             scroll_offset_y=float(json['scrollOffsetY']) if 'scrollOffsetY' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class InlineTextBox:
     '''
@@ -229,11 +231,12 @@ class InlineTextBox:
     def from_json(cls, json: T_JSON_DICT) -> InlineTextBox:
         return cls(
             bounding_box=dom.Rect.from_json(json['boundingBox']),
-            start_character_index=int(json['startCharacterIndex']),
-            num_characters=int(json['numCharacters']),
+            start_character_index=json['startCharacterIndex'],
+            num_characters=json['numCharacters'],
         )
 
 
+@add_slots
 @dataclass
 class LayoutTreeNode:
     '''
@@ -281,16 +284,17 @@ class LayoutTreeNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeNode:
         return cls(
-            dom_node_index=int(json['domNodeIndex']),
+            dom_node_index=json['domNodeIndex'],
             bounding_box=dom.Rect.from_json(json['boundingBox']),
-            layout_text=str(json['layoutText']) if 'layoutText' in json else None,
+            layout_text=json.get('layoutText'),
             inline_text_nodes=[InlineTextBox.from_json(i) for i in json['inlineTextNodes']] if 'inlineTextNodes' in json else None,
-            style_index=int(json['styleIndex']) if 'styleIndex' in json else None,
-            paint_order=int(json['paintOrder']) if 'paintOrder' in json else None,
-            is_stacking_context=bool(json['isStackingContext']) if 'isStackingContext' in json else None,
+            style_index=json.get('styleIndex'),
+            paint_order=json.get('paintOrder'),
+            is_stacking_context=json.get('isStackingContext'),
         )
 
 
+@add_slots
 @dataclass
 class ComputedStyle:
     '''
@@ -311,6 +315,7 @@ class ComputedStyle:
         )
 
 
+@add_slots
 @dataclass
 class NameValue:
     '''
@@ -331,8 +336,8 @@ class NameValue:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NameValue:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -366,6 +371,7 @@ class ArrayOfStrings(list):
         return 'ArrayOfStrings({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class RareStringData:
     '''
@@ -384,11 +390,12 @@ class RareStringData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareStringData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[StringIndex.from_json(i) for i in json['value']],
+            index=json['index'],
+            value=[StringIndex(i) for i in json['value']],
         )
 
 
+@add_slots
 @dataclass
 class RareBooleanData:
     index: typing.List[int]
@@ -401,10 +408,11 @@ class RareBooleanData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareBooleanData:
         return cls(
-            index=[int(i) for i in json['index']],
+            index=json['index'],
         )
 
 
+@add_slots
 @dataclass
 class RareIntegerData:
     index: typing.List[int]
@@ -420,8 +428,8 @@ class RareIntegerData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareIntegerData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[int(i) for i in json['value']],
+            index=json['index'],
+            value=json['value'],
         )
 
 
@@ -437,6 +445,7 @@ class Rectangle(list):
         return 'Rectangle({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class DocumentSnapshot:
     '''
@@ -499,13 +508,13 @@ class DocumentSnapshot:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentSnapshot:
         return cls(
-            document_url=StringIndex.from_json(json['documentURL']),
-            base_url=StringIndex.from_json(json['baseURL']),
-            content_language=StringIndex.from_json(json['contentLanguage']),
-            encoding_name=StringIndex.from_json(json['encodingName']),
-            public_id=StringIndex.from_json(json['publicId']),
-            system_id=StringIndex.from_json(json['systemId']),
-            frame_id=StringIndex.from_json(json['frameId']),
+            document_url=StringIndex(json['documentURL']),
+            base_url=StringIndex(json['baseURL']),
+            content_language=StringIndex(json['contentLanguage']),
+            encoding_name=StringIndex(json['encodingName']),
+            public_id=StringIndex(json['publicId']),
+            system_id=StringIndex(json['systemId']),
+            frame_id=StringIndex(json['frameId']),
             nodes=NodeTreeSnapshot.from_json(json['nodes']),
             layout=LayoutTreeSnapshot.from_json(json['layout']),
             text_boxes=TextBoxSnapshot.from_json(json['textBoxes']),
@@ -514,6 +523,7 @@ class DocumentSnapshot:
         )
 
 
+@add_slots
 @dataclass
 class NodeTreeSnapshot:
     '''
@@ -603,12 +613,12 @@ class NodeTreeSnapshot:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeTreeSnapshot:
         return cls(
-            parent_index=[int(i) for i in json['parentIndex']] if 'parentIndex' in json else None,
-            node_type=[int(i) for i in json['nodeType']] if 'nodeType' in json else None,
-            node_name=[StringIndex.from_json(i) for i in json['nodeName']] if 'nodeName' in json else None,
-            node_value=[StringIndex.from_json(i) for i in json['nodeValue']] if 'nodeValue' in json else None,
-            backend_node_id=[dom.BackendNodeId.from_json(i) for i in json['backendNodeId']] if 'backendNodeId' in json else None,
-            attributes=[ArrayOfStrings.from_json(i) for i in json['attributes']] if 'attributes' in json else None,
+            parent_index=json.get('parentIndex'),
+            node_type=json.get('nodeType'),
+            node_name=[StringIndex(i) for i in json['nodeName']] if 'nodeName' in json else None,
+            node_value=[StringIndex(i) for i in json['nodeValue']] if 'nodeValue' in json else None,
+            backend_node_id=[dom.BackendNodeId(i) for i in json['backendNodeId']] if 'backendNodeId' in json else None,
+            attributes=[ArrayOfStrings(i) for i in json['attributes']] if 'attributes' in json else None,
             text_value=RareStringData.from_json(json['textValue']) if 'textValue' in json else None,
             input_value=RareStringData.from_json(json['inputValue']) if 'inputValue' in json else None,
             input_checked=RareBooleanData.from_json(json['inputChecked']) if 'inputChecked' in json else None,
@@ -621,6 +631,7 @@ class NodeTreeSnapshot:
         )
 
 
+@add_slots
 @dataclass
 class LayoutTreeSnapshot:
     '''
@@ -668,17 +679,18 @@ class LayoutTreeSnapshot:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeSnapshot:
         return cls(
-            node_index=[int(i) for i in json['nodeIndex']],
-            styles=[ArrayOfStrings.from_json(i) for i in json['styles']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            text=[StringIndex.from_json(i) for i in json['text']],
+            node_index=json['nodeIndex'],
+            styles=[ArrayOfStrings(i) for i in json['styles']],
+            bounds=[Rectangle(i) for i in json['bounds']],
+            text=[StringIndex(i) for i in json['text']],
             stacking_contexts=RareBooleanData.from_json(json['stackingContexts']),
-            offset_rects=[Rectangle.from_json(i) for i in json['offsetRects']] if 'offsetRects' in json else None,
-            scroll_rects=[Rectangle.from_json(i) for i in json['scrollRects']] if 'scrollRects' in json else None,
-            client_rects=[Rectangle.from_json(i) for i in json['clientRects']] if 'clientRects' in json else None,
+            offset_rects=[Rectangle(i) for i in json['offsetRects']] if 'offsetRects' in json else None,
+            scroll_rects=[Rectangle(i) for i in json['scrollRects']] if 'scrollRects' in json else None,
+            client_rects=[Rectangle(i) for i in json['clientRects']] if 'clientRects' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class TextBoxSnapshot:
     '''
@@ -710,10 +722,10 @@ class TextBoxSnapshot:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TextBoxSnapshot:
         return cls(
-            layout_index=[int(i) for i in json['layoutIndex']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            start=[int(i) for i in json['start']],
-            length=[int(i) for i in json['length']],
+            layout_index=json['layoutIndex'],
+            bounds=[Rectangle(i) for i in json['bounds']],
+            start=json['start'],
+            length=json['length'],
         )
 
 
@@ -810,5 +822,5 @@ def capture_snapshot(
     json = yield cmd_dict
     return (
         [DocumentSnapshot.from_json(i) for i in json['documents']],
-        [str(i) for i in json['strings']]
+        json['strings']
     )
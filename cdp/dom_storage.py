@@ -6,12 +6,13 @@
 # CDP domain: DOMStorage (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class StorageId:
     '''
@@ -32,8 +33,8 @@ class StorageId:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageId:
         return cls(
-            security_origin=str(json['securityOrigin']),
-            is_local_storage=bool(json['isLocalStorage']),
+            security_origin=json['securityOrigin'],
+            is_local_storage=json['isLocalStorage'],
         )
 
 
@@ -101,7 +102,7 @@ def get_dom_storage_items(
         'params': params,
     }
     json = yield cmd_dict
-    return [Item.from_json(i) for i in json['entries']]
+    return [Item(i) for i in json['entries']]
 
 
 def remove_dom_storage_item(
@@ -144,36 +145,43 @@ def set_dom_storage_item(
 
 
 @event_class('DOMStorage.domStorageItemAdded')
+@add_slots
 @dataclass
 class DomStorageItemAdded:
     storage_id: StorageId
     key: str
     new_value: str
 
+    _json_names = ('storageId', 'key', 'newValue')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemAdded:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            new_value=str(json['newValue'])
+            key=json['key'],
+            new_value=json['newValue']
         )
 
 
 @event_class('DOMStorage.domStorageItemRemoved')
+@add_slots
 @dataclass
 class DomStorageItemRemoved:
     storage_id: StorageId
     key: str
 
+    _json_names = ('storageId', 'key')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemRemoved:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key'])
+            key=json['key']
         )
 
 
 @event_class('DOMStorage.domStorageItemUpdated')
+@add_slots
 @dataclass
 class DomStorageItemUpdated:
     storage_id: StorageId
@@ -181,21 +189,26 @@ class DomStorageItemUpdated:
     old_value: str
     new_value: str
 
+    _json_names = ('storageId', 'key', 'oldValue', 'newValue')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemUpdated:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            old_value=str(json['oldValue']),
-            new_value=str(json['newValue'])
+            key=json['key'],
+            old_value=json['oldValue'],
+            new_value=json['newValue']
         )
 
 
 @event_class('DOMStorage.domStorageItemsCleared')
+@add_slots
 @dataclass
 class DomStorageItemsCleared:
     storage_id: StorageId
 
+    _json_names = ('storageId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemsCleared:
         return cls(
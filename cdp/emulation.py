@@ -6,7 +6,7 @@
 # CDP domain: Emulation
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -17,6 +17,7 @@ from . import page
 from deprecated.sphinx import deprecated # type: ignore
 
 
+@add_slots
 @dataclass
 class ScreenOrientation:
     '''
@@ -37,8 +38,8 @@ class ScreenOrientation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenOrientation:
         return cls(
-            type_=str(json['type']),
-            angle=int(json['angle']),
+            type_=json['type'],
+            angle=json['angle'],
         )
 
 
@@ -58,7 +59,14 @@ class VirtualTimePolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> VirtualTimePolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
@@ -71,7 +79,7 @@ def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
         'method': 'Emulation.canEmulate',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return json['result']
 
 
 def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -517,6 +525,7 @@ def set_user_agent_override(
 
 
 @event_class('Emulation.virtualTimeBudgetExpired')
+@add_slots
 @dataclass
 class VirtualTimeBudgetExpired:
     '''
@@ -526,6 +535,8 @@ class VirtualTimeBudgetExpired:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VirtualTimeBudgetExpired:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: Fetch (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -45,9 +45,17 @@ class RequestStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RequestStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class RequestPattern:
     #: Wildcards ('*' -> zero or more, '?' -> exactly one) are allowed. Escape character is
@@ -73,12 +81,13 @@ class RequestPattern:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
         return cls(
-            url_pattern=str(json['urlPattern']) if 'urlPattern' in json else None,
+            url_pattern=json.get('urlPattern'),
             resource_type=network.ResourceType.from_json(json['resourceType']) if 'resourceType' in json else None,
             request_stage=RequestStage.from_json(json['requestStage']) if 'requestStage' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class HeaderEntry:
     '''
@@ -97,11 +106,12 @@ class HeaderEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeaderEntry:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
+@add_slots
 @dataclass
 class AuthChallenge:
     '''
@@ -131,13 +141,14 @@ class AuthChallenge:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if 'source' in json else None,
+            origin=json['origin'],
+            scheme=json['scheme'],
+            realm=json['realm'],
+            source=json.get('source'),
         )
 
 
+@add_slots
 @dataclass
 class AuthChallengeResponse:
     '''
@@ -168,9 +179,9 @@ class AuthChallengeResponse:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if 'username' in json else None,
-            password=str(json['password']) if 'password' in json else None,
+            response=json['response'],
+            username=json.get('username'),
+            password=json.get('password'),
         )
 
 
@@ -336,8 +347,8 @@ def get_response_body(
     }
     json = yield cmd_dict
     return (
-        str(json['body']),
-        bool(json['base64Encoded'])
+        json['body'],
+        json['base64Encoded']
     )
 
 
@@ -366,10 +377,11 @@ def take_response_body_as_stream(
         'params': params,
     }
     json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    return io.StreamHandle(json['stream'])
 
 
 @event_class('Fetch.requestPaused')
+@add_slots
 @dataclass
 class RequestPaused:
     '''
@@ -398,21 +410,24 @@ class RequestPaused:
     #: then this networkId will be the same as the requestId present in the requestWillBeSent event.
     network_id: typing.Optional[RequestId]
 
+    _json_names = ('requestId', 'request', 'frameId', 'resourceType', 'responseErrorReason', 'responseStatusCode', 'responseHeaders', 'networkId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPaused:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=network.ResourceType.from_json(json['resourceType']),
             response_error_reason=network.ErrorReason.from_json(json['responseErrorReason']) if 'responseErrorReason' in json else None,
-            response_status_code=int(json['responseStatusCode']) if 'responseStatusCode' in json else None,
+            response_status_code=json.get('responseStatusCode'),
             response_headers=[HeaderEntry.from_json(i) for i in json['responseHeaders']] if 'responseHeaders' in json else None,
-            network_id=RequestId.from_json(json['networkId']) if 'networkId' in json else None
+            network_id=RequestId(json['networkId']) if 'networkId' in json else None
         )
 
 
 @event_class('Fetch.authRequired')
+@add_slots
 @dataclass
 class AuthRequired:
     '''
@@ -432,12 +447,14 @@ class AuthRequired:
     #: contains AuthChallengeResponse.
     auth_challenge: AuthChallenge
 
+    _json_names = ('requestId', 'request', 'frameId', 'resourceType', 'authChallenge')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthRequired:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=network.ResourceType.from_json(json['resourceType']),
             auth_challenge=AuthChallenge.from_json(json['authChallenge'])
         )
@@ -6,12 +6,13 @@
 # CDP domain: HeadlessExperimental (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class ScreenshotParams:
     '''
@@ -34,8 +35,8 @@ class ScreenshotParams:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotParams:
         return cls(
-            format_=str(json['format']) if 'format' in json else None,
-            quality=int(json['quality']) if 'quality' in json else None,
+            format_=json.get('format'),
+            quality=json.get('quality'),
         )
 
 
@@ -75,8 +76,8 @@ def begin_frame(
     }
     json = yield cmd_dict
     return (
-        bool(json['hasDamage']),
-        str(json['screenshotData']) if 'screenshotData' in json else None
+        json['hasDamage'],
+        json.get('screenshotData')
     )
 
 
@@ -101,6 +102,7 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
 
 @event_class('HeadlessExperimental.needsBeginFramesChanged')
+@add_slots
 @dataclass
 class NeedsBeginFramesChanged:
     '''
@@ -109,8 +111,10 @@ class NeedsBeginFramesChanged:
     #: True if BeginFrames are needed, false otherwise.
     needs_begin_frames: bool
 
+    _json_names = ('needsBeginFrames',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NeedsBeginFramesChanged:
         return cls(
-            needs_begin_frames=bool(json['needsBeginFrames'])
+            needs_begin_frames=json['needsBeginFrames']
         )
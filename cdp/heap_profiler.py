@@ -6,7 +6,7 @@
 # CDP domain: HeapProfiler (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -29,6 +29,7 @@ class HeapSnapshotObjectId(str):
         return 'HeapSnapshotObjectId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class SamplingHeapProfileNode:
     '''
@@ -59,11 +60,12 @@ class SamplingHeapProfileNode:
         return cls(
             call_frame=runtime.CallFrame.from_json(json['callFrame']),
             self_size=float(json['selfSize']),
-            id_=int(json['id']),
+            id_=json['id'],
             children=[SamplingHeapProfileNode.from_json(i) for i in json['children']],
         )
 
 
+@add_slots
 @dataclass
 class SamplingHeapProfileSample:
     '''
@@ -90,11 +92,12 @@ class SamplingHeapProfileSample:
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileSample:
         return cls(
             size=float(json['size']),
-            node_id=int(json['nodeId']),
+            node_id=json['nodeId'],
             ordinal=float(json['ordinal']),
         )
 
 
+@add_slots
 @dataclass
 class SamplingHeapProfile:
     '''
@@ -174,7 +177,7 @@ def get_heap_object_id(
         'params': params,
     }
     json = yield cmd_dict
-    return HeapSnapshotObjectId.from_json(json['heapSnapshotObjectId'])
+    return HeapSnapshotObjectId(json['heapSnapshotObjectId'])
 
 
 def get_object_by_heap_object_id(
@@ -289,18 +292,22 @@ def take_heap_snapshot(
 
 
 @event_class('HeapProfiler.addHeapSnapshotChunk')
+@add_slots
 @dataclass
 class AddHeapSnapshotChunk:
     chunk: str
 
+    _json_names = ('chunk',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddHeapSnapshotChunk:
         return cls(
-            chunk=str(json['chunk'])
+            chunk=json['chunk']
         )
 
 
 @event_class('HeapProfiler.heapStatsUpdate')
+@add_slots
 @dataclass
 class HeapStatsUpdate:
     '''
@@ -311,14 +318,17 @@ class HeapStatsUpdate:
     #: a total size of the objects for the fragment.
     stats_update: typing.List[int]
 
+    _json_names = ('statsUpdate',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeapStatsUpdate:
         return cls(
-            stats_update=[int(i) for i in json['statsUpdate']]
+            stats_update=json['statsUpdate']
         )
 
 
 @event_class('HeapProfiler.lastSeenObjectId')
+@add_slots
 @dataclass
 class LastSeenObjectId:
     '''
@@ -329,35 +339,43 @@ class LastSeenObjectId:
     last_seen_object_id: int
     timestamp: float
 
+    _json_names = ('lastSeenObjectId', 'timestamp')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LastSeenObjectId:
         return cls(
-            last_seen_object_id=int(json['lastSeenObjectId']),
+            last_seen_object_id=json['lastSeenObjectId'],
             timestamp=float(json['timestamp'])
         )
 
 
 @event_class('HeapProfiler.reportHeapSnapshotProgress')
+@add_slots
 @dataclass
 class ReportHeapSnapshotProgress:
     done: int
     total: int
     finished: typing.Optional[bool]
 
+    _json_names = ('done', 'total', 'finished')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportHeapSnapshotProgress:
         return cls(
-            done=int(json['done']),
-            total=int(json['total']),
-            finished=bool(json['finished']) if 'finished' in json else None
+            done=json['done'],
+            total=json['total'],
+            finished=json.get('finished')
         )
 
 
 @event_class('HeapProfiler.resetProfiles')
+@add_slots
 @dataclass
 class ResetProfiles:
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResetProfiles:
         return cls(
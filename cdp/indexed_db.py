@@ -6,7 +6,7 @@
 # CDP domain: IndexedDB (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -14,6 +14,7 @@ import typing
 from . import runtime
 
 
+@add_slots
 @dataclass
 class DatabaseWithObjectStores:
     '''
@@ -39,12 +40,13 @@ class DatabaseWithObjectStores:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DatabaseWithObjectStores:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             version=float(json['version']),
             object_stores=[ObjectStore.from_json(i) for i in json['objectStores']],
         )
 
 
+@add_slots
 @dataclass
 class ObjectStore:
     '''
@@ -73,13 +75,14 @@ class ObjectStore:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStore:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             key_path=KeyPath.from_json(json['keyPath']),
-            auto_increment=bool(json['autoIncrement']),
+            auto_increment=json['autoIncrement'],
             indexes=[ObjectStoreIndex.from_json(i) for i in json['indexes']],
         )
 
 
+@add_slots
 @dataclass
 class ObjectStoreIndex:
     '''
@@ -108,13 +111,14 @@ class ObjectStoreIndex:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStoreIndex:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             key_path=KeyPath.from_json(json['keyPath']),
-            unique=bool(json['unique']),
-            multi_entry=bool(json['multiEntry']),
+            unique=json['unique'],
+            multi_entry=json['multiEntry'],
         )
 
 
+@add_slots
 @dataclass
 class Key:
     '''
@@ -151,14 +155,15 @@ class Key:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Key:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             number=float(json['number']) if 'number' in json else None,
-            string=str(json['string']) if 'string' in json else None,
+            string=json.get('string'),
             date=float(json['date']) if 'date' in json else None,
             array=[Key.from_json(i) for i in json['array']] if 'array' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class KeyRange:
     '''
@@ -189,13 +194,14 @@ class KeyRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyRange:
         return cls(
-            lower_open=bool(json['lowerOpen']),
-            upper_open=bool(json['upperOpen']),
+            lower_open=json['lowerOpen'],
+            upper_open=json['upperOpen'],
             lower=Key.from_json(json['lower']) if 'lower' in json else None,
             upper=Key.from_json(json['upper']) if 'upper' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class DataEntry:
     '''
@@ -226,6 +232,7 @@ class DataEntry:
         )
 
 
+@add_slots
 @dataclass
 class KeyPath:
     '''
@@ -252,9 +259,9 @@ class KeyPath:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyPath:
         return cls(
-            type_=str(json['type']),
-            string=str(json['string']) if 'string' in json else None,
-            array=[str(i) for i in json['array']] if 'array' in json else None,
+            type_=json['type'],
+            string=json.get('string'),
+            array=json.get('array'),
         )
 
 
@@ -387,7 +394,7 @@ def request_data(
     json = yield cmd_dict
     return (
         [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
-        bool(json['hasMore'])
+        json['hasMore']
     )
 
 
@@ -460,4 +467,4 @@ def request_database_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['databaseNames']]
+    return json['databaseNames']
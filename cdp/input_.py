@@ -6,12 +6,13 @@
 # CDP domain: Input
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class TouchPoint:
     #: X coordinate of the event relative to the main frame's viewport in CSS pixels.
@@ -75,7 +76,14 @@ class GestureSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GestureSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class TimeSinceEpoch(float):
@@ -6,7 +6,7 @@
 # CDP domain: Inspector (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -33,6 +33,7 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
 
 @event_class('Inspector.detached')
+@add_slots
 @dataclass
 class Detached:
     '''
@@ -41,14 +42,17 @@ class Detached:
     #: The reason why connection has been terminated.
     reason: str
 
+    _json_names = ('reason',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Detached:
         return cls(
-            reason=str(json['reason'])
+            reason=json['reason']
         )
 
 
 @event_class('Inspector.targetCrashed')
+@add_slots
 @dataclass
 class TargetCrashed:
     '''
@@ -56,6 +60,8 @@ class TargetCrashed:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
         return cls(
@@ -64,6 +70,7 @@ class TargetCrashed:
 
 
 @event_class('Inspector.targetReloadedAfterCrash')
+@add_slots
 @dataclass
 class TargetReloadedAfterCrash:
     '''
@@ -71,6 +78,8 @@ class TargetReloadedAfterCrash:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetReloadedAfterCrash:
         return cls(
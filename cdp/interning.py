@@ -0,0 +1,237 @@
+'''
+Share the storage of strings that are repeated across many events.
+
+Network events repeat the same request IDs, loader IDs, frame IDs, URLs, MIME
+types and header names over and over, and decoding each event creates new
+objects for all of them. When interning is enabled, the decoders for those
+values look each one up in an intern table first, so that every copy of a
+value refers to the same object.
+
+Interning is off by default, because it trades decoding time for memory: each
+interned value costs a dict lookup, and the interned types and fields are
+decoded by Python functions that wrap the generated ones.
+Each kind of value has its own table, and a table holds at most ``maxsize``
+values: when it is full, the oldest value is evicted to make room, so that a
+long running client doesn't keep every ID it has ever seen alive.
+
+.. code-block:: python
+
+    interner = enable_interning()
+    ...  # decode events
+    disable_interning()
+
+Identifier types are interned when they are decoded if they are generated as
+classes, which is the default. With ``generate.py --newtype-ids`` they are
+plain strings that the decoders don't convert, so the fields of network and
+page types and events that hold them are interned instead.
+'''
+import dataclasses
+import typing
+
+from cdp import network, page
+from cdp.util import is_id_type
+
+
+class InternTable:
+    '''
+    A bounded table of interned values.
+
+    When the table is full, the value that was added first is evicted.
+    '''
+    def __init__(self, maxsize: int):
+        '''
+        Constructor.
+
+        :param maxsize: the maximum number of values in the table
+        '''
+        self.maxsize = maxsize
+        self._values: typing.Dict[typing.Any, typing.Any] = dict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, value):
+        return value in self._values
+
+    def intern(self, value: typing.Any) -> typing.Any:
+        '''
+        Return the interned copy of ``value``, adding ``value`` to the table if
+        it isn't there yet.
+        '''
+        try:
+            return self._values[value]
+        except KeyError:
+            pass
+        if len(self._values) >= self.maxsize:
+            del self._values[next(iter(self._values))]
+        self._values[value] = value
+        return value
+
+    def clear(self) -> None:
+        ''' Remove all values from the table. '''
+        self._values.clear()
+
+
+#: Identifier types whose instances are interned.
+INTERNED_TYPES = [network.RequestId, network.LoaderId, page.FrameId]
+
+#: Dataclass fields whose values are interned, with the name of the table
+#: each one uses. Fields that hold the same kind of value share a table, so
+#: that a request's URL and its response's URL are the same object.
+INTERNED_FIELDS = {
+    network.Request: {'url': 'url', 'method': 'method'},
+    network.Response: {'url': 'url', 'mime_type': 'mime type',
+        'protocol': 'protocol', 'remote_ip_address': 'IP address'},
+    page.Frame: {'url': 'url', 'security_origin': 'origin',
+        'mime_type': 'mime type'},
+}
+
+
+class Interner:
+    '''
+    The intern tables that are used while interning is enabled.
+
+    Use :func:`enable_interning` to create one.
+    '''
+    def __init__(self, maxsize: int):
+        '''
+        Constructor.
+
+        :param maxsize: the maximum number of values in each table
+        '''
+        self.maxsize = maxsize
+        #: The intern tables, keyed by the kind of value they hold, e.g.
+        #: ``network.RequestId`` or ``url``.
+        self.tables: typing.Dict[str, InternTable] = dict()
+        self._patches: typing.List[typing.Tuple[type, str, typing.Any]] = \
+            list()
+
+    def table(self, name: str) -> InternTable:
+        ''' Return the table for a kind of value, creating it if needed. '''
+        try:
+            return self.tables[name]
+        except KeyError:
+            table = InternTable(self.maxsize)
+            self.tables[name] = table
+            return table
+
+    def clear(self) -> None:
+        ''' Remove all values from all tables. '''
+        for table in self.tables.values():
+            table.clear()
+
+    def _patch(self, cls, name, value):
+        self._patches.append((cls, name, cls.__dict__.get(name)))
+        setattr(cls, name, value)
+
+    def _install(self):
+        for type_ in INTERNED_TYPES:
+            if is_id_type(type_):
+                self._patch(type_, 'from_json',
+                    self.table(_table_name(type_)).intern)
+            else:
+                self._patch(type_, '__new__', staticmethod(self._new(type_)))
+        self._patch(network.Headers, '__init__', self._headers_init())
+        for cls, fields in _interned_fields().items():
+            self._patch(cls, 'from_json', self._from_json(cls, fields))
+
+    def _uninstall(self):
+        while self._patches:
+            cls, name, original = self._patches.pop()
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+    def _new(self, type_):
+        table = self.table(_table_name(type_))
+        known = table._values
+        base_new = type_.__mro__[1].__new__
+        def __new__(cls, value):
+            # Look the value up before allocating a new instance.
+            try:
+                return known[value]
+            except KeyError:
+                return table.intern(base_new(cls, value))
+        return __new__
+
+    def _headers_init(self):
+        names = self.table('header name')
+        get = names._values.get
+        intern = names.intern
+        def __init__(self, headers=(), **kwargs):
+            if kwargs or not isinstance(headers, dict):
+                headers = dict(headers, **kwargs)
+            dict.__init__(self, {get(key) or intern(key): value
+                for key, value in headers.items()})
+        return __init__
+
+    def _from_json(self, cls, fields):
+        decode = cls.from_json
+        tables = [(field, self.table(name)) for field, name in fields.items()]
+        def from_json(json):
+            obj = decode(json)
+            for field, table in tables:
+                value = getattr(obj, field)
+                if value:
+                    setattr(obj, field, table.intern(value))
+            return obj
+        return staticmethod(from_json)
+
+
+def _table_name(type_: typing.Any) -> str:
+    ''' Return the name of the table for an identifier type. '''
+    return f'{type_.__module__[4:]}.{type_.__name__}'
+
+
+def _interned_fields() -> typing.Dict[type, typing.Dict[str, str]]:
+    '''
+    Return :data:`INTERNED_FIELDS`, and if identifiers are generated as
+    ``typing.NewType`` aliases, the fields that hold them.
+    '''
+    fields = {cls: dict(names) for cls, names in INTERNED_FIELDS.items()}
+    id_tables = {type_: _table_name(type_) for type_ in INTERNED_TYPES
+        if is_id_type(type_)}
+    if not id_tables:
+        return fields
+    for module in (network, page):
+        for cls in vars(module).values():
+            if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+                continue
+            for name, hint in typing.get_type_hints(cls).items():
+                if getattr(hint, '__origin__', None) is typing.Union:
+                    # An optional field.
+                    hint = hint.__args__[0]
+                if hint in id_tables:
+                    fields.setdefault(cls, dict())[name] = id_tables[hint]
+    return fields
+
+
+_interner: typing.Optional[Interner] = None
+
+
+def enable_interning(maxsize: int = 10000) -> Interner:
+    '''
+    Start interning repeated values in decoded events.
+
+    If interning is already enabled, it is restarted with empty tables.
+
+    :param maxsize: the maximum number of values in each intern table
+    :returns: the tables that are used until interning is disabled
+    '''
+    global _interner
+    disable_interning()
+    _interner = Interner(maxsize)
+    _interner._install()
+    return _interner
+
+
+def disable_interning() -> None:
+    '''
+    Stop interning values. Objects that have already been decoded keep
+    sharing their values.
+    '''
+    global _interner
+    if _interner is not None:
+        _interner._uninstall()
+        _interner = None
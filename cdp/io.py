@@ -6,7 +6,7 @@
 # CDP domain: IO
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -76,9 +76,9 @@ def read(
     }
     json = yield cmd_dict
     return (
-        bool(json['base64Encoded']) if 'base64Encoded' in json else None,
-        str(json['data']),
-        bool(json['eof'])
+        json.get('base64Encoded'),
+        json['data'],
+        json['eof']
     )
 
 
@@ -98,4 +98,4 @@ def resolve_blob(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['uuid'])
+    return json['uuid']
@@ -6,7 +6,7 @@
 # CDP domain: LayerTree (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -44,6 +44,7 @@ class SnapshotId(str):
         return 'SnapshotId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class ScrollRect:
     '''
@@ -65,10 +66,11 @@ class ScrollRect:
     def from_json(cls, json: T_JSON_DICT) -> ScrollRect:
         return cls(
             rect=dom.Rect.from_json(json['rect']),
-            type_=str(json['type']),
+            type_=json['type'],
         )
 
 
+@add_slots
 @dataclass
 class StickyPositionConstraint:
     '''
@@ -101,11 +103,12 @@ class StickyPositionConstraint:
         return cls(
             sticky_box_rect=dom.Rect.from_json(json['stickyBoxRect']),
             containing_block_rect=dom.Rect.from_json(json['containingBlockRect']),
-            nearest_layer_shifting_sticky_box=LayerId.from_json(json['nearestLayerShiftingStickyBox']) if 'nearestLayerShiftingStickyBox' in json else None,
-            nearest_layer_shifting_containing_block=LayerId.from_json(json['nearestLayerShiftingContainingBlock']) if 'nearestLayerShiftingContainingBlock' in json else None,
+            nearest_layer_shifting_sticky_box=LayerId(json['nearestLayerShiftingStickyBox']) if 'nearestLayerShiftingStickyBox' in json else None,
+            nearest_layer_shifting_containing_block=LayerId(json['nearestLayerShiftingContainingBlock']) if 'nearestLayerShiftingContainingBlock' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class PictureTile:
     '''
@@ -132,10 +135,11 @@ class PictureTile:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
-            picture=str(json['picture']),
+            picture=json['picture'],
         )
 
 
+@add_slots
 @dataclass
 class Layer:
     '''
@@ -222,20 +226,20 @@ class Layer:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Layer:
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
+            layer_id=LayerId(json['layerId']),
             offset_x=float(json['offsetX']),
             offset_y=float(json['offsetY']),
             width=float(json['width']),
             height=float(json['height']),
-            paint_count=int(json['paintCount']),
-            draws_content=bool(json['drawsContent']),
-            parent_layer_id=LayerId.from_json(json['parentLayerId']) if 'parentLayerId' in json else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if 'backendNodeId' in json else None,
+            paint_count=json['paintCount'],
+            draws_content=json['drawsContent'],
+            parent_layer_id=LayerId(json['parentLayerId']) if 'parentLayerId' in json else None,
+            backend_node_id=dom.BackendNodeId(json['backendNodeId']) if 'backendNodeId' in json else None,
             transform=[float(i) for i in json['transform']] if 'transform' in json else None,
             anchor_x=float(json['anchorX']) if 'anchorX' in json else None,
             anchor_y=float(json['anchorY']) if 'anchorY' in json else None,
             anchor_z=float(json['anchorZ']) if 'anchorZ' in json else None,
-            invisible=bool(json['invisible']) if 'invisible' in json else None,
+            invisible=json.get('invisible'),
             scroll_rects=[ScrollRect.from_json(i) for i in json['scrollRects']] if 'scrollRects' in json else None,
             sticky_position_constraint=StickyPositionConstraint.from_json(json['stickyPositionConstraint']) if 'stickyPositionConstraint' in json else None,
         )
@@ -272,7 +276,7 @@ def compositing_reasons(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['compositingReasons']]
+    return json['compositingReasons']
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -311,7 +315,7 @@ def load_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return SnapshotId.from_json(json['snapshotId'])
+    return SnapshotId(json['snapshotId'])
 
 
 def make_snapshot(
@@ -330,7 +334,7 @@ def make_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return SnapshotId.from_json(json['snapshotId'])
+    return SnapshotId(json['snapshotId'])
 
 
 def profile_snapshot(
@@ -359,7 +363,7 @@ def profile_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return [PaintProfile.from_json(i) for i in json['timings']]
+    return [PaintProfile(i) for i in json['timings']]
 
 
 def release_snapshot(
@@ -407,7 +411,7 @@ def replay_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['dataURL'])
+    return json['dataURL']
 
 
 def snapshot_command_log(
@@ -426,10 +430,11 @@ def snapshot_command_log(
         'params': params,
     }
     json = yield cmd_dict
-    return [dict(i) for i in json['commandLog']]
+    return json['commandLog']
 
 
 @event_class('LayerTree.layerPainted')
+@add_slots
 @dataclass
 class LayerPainted:
     #: The id of the painted layer.
@@ -437,20 +442,25 @@ class LayerPainted:
     #: Clip rectangle.
     clip: dom.Rect
 
+    _json_names = ('layerId', 'clip')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerPainted:
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
+            layer_id=LayerId(json['layerId']),
             clip=dom.Rect.from_json(json['clip'])
         )
 
 
 @event_class('LayerTree.layerTreeDidChange')
+@add_slots
 @dataclass
 class LayerTreeDidChange:
     #: Layer tree, absent if not in the comspositing mode.
     layers: typing.Optional[typing.List[Layer]]
 
+    _json_names = ('layers',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerTreeDidChange:
         return cls(
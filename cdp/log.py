@@ -6,7 +6,7 @@
 # CDP domain: Log
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -15,6 +15,7 @@ from . import network
 from . import runtime
 
 
+@add_slots
 @dataclass
 class LogEntry:
     '''
@@ -73,19 +74,20 @@ class LogEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LogEntry:
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            timestamp=runtime.Timestamp.from_json(json['timestamp']),
-            url=str(json['url']) if 'url' in json else None,
-            line_number=int(json['lineNumber']) if 'lineNumber' in json else None,
+            source=json['source'],
+            level=json['level'],
+            text=json['text'],
+            timestamp=runtime.Timestamp(json['timestamp']),
+            url=json.get('url'),
+            line_number=json.get('lineNumber'),
             stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if 'stackTrace' in json else None,
-            network_request_id=network.RequestId.from_json(json['networkRequestId']) if 'networkRequestId' in json else None,
-            worker_id=str(json['workerId']) if 'workerId' in json else None,
+            network_request_id=network.RequestId(json['networkRequestId']) if 'networkRequestId' in json else None,
+            worker_id=json.get('workerId'),
             args=[runtime.RemoteObject.from_json(i) for i in json['args']] if 'args' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class ViolationSetting:
     '''
@@ -106,7 +108,7 @@ class ViolationSetting:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ViolationSetting:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             threshold=float(json['threshold']),
         )
 
@@ -170,6 +172,7 @@ def stop_violations_report() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
 
 @event_class('Log.entryAdded')
+@add_slots
 @dataclass
 class EntryAdded:
     '''
@@ -178,6 +181,8 @@ class EntryAdded:
     #: The entry.
     entry: LogEntry
 
+    _json_names = ('entry',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EntryAdded:
         return cls(
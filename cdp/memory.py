@@ -6,7 +6,7 @@
 # CDP domain: Memory (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -24,9 +24,17 @@ class PressureLevel(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureLevel:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class SamplingProfileNode:
     '''
@@ -53,10 +61,11 @@ class SamplingProfileNode:
         return cls(
             size=float(json['size']),
             total=float(json['total']),
-            stack=[str(i) for i in json['stack']],
+            stack=json['stack'],
         )
 
 
+@add_slots
 @dataclass
 class SamplingProfile:
     '''
@@ -80,6 +89,7 @@ class SamplingProfile:
         )
 
 
+@add_slots
 @dataclass
 class Module:
     '''
@@ -109,9 +119,9 @@ class Module:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Module:
         return cls(
-            name=str(json['name']),
-            uuid=str(json['uuid']),
-            base_address=str(json['baseAddress']),
+            name=json['name'],
+            uuid=json['uuid'],
+            base_address=json['baseAddress'],
             size=float(json['size']),
         )
 
@@ -131,9 +141,9 @@ def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
     }
     json = yield cmd_dict
     return (
-        int(json['documents']),
-        int(json['nodes']),
-        int(json['jsEventListeners'])
+        json['documents'],
+        json['nodes'],
+        json['jsEventListeners']
     )
 
 
@@ -0,0 +1,312 @@
+'''
+Measure which CDP methods take the most time and bandwidth.
+
+Instrumentation is off by default. When it is enabled, an
+:class:`Instrumentation` is told about every command that a
+:class:`cdp.connection.Connection` runs, every event that a connection
+receives, and every event that :func:`cdp.util.parse_json_event` or the
+classes in :mod:`cdp.dispatch` decode.
+When it is disabled, the only cost is a check for ``None`` on each message.
+
+:class:`Metrics` is an instrumentation that counts everything by method, and
+can export the counts as a dict or in the Prometheus text format. To do
+something else, e.g. to log slow commands, subclass :class:`Instrumentation`.
+
+.. code-block:: python
+
+    metrics = enable_instrumentation(Metrics())
+    ...  # run commands and receive events
+    print(metrics.prometheus())
+    disable_instrumentation()
+'''
+import bisect
+from dataclasses import dataclass
+import typing
+
+from cdp import util
+
+
+#: The default histogram buckets for command latency, in seconds.
+COMMAND_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0)
+
+#: The default histogram buckets for event decoding time, in seconds.
+DECODE_BUCKETS = (0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.01)
+
+
+class Instrumentation:
+    '''
+    Callbacks for the messages that are sent and received. The methods of
+    this class do nothing; override the ones you need.
+
+    The callbacks are called on the hot path, so they should be quick.
+    '''
+    def command_completed(self, method: str, seconds: float, sent_bytes: int,
+            received_bytes: int, error: bool) -> None:
+        '''
+        Called when a connection receives the response to a command.
+
+        :param method: the command name, e.g. ``Page.navigate``
+        :param seconds: the time from sending the command to receiving the
+            response
+        :param sent_bytes: the size of the encoded command
+        :param received_bytes: the size of the encoded response
+        :param error: true if the response is an error
+        '''
+
+    def event_received(self, method: str, received_bytes: int) -> None:
+        '''
+        Called when a connection receives an event, whether or not anybody is
+        listening for it.
+
+        :param method: the event name, e.g. ``Network.dataReceived``
+        :param received_bytes: the size of the encoded event
+        '''
+
+    def event_decoded(self, method: str, seconds: float) -> None:
+        '''
+        Called when an event is decoded, see :func:`cdp.util.decode_event`.
+
+        :param method: the event name, e.g. ``Network.dataReceived``
+        :param seconds: the time that it took to decode the event's
+            parameters, which doesn't include decoding the JSON
+        '''
+
+    def event_decode_failed(self, method: str) -> None:
+        '''
+        Called when decoding an event raises an exception, e.g. because a
+        required parameter is missing.
+
+        :param method: the event name, e.g. ``Network.dataReceived``
+        '''
+
+
+class Histogram:
+    ''' Counts of observed values in buckets, like a Prometheus histogram. '''
+    def __init__(self, buckets: typing.Sequence[float]):
+        '''
+        Constructor.
+
+        :param buckets: the upper bound of each bucket, in increasing order.
+            Values above the last bound are only counted in the total.
+        '''
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        #: The number of observed values.
+        self.count = 0
+        #: The sum of the observed values.
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        ''' Count a value. '''
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> typing.List[typing.Tuple[float, int]]:
+        '''
+        Return the number of values that are less than or equal to each
+        bucket's upper bound, ending with ``inf`` and the total count.
+        '''
+        result = list()
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+@dataclass
+class CommandStats:
+    ''' Statistics for one command. '''
+    #: The time from sending each command to receiving its response.
+    seconds: Histogram
+
+    #: The number of responses that were errors.
+    errors: int = 0
+
+    #: The total size of the encoded commands.
+    sent_bytes: int = 0
+
+    #: The total size of the encoded responses.
+    received_bytes: int = 0
+
+
+@dataclass
+class EventStats:
+    ''' Statistics for one event. '''
+    #: The time that it took to decode each event.
+    decode_seconds: Histogram
+
+    #: The number of events that connections received.
+    received: int = 0
+
+    #: The total size of the encoded events that connections received.
+    received_bytes: int = 0
+
+    #: The number of events that failed to decode.
+    decode_errors: int = 0
+
+
+class Metrics(Instrumentation):
+    ''' An instrumentation that counts commands and events by method. '''
+    def __init__(self, command_buckets: typing.Sequence[float] =
+            COMMAND_BUCKETS, decode_buckets: typing.Sequence[float] =
+            DECODE_BUCKETS):
+        '''
+        Constructor.
+
+        :param command_buckets: the histogram buckets for command latency
+        :param decode_buckets: the histogram buckets for decoding time
+        '''
+        self._command_buckets = command_buckets
+        self._decode_buckets = decode_buckets
+        #: Statistics for each command, keyed by name.
+        self.commands: typing.Dict[str, CommandStats] = dict()
+        #: Statistics for each event, keyed by name.
+        self.events: typing.Dict[str, EventStats] = dict()
+
+    def command_completed(self, method: str, seconds: float, sent_bytes: int,
+            received_bytes: int, error: bool) -> None:
+        try:
+            stats = self.commands[method]
+        except KeyError:
+            stats = CommandStats(Histogram(self._command_buckets))
+            self.commands[method] = stats
+        stats.seconds.observe(seconds)
+        stats.sent_bytes += sent_bytes
+        stats.received_bytes += received_bytes
+        if error:
+            stats.errors += 1
+
+    def event_received(self, method: str, received_bytes: int) -> None:
+        stats = self._event_stats(method)
+        stats.received += 1
+        stats.received_bytes += received_bytes
+
+    def event_decoded(self, method: str, seconds: float) -> None:
+        self._event_stats(method).decode_seconds.observe(seconds)
+
+    def event_decode_failed(self, method: str) -> None:
+        self._event_stats(method).decode_errors += 1
+
+    def reset(self) -> None:
+        ''' Forget everything that has been counted. '''
+        self.commands.clear()
+        self.events.clear()
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        '''
+        Return the counts as plain data, e.g. to encode as JSON.
+
+        Times are in seconds and sizes are in bytes.
+        '''
+        commands = dict()
+        for method, command in sorted(self.commands.items()):
+            commands[method] = {
+                'count': command.seconds.count,
+                'errors': command.errors,
+                'seconds': command.seconds.sum,
+                'sent_bytes': command.sent_bytes,
+                'received_bytes': command.received_bytes,
+            }
+        events = dict()
+        for method, event in sorted(self.events.items()):
+            events[method] = {
+                'received': event.received,
+                'received_bytes': event.received_bytes,
+                'decoded': event.decode_seconds.count,
+                'decode_seconds': event.decode_seconds.sum,
+                'decode_errors': event.decode_errors,
+            }
+        return {'commands': commands, 'events': events}
+
+    def prometheus(self, prefix: str = 'cdp') -> str:
+        '''
+        Return the counts in the Prometheus text exposition format.
+
+        :param prefix: the prefix of each metric name
+        '''
+        lines: typing.List[str] = list()
+        _histogram(lines, f'{prefix}_command_duration_seconds',
+            'Time from sending a command to receiving its response.',
+            {method: stats.seconds for method, stats in self.commands.items()})
+        _counter(lines, f'{prefix}_command_errors_total',
+            'Commands that failed with an error response.',
+            {method: stats.errors for method, stats in self.commands.items()})
+        _counter(lines, f'{prefix}_command_sent_bytes_total',
+            'Size of the encoded commands.',
+            {method: stats.sent_bytes for method, stats in
+            self.commands.items()})
+        _counter(lines, f'{prefix}_command_received_bytes_total',
+            'Size of the encoded responses.',
+            {method: stats.received_bytes for method, stats in
+            self.commands.items()})
+        _counter(lines, f'{prefix}_events_received_total',
+            'Events received on a connection.',
+            {method: stats.received for method, stats in self.events.items()})
+        _counter(lines, f'{prefix}_event_received_bytes_total',
+            'Size of the encoded events received on a connection.',
+            {method: stats.received_bytes for method, stats in
+            self.events.items()})
+        _histogram(lines, f'{prefix}_event_decode_seconds',
+            'Time to decode the parameters of an event.',
+            {method: stats.decode_seconds for method, stats in
+            self.events.items() if stats.decode_seconds.count})
+        _counter(lines, f'{prefix}_event_decode_errors_total',
+            'Events that failed to decode.',
+            {method: stats.decode_errors for method, stats in
+            self.events.items() if stats.decode_errors})
+        return '\n'.join(lines) + '\n'
+
+    def _event_stats(self, method: str) -> EventStats:
+        try:
+            return self.events[method]
+        except KeyError:
+            stats = EventStats(Histogram(self._decode_buckets))
+            self.events[method] = stats
+            return stats
+
+
+def _label(method: str) -> str:
+    escaped = method.replace('\\', '\\\\').replace('"', '\\"')
+    return f'method="{escaped}"'
+
+
+def _counter(lines: typing.List[str], name: str, help_: str,
+        values: typing.Mapping[str, int]) -> None:
+    lines.append(f'# HELP {name} {help_}')
+    lines.append(f'# TYPE {name} counter')
+    for method, value in sorted(values.items()):
+        lines.append(f'{name}{{{_label(method)}}} {value}')
+
+
+def _histogram(lines: typing.List[str], name: str, help_: str,
+        values: typing.Mapping[str, Histogram]) -> None:
+    lines.append(f'# HELP {name} {help_}')
+    lines.append(f'# TYPE {name} histogram')
+    for method, histogram in sorted(values.items()):
+        label = _label(method)
+        for bound, count in histogram.cumulative():
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            lines.append(f'{name}_bucket{{{label},le="{le}"}} {count}')
+        lines.append(f'{name}_sum{{{label}}} {histogram.sum!r}')
+        lines.append(f'{name}_count{{{label}}} {histogram.count}')
+
+
+def enable_instrumentation(instrumentation: Instrumentation) -> \
+        Instrumentation:
+    '''
+    Start calling ``instrumentation`` for commands and events, replacing any
+    instrumentation that is already enabled.
+
+    :returns: ``instrumentation``
+    '''
+    util._instrumentation = instrumentation
+    return instrumentation
+
+
+def disable_instrumentation() -> None:
+    ''' Stop calling the instrumentation. '''
+    util._instrumentation = None
@@ -0,0 +1,458 @@
+'''
+Keep a local copy of a page's DOM up to date with DOM events.
+
+Once a client has requested nodes, e.g. with ``dom.get_document()``, the
+browser sends events such as ``dom.ChildNodeInserted`` and
+``dom.AttributeModified`` whenever those nodes change. A :class:`DomMirror`
+applies these events to its copy of the tree, so the tree is current without
+requesting the whole document again.
+
+.. code-block:: python
+
+    mirror = DomMirror()
+    events = conn.listen(*DomMirror.EVENTS)
+    mirror.set_document(await conn.execute(dom.get_document(depth=-1)))
+    async for event in events:
+        mirror.apply(event)
+
+Each event costs time proportional to the number of nodes that it adds or
+removes. Children are linked to their siblings, so inserting or removing a
+node doesn't shift its siblings.
+'''
+from __future__ import annotations
+from dataclasses import dataclass, field
+import typing
+
+from cdp import dom
+from cdp.util import add_slots
+
+
+class MirrorNode:
+    '''
+    A node in a :class:`DomMirror`.
+
+    The fields that are copied from ``dom.Node`` have the same names. The
+    other fields link the node to its parent and siblings; use
+    :meth:`children` to iterate over its children.
+    '''
+    __slots__ = ('node_id', 'backend_node_id', 'node_type', 'node_name',
+        'local_name', 'node_value', 'attributes', 'frame_id', 'pseudo_type',
+        'shadow_root_type', 'parent', 'first_child', 'last_child',
+        'previous_sibling', 'next_sibling', 'child_node_count',
+        'children_known', 'shadow_roots', 'pseudo_elements',
+        'content_document', 'template_content')
+
+    def __init__(self, node: dom.Node):
+        self.node_id: dom.NodeId = node.node_id
+        self.backend_node_id: dom.BackendNodeId = node.backend_node_id
+        self.node_type: int = node.node_type
+        self.node_name: str = node.node_name
+        self.local_name: str = node.local_name
+        self.node_value: str = node.node_value
+        #: The element's attributes by name.
+        self.attributes: typing.Dict[str, str] = dict()
+        if node.attributes:
+            values = node.attributes
+            self.attributes = dict(zip(values[::2], values[1::2]))
+        self.frame_id = node.frame_id
+        self.pseudo_type = node.pseudo_type
+        self.shadow_root_type = node.shadow_root_type
+        #: The parent node, or the host of a shadow root, the element of a
+        #: pseudo element, or the frame owner of a content document.
+        self.parent: typing.Optional[MirrorNode] = None
+        self.first_child: typing.Optional[MirrorNode] = None
+        self.last_child: typing.Optional[MirrorNode] = None
+        self.previous_sibling: typing.Optional[MirrorNode] = None
+        self.next_sibling: typing.Optional[MirrorNode] = None
+        #: The number of children, which the browser reports even if it
+        #: hasn't sent the children.
+        self.child_node_count: int = node.child_node_count or 0
+        #: Whether the browser has sent the children of the node. If it
+        #: hasn't, ``child_node_count`` may be more than zero while the node
+        #: has no children in the mirror.
+        self.children_known = False
+        self.shadow_roots: typing.List[MirrorNode] = list()
+        self.pseudo_elements: typing.List[MirrorNode] = list()
+        self.content_document: typing.Optional[MirrorNode] = None
+        self.template_content: typing.Optional[MirrorNode] = None
+
+    def children(self) -> typing.Iterator[MirrorNode]:
+        ''' Yield the node's children in document order. '''
+        child = self.first_child
+        while child is not None:
+            yield child
+            child = child.next_sibling
+
+    def __repr__(self):
+        return 'MirrorNode(node_id={}, node_name={!r})'.format(self.node_id,
+            self.node_name)
+
+
+@add_slots
+@dataclass(frozen=True)
+class NodeState:
+    '''
+    The state of a node at the time of :meth:`DomMirror.snapshot`.
+    '''
+    #: The backend node ID of the node's parent, or ``None`` for the root.
+    parent: typing.Optional[int]
+
+    node_name: str
+
+    node_value: str
+
+    #: The attribute names and values.
+    attributes: typing.Tuple[typing.Tuple[str, str], ...]
+
+
+@add_slots
+@dataclass
+class MirrorDiff:
+    '''
+    The differences between two snapshots, as lists of backend node IDs.
+    '''
+    #: Nodes that are only in the second snapshot.
+    added: typing.List[int] = field(default_factory=list)
+
+    #: Nodes that are only in the first snapshot.
+    removed: typing.List[int] = field(default_factory=list)
+
+    #: Nodes whose parent, value, or attributes changed.
+    changed: typing.List[int] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+class DomMirror:
+    '''
+    A copy of a page's DOM that is updated by DOM events.
+
+    Nodes are indexed by node ID and by backend node ID. Events about nodes
+    that aren't in the mirror are ignored, because the browser only sends
+    events about nodes that the client has requested, and those may have
+    been requested by another mirror or before :meth:`set_document`.
+    '''
+    #: The events that the mirror applies.
+    EVENTS = (
+        dom.SetChildNodes,
+        dom.ChildNodeInserted,
+        dom.ChildNodeRemoved,
+        dom.ChildNodeCountUpdated,
+        dom.AttributeModified,
+        dom.AttributeRemoved,
+        dom.CharacterDataModified,
+        dom.DocumentUpdated,
+        dom.ShadowRootPushed,
+        dom.ShadowRootPopped,
+        dom.PseudoElementAdded,
+        dom.PseudoElementRemoved,
+    )
+
+    def __init__(self):
+        #: The document node, or ``None`` before :meth:`set_document` and
+        #: after ``dom.DocumentUpdated``.
+        self.root: typing.Optional[MirrorNode] = None
+        self._nodes: typing.Dict[int, MirrorNode] = dict()
+        self._backend_ids: typing.Dict[int, int] = dict()
+        self._handlers: typing.Dict[type, typing.Callable[[typing.Any],
+            None]] = {
+            dom.SetChildNodes: self._set_child_nodes,
+            dom.ChildNodeInserted: self._child_node_inserted,
+            dom.ChildNodeRemoved: self._child_node_removed,
+            dom.ChildNodeCountUpdated: self._child_node_count_updated,
+            dom.AttributeModified: self._attribute_modified,
+            dom.AttributeRemoved: self._attribute_removed,
+            dom.CharacterDataModified: self._character_data_modified,
+            dom.DocumentUpdated: self._document_updated,
+            dom.ShadowRootPushed: self._shadow_root_pushed,
+            dom.ShadowRootPopped: self._shadow_root_popped,
+            dom.PseudoElementAdded: self._pseudo_element_added,
+            dom.PseudoElementRemoved: self._pseudo_element_removed,
+        }
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self._nodes
+
+    def set_document(self, root: dom.Node) -> MirrorNode:
+        '''
+        Replace the mirror's tree with the result of ``dom.get_document()``.
+
+        Requesting the document invalidates the node IDs that the browser
+        sent before, so the old tree is discarded.
+        '''
+        self._nodes.clear()
+        self._backend_ids.clear()
+        self.root = self._add_tree(root, None)
+        return self.root
+
+    def node(self, node_id: int) -> MirrorNode:
+        '''
+        Return a node by node ID.
+
+        :raises KeyError: if the node isn't in the mirror
+        '''
+        return self._nodes[node_id]
+
+    def get(self, node_id: int) -> typing.Optional[MirrorNode]:
+        ''' Return a node by node ID, or ``None`` if it isn't in the mirror. '''
+        return self._nodes.get(node_id)
+
+    def node_by_backend_id(self, backend_node_id: int
+            ) -> typing.Optional[MirrorNode]:
+        '''
+        Return a node by backend node ID, or ``None`` if it isn't in the
+        mirror.
+        '''
+        node_id = self._backend_ids.get(backend_node_id)
+        return None if node_id is None else self._nodes[node_id]
+
+    def apply(self, event: typing.Any) -> bool:
+        '''
+        Apply an event to the mirror.
+
+        :param event: an event, which may be lazy (see
+            :func:`cdp.util.lazy_event_class`)
+        :returns: false if the mirror doesn't handle this type of event
+        '''
+        handler = self._handlers.get(type(event))
+        if handler is None:
+            # A lazy event is an instance of a subclass of the event class.
+            for cls in type(event).__mro__[1:]:
+                handler = self._handlers.get(cls)
+                if handler is not None:
+                    self._handlers[type(event)] = handler
+                    break
+            else:
+                return False
+        handler(event)
+        return True
+
+    def snapshot(self) -> typing.Dict[int, NodeState]:
+        '''
+        Return the state of each node by backend node ID, for comparing with
+        :func:`diff`. Backend node IDs stay the same when the document is
+        requested again, unlike node IDs.
+        '''
+        states = dict()
+        for node in self._nodes.values():
+            parent = node.parent
+            states[node.backend_node_id] = NodeState(
+                parent=None if parent is None else parent.backend_node_id,
+                node_name=node.node_name,
+                node_value=node.node_value,
+                attributes=tuple(node.attributes.items()),
+            )
+        return states
+
+    def _add_tree(self, root: dom.Node,
+            parent: typing.Optional[MirrorNode]) -> MirrorNode:
+        ''' Add a node and its subtree without recursion. '''
+        root_node = self._add_node(root, parent)
+        stack = [(root, root_node)]
+        while stack:
+            json_node, node = stack.pop()
+            if json_node.children is not None:
+                node.children_known = True
+                node.child_node_count = 0
+                for child in json_node.children:
+                    child_node = self._add_node(child, node)
+                    self._link(node, node.last_child, child_node)
+                    stack.append((child, child_node))
+            for shadow_root in json_node.shadow_roots or ():
+                shadow_node = self._add_node(shadow_root, node)
+                node.shadow_roots.append(shadow_node)
+                stack.append((shadow_root, shadow_node))
+            for pseudo_element in json_node.pseudo_elements or ():
+                pseudo_node = self._add_node(pseudo_element, node)
+                node.pseudo_elements.append(pseudo_node)
+                stack.append((pseudo_element, pseudo_node))
+            if json_node.content_document is not None:
+                node.content_document = self._add_node(
+                    json_node.content_document, node)
+                stack.append((json_node.content_document,
+                    node.content_document))
+            if json_node.template_content is not None:
+                node.template_content = self._add_node(
+                    json_node.template_content, node)
+                stack.append((json_node.template_content,
+                    node.template_content))
+        return root_node
+
+    def _add_node(self, json_node: dom.Node,
+            parent: typing.Optional[MirrorNode]) -> MirrorNode:
+        node = MirrorNode(json_node)
+        node.parent = parent
+        old = self._nodes.get(node.node_id)
+        if old is not None:
+            self._unlink(old)
+            self._remove_tree(old)
+        self._nodes[node.node_id] = node
+        self._backend_ids[node.backend_node_id] = node.node_id
+        return node
+
+    def _link(self, parent: MirrorNode, previous: typing.Optional[MirrorNode],
+            node: MirrorNode) -> None:
+        ''' Insert a node after ``previous``, or first if that is ``None``. '''
+        following = parent.first_child if previous is None else \
+            previous.next_sibling
+        node.previous_sibling = previous
+        node.next_sibling = following
+        if previous is None:
+            parent.first_child = node
+        else:
+            previous.next_sibling = node
+        if following is None:
+            parent.last_child = node
+        else:
+            following.previous_sibling = node
+        parent.child_node_count += 1
+
+    def _unlink(self, node: MirrorNode) -> None:
+        ''' Detach a node from its parent and siblings. '''
+        parent = node.parent
+        if parent is None:
+            return
+        if node.previous_sibling is not None:
+            node.previous_sibling.next_sibling = node.next_sibling
+        elif parent.first_child is node:
+            parent.first_child = node.next_sibling
+        else:
+            # The node isn't a child, e.g. it is a shadow root.
+            return
+        if node.next_sibling is not None:
+            node.next_sibling.previous_sibling = node.previous_sibling
+        else:
+            parent.last_child = node.previous_sibling
+        node.previous_sibling = node.next_sibling = None
+        parent.child_node_count -= 1
+
+    def _remove_tree(self, root: MirrorNode) -> None:
+        ''' Remove a node and its subtree from the indexes. '''
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if self._nodes.get(node.node_id) is node:
+                del self._nodes[node.node_id]
+                if self._backend_ids.get(node.backend_node_id) == \
+                        node.node_id:
+                    del self._backend_ids[node.backend_node_id]
+            stack.extend(node.children())
+            stack.extend(node.shadow_roots)
+            stack.extend(node.pseudo_elements)
+            if node.content_document is not None:
+                stack.append(node.content_document)
+            if node.template_content is not None:
+                stack.append(node.template_content)
+
+    def _set_child_nodes(self, event: dom.SetChildNodes) -> None:
+        parent = self._nodes.get(event.parent_id)
+        if parent is None:
+            return
+        child = parent.first_child
+        while child is not None:
+            following = child.next_sibling
+            self._remove_tree(child)
+            child.previous_sibling = child.next_sibling = None
+            child = following
+        parent.first_child = parent.last_child = None
+        parent.child_node_count = 0
+        parent.children_known = True
+        for json_node in event.nodes:
+            self._link(parent, parent.last_child,
+                self._add_tree(json_node, parent))
+
+    def _child_node_inserted(self, event: dom.ChildNodeInserted) -> None:
+        parent = self._nodes.get(event.parent_node_id)
+        if parent is None:
+            return
+        node = self._add_tree(event.node, parent)
+        previous = None
+        if event.previous_node_id:
+            previous = self._nodes.get(event.previous_node_id)
+            if previous is None or previous is node or \
+                    previous.parent is not parent:
+                # Don't lose the node if the sibling is unknown.
+                previous = parent.last_child
+        self._link(parent, previous, node)
+
+    def _child_node_removed(self, event: dom.ChildNodeRemoved) -> None:
+        node = self._nodes.get(event.node_id)
+        if node is None:
+            return
+        self._unlink(node)
+        self._remove_tree(node)
+
+    def _child_node_count_updated(self,
+            event: dom.ChildNodeCountUpdated) -> None:
+        node = self._nodes.get(event.node_id)
+        if node is not None and not node.children_known:
+            node.child_node_count = event.child_node_count
+
+    def _attribute_modified(self, event: dom.AttributeModified) -> None:
+        node = self._nodes.get(event.node_id)
+        if node is not None:
+            node.attributes[event.name] = event.value
+
+    def _attribute_removed(self, event: dom.AttributeRemoved) -> None:
+        node = self._nodes.get(event.node_id)
+        if node is not None:
+            node.attributes.pop(event.name, None)
+
+    def _character_data_modified(self,
+            event: dom.CharacterDataModified) -> None:
+        node = self._nodes.get(event.node_id)
+        if node is not None:
+            node.node_value = event.character_data
+
+    def _document_updated(self, event: dom.DocumentUpdated) -> None:
+        self.root = None
+        self._nodes.clear()
+        self._backend_ids.clear()
+
+    def _shadow_root_pushed(self, event: dom.ShadowRootPushed) -> None:
+        host = self._nodes.get(event.host_id)
+        if host is not None:
+            host.shadow_roots.append(self._add_tree(event.root, host))
+
+    def _shadow_root_popped(self, event: dom.ShadowRootPopped) -> None:
+        host = self._nodes.get(event.host_id)
+        root = self._nodes.get(event.root_id)
+        if host is not None and root is not None and root in host.shadow_roots:
+            host.shadow_roots.remove(root)
+            self._remove_tree(root)
+
+    def _pseudo_element_added(self, event: dom.PseudoElementAdded) -> None:
+        parent = self._nodes.get(event.parent_id)
+        if parent is not None:
+            parent.pseudo_elements.append(self._add_tree(event.pseudo_element,
+                parent))
+
+    def _pseudo_element_removed(self,
+            event: dom.PseudoElementRemoved) -> None:
+        parent = self._nodes.get(event.parent_id)
+        node = self._nodes.get(event.pseudo_element_id)
+        if parent is not None and node is not None and \
+                node in parent.pseudo_elements:
+            parent.pseudo_elements.remove(node)
+            self._remove_tree(node)
+
+
+def diff(before: typing.Dict[int, NodeState],
+        after: typing.Dict[int, NodeState]) -> MirrorDiff:
+    '''
+    Compare two results of :meth:`DomMirror.snapshot`.
+    '''
+    result = MirrorDiff()
+    for backend_id, state in after.items():
+        old = before.get(backend_id)
+        if old is None:
+            result.added.append(backend_id)
+        elif old != state:
+            result.changed.append(backend_id)
+    result.removed = [backend_id for backend_id in before
+        if backend_id not in after]
+    return result
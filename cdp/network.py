@@ -6,7 +6,7 @@
 # CDP domain: Network
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -45,7 +45,14 @@ class ResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class LoaderId(str):
@@ -117,7 +124,14 @@ class ErrorReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ErrorReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class TimeSinceEpoch(float):
@@ -184,7 +198,14 @@ class ConnectionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class CookieSameSite(enum.Enum):
@@ -202,9 +223,17 @@ class CookieSameSite(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSameSite:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class ResourceTiming:
     '''
@@ -316,9 +345,17 @@ class ResourcePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourcePriority:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class Request:
     '''
@@ -376,19 +413,20 @@ class Request:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Request:
         return cls(
-            url=str(json['url']),
-            method=str(json['method']),
-            headers=Headers.from_json(json['headers']),
+            url=json['url'],
+            method=json['method'],
+            headers=Headers(json['headers']),
             initial_priority=ResourcePriority.from_json(json['initialPriority']),
-            referrer_policy=str(json['referrerPolicy']),
-            url_fragment=str(json['urlFragment']) if 'urlFragment' in json else None,
-            post_data=str(json['postData']) if 'postData' in json else None,
-            has_post_data=bool(json['hasPostData']) if 'hasPostData' in json else None,
+            referrer_policy=json['referrerPolicy'],
+            url_fragment=json.get('urlFragment'),
+            post_data=json.get('postData'),
+            has_post_data=json.get('hasPostData'),
             mixed_content_type=security.MixedContentType.from_json(json['mixedContentType']) if 'mixedContentType' in json else None,
-            is_link_preload=bool(json['isLinkPreload']) if 'isLinkPreload' in json else None,
+            is_link_preload=json.get('isLinkPreload'),
         )
 
 
+@add_slots
 @dataclass
 class SignedCertificateTimestamp:
     '''
@@ -433,17 +471,18 @@ class SignedCertificateTimestamp:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedCertificateTimestamp:
         return cls(
-            status=str(json['status']),
-            origin=str(json['origin']),
-            log_description=str(json['logDescription']),
-            log_id=str(json['logId']),
-            timestamp=TimeSinceEpoch.from_json(json['timestamp']),
-            hash_algorithm=str(json['hashAlgorithm']),
-            signature_algorithm=str(json['signatureAlgorithm']),
-            signature_data=str(json['signatureData']),
+            status=json['status'],
+            origin=json['origin'],
+            log_description=json['logDescription'],
+            log_id=json['logId'],
+            timestamp=TimeSinceEpoch(json['timestamp']),
+            hash_algorithm=json['hashAlgorithm'],
+            signature_algorithm=json['signatureAlgorithm'],
+            signature_data=json['signatureData'],
         )
 
 
+@add_slots
 @dataclass
 class SecurityDetails:
     '''
@@ -510,19 +549,19 @@ class SecurityDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityDetails:
         return cls(
-            protocol=str(json['protocol']),
-            key_exchange=str(json['keyExchange']),
-            cipher=str(json['cipher']),
-            certificate_id=security.CertificateId.from_json(json['certificateId']),
-            subject_name=str(json['subjectName']),
-            san_list=[str(i) for i in json['sanList']],
-            issuer=str(json['issuer']),
-            valid_from=TimeSinceEpoch.from_json(json['validFrom']),
-            valid_to=TimeSinceEpoch.from_json(json['validTo']),
+            protocol=json['protocol'],
+            key_exchange=json['keyExchange'],
+            cipher=json['cipher'],
+            certificate_id=security.CertificateId(json['certificateId']),
+            subject_name=json['subjectName'],
+            san_list=json['sanList'],
+            issuer=json['issuer'],
+            valid_from=TimeSinceEpoch(json['validFrom']),
+            valid_to=TimeSinceEpoch(json['validTo']),
             signed_certificate_timestamp_list=[SignedCertificateTimestamp.from_json(i) for i in json['signedCertificateTimestampList']],
             certificate_transparency_compliance=CertificateTransparencyCompliance.from_json(json['certificateTransparencyCompliance']),
-            key_exchange_group=str(json['keyExchangeGroup']) if 'keyExchangeGroup' in json else None,
-            mac=str(json['mac']) if 'mac' in json else None,
+            key_exchange_group=json.get('keyExchangeGroup'),
+            mac=json.get('mac'),
         )
 
 
@@ -539,7 +578,14 @@ class CertificateTransparencyCompliance(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateTransparencyCompliance:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class BlockedReason(enum.Enum):
@@ -560,9 +606,17 @@ class BlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
 
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
+
+@add_slots
 @dataclass
 class Response:
     '''
@@ -666,29 +720,30 @@ class Response:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Response:
         return cls(
-            url=str(json['url']),
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            mime_type=str(json['mimeType']),
-            connection_reused=bool(json['connectionReused']),
+            url=json['url'],
+            status=json['status'],
+            status_text=json['statusText'],
+            headers=Headers(json['headers']),
+            mime_type=json['mimeType'],
+            connection_reused=json['connectionReused'],
             connection_id=float(json['connectionId']),
             encoded_data_length=float(json['encodedDataLength']),
             security_state=security.SecurityState.from_json(json['securityState']),
-            headers_text=str(json['headersText']) if 'headersText' in json else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if 'requestHeaders' in json else None,
-            request_headers_text=str(json['requestHeadersText']) if 'requestHeadersText' in json else None,
-            remote_ip_address=str(json['remoteIPAddress']) if 'remoteIPAddress' in json else None,
-            remote_port=int(json['remotePort']) if 'remotePort' in json else None,
-            from_disk_cache=bool(json['fromDiskCache']) if 'fromDiskCache' in json else None,
-            from_service_worker=bool(json['fromServiceWorker']) if 'fromServiceWorker' in json else None,
-            from_prefetch_cache=bool(json['fromPrefetchCache']) if 'fromPrefetchCache' in json else None,
+            headers_text=json.get('headersText'),
+            request_headers=Headers(json['requestHeaders']) if 'requestHeaders' in json else None,
+            request_headers_text=json.get('requestHeadersText'),
+            remote_ip_address=json.get('remoteIPAddress'),
+            remote_port=json.get('remotePort'),
+            from_disk_cache=json.get('fromDiskCache'),
+            from_service_worker=json.get('fromServiceWorker'),
+            from_prefetch_cache=json.get('fromPrefetchCache'),
             timing=ResourceTiming.from_json(json['timing']) if 'timing' in json else None,
-            protocol=str(json['protocol']) if 'protocol' in json else None,
+            protocol=json.get('protocol'),
             security_details=SecurityDetails.from_json(json['securityDetails']) if 'securityDetails' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class WebSocketRequest:
     '''
@@ -705,10 +760,11 @@ class WebSocketRequest:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketRequest:
         return cls(
-            headers=Headers.from_json(json['headers']),
+            headers=Headers(json['headers']),
         )
 
 
+@add_slots
 @dataclass
 class WebSocketResponse:
     '''
@@ -748,15 +804,16 @@ class WebSocketResponse:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketResponse:
         return cls(
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            headers_text=str(json['headersText']) if 'headersText' in json else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if 'requestHeaders' in json else None,
-            request_headers_text=str(json['requestHeadersText']) if 'requestHeadersText' in json else None,
+            status=json['status'],
+            status_text=json['statusText'],
+            headers=Headers(json['headers']),
+            headers_text=json.get('headersText'),
+            request_headers=Headers(json['requestHeaders']) if 'requestHeaders' in json else None,
+            request_headers_text=json.get('requestHeadersText'),
         )
 
 
+@add_slots
 @dataclass
 class WebSocketFrame:
     '''
@@ -784,11 +841,12 @@ class WebSocketFrame:
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrame:
         return cls(
             opcode=float(json['opcode']),
-            mask=bool(json['mask']),
-            payload_data=str(json['payloadData']),
+            mask=json['mask'],
+            payload_data=json['payloadData'],
         )
 
 
+@add_slots
 @dataclass
 class CachedResource:
     '''
@@ -818,13 +876,14 @@ class CachedResource:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResource:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             type_=ResourceType.from_json(json['type']),
             body_size=float(json['bodySize']),
             response=Response.from_json(json['response']) if 'response' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class Initiator:
     '''
@@ -857,13 +916,14 @@ class Initiator:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Initiator:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             stack=runtime.StackTrace.from_json(json['stack']) if 'stack' in json else None,
-            url=str(json['url']) if 'url' in json else None,
+            url=json.get('url'),
             line_number=float(json['lineNumber']) if 'lineNumber' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class Cookie:
     '''
@@ -917,15 +977,15 @@ class Cookie:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cookie:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            domain=str(json['domain']),
-            path=str(json['path']),
+            name=json['name'],
+            value=json['value'],
+            domain=json['domain'],
+            path=json['path'],
             expires=float(json['expires']),
-            size=int(json['size']),
-            http_only=bool(json['httpOnly']),
-            secure=bool(json['secure']),
-            session=bool(json['session']),
+            size=json['size'],
+            http_only=json['httpOnly'],
+            secure=json['secure'],
+            session=json['session'],
             same_site=CookieSameSite.from_json(json['sameSite']) if 'sameSite' in json else None,
         )
 
@@ -953,7 +1013,14 @@ class SetCookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SetCookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class CookieBlockedReason(enum.Enum):
@@ -976,9 +1043,17 @@ class CookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class BlockedSetCookieWithReason:
     '''
@@ -1008,11 +1083,12 @@ class BlockedSetCookieWithReason:
     def from_json(cls, json: T_JSON_DICT) -> BlockedSetCookieWithReason:
         return cls(
             blocked_reason=SetCookieBlockedReason.from_json(json['blockedReason']),
-            cookie_line=str(json['cookieLine']),
+            cookie_line=json['cookieLine'],
             cookie=Cookie.from_json(json['cookie']) if 'cookie' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class BlockedCookieWithReason:
     '''
@@ -1038,6 +1114,7 @@ class BlockedCookieWithReason:
         )
 
 
+@add_slots
 @dataclass
 class CookieParam:
     '''
@@ -1094,18 +1171,19 @@ class CookieParam:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieParam:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            url=str(json['url']) if 'url' in json else None,
-            domain=str(json['domain']) if 'domain' in json else None,
-            path=str(json['path']) if 'path' in json else None,
-            secure=bool(json['secure']) if 'secure' in json else None,
-            http_only=bool(json['httpOnly']) if 'httpOnly' in json else None,
+            name=json['name'],
+            value=json['value'],
+            url=json.get('url'),
+            domain=json.get('domain'),
+            path=json.get('path'),
+            secure=json.get('secure'),
+            http_only=json.get('httpOnly'),
             same_site=CookieSameSite.from_json(json['sameSite']) if 'sameSite' in json else None,
-            expires=TimeSinceEpoch.from_json(json['expires']) if 'expires' in json else None,
+            expires=TimeSinceEpoch(json['expires']) if 'expires' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class AuthChallenge:
     '''
@@ -1135,13 +1213,14 @@ class AuthChallenge:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if 'source' in json else None,
+            origin=json['origin'],
+            scheme=json['scheme'],
+            realm=json['realm'],
+            source=json.get('source'),
         )
 
 
+@add_slots
 @dataclass
 class AuthChallengeResponse:
     '''
@@ -1172,9 +1251,9 @@ class AuthChallengeResponse:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if 'username' in json else None,
-            password=str(json['password']) if 'password' in json else None,
+            response=json['response'],
+            username=json.get('username'),
+            password=json.get('password'),
         )
 
 
@@ -1191,9 +1270,17 @@ class InterceptionStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterceptionStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class RequestPattern:
     '''
@@ -1222,12 +1309,13 @@ class RequestPattern:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
         return cls(
-            url_pattern=str(json['urlPattern']) if 'urlPattern' in json else None,
+            url_pattern=json.get('urlPattern'),
             resource_type=ResourceType.from_json(json['resourceType']) if 'resourceType' in json else None,
             interception_stage=InterceptionStage.from_json(json['interceptionStage']) if 'interceptionStage' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class SignedExchangeSignature:
     '''
@@ -1280,18 +1368,19 @@ class SignedExchangeSignature:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeSignature:
         return cls(
-            label=str(json['label']),
-            signature=str(json['signature']),
-            integrity=str(json['integrity']),
-            validity_url=str(json['validityUrl']),
-            date=int(json['date']),
-            expires=int(json['expires']),
-            cert_url=str(json['certUrl']) if 'certUrl' in json else None,
-            cert_sha256=str(json['certSha256']) if 'certSha256' in json else None,
-            certificates=[str(i) for i in json['certificates']] if 'certificates' in json else None,
+            label=json['label'],
+            signature=json['signature'],
+            integrity=json['integrity'],
+            validity_url=json['validityUrl'],
+            date=json['date'],
+            expires=json['expires'],
+            cert_url=json.get('certUrl'),
+            cert_sha256=json.get('certSha256'),
+            certificates=json.get('certificates'),
         )
 
 
+@add_slots
 @dataclass
 class SignedExchangeHeader:
     '''
@@ -1325,11 +1414,11 @@ class SignedExchangeHeader:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeHeader:
         return cls(
-            request_url=str(json['requestUrl']),
-            response_code=int(json['responseCode']),
-            response_headers=Headers.from_json(json['responseHeaders']),
+            request_url=json['requestUrl'],
+            response_code=json['responseCode'],
+            response_headers=Headers(json['responseHeaders']),
             signatures=[SignedExchangeSignature.from_json(i) for i in json['signatures']],
-            header_integrity=str(json['headerIntegrity']),
+            header_integrity=json['headerIntegrity'],
         )
 
 
@@ -1349,9 +1438,17 @@ class SignedExchangeErrorField(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SignedExchangeErrorField:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class SignedExchangeError:
     '''
@@ -1378,12 +1475,13 @@ class SignedExchangeError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeError:
         return cls(
-            message=str(json['message']),
-            signature_index=int(json['signatureIndex']) if 'signatureIndex' in json else None,
+            message=json['message'],
+            signature_index=json.get('signatureIndex'),
             error_field=SignedExchangeErrorField.from_json(json['errorField']) if 'errorField' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class SignedExchangeInfo:
     '''
@@ -1435,7 +1533,7 @@ def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
         'method': 'Network.canClearBrowserCache',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return json['result']
 
 
 @deprecated(version="1.3")
@@ -1451,7 +1549,7 @@ def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool
         'method': 'Network.canClearBrowserCookies',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return json['result']
 
 
 @deprecated(version="1.3")
@@ -1467,7 +1565,7 @@ def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT
         'method': 'Network.canEmulateNetworkConditions',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return json['result']
 
 
 def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1671,7 +1769,7 @@ def get_certificate(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['tableNames']]
+    return json['tableNames']
 
 
 def get_cookies(
@@ -1715,8 +1813,8 @@ def get_response_body(
     }
     json = yield cmd_dict
     return (
-        str(json['body']),
-        bool(json['base64Encoded'])
+        json['body'],
+        json['base64Encoded']
     )
 
 
@@ -1736,7 +1834,7 @@ def get_request_post_data(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['postData'])
+    return json['postData']
 
 
 def get_response_body_for_interception(
@@ -1761,8 +1859,8 @@ def get_response_body_for_interception(
     }
     json = yield cmd_dict
     return (
-        str(json['body']),
-        bool(json['base64Encoded'])
+        json['body'],
+        json['base64Encoded']
     )
 
 
@@ -1787,7 +1885,7 @@ def take_response_body_for_interception_as_stream(
         'params': params,
     }
     json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    return io.StreamHandle(json['stream'])
 
 
 def replay_xhr(
@@ -1945,7 +2043,7 @@ def set_cookie(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['success'])
+    return json['success']
 
 
 def set_cookies(
@@ -2053,6 +2151,7 @@ def set_user_agent_override(
 
 
 @event_class('Network.dataReceived')
+@add_slots
 @dataclass
 class DataReceived:
     '''
@@ -2067,17 +2166,20 @@ class DataReceived:
     #: Actual bytes received (might be less than dataLength for compressed encodings).
     encoded_data_length: int
 
+    _json_names = ('requestId', 'timestamp', 'dataLength', 'encodedDataLength')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            data_length=int(json['dataLength']),
-            encoded_data_length=int(json['encodedDataLength'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            data_length=json['dataLength'],
+            encoded_data_length=json['encodedDataLength']
         )
 
 
 @event_class('Network.eventSourceMessageReceived')
+@add_slots
 @dataclass
 class EventSourceMessageReceived:
     '''
@@ -2094,18 +2196,21 @@ class EventSourceMessageReceived:
     #: Message content.
     data: str
 
+    _json_names = ('requestId', 'timestamp', 'eventName', 'eventId', 'data')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventSourceMessageReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            event_name=str(json['eventName']),
-            event_id=str(json['eventId']),
-            data=str(json['data'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            event_name=json['eventName'],
+            event_id=json['eventId'],
+            data=json['data']
         )
 
 
 @event_class('Network.loadingFailed')
+@add_slots
 @dataclass
 class LoadingFailed:
     '''
@@ -2124,19 +2229,22 @@ class LoadingFailed:
     #: The reason why loading was blocked, if any.
     blocked_reason: typing.Optional[BlockedReason]
 
+    _json_names = ('requestId', 'timestamp', 'type', 'errorText', 'canceled', 'blockedReason')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFailed:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             type_=ResourceType.from_json(json['type']),
-            error_text=str(json['errorText']),
-            canceled=bool(json['canceled']) if 'canceled' in json else None,
+            error_text=json['errorText'],
+            canceled=json.get('canceled'),
             blocked_reason=BlockedReason.from_json(json['blockedReason']) if 'blockedReason' in json else None
         )
 
 
 @event_class('Network.loadingFinished')
+@add_slots
 @dataclass
 class LoadingFinished:
     '''
@@ -2152,18 +2260,21 @@ class LoadingFinished:
     #: 2) this needs to be reported to the DevTools console.
     should_report_corb_blocking: typing.Optional[bool]
 
+    _json_names = ('requestId', 'timestamp', 'encodedDataLength', 'shouldReportCorbBlocking')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFinished:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             encoded_data_length=float(json['encodedDataLength']),
-            should_report_corb_blocking=bool(json['shouldReportCorbBlocking']) if 'shouldReportCorbBlocking' in json else None
+            should_report_corb_blocking=json.get('shouldReportCorbBlocking')
         )
 
 
 @deprecated(version="1.3")
 @event_class('Network.requestIntercepted')
+@add_slots
 @dataclass
 class RequestIntercepted:
     '''
@@ -2205,25 +2316,28 @@ class RequestIntercepted:
     #: this requestId will be the same as the requestId present in the requestWillBeSent event.
     request_id: typing.Optional[RequestId]
 
+    _json_names = ('interceptionId', 'request', 'frameId', 'resourceType', 'isNavigationRequest', 'isDownload', 'redirectUrl', 'authChallenge', 'responseErrorReason', 'responseStatusCode', 'responseHeaders', 'requestId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestIntercepted:
         return cls(
-            interception_id=InterceptionId.from_json(json['interceptionId']),
+            interception_id=InterceptionId(json['interceptionId']),
             request=Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=ResourceType.from_json(json['resourceType']),
-            is_navigation_request=bool(json['isNavigationRequest']),
-            is_download=bool(json['isDownload']) if 'isDownload' in json else None,
-            redirect_url=str(json['redirectUrl']) if 'redirectUrl' in json else None,
+            is_navigation_request=json['isNavigationRequest'],
+            is_download=json.get('isDownload'),
+            redirect_url=json.get('redirectUrl'),
             auth_challenge=AuthChallenge.from_json(json['authChallenge']) if 'authChallenge' in json else None,
             response_error_reason=ErrorReason.from_json(json['responseErrorReason']) if 'responseErrorReason' in json else None,
-            response_status_code=int(json['responseStatusCode']) if 'responseStatusCode' in json else None,
-            response_headers=Headers.from_json(json['responseHeaders']) if 'responseHeaders' in json else None,
-            request_id=RequestId.from_json(json['requestId']) if 'requestId' in json else None
+            response_status_code=json.get('responseStatusCode'),
+            response_headers=Headers(json['responseHeaders']) if 'responseHeaders' in json else None,
+            request_id=RequestId(json['requestId']) if 'requestId' in json else None
         )
 
 
 @event_class('Network.requestServedFromCache')
+@add_slots
 @dataclass
 class RequestServedFromCache:
     '''
@@ -2232,14 +2346,17 @@ class RequestServedFromCache:
     #: Request identifier.
     request_id: RequestId
 
+    _json_names = ('requestId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestServedFromCache:
         return cls(
-            request_id=RequestId.from_json(json['requestId'])
+            request_id=RequestId(json['requestId'])
         )
 
 
 @event_class('Network.requestWillBeSent')
+@add_slots
 @dataclass
 class RequestWillBeSent:
     '''
@@ -2268,24 +2385,27 @@ class RequestWillBeSent:
     #: Whether the request is initiated by a user gesture. Defaults to false.
     has_user_gesture: typing.Optional[bool]
 
+    _json_names = ('requestId', 'loaderId', 'documentURL', 'request', 'timestamp', 'wallTime', 'initiator', 'redirectResponse', 'type', 'frameId', 'hasUserGesture')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSent:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            document_url=str(json['documentURL']),
+            request_id=RequestId(json['requestId']),
+            loader_id=LoaderId(json['loaderId']),
+            document_url=json['documentURL'],
             request=Request.from_json(json['request']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
+            timestamp=MonotonicTime(json['timestamp']),
+            wall_time=TimeSinceEpoch(json['wallTime']),
             initiator=Initiator.from_json(json['initiator']),
             redirect_response=Response.from_json(json['redirectResponse']) if 'redirectResponse' in json else None,
             type_=ResourceType.from_json(json['type']) if 'type' in json else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None,
-            has_user_gesture=bool(json['hasUserGesture']) if 'hasUserGesture' in json else None
+            frame_id=page.FrameId(json['frameId']) if 'frameId' in json else None,
+            has_user_gesture=json.get('hasUserGesture')
         )
 
 
 @event_class('Network.resourceChangedPriority')
+@add_slots
 @dataclass
 class ResourceChangedPriority:
     '''
@@ -2300,16 +2420,19 @@ class ResourceChangedPriority:
     #: Timestamp.
     timestamp: MonotonicTime
 
+    _json_names = ('requestId', 'newPriority', 'timestamp')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResourceChangedPriority:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             new_priority=ResourcePriority.from_json(json['newPriority']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
 @event_class('Network.signedExchangeReceived')
+@add_slots
 @dataclass
 class SignedExchangeReceived:
     '''
@@ -2322,15 +2445,18 @@ class SignedExchangeReceived:
     #: Information about the signed exchange response.
     info: SignedExchangeInfo
 
+    _json_names = ('requestId', 'info')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             info=SignedExchangeInfo.from_json(json['info'])
         )
 
 
 @event_class('Network.responseReceived')
+@add_slots
 @dataclass
 class ResponseReceived:
     '''
@@ -2349,19 +2475,22 @@ class ResponseReceived:
     #: Frame identifier.
     frame_id: typing.Optional[page.FrameId]
 
+    _json_names = ('requestId', 'loaderId', 'timestamp', 'type', 'response', 'frameId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            loader_id=LoaderId(json['loaderId']),
+            timestamp=MonotonicTime(json['timestamp']),
             type_=ResourceType.from_json(json['type']),
             response=Response.from_json(json['response']),
-            frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None
+            frame_id=page.FrameId(json['frameId']) if 'frameId' in json else None
         )
 
 
 @event_class('Network.webSocketClosed')
+@add_slots
 @dataclass
 class WebSocketClosed:
     '''
@@ -2372,15 +2501,18 @@ class WebSocketClosed:
     #: Timestamp.
     timestamp: MonotonicTime
 
+    _json_names = ('requestId', 'timestamp')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketClosed:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
 @event_class('Network.webSocketCreated')
+@add_slots
 @dataclass
 class WebSocketCreated:
     '''
@@ -2393,16 +2525,19 @@ class WebSocketCreated:
     #: Request initiator.
     initiator: typing.Optional[Initiator]
 
+    _json_names = ('requestId', 'url', 'initiator')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketCreated:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            url=str(json['url']),
+            request_id=RequestId(json['requestId']),
+            url=json['url'],
             initiator=Initiator.from_json(json['initiator']) if 'initiator' in json else None
         )
 
 
 @event_class('Network.webSocketFrameError')
+@add_slots
 @dataclass
 class WebSocketFrameError:
     '''
@@ -2415,16 +2550,19 @@ class WebSocketFrameError:
     #: WebSocket error message.
     error_message: str
 
+    _json_names = ('requestId', 'timestamp', 'errorMessage')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameError:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            error_message=str(json['errorMessage'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            error_message=json['errorMessage']
         )
 
 
 @event_class('Network.webSocketFrameReceived')
+@add_slots
 @dataclass
 class WebSocketFrameReceived:
     '''
@@ -2437,16 +2575,19 @@ class WebSocketFrameReceived:
     #: WebSocket response data.
     response: WebSocketFrame
 
+    _json_names = ('requestId', 'timestamp', 'response')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketFrame.from_json(json['response'])
         )
 
 
 @event_class('Network.webSocketFrameSent')
+@add_slots
 @dataclass
 class WebSocketFrameSent:
     '''
@@ -2459,16 +2600,19 @@ class WebSocketFrameSent:
     #: WebSocket response data.
     response: WebSocketFrame
 
+    _json_names = ('requestId', 'timestamp', 'response')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameSent:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketFrame.from_json(json['response'])
         )
 
 
 @event_class('Network.webSocketHandshakeResponseReceived')
+@add_slots
 @dataclass
 class WebSocketHandshakeResponseReceived:
     '''
@@ -2481,16 +2625,19 @@ class WebSocketHandshakeResponseReceived:
     #: WebSocket response data.
     response: WebSocketResponse
 
+    _json_names = ('requestId', 'timestamp', 'response')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketHandshakeResponseReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketResponse.from_json(json['response'])
         )
 
 
 @event_class('Network.webSocketWillSendHandshakeRequest')
+@add_slots
 @dataclass
 class WebSocketWillSendHandshakeRequest:
     '''
@@ -2505,17 +2652,20 @@ class WebSocketWillSendHandshakeRequest:
     #: WebSocket request data.
     request: WebSocketRequest
 
+    _json_names = ('requestId', 'timestamp', 'wallTime', 'request')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketWillSendHandshakeRequest:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            wall_time=TimeSinceEpoch(json['wallTime']),
             request=WebSocketRequest.from_json(json['request'])
         )
 
 
 @event_class('Network.requestWillBeSentExtraInfo')
+@add_slots
 @dataclass
 class RequestWillBeSentExtraInfo:
     '''
@@ -2534,16 +2684,19 @@ class RequestWillBeSentExtraInfo:
     #: Raw request headers as they will be sent over the wire.
     headers: Headers
 
+    _json_names = ('requestId', 'blockedCookies', 'headers')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSentExtraInfo:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             blocked_cookies=[BlockedCookieWithReason.from_json(i) for i in json['blockedCookies']],
-            headers=Headers.from_json(json['headers'])
+            headers=Headers(json['headers'])
         )
 
 
 @event_class('Network.responseReceivedExtraInfo')
+@add_slots
 @dataclass
 class ResponseReceivedExtraInfo:
     '''
@@ -2565,11 +2718,13 @@ class ResponseReceivedExtraInfo:
     #: available, such as in the case of HTTP/2 or QUIC.
     headers_text: typing.Optional[str]
 
+    _json_names = ('requestId', 'blockedCookies', 'headers', 'headersText')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedExtraInfo:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             blocked_cookies=[BlockedSetCookieWithReason.from_json(i) for i in json['blockedCookies']],
-            headers=Headers.from_json(json['headers']),
-            headers_text=str(json['headersText']) if 'headersText' in json else None
+            headers=Headers(json['headers']),
+            headers_text=json.get('headersText')
         )
@@ -0,0 +1,521 @@
+'''
+Decode DOM trees into a compact table of nodes.
+
+``dom.Node.from_json()`` decodes a tree recursively, into a dataclass for
+every node with its own list of attributes, so a large document costs a lot
+of memory and a deep one can exceed the recursion limit. A :class:`NodeTable`
+decodes the same tree without recursion into parallel arrays with a row for
+each node: its IDs, its parent, its type, indexes into a shared table of
+strings for its names and value, and the range of its attributes.
+
+.. code-block:: python
+
+    table = await conn.execute(node_table.get_document(depth=-1))
+    for node in table.root.children:
+        print(node.node_name, node.attributes)
+
+:class:`NodeView` presents a row with the same fields as ``dom.Node``, and
+:meth:`NodeTable.to_node` converts a subtree to ``dom.Node`` objects.
+
+The JSON of a deep tree is nested as deeply, so a tree that exceeds the
+recursion limit of the JSON decoder can only be requested with
+``get_flattened_document()``.
+'''
+from __future__ import annotations
+import array
+import enum
+import typing
+
+from cdp import dom
+from cdp.util import T_JSON_DICT
+
+
+class NodeRelation(enum.IntEnum):
+    ''' How a node is related to the node it belongs to. '''
+    CHILD = 0
+    SHADOW_ROOT = 1
+    PSEUDO_ELEMENT = 2
+    CONTENT_DOCUMENT = 3
+    TEMPLATE_CONTENT = 4
+    IMPORTED_DOCUMENT = 5
+
+
+# The keys of the nodes that nest other nodes, in the order that the nested
+# nodes are stored in.
+_NESTED = [
+    ('shadowRoots', NodeRelation.SHADOW_ROOT, True),
+    ('pseudoElements', NodeRelation.PSEUDO_ELEMENT, True),
+    ('contentDocument', NodeRelation.CONTENT_DOCUMENT, False),
+    ('templateContent', NodeRelation.TEMPLATE_CONTENT, False),
+    ('importedDocument', NodeRelation.IMPORTED_DOCUMENT, False),
+    ('children', NodeRelation.CHILD, True),
+]
+
+# The keys that are stored in columns. The other keys of a node are rare, and
+# they are kept in ``NodeTable.extras``.
+_COLUMN_KEYS = frozenset(['nodeId', 'backendNodeId', 'nodeType', 'nodeName',
+    'localName', 'nodeValue', 'parentId', 'childNodeCount', 'attributes'] +
+    [key for key, _, _ in _NESTED])
+
+# Flags of each node.
+_HAS_CHILDREN = 1
+_HAS_ATTRIBUTES = 2
+_HAS_PARENT_ID = 4
+
+_INT = 'i'
+
+
+class NodeTable:
+    '''
+    A DOM tree stored in parallel arrays with a row for each node.
+
+    The rows are in document order. The children of a row, and the nodes
+    nested in it such as shadow roots, are linked with ``first_child`` and
+    ``next_sibling``, and ``relation`` says how each row is related to its
+    ``parent``. String columns hold indexes into ``strings``, which holds each
+    distinct string once.
+    '''
+    def __init__(self):
+        #: The node ID of each row.
+        self.node_id = array.array(_INT)
+        #: The backend node ID of each row.
+        self.backend_node_id = array.array(_INT)
+        #: The row of each row's parent, or -1.
+        self.parent = array.array(_INT)
+        #: The ``parentId`` that the browser sent for each row, or 0 if it
+        #: didn't send one.
+        self.parent_id = array.array(_INT)
+        #: The :class:`NodeRelation` of each row to its parent.
+        self.relation = array.array('b')
+        #: The node type of each row.
+        self.node_type = array.array(_INT)
+        #: The index of each row's node name in ``strings``.
+        self.node_name = array.array(_INT)
+        #: The index of each row's local name in ``strings``.
+        self.local_name = array.array(_INT)
+        #: The index of each row's node value in ``strings``.
+        self.node_value = array.array(_INT)
+        #: The child node count of each row, or -1 if the browser didn't
+        #: send it.
+        self.child_node_count = array.array(_INT)
+        #: The first row nested in each row, or -1.
+        self.first_child = array.array(_INT)
+        #: The next row nested in the same parent, or -1.
+        self.next_sibling = array.array(_INT)
+        #: The attributes of row ``i`` are
+        #: ``attributes[attribute_offsets[i]:attribute_offsets[i + 1]]``.
+        self.attribute_offsets = array.array(_INT, [0])
+        #: The flattened names and values of all attributes, as indexes into
+        #: ``strings``.
+        self.attributes = array.array(_INT)
+        #: The distinct strings of the tree.
+        self.strings: typing.List[str] = list()
+        #: The rare fields of some rows, e.g. ``documentURL``, as JSON.
+        self.extras: typing.Dict[int, T_JSON_DICT] = dict()
+        self._flags = bytearray()
+        self._string_ids: typing.Dict[str, int] = dict()
+        self._last_child: typing.List[int] = list()
+        self._rows: typing.Optional[typing.Dict[int, int]] = None
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> NodeTable:
+        '''
+        Decode a tree, e.g. the result of ``DOM.getDocument``.
+
+        :param json: the JSON of the root node
+        '''
+        table = cls()
+        table._add_tree(json)
+        table._finish()
+        return table
+
+    @classmethod
+    def from_flattened_json(cls, json: typing.List[T_JSON_DICT]
+            ) -> NodeTable:
+        '''
+        Decode a list of nodes that refer to their parents with
+        ``parentId``, e.g. the result of ``DOM.getFlattenedDocument``.
+        Shadow roots and pseudo elements are identified by their
+        ``shadowRootType`` and ``pseudoType``.
+
+        :param json: the JSON of the nodes, in document order
+        '''
+        table = cls()
+        rows = [table._add_node(node) for node in json]
+        row_ids = {node_id: row for row, node_id in enumerate(table.node_id)}
+        for row, node in zip(rows, json):
+            parent = row_ids.get(node.get('parentId', -1), -1)
+            if 'shadowRootType' in node:
+                relation = NodeRelation.SHADOW_ROOT
+            elif 'pseudoType' in node:
+                relation = NodeRelation.PSEUDO_ELEMENT
+            else:
+                relation = NodeRelation.CHILD
+            if parent >= 0:
+                table._link(parent, row, relation)
+                if relation == NodeRelation.CHILD:
+                    table._flags[parent] |= _HAS_CHILDREN
+        table._rows = row_ids
+        table._finish()
+        return table
+
+    def _add_node(self, json: T_JSON_DICT) -> int:
+        ''' Add a row for a node without linking it to its parent. '''
+        row = len(self.node_id)
+        string_ids = self._string_ids
+        self.node_id.append(json['nodeId'])
+        self.backend_node_id.append(json['backendNodeId'])
+        self.parent.append(-1)
+        self.relation.append(NodeRelation.CHILD)
+        self.node_type.append(json['nodeType'])
+        self.node_name.append(string_ids.setdefault(json['nodeName'],
+            len(string_ids)))
+        self.local_name.append(string_ids.setdefault(json['localName'],
+            len(string_ids)))
+        self.node_value.append(string_ids.setdefault(json['nodeValue'],
+            len(string_ids)))
+        self.child_node_count.append(json.get('childNodeCount', -1))
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self._last_child.append(-1)
+        flags = 0
+        if 'children' in json:
+            flags |= _HAS_CHILDREN
+        attributes = json.get('attributes')
+        if attributes is not None:
+            flags |= _HAS_ATTRIBUTES
+            self.attributes.extend([string_ids.setdefault(value,
+                len(string_ids)) for value in attributes])
+        self.attribute_offsets.append(len(self.attributes))
+        parent_id = json.get('parentId')
+        if parent_id is not None:
+            flags |= _HAS_PARENT_ID
+        self.parent_id.append(parent_id or 0)
+        self._flags.append(flags)
+        extra_keys = json.keys() - _COLUMN_KEYS
+        if extra_keys:
+            self.extras[row] = {key: json[key] for key in extra_keys}
+        return row
+
+    def _link(self, parent: int, row: int, relation: int) -> None:
+        ''' Add a row after the last row nested in ``parent``. '''
+        self.parent[row] = parent
+        self.relation[row] = relation
+        last = self._last_child[parent]
+        if last < 0:
+            self.first_child[parent] = row
+        else:
+            self.next_sibling[last] = row
+        self._last_child[parent] = row
+
+    def _add_tree(self, json: T_JSON_DICT) -> None:
+        ''' Add a node and the nodes nested in it without recursion. '''
+        stack: typing.List[typing.Tuple[T_JSON_DICT, int, int]] = [
+            (json, -1, NodeRelation.CHILD)]
+        while stack:
+            node, parent, relation = stack.pop()
+            row = self._add_node(node)
+            if parent >= 0:
+                self._link(parent, row, relation)
+            # Push the nested nodes in reverse, so that they are added in
+            # order.
+            for key, nested_relation, many in reversed(_NESTED):
+                nested = node.get(key)
+                if nested is None:
+                    continue
+                if many:
+                    stack.extend((child, row, nested_relation)
+                        for child in reversed(nested))
+                else:
+                    stack.append((nested, row, nested_relation))
+
+    def _finish(self) -> None:
+        # String IDs are assigned in insertion order, so the keys of the
+        # dict are the table of strings.
+        self.strings = list(self._string_ids)
+        # Drop the tables that are only needed while decoding.
+        self._string_ids = dict()
+        self._last_child = list()
+
+    def __len__(self) -> int:
+        return len(self.node_id)
+
+    @property
+    def root(self) -> NodeView:
+        ''' The first row, which is the root of a decoded tree. '''
+        return self.view(0)
+
+    def view(self, row: int) -> NodeView:
+        ''' Return a view of a row. '''
+        if not 0 <= row < len(self.node_id):
+            raise IndexError('Row out of range: {}'.format(row))
+        return NodeView(self, row)
+
+    def row(self, node_id: int) -> int:
+        '''
+        Return the row of a node ID.
+
+        :raises KeyError: if the table doesn't contain the node
+        '''
+        if self._rows is None:
+            self._rows = {node_id: row for row, node_id in
+                enumerate(self.node_id)}
+        return self._rows[node_id]
+
+    def nested(self, row: int, relation: typing.Optional[int] = None
+            ) -> typing.Iterator[int]:
+        '''
+        Yield the rows nested in a row, or only those with a relation, e.g.
+        ``NodeRelation.CHILD`` for its children.
+        '''
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        row = first_child[row]
+        while row >= 0:
+            if relation is None or self.relation[row] == relation:
+                yield row
+            row = next_sibling[row]
+
+    def attribute_list(self, row: int) -> typing.Optional[typing.List[str]]:
+        '''
+        Return the flattened names and values of a row's attributes, or
+        ``None`` if the row doesn't have attributes.
+        '''
+        if not self._flags[row] & _HAS_ATTRIBUTES:
+            return None
+        strings = self.strings
+        return [strings[i] for i in self.attributes[
+            self.attribute_offsets[row]:self.attribute_offsets[row + 1]]]
+
+    def _parent_id(self, row: int) -> typing.Optional[int]:
+        if not self._flags[row] & _HAS_PARENT_ID:
+            return None
+        return self.parent_id[row]
+
+    def _node_json(self, row: int) -> T_JSON_DICT:
+        ''' Return the JSON of a row without the nodes nested in it. '''
+        strings = self.strings
+        json: T_JSON_DICT = {
+            'nodeId': self.node_id[row],
+            'backendNodeId': self.backend_node_id[row],
+            'nodeType': self.node_type[row],
+            'nodeName': strings[self.node_name[row]],
+            'localName': strings[self.local_name[row]],
+            'nodeValue': strings[self.node_value[row]],
+        }
+        if self.child_node_count[row] >= 0:
+            json['childNodeCount'] = self.child_node_count[row]
+        attributes = self.attribute_list(row)
+        if attributes is not None:
+            json['attributes'] = attributes
+        json.update(self.extras.get(row, ()))
+        parent_id = self._parent_id(row)
+        if parent_id is not None:
+            json['parentId'] = parent_id
+        return json
+
+    def to_node(self, row: int = 0) -> dom.Node:
+        '''
+        Convert a row and the nodes nested in it to ``dom.Node`` objects,
+        without recursion.
+        '''
+        root: typing.Optional[dom.Node] = None
+        stack: typing.List[typing.Tuple[int, typing.Optional[dom.Node]]] = [
+            (row, None)]
+        while stack:
+            row, parent = stack.pop()
+            node = dom.Node.from_json(self._node_json(row))
+            if self._flags[row] & _HAS_CHILDREN:
+                node.children = list()
+            if parent is None:
+                root = node
+            else:
+                _attach(parent, node, self.relation[row])
+            stack.extend((nested, node)
+                for nested in reversed(list(self.nested(row))))
+        assert root is not None
+        return root
+
+
+def _attach(parent: dom.Node, node: dom.Node, relation: int) -> None:
+    if relation == NodeRelation.CHILD:
+        if parent.children is None:
+            parent.children = list()
+        parent.children.append(node)
+    elif relation == NodeRelation.SHADOW_ROOT:
+        if parent.shadow_roots is None:
+            parent.shadow_roots = list()
+        parent.shadow_roots.append(node)
+    elif relation == NodeRelation.PSEUDO_ELEMENT:
+        if parent.pseudo_elements is None:
+            parent.pseudo_elements = list()
+        parent.pseudo_elements.append(node)
+    elif relation == NodeRelation.CONTENT_DOCUMENT:
+        parent.content_document = node
+    elif relation == NodeRelation.TEMPLATE_CONTENT:
+        parent.template_content = node
+    else:
+        parent.imported_document = node
+
+
+class NodeView:
+    '''
+    A row of a :class:`NodeTable` with the same fields as ``dom.Node``.
+
+    The fields are read from the table when they are accessed. Nested nodes,
+    e.g. ``children``, are views too. The rare fields, e.g. ``document_url``,
+    are decoded by ``dom.Node``.
+    '''
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: NodeTable, row: int):
+        self.table = table
+        self.row = row
+
+    @property
+    def node_id(self) -> dom.NodeId:
+        return dom.NodeId(self.table.node_id[self.row])
+
+    @property
+    def backend_node_id(self) -> dom.BackendNodeId:
+        return dom.BackendNodeId(self.table.backend_node_id[self.row])
+
+    @property
+    def node_type(self) -> int:
+        return self.table.node_type[self.row]
+
+    @property
+    def node_name(self) -> str:
+        return self.table.strings[self.table.node_name[self.row]]
+
+    @property
+    def local_name(self) -> str:
+        return self.table.strings[self.table.local_name[self.row]]
+
+    @property
+    def node_value(self) -> str:
+        return self.table.strings[self.table.node_value[self.row]]
+
+    @property
+    def parent_id(self) -> typing.Optional[dom.NodeId]:
+        parent_id = self.table._parent_id(self.row)
+        return None if parent_id is None else dom.NodeId(parent_id)
+
+    @property
+    def child_node_count(self) -> typing.Optional[int]:
+        count = self.table.child_node_count[self.row]
+        return None if count < 0 else count
+
+    @property
+    def attributes(self) -> typing.Optional[typing.List[str]]:
+        return self.table.attribute_list(self.row)
+
+    @property
+    def parent(self) -> typing.Optional[NodeView]:
+        ''' The view of the row that this row is nested in, or ``None``. '''
+        parent = self.table.parent[self.row]
+        return None if parent < 0 else NodeView(self.table, parent)
+
+    @property
+    def children(self) -> typing.Optional[typing.List[NodeView]]:
+        if not self.table._flags[self.row] & _HAS_CHILDREN:
+            return None
+        return self._nested(NodeRelation.CHILD)
+
+    @property
+    def shadow_roots(self) -> typing.Optional[typing.List[NodeView]]:
+        return self._nested(NodeRelation.SHADOW_ROOT) or None
+
+    @property
+    def pseudo_elements(self) -> typing.Optional[typing.List[NodeView]]:
+        return self._nested(NodeRelation.PSEUDO_ELEMENT) or None
+
+    @property
+    def content_document(self) -> typing.Optional[NodeView]:
+        return self._nested_one(NodeRelation.CONTENT_DOCUMENT)
+
+    @property
+    def template_content(self) -> typing.Optional[NodeView]:
+        return self._nested_one(NodeRelation.TEMPLATE_CONTENT)
+
+    @property
+    def imported_document(self) -> typing.Optional[NodeView]:
+        return self._nested_one(NodeRelation.IMPORTED_DOCUMENT)
+
+    def _nested(self, relation: int) -> typing.List[NodeView]:
+        table = self.table
+        return [NodeView(table, row) for row in table.nested(self.row,
+            relation)]
+
+    def _nested_one(self, relation: int) -> typing.Optional[NodeView]:
+        for row in self.table.nested(self.row, relation):
+            return NodeView(self.table, row)
+        return None
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # The rare fields of dom.Node.
+        if name not in _NODE_FIELDS:
+            raise AttributeError(name)
+        if self.row not in self.table.extras:
+            return None
+        return getattr(dom.Node.from_json(self.table._node_json(self.row)),
+            name)
+
+    def to_node(self) -> dom.Node:
+        ''' Convert the row and the nodes nested in it to ``dom.Node``. '''
+        return self.table.to_node(self.row)
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and self.table is other.table \
+            and self.row == other.row
+
+    def __hash__(self):
+        return hash((id(self.table), self.row))
+
+    def __repr__(self):
+        return 'NodeView(node_id={}, node_name={!r})'.format(self.node_id,
+            self.node_name)
+
+
+_NODE_FIELDS = frozenset(['document_url', 'base_url', 'public_id',
+    'system_id', 'internal_subset', 'xml_version', 'name', 'value',
+    'pseudo_type', 'shadow_root_type', 'frame_id', 'distributed_nodes',
+    'is_svg'])
+
+
+def get_document(
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, NodeTable]:
+    '''
+    Like ``dom.get_document()``, but the tree is decoded into a
+    :class:`NodeTable`.
+
+    :param depth: *(Optional)* The maximum depth at which children should be
+        retrieved, defaults to 1. Use -1 for the entire subtree or provide an
+        integer larger than 0.
+    :param pierce: *(Optional)* Whether or not iframes and shadow roots should
+        be traversed when returning the subtree (default is false).
+    '''
+    cmd = dom.get_document(depth, pierce)
+    json = yield next(cmd)
+    return NodeTable.from_json(json['root'])
+
+
+def get_flattened_document(
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, NodeTable]:
+    '''
+    Like ``dom.get_flattened_document()``, but the nodes are decoded into a
+    :class:`NodeTable`.
+
+    :param depth: *(Optional)* The maximum depth at which children should be
+        retrieved, defaults to 1. Use -1 for the entire subtree or provide an
+        integer larger than 0.
+    :param pierce: *(Optional)* Whether or not iframes and shadow roots should
+        be traversed when returning the subtree (default is false).
+    '''
+    cmd = dom.get_flattened_document(depth, pierce)
+    json = yield next(cmd)
+    return NodeTable.from_flattened_json(json['nodes'])
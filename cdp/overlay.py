@@ -6,7 +6,7 @@
 # CDP domain: Overlay (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -16,6 +16,7 @@ from . import page
 from . import runtime
 
 
+@add_slots
 @dataclass
 class HighlightConfig:
     '''
@@ -88,10 +89,10 @@ class HighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HighlightConfig:
         return cls(
-            show_info=bool(json['showInfo']) if 'showInfo' in json else None,
-            show_styles=bool(json['showStyles']) if 'showStyles' in json else None,
-            show_rulers=bool(json['showRulers']) if 'showRulers' in json else None,
-            show_extension_lines=bool(json['showExtensionLines']) if 'showExtensionLines' in json else None,
+            show_info=json.get('showInfo'),
+            show_styles=json.get('showStyles'),
+            show_rulers=json.get('showRulers'),
+            show_extension_lines=json.get('showExtensionLines'),
             content_color=dom.RGBA.from_json(json['contentColor']) if 'contentColor' in json else None,
             padding_color=dom.RGBA.from_json(json['paddingColor']) if 'paddingColor' in json else None,
             border_color=dom.RGBA.from_json(json['borderColor']) if 'borderColor' in json else None,
@@ -115,7 +116,14 @@ class InspectMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -162,7 +170,7 @@ def get_highlight_object_for_test(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['highlight'])
+    return json['highlight']
 
 
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -468,6 +476,7 @@ def set_show_viewport_size_on_resize(
 
 
 @event_class('Overlay.inspectNodeRequested')
+@add_slots
 @dataclass
 class InspectNodeRequested:
     '''
@@ -477,14 +486,17 @@ class InspectNodeRequested:
     #: Id of the node to inspect.
     backend_node_id: dom.BackendNodeId
 
+    _json_names = ('backendNodeId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectNodeRequested:
         return cls(
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId'])
+            backend_node_id=dom.BackendNodeId(json['backendNodeId'])
         )
 
 
 @event_class('Overlay.nodeHighlightRequested')
+@add_slots
 @dataclass
 class NodeHighlightRequested:
     '''
@@ -492,14 +504,17 @@ class NodeHighlightRequested:
     '''
     node_id: dom.NodeId
 
+    _json_names = ('nodeId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeHighlightRequested:
         return cls(
-            node_id=dom.NodeId.from_json(json['nodeId'])
+            node_id=dom.NodeId(json['nodeId'])
         )
 
 
 @event_class('Overlay.screenshotRequested')
+@add_slots
 @dataclass
 class ScreenshotRequested:
     '''
@@ -508,6 +523,8 @@ class ScreenshotRequested:
     #: Viewport to capture, in device independent pixels (dip).
     viewport: page.Viewport
 
+    _json_names = ('viewport',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotRequested:
         return cls(
@@ -516,6 +533,7 @@ class ScreenshotRequested:
 
 
 @event_class('Overlay.inspectModeCanceled')
+@add_slots
 @dataclass
 class InspectModeCanceled:
     '''
@@ -523,6 +541,8 @@ class InspectModeCanceled:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectModeCanceled:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: Page
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -35,6 +35,7 @@ class FrameId(str):
         return 'FrameId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class Frame:
     '''
@@ -87,18 +88,19 @@ class Frame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Frame:
         return cls(
-            id_=str(json['id']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            url=str(json['url']),
-            security_origin=str(json['securityOrigin']),
-            mime_type=str(json['mimeType']),
-            parent_id=str(json['parentId']) if 'parentId' in json else None,
-            name=str(json['name']) if 'name' in json else None,
-            url_fragment=str(json['urlFragment']) if 'urlFragment' in json else None,
-            unreachable_url=str(json['unreachableUrl']) if 'unreachableUrl' in json else None,
+            id_=json['id'],
+            loader_id=network.LoaderId(json['loaderId']),
+            url=json['url'],
+            security_origin=json['securityOrigin'],
+            mime_type=json['mimeType'],
+            parent_id=json.get('parentId'),
+            name=json.get('name'),
+            url_fragment=json.get('urlFragment'),
+            unreachable_url=json.get('unreachableUrl'),
         )
 
 
+@add_slots
 @dataclass
 class FrameResource:
     '''
@@ -143,16 +145,17 @@ class FrameResource:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResource:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             type_=network.ResourceType.from_json(json['type']),
-            mime_type=str(json['mimeType']),
-            last_modified=network.TimeSinceEpoch.from_json(json['lastModified']) if 'lastModified' in json else None,
+            mime_type=json['mimeType'],
+            last_modified=network.TimeSinceEpoch(json['lastModified']) if 'lastModified' in json else None,
             content_size=float(json['contentSize']) if 'contentSize' in json else None,
-            failed=bool(json['failed']) if 'failed' in json else None,
-            canceled=bool(json['canceled']) if 'canceled' in json else None,
+            failed=json.get('failed'),
+            canceled=json.get('canceled'),
         )
 
 
+@add_slots
 @dataclass
 class FrameResourceTree:
     '''
@@ -184,6 +187,7 @@ class FrameResourceTree:
         )
 
 
+@add_slots
 @dataclass
 class FrameTree:
     '''
@@ -248,9 +252,17 @@ class TransitionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TransitionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class NavigationEntry:
     '''
@@ -283,14 +295,15 @@ class NavigationEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigationEntry:
         return cls(
-            id_=int(json['id']),
-            url=str(json['url']),
-            user_typed_url=str(json['userTypedURL']),
-            title=str(json['title']),
+            id_=json['id'],
+            url=json['url'],
+            user_typed_url=json['userTypedURL'],
+            title=json['title'],
             transition_type=TransitionType.from_json(json['transitionType']),
         )
 
 
+@add_slots
 @dataclass
 class ScreencastFrameMetadata:
     '''
@@ -338,7 +351,7 @@ class ScreencastFrameMetadata:
             device_height=float(json['deviceHeight']),
             scroll_offset_x=float(json['scrollOffsetX']),
             scroll_offset_y=float(json['scrollOffsetY']),
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']) if 'timestamp' in json else None,
+            timestamp=network.TimeSinceEpoch(json['timestamp']) if 'timestamp' in json else None,
         )
 
 
@@ -356,9 +369,17 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class AppManifestError:
     '''
@@ -387,13 +408,14 @@ class AppManifestError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AppManifestError:
         return cls(
-            message=str(json['message']),
-            critical=int(json['critical']),
-            line=int(json['line']),
-            column=int(json['column']),
+            message=json['message'],
+            critical=json['critical'],
+            line=json['line'],
+            column=json['column'],
         )
 
 
+@add_slots
 @dataclass
 class LayoutViewport:
     '''
@@ -422,13 +444,14 @@ class LayoutViewport:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutViewport:
         return cls(
-            page_x=int(json['pageX']),
-            page_y=int(json['pageY']),
-            client_width=int(json['clientWidth']),
-            client_height=int(json['clientHeight']),
+            page_x=json['pageX'],
+            page_y=json['pageY'],
+            client_width=json['clientWidth'],
+            client_height=json['clientHeight'],
         )
 
 
+@add_slots
 @dataclass
 class VisualViewport:
     '''
@@ -485,6 +508,7 @@ class VisualViewport:
         )
 
 
+@add_slots
 @dataclass
 class Viewport:
     '''
@@ -525,6 +549,7 @@ class Viewport:
         )
 
 
+@add_slots
 @dataclass
 class FontFamilies:
     '''
@@ -572,16 +597,17 @@ class FontFamilies:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFamilies:
         return cls(
-            standard=str(json['standard']) if 'standard' in json else None,
-            fixed=str(json['fixed']) if 'fixed' in json else None,
-            serif=str(json['serif']) if 'serif' in json else None,
-            sans_serif=str(json['sansSerif']) if 'sansSerif' in json else None,
-            cursive=str(json['cursive']) if 'cursive' in json else None,
-            fantasy=str(json['fantasy']) if 'fantasy' in json else None,
-            pictograph=str(json['pictograph']) if 'pictograph' in json else None,
+            standard=json.get('standard'),
+            fixed=json.get('fixed'),
+            serif=json.get('serif'),
+            sans_serif=json.get('sansSerif'),
+            cursive=json.get('cursive'),
+            fantasy=json.get('fantasy'),
+            pictograph=json.get('pictograph'),
         )
 
 
+@add_slots
 @dataclass
 class FontSizes:
     '''
@@ -604,8 +630,8 @@ class FontSizes:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontSizes:
         return cls(
-            standard=int(json['standard']) if 'standard' in json else None,
-            fixed=int(json['fixed']) if 'fixed' in json else None,
+            standard=json.get('standard'),
+            fixed=json.get('fixed'),
         )
 
 
@@ -623,7 +649,14 @@ class ClientNavigationReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 @deprecated(version="1.3")
@@ -647,7 +680,7 @@ def add_script_to_evaluate_on_load(
         'params': params,
     }
     json = yield cmd_dict
-    return ScriptIdentifier.from_json(json['identifier'])
+    return ScriptIdentifier(json['identifier'])
 
 
 def add_script_to_evaluate_on_new_document(
@@ -670,7 +703,7 @@ def add_script_to_evaluate_on_new_document(
         'params': params,
     }
     json = yield cmd_dict
-    return ScriptIdentifier.from_json(json['identifier'])
+    return ScriptIdentifier(json['identifier'])
 
 
 def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -712,7 +745,7 @@ def capture_screenshot(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['data'])
+    return json['data']
 
 
 def capture_snapshot(
@@ -735,7 +768,7 @@ def capture_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['data'])
+    return json['data']
 
 
 @deprecated(version="1.3")
@@ -805,7 +838,7 @@ def create_isolated_world(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.ExecutionContextId.from_json(json['executionContextId'])
+    return runtime.ExecutionContextId(json['executionContextId'])
 
 
 @deprecated(version="1.3")
@@ -868,9 +901,9 @@ def get_app_manifest() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
     }
     json = yield cmd_dict
     return (
-        str(json['url']),
+        json['url'],
         [AppManifestError.from_json(i) for i in json['errors']],
-        str(json['data']) if 'data' in json else None
+        json.get('data')
     )
 
 
@@ -886,7 +919,7 @@ def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typi
         'method': 'Page.getInstallabilityErrors',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['errors']]
+    return json['errors']
 
 
 @deprecated(version="1.3")
@@ -956,7 +989,7 @@ def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
     }
     json = yield cmd_dict
     return (
-        int(json['currentIndex']),
+        json['currentIndex'],
         [NavigationEntry.from_json(i) for i in json['entries']]
     )
 
@@ -996,8 +1029,8 @@ def get_resource_content(
     }
     json = yield cmd_dict
     return (
-        str(json['content']),
-        bool(json['base64Encoded'])
+        json['content'],
+        json['base64Encoded']
     )
 
 
@@ -1070,9 +1103,9 @@ def navigate(
     }
     json = yield cmd_dict
     return (
-        FrameId.from_json(json['frameId']),
-        network.LoaderId.from_json(json['loaderId']) if 'loaderId' in json else None,
-        str(json['errorText']) if 'errorText' in json else None
+        FrameId(json['frameId']),
+        network.LoaderId(json['loaderId']) if 'loaderId' in json else None,
+        json.get('errorText')
     )
 
 
@@ -1174,8 +1207,8 @@ def print_to_pdf(
     }
     json = yield cmd_dict
     return (
-        str(json['data']),
-        io.StreamHandle.from_json(json['stream']) if 'stream' in json else None
+        json['data'],
+        io.StreamHandle(json['stream']) if 'stream' in json else None
     )
 
 
@@ -1819,18 +1852,22 @@ def handle_file_chooser(
 
 
 @event_class('Page.domContentEventFired')
+@add_slots
 @dataclass
 class DomContentEventFired:
     timestamp: network.MonotonicTime
 
+    _json_names = ('timestamp',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomContentEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
 @event_class('Page.fileChooserOpened')
+@add_slots
 @dataclass
 class FileChooserOpened:
     '''
@@ -1838,14 +1875,17 @@ class FileChooserOpened:
     '''
     mode: str
 
+    _json_names = ('mode',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileChooserOpened:
         return cls(
-            mode=str(json['mode'])
+            mode=json['mode']
         )
 
 
 @event_class('Page.frameAttached')
+@add_slots
 @dataclass
 class FrameAttached:
     '''
@@ -1858,17 +1898,20 @@ class FrameAttached:
     #: JavaScript stack trace of when frame was attached, only set if frame initiated from script.
     stack: typing.Optional[runtime.StackTrace]
 
+    _json_names = ('frameId', 'parentFrameId', 'stack')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameAttached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            parent_frame_id=FrameId.from_json(json['parentFrameId']),
+            frame_id=FrameId(json['frameId']),
+            parent_frame_id=FrameId(json['parentFrameId']),
             stack=runtime.StackTrace.from_json(json['stack']) if 'stack' in json else None
         )
 
 
 @deprecated(version="1.3")
 @event_class('Page.frameClearedScheduledNavigation')
+@add_slots
 @dataclass
 class FrameClearedScheduledNavigation:
     '''
@@ -1877,14 +1920,17 @@ class FrameClearedScheduledNavigation:
     #: Id of the frame that has cleared its scheduled navigation.
     frame_id: FrameId
 
+    _json_names = ('frameId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameClearedScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
 @event_class('Page.frameDetached')
+@add_slots
 @dataclass
 class FrameDetached:
     '''
@@ -1893,14 +1939,17 @@ class FrameDetached:
     #: Id of the frame that has been detached.
     frame_id: FrameId
 
+    _json_names = ('frameId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameDetached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
 @event_class('Page.frameNavigated')
+@add_slots
 @dataclass
 class FrameNavigated:
     '''
@@ -1909,6 +1958,8 @@ class FrameNavigated:
     #: Frame object.
     frame: Frame
 
+    _json_names = ('frame',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameNavigated:
         return cls(
@@ -1917,6 +1968,7 @@ class FrameNavigated:
 
 
 @event_class('Page.frameResized')
+@add_slots
 @dataclass
 class FrameResized:
     '''
@@ -1926,6 +1978,8 @@ class FrameResized:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResized:
         return cls(
@@ -1934,6 +1988,7 @@ class FrameResized:
 
 
 @event_class('Page.frameRequestedNavigation')
+@add_slots
 @dataclass
 class FrameRequestedNavigation:
     '''
@@ -1949,17 +2004,20 @@ class FrameRequestedNavigation:
     #: The destination URL for the requested navigation.
     url: str
 
+    _json_names = ('frameId', 'reason', 'url')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameRequestedNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
+            frame_id=FrameId(json['frameId']),
             reason=ClientNavigationReason.from_json(json['reason']),
-            url=str(json['url'])
+            url=json['url']
         )
 
 
 @deprecated(version="1.3")
 @event_class('Page.frameScheduledNavigation')
+@add_slots
 @dataclass
 class FrameScheduledNavigation:
     '''
@@ -1975,17 +2033,20 @@ class FrameScheduledNavigation:
     #: The destination URL for the scheduled navigation.
     url: str
 
+    _json_names = ('frameId', 'delay', 'reason', 'url')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
+            frame_id=FrameId(json['frameId']),
             delay=float(json['delay']),
-            reason=str(json['reason']),
-            url=str(json['url'])
+            reason=json['reason'],
+            url=json['url']
         )
 
 
 @event_class('Page.frameStartedLoading')
+@add_slots
 @dataclass
 class FrameStartedLoading:
     '''
@@ -1996,14 +2057,17 @@ class FrameStartedLoading:
     #: Id of the frame that has started loading.
     frame_id: FrameId
 
+    _json_names = ('frameId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStartedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
 @event_class('Page.frameStoppedLoading')
+@add_slots
 @dataclass
 class FrameStoppedLoading:
     '''
@@ -2014,14 +2078,17 @@ class FrameStoppedLoading:
     #: Id of the frame that has stopped loading.
     frame_id: FrameId
 
+    _json_names = ('frameId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStoppedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
 @event_class('Page.downloadWillBegin')
+@add_slots
 @dataclass
 class DownloadWillBegin:
     '''
@@ -2034,15 +2101,18 @@ class DownloadWillBegin:
     #: URL of the resource being downloaded.
     url: str
 
+    _json_names = ('frameId', 'url')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            url=str(json['url'])
+            frame_id=FrameId(json['frameId']),
+            url=json['url']
         )
 
 
 @event_class('Page.interstitialHidden')
+@add_slots
 @dataclass
 class InterstitialHidden:
     '''
@@ -2050,6 +2120,8 @@ class InterstitialHidden:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialHidden:
         return cls(
@@ -2058,6 +2130,7 @@ class InterstitialHidden:
 
 
 @event_class('Page.interstitialShown')
+@add_slots
 @dataclass
 class InterstitialShown:
     '''
@@ -2065,6 +2138,8 @@ class InterstitialShown:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialShown:
         return cls(
@@ -2073,6 +2148,7 @@ class InterstitialShown:
 
 
 @event_class('Page.javascriptDialogClosed')
+@add_slots
 @dataclass
 class JavascriptDialogClosed:
     '''
@@ -2084,15 +2160,18 @@ class JavascriptDialogClosed:
     #: User input in case of prompt.
     user_input: str
 
+    _json_names = ('result', 'userInput')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogClosed:
         return cls(
-            result=bool(json['result']),
-            user_input=str(json['userInput'])
+            result=json['result'],
+            user_input=json['userInput']
         )
 
 
 @event_class('Page.javascriptDialogOpening')
+@add_slots
 @dataclass
 class JavascriptDialogOpening:
     '''
@@ -2112,18 +2191,21 @@ class JavascriptDialogOpening:
     #: Default dialog prompt.
     default_prompt: typing.Optional[str]
 
+    _json_names = ('url', 'message', 'type', 'hasBrowserHandler', 'defaultPrompt')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogOpening:
         return cls(
-            url=str(json['url']),
-            message=str(json['message']),
+            url=json['url'],
+            message=json['message'],
             type_=DialogType.from_json(json['type']),
-            has_browser_handler=bool(json['hasBrowserHandler']),
-            default_prompt=str(json['defaultPrompt']) if 'defaultPrompt' in json else None
+            has_browser_handler=json['hasBrowserHandler'],
+            default_prompt=json.get('defaultPrompt')
         )
 
 
 @event_class('Page.lifecycleEvent')
+@add_slots
 @dataclass
 class LifecycleEvent:
     '''
@@ -2136,29 +2218,35 @@ class LifecycleEvent:
     name: str
     timestamp: network.MonotonicTime
 
+    _json_names = ('frameId', 'loaderId', 'name', 'timestamp')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LifecycleEvent:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            name=str(json['name']),
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            frame_id=FrameId(json['frameId']),
+            loader_id=network.LoaderId(json['loaderId']),
+            name=json['name'],
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
 @event_class('Page.loadEventFired')
+@add_slots
 @dataclass
 class LoadEventFired:
     timestamp: network.MonotonicTime
 
+    _json_names = ('timestamp',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
 @event_class('Page.navigatedWithinDocument')
+@add_slots
 @dataclass
 class NavigatedWithinDocument:
     '''
@@ -2171,15 +2259,18 @@ class NavigatedWithinDocument:
     #: Frame's new url.
     url: str
 
+    _json_names = ('frameId', 'url')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigatedWithinDocument:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            url=str(json['url'])
+            frame_id=FrameId(json['frameId']),
+            url=json['url']
         )
 
 
 @event_class('Page.screencastFrame')
+@add_slots
 @dataclass
 class ScreencastFrame:
     '''
@@ -2194,16 +2285,19 @@ class ScreencastFrame:
     #: Frame number.
     session_id: int
 
+    _json_names = ('data', 'metadata', 'sessionId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastFrame:
         return cls(
-            data=str(json['data']),
+            data=json['data'],
             metadata=ScreencastFrameMetadata.from_json(json['metadata']),
-            session_id=int(json['sessionId'])
+            session_id=json['sessionId']
         )
 
 
 @event_class('Page.screencastVisibilityChanged')
+@add_slots
 @dataclass
 class ScreencastVisibilityChanged:
     '''
@@ -2214,14 +2308,17 @@ class ScreencastVisibilityChanged:
     #: True if the page is visible.
     visible: bool
 
+    _json_names = ('visible',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastVisibilityChanged:
         return cls(
-            visible=bool(json['visible'])
+            visible=json['visible']
         )
 
 
 @event_class('Page.windowOpen')
+@add_slots
 @dataclass
 class WindowOpen:
     '''
@@ -2237,17 +2334,20 @@ class WindowOpen:
     #: Whether or not it was triggered by user gesture.
     user_gesture: bool
 
+    _json_names = ('url', 'windowName', 'windowFeatures', 'userGesture')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
         return cls(
-            url=str(json['url']),
-            window_name=str(json['windowName']),
-            window_features=[str(i) for i in json['windowFeatures']],
-            user_gesture=bool(json['userGesture'])
+            url=json['url'],
+            window_name=json['windowName'],
+            window_features=json['windowFeatures'],
+            user_gesture=json['userGesture']
         )
 
 
 @event_class('Page.compilationCacheProduced')
+@add_slots
 @dataclass
 class CompilationCacheProduced:
     '''
@@ -2260,9 +2360,11 @@ class CompilationCacheProduced:
     #: Base64-encoded data
     data: str
 
+    _json_names = ('url', 'data')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CompilationCacheProduced:
         return cls(
-            url=str(json['url']),
-            data=str(json['data'])
+            url=json['url'],
+            data=json['data']
         )
@@ -6,12 +6,13 @@
 # CDP domain: Performance
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class Metric:
     '''
@@ -32,7 +33,7 @@ class Metric:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metric:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             value=float(json['value']),
         )
 
@@ -92,6 +93,7 @@ def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric
 
 
 @event_class('Performance.metrics')
+@add_slots
 @dataclass
 class Metrics:
     '''
@@ -102,9 +104,11 @@ class Metrics:
     #: Timestamp title.
     title: str
 
+    _json_names = ('metrics', 'title')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metrics:
         return cls(
             metrics=[Metric.from_json(i) for i in json['metrics']],
-            title=str(json['title'])
+            title=json['title']
         )
@@ -6,7 +6,7 @@
 # CDP domain: Profiler
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -15,6 +15,7 @@ from . import debugger
 from . import runtime
 
 
+@add_slots
 @dataclass
 class ProfileNode:
     '''
@@ -56,15 +57,16 @@ class ProfileNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProfileNode:
         return cls(
-            id_=int(json['id']),
+            id_=json['id'],
             call_frame=runtime.CallFrame.from_json(json['callFrame']),
-            hit_count=int(json['hitCount']) if 'hitCount' in json else None,
-            children=[int(i) for i in json['children']] if 'children' in json else None,
-            deopt_reason=str(json['deoptReason']) if 'deoptReason' in json else None,
+            hit_count=json.get('hitCount'),
+            children=json.get('children'),
+            deopt_reason=json.get('deoptReason'),
             position_ticks=[PositionTickInfo.from_json(i) for i in json['positionTicks']] if 'positionTicks' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class Profile:
     '''
@@ -103,11 +105,12 @@ class Profile:
             nodes=[ProfileNode.from_json(i) for i in json['nodes']],
             start_time=float(json['startTime']),
             end_time=float(json['endTime']),
-            samples=[int(i) for i in json['samples']] if 'samples' in json else None,
-            time_deltas=[int(i) for i in json['timeDeltas']] if 'timeDeltas' in json else None,
+            samples=json.get('samples'),
+            time_deltas=json.get('timeDeltas'),
         )
 
 
+@add_slots
 @dataclass
 class PositionTickInfo:
     '''
@@ -128,11 +131,12 @@ class PositionTickInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PositionTickInfo:
         return cls(
-            line=int(json['line']),
-            ticks=int(json['ticks']),
+            line=json['line'],
+            ticks=json['ticks'],
         )
 
 
+@add_slots
 @dataclass
 class CoverageRange:
     '''
@@ -157,12 +161,13 @@ class CoverageRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CoverageRange:
         return cls(
-            start_offset=int(json['startOffset']),
-            end_offset=int(json['endOffset']),
-            count=int(json['count']),
+            start_offset=json['startOffset'],
+            end_offset=json['endOffset'],
+            count=json['count'],
         )
 
 
+@add_slots
 @dataclass
 class FunctionCoverage:
     '''
@@ -187,12 +192,13 @@ class FunctionCoverage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FunctionCoverage:
         return cls(
-            function_name=str(json['functionName']),
+            function_name=json['functionName'],
             ranges=[CoverageRange.from_json(i) for i in json['ranges']],
-            is_block_coverage=bool(json['isBlockCoverage']),
+            is_block_coverage=json['isBlockCoverage'],
         )
 
 
+@add_slots
 @dataclass
 class ScriptCoverage:
     '''
@@ -217,12 +223,13 @@ class ScriptCoverage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptCoverage:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
             functions=[FunctionCoverage.from_json(i) for i in json['functions']],
         )
 
 
+@add_slots
 @dataclass
 class TypeObject:
     '''
@@ -239,10 +246,11 @@ class TypeObject:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TypeObject:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
         )
 
 
+@add_slots
 @dataclass
 class TypeProfileEntry:
     '''
@@ -263,11 +271,12 @@ class TypeProfileEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TypeProfileEntry:
         return cls(
-            offset=int(json['offset']),
+            offset=json['offset'],
             types=[TypeObject.from_json(i) for i in json['types']],
         )
 
 
+@add_slots
 @dataclass
 class ScriptTypeProfile:
     '''
@@ -292,8 +301,8 @@ class ScriptTypeProfile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptTypeProfile:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
             entries=[TypeProfileEntry.from_json(i) for i in json['entries']],
         )
 
@@ -455,6 +464,7 @@ def take_type_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[
 
 
 @event_class('Profiler.consoleProfileFinished')
+@add_slots
 @dataclass
 class ConsoleProfileFinished:
     id_: str
@@ -464,17 +474,20 @@ class ConsoleProfileFinished:
     #: Profile title passed as an argument to console.profile().
     title: typing.Optional[str]
 
+    _json_names = ('id', 'location', 'profile', 'title')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileFinished:
         return cls(
-            id_=str(json['id']),
+            id_=json['id'],
             location=debugger.Location.from_json(json['location']),
             profile=Profile.from_json(json['profile']),
-            title=str(json['title']) if 'title' in json else None
+            title=json.get('title')
         )
 
 
 @event_class('Profiler.consoleProfileStarted')
+@add_slots
 @dataclass
 class ConsoleProfileStarted:
     '''
@@ -486,10 +499,12 @@ class ConsoleProfileStarted:
     #: Profile title passed as an argument to console.profile().
     title: typing.Optional[str]
 
+    _json_names = ('id', 'location', 'title')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileStarted:
         return cls(
-            id_=str(json['id']),
+            id_=json['id'],
             location=debugger.Location.from_json(json['location']),
-            title=str(json['title']) if 'title' in json else None
+            title=json.get('title')
         )
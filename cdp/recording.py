@@ -0,0 +1,342 @@
+'''
+Record CDP traffic to a file and read it back, e.g. to benchmark parsers and
+drivers with real traffic.
+
+A recording is a file that starts with :data:`MAGIC`, followed by a record for
+each message. Each record has a header with the length of the message, the
+time that it was sent or received, and its direction, followed by the message
+exactly as it was on the wire:
+
+======  =====  =========================================================
+Offset  Size   Field
+======  =====  =========================================================
+0       4      length of the message in bytes (unsigned, little endian)
+4       8      time in seconds since the epoch (double, little endian)
+12      1      :class:`Direction`
+13      n      the message
+======  =====  =========================================================
+
+Recordings are append-only: opening an existing recording for writing adds
+records to the end. The whole file may be compressed with gzip or zstd (with
+the ``zstandard`` package, which is not a dependency of this library and must
+be installed separately). Uncompressed recordings are memory-mapped when they
+are read.
+'''
+from dataclasses import dataclass
+import enum
+import gzip
+import importlib
+import io
+import mmap
+from pathlib import Path
+import struct
+import time
+import typing
+
+from cdp.codec import Codec, get_codec, parse_message, Response, T_DATA
+from cdp.util import T_JSON_DICT
+
+
+#: The first bytes of an (uncompressed) recording.
+MAGIC = b'CDPREC\x00\x01'
+
+_HEADER = struct.Struct('<IdB')
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+T_PATH = typing.Union[str, Path]
+
+
+class Direction(enum.IntEnum):
+    ''' The direction of a recorded message. '''
+    #: A command that the client sent to the browser.
+    SENT = 0
+
+    #: A response or an event that the client received from the browser.
+    RECEIVED = 1
+
+
+_DIRECTIONS = list(Direction)
+
+
+@dataclass
+class Record:
+    ''' One recorded message. '''
+    #: The time that the message was sent or received, in seconds since the
+    #: epoch.
+    timestamp: float
+
+    #: Whether the message was sent or received.
+    direction: Direction
+
+    #: The message as it was on the wire.
+    data: bytes
+
+
+class RecordingWriter:
+    '''
+    Append messages to a recording.
+
+    .. code-block:: python
+
+        with RecordingWriter('traffic.cdprec.gz', compression='gzip') as writer:
+            writer.write(Direction.RECEIVED, data)
+    '''
+    def __init__(self, path: T_PATH, compression: typing.Optional[str] = None,
+            level: typing.Optional[int] = None):
+        '''
+        Constructor.
+
+        :param path: the recording to append to, which is created if it
+            doesn't exist. An existing recording must have been written with
+            the same compression.
+        :param compression: ``gzip``, ``zstd``, or ``None`` for no compression
+        :param level: the compression level. The default is 6 for gzip and 3
+            for zstd, which compress traffic well enough without slowing down
+            the client.
+        :raises ValueError: if the compression is unknown
+        :raises ImportError: if the compression is ``zstd`` and
+            ``zstandard`` is not installed
+        '''
+        self._file: typing.BinaryIO = open(path, 'ab')
+        empty = self._file.tell() == 0
+        self._stream: typing.Any
+        self._flush_arg: typing.Tuple = ()
+        try:
+            if compression is None:
+                self._stream = self._file
+            elif compression == 'gzip':
+                self._stream = gzip.GzipFile(fileobj=self._file, mode='ab',
+                    compresslevel=6 if level is None else level)
+            elif compression == 'zstd':
+                zstandard = importlib.import_module('zstandard')
+                compressor = zstandard.ZstdCompressor(
+                    level=3 if level is None else level)
+                self._stream = compressor.stream_writer(self._file,
+                    closefd=False)
+                self._flush_arg = (zstandard.FLUSH_BLOCK,)
+            else:
+                raise ValueError(f'Unknown compression: {compression!r}')
+        except BaseException:
+            self._file.close()
+            raise
+        if empty:
+            self._stream.write(MAGIC)
+
+    def __enter__(self) -> 'RecordingWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, direction: Direction, data: T_DATA,
+            timestamp: typing.Optional[float] = None) -> None:
+        '''
+        Append a message.
+
+        :param direction: whether the message was sent or received
+        :param data: the message as it was on the wire
+        :param timestamp: the time that the message was sent or received, or
+            the current time
+        '''
+        if isinstance(data, str):
+            data = data.encode('utf8')
+        if timestamp is None:
+            timestamp = time.time()
+        self._stream.write(_HEADER.pack(len(data), timestamp, direction))
+        self._stream.write(data)
+
+    def flush(self) -> None:
+        '''
+        Write buffered records to the file, so that a reader can see them
+        even if this process crashes.
+        '''
+        self._stream.flush(*self._flush_arg)
+        self._file.flush()
+
+    def close(self) -> None:
+        ''' Flush and close the recording. '''
+        if self._file.closed:
+            return
+        try:
+            if self._stream is not self._file:
+                self._stream.close()
+        finally:
+            self._file.close()
+
+
+class RecordingReader:
+    '''
+    Read the records in a recording.
+
+    The compression is detected automatically. Iterating over the reader
+    yields each :class:`Record`; the other methods decode the messages.
+
+    .. code-block:: python
+
+        with RecordingReader('traffic.cdprec.gz') as reader:
+            for event in reader.events():
+                ...
+    '''
+    def __init__(self, path: T_PATH):
+        '''
+        Constructor.
+
+        :param path: the recording to read
+        :raises ValueError: if the file is not a recording
+        :raises ImportError: if the recording is compressed with zstd and
+            ``zstandard`` is not installed
+        '''
+        self._file: typing.BinaryIO = open(path, 'rb')
+        self._mmap: typing.Optional[mmap.mmap] = None
+        self._stream: typing.Optional[typing.BinaryIO] = None
+        try:
+            start = self._file.read(len(MAGIC))
+            self._file.seek(0)
+            if start.startswith(_GZIP_MAGIC):
+                self._stream = typing.cast(typing.BinaryIO,
+                    gzip.GzipFile(fileobj=self._file, mode='rb'))
+            elif start.startswith(_ZSTD_MAGIC):
+                zstandard = importlib.import_module('zstandard')
+                self._stream = io.BufferedReader(zstandard.ZstdDecompressor()
+                    .stream_reader(self._file, read_across_frames=True,
+                    closefd=False))
+            elif start == MAGIC:
+                self._mmap = mmap.mmap(self._file.fileno(), 0,
+                    access=mmap.ACCESS_READ)
+            if self._stream is not None:
+                start = self._stream.read(len(MAGIC))
+            if start != MAGIC:
+                raise ValueError(f'Not a CDP recording: {path!r}')
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> 'RecordingReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> typing.Iterator[Record]:
+        '''
+        Yield each record in the order it was written. A record that was cut
+        off at the end of the file, e.g. because the writer crashed, is
+        ignored.
+
+        Each call starts from the beginning of the recording, except for a
+        compressed recording, which can only be read once.
+        '''
+        if self._mmap is not None:
+            return self._iter_mmap(self._mmap)
+        assert self._stream is not None
+        return self._iter_stream(self._stream)
+
+    def messages(self, direction: typing.Optional[Direction] = None,
+            codec: typing.Optional[Codec] = None) -> typing.Iterator[
+            T_JSON_DICT]:
+        '''
+        Decode the recorded messages.
+
+        :param direction: decode only the messages in this direction, or
+            all of them
+        :param codec: the codec to decode the messages with, or the default
+            codec
+        '''
+        loads = (codec or get_codec()).loads
+        for record in self:
+            if direction is None or record.direction == direction:
+                yield loads(record.data)
+
+    def received(self, codec: typing.Optional[Codec] = None,
+            lazy: bool = False) -> typing.Iterator[typing.Any]:
+        '''
+        Parse each received message with :func:`cdp.codec.parse_message`,
+        i.e. into a :class:`cdp.codec.Response` or an event object.
+
+        :param codec: the codec to decode the messages with, or the default
+            codec
+        :param lazy: if true, return lazy events, see
+            :func:`cdp.util.lazy_event_class`
+        '''
+        for record in self:
+            if record.direction == Direction.RECEIVED:
+                yield parse_message(record.data, codec, lazy)
+
+    def events(self, codec: typing.Optional[Codec] = None,
+            lazy: bool = False) -> typing.Iterator[typing.Any]:
+        '''
+        Parse each received event with :func:`cdp.util.parse_json_event`.
+
+        :param codec: the codec to decode the messages with, or the default
+            codec
+        :param lazy: if true, return lazy events, see
+            :func:`cdp.util.lazy_event_class`
+        '''
+        for message in self.received(codec, lazy):
+            if not isinstance(message, Response):
+                yield message
+
+    def exchanges(self, codec: typing.Optional[Codec] = None) -> \
+            typing.Iterator[typing.Tuple[T_JSON_DICT, T_JSON_DICT]]:
+        '''
+        Pair each command with its response.
+
+        Each command's ``result`` can be sent into the generator that made
+        the command, e.g. to benchmark how long it takes to parse the result.
+        Commands that were never answered are left out.
+
+        :param codec: the codec to decode the messages with, or the default
+            codec
+        :returns: an iterator of ``(command, response)`` messages, in the
+            order that the responses were received
+        '''
+        loads = (codec or get_codec()).loads
+        pending: typing.Dict[int, T_JSON_DICT] = dict()
+        for record in self:
+            message = loads(record.data)
+            if 'id' not in message:
+                continue
+            if record.direction == Direction.SENT:
+                pending[message['id']] = message
+            else:
+                command = pending.pop(message['id'], None)
+                if command is not None:
+                    yield command, message
+
+    def close(self) -> None:
+        ''' Close the recording. '''
+        if self._stream is not None:
+            self._stream.close()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    @staticmethod
+    def _iter_mmap(buffer: mmap.mmap) -> typing.Iterator[Record]:
+        unpack_from = _HEADER.unpack_from
+        header_size = _HEADER.size
+        offset = len(MAGIC)
+        end = len(buffer)
+        while offset + header_size <= end:
+            length, timestamp, direction = unpack_from(buffer, offset)
+            offset += header_size
+            if offset + length > end:
+                break
+            yield Record(timestamp, _DIRECTIONS[direction],
+                buffer[offset:offset + length])
+            offset += length
+
+    @staticmethod
+    def _iter_stream(stream: typing.BinaryIO) -> typing.Iterator[Record]:
+        unpack = _HEADER.unpack
+        header_size = _HEADER.size
+        while True:
+            header = stream.read(header_size)
+            if len(header) < header_size:
+                break
+            length, timestamp, direction = unpack(header)
+            data = stream.read(length)
+            if len(data) < length:
+                break
+            yield Record(timestamp, _DIRECTIONS[direction], data)
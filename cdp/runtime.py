@@ -6,7 +6,7 @@
 # CDP domain: Runtime
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -58,6 +58,7 @@ class UnserializableValue(str):
         return 'UnserializableValue({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class RemoteObject:
     '''
@@ -114,18 +115,19 @@ class RemoteObject:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteObject:
         return cls(
-            type_=str(json['type']),
-            subtype=str(json['subtype']) if 'subtype' in json else None,
-            class_name=str(json['className']) if 'className' in json else None,
-            value=json['value'] if 'value' in json else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if 'unserializableValue' in json else None,
-            description=str(json['description']) if 'description' in json else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if 'objectId' in json else None,
+            type_=json['type'],
+            subtype=json.get('subtype'),
+            class_name=json.get('className'),
+            value=json.get('value'),
+            unserializable_value=UnserializableValue(json['unserializableValue']) if 'unserializableValue' in json else None,
+            description=json.get('description'),
+            object_id=RemoteObjectId(json['objectId']) if 'objectId' in json else None,
             preview=ObjectPreview.from_json(json['preview']) if 'preview' in json else None,
             custom_preview=CustomPreview.from_json(json['customPreview']) if 'customPreview' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class CustomPreview:
     #: The JSON-stringified result of formatter.header(object, config) call.
@@ -147,11 +149,12 @@ class CustomPreview:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CustomPreview:
         return cls(
-            header=str(json['header']),
-            body_getter_id=RemoteObjectId.from_json(json['bodyGetterId']) if 'bodyGetterId' in json else None,
+            header=json['header'],
+            body_getter_id=RemoteObjectId(json['bodyGetterId']) if 'bodyGetterId' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class ObjectPreview:
     '''
@@ -191,15 +194,16 @@ class ObjectPreview:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectPreview:
         return cls(
-            type_=str(json['type']),
-            overflow=bool(json['overflow']),
+            type_=json['type'],
+            overflow=json['overflow'],
             properties=[PropertyPreview.from_json(i) for i in json['properties']],
-            subtype=str(json['subtype']) if 'subtype' in json else None,
-            description=str(json['description']) if 'description' in json else None,
+            subtype=json.get('subtype'),
+            description=json.get('description'),
             entries=[EntryPreview.from_json(i) for i in json['entries']] if 'entries' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class PropertyPreview:
     #: Property name.
@@ -232,14 +236,15 @@ class PropertyPreview:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyPreview:
         return cls(
-            name=str(json['name']),
-            type_=str(json['type']),
-            value=str(json['value']) if 'value' in json else None,
+            name=json['name'],
+            type_=json['type'],
+            value=json.get('value'),
             value_preview=ObjectPreview.from_json(json['valuePreview']) if 'valuePreview' in json else None,
-            subtype=str(json['subtype']) if 'subtype' in json else None,
+            subtype=json.get('subtype'),
         )
 
 
+@add_slots
 @dataclass
 class EntryPreview:
     #: Preview of the value.
@@ -263,6 +268,7 @@ class EntryPreview:
         )
 
 
+@add_slots
 @dataclass
 class PropertyDescriptor:
     '''
@@ -326,19 +332,20 @@ class PropertyDescriptor:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyDescriptor:
         return cls(
-            name=str(json['name']),
-            configurable=bool(json['configurable']),
-            enumerable=bool(json['enumerable']),
+            name=json['name'],
+            configurable=json['configurable'],
+            enumerable=json['enumerable'],
             value=RemoteObject.from_json(json['value']) if 'value' in json else None,
-            writable=bool(json['writable']) if 'writable' in json else None,
+            writable=json.get('writable'),
             get=RemoteObject.from_json(json['get']) if 'get' in json else None,
             set_=RemoteObject.from_json(json['set']) if 'set' in json else None,
-            was_thrown=bool(json['wasThrown']) if 'wasThrown' in json else None,
-            is_own=bool(json['isOwn']) if 'isOwn' in json else None,
+            was_thrown=json.get('wasThrown'),
+            is_own=json.get('isOwn'),
             symbol=RemoteObject.from_json(json['symbol']) if 'symbol' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class InternalPropertyDescriptor:
     '''
@@ -360,11 +367,12 @@ class InternalPropertyDescriptor:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InternalPropertyDescriptor:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             value=RemoteObject.from_json(json['value']) if 'value' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class PrivatePropertyDescriptor:
     '''
@@ -385,11 +393,12 @@ class PrivatePropertyDescriptor:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrivatePropertyDescriptor:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             value=RemoteObject.from_json(json['value']),
         )
 
 
+@add_slots
 @dataclass
 class CallArgument:
     '''
@@ -418,9 +427,9 @@ class CallArgument:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallArgument:
         return cls(
-            value=json['value'] if 'value' in json else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if 'unserializableValue' in json else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if 'objectId' in json else None,
+            value=json.get('value'),
+            unserializable_value=UnserializableValue(json['unserializableValue']) if 'unserializableValue' in json else None,
+            object_id=RemoteObjectId(json['objectId']) if 'objectId' in json else None,
         )
 
 
@@ -439,6 +448,7 @@ class ExecutionContextId(int):
         return 'ExecutionContextId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class ExecutionContextDescription:
     '''
@@ -469,13 +479,14 @@ class ExecutionContextDescription:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDescription:
         return cls(
-            id_=ExecutionContextId.from_json(json['id']),
-            origin=str(json['origin']),
-            name=str(json['name']),
-            aux_data=dict(json['auxData']) if 'auxData' in json else None,
+            id_=ExecutionContextId(json['id']),
+            origin=json['origin'],
+            name=json['name'],
+            aux_data=json.get('auxData'),
         )
 
 
+@add_slots
 @dataclass
 class ExceptionDetails:
     '''
@@ -530,15 +541,15 @@ class ExceptionDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionDetails:
         return cls(
-            exception_id=int(json['exceptionId']),
-            text=str(json['text']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            script_id=ScriptId.from_json(json['scriptId']) if 'scriptId' in json else None,
-            url=str(json['url']) if 'url' in json else None,
+            exception_id=json['exceptionId'],
+            text=json['text'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
+            script_id=ScriptId(json['scriptId']) if 'scriptId' in json else None,
+            url=json.get('url'),
             stack_trace=StackTrace.from_json(json['stackTrace']) if 'stackTrace' in json else None,
             exception=RemoteObject.from_json(json['exception']) if 'exception' in json else None,
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']) if 'executionContextId' in json else None,
+            execution_context_id=ExecutionContextId(json['executionContextId']) if 'executionContextId' in json else None,
         )
 
 
@@ -572,6 +583,7 @@ class TimeDelta(float):
         return 'TimeDelta({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class CallFrame:
     '''
@@ -604,14 +616,15 @@ class CallFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
         return cls(
-            function_name=str(json['functionName']),
-            script_id=ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            function_name=json['functionName'],
+            script_id=ScriptId(json['scriptId']),
+            url=json['url'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
+@add_slots
 @dataclass
 class StackTrace:
     '''
@@ -645,7 +658,7 @@ class StackTrace:
     def from_json(cls, json: T_JSON_DICT) -> StackTrace:
         return cls(
             call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            description=str(json['description']) if 'description' in json else None,
+            description=json.get('description'),
             parent=StackTrace.from_json(json['parent']) if 'parent' in json else None,
             parent_id=StackTraceId.from_json(json['parentId']) if 'parentId' in json else None,
         )
@@ -666,6 +679,7 @@ class UniqueDebuggerId(str):
         return 'UniqueDebuggerId({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class StackTraceId:
     '''
@@ -686,8 +700,8 @@ class StackTraceId:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTraceId:
         return cls(
-            id_=str(json['id']),
-            debugger_id=UniqueDebuggerId.from_json(json['debuggerId']) if 'debuggerId' in json else None,
+            id_=json['id'],
+            debugger_id=UniqueDebuggerId(json['debuggerId']) if 'debuggerId' in json else None,
         )
 
 
@@ -816,7 +830,7 @@ def compile_script(
     }
     json = yield cmd_dict
     return (
-        ScriptId.from_json(json['scriptId']) if 'scriptId' in json else None,
+        ScriptId(json['scriptId']) if 'scriptId' in json else None,
         ExceptionDetails.from_json(json['exceptionDetails']) if 'exceptionDetails' in json else None
     )
 
@@ -930,7 +944,7 @@ def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
         'method': 'Runtime.getIsolateId',
     }
     json = yield cmd_dict
-    return str(json['id'])
+    return json['id']
 
 
 def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float]]:
@@ -1014,7 +1028,7 @@ def global_lexical_scope_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['names']]
+    return json['names']
 
 
 def query_objects(
@@ -1254,6 +1268,7 @@ def remove_binding(
 
 
 @event_class('Runtime.bindingCalled')
+@add_slots
 @dataclass
 class BindingCalled:
     '''
@@ -1266,16 +1281,19 @@ class BindingCalled:
     #: Identifier of the context where the call was made.
     execution_context_id: ExecutionContextId
 
+    _json_names = ('name', 'payload', 'executionContextId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BindingCalled:
         return cls(
-            name=str(json['name']),
-            payload=str(json['payload']),
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId'])
+            name=json['name'],
+            payload=json['payload'],
+            execution_context_id=ExecutionContextId(json['executionContextId'])
         )
 
 
 @event_class('Runtime.consoleAPICalled')
+@add_slots
 @dataclass
 class ConsoleAPICalled:
     '''
@@ -1298,19 +1316,22 @@ class ConsoleAPICalled:
     #: on named context.
     context: typing.Optional[str]
 
+    _json_names = ('type', 'args', 'executionContextId', 'timestamp', 'stackTrace', 'context')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleAPICalled:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             args=[RemoteObject.from_json(i) for i in json['args']],
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
-            timestamp=Timestamp.from_json(json['timestamp']),
+            execution_context_id=ExecutionContextId(json['executionContextId']),
+            timestamp=Timestamp(json['timestamp']),
             stack_trace=StackTrace.from_json(json['stackTrace']) if 'stackTrace' in json else None,
-            context=str(json['context']) if 'context' in json else None
+            context=json.get('context')
         )
 
 
 @event_class('Runtime.exceptionRevoked')
+@add_slots
 @dataclass
 class ExceptionRevoked:
     '''
@@ -1321,15 +1342,18 @@ class ExceptionRevoked:
     #: The id of revoked exception, as reported in ``exceptionThrown``.
     exception_id: int
 
+    _json_names = ('reason', 'exceptionId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionRevoked:
         return cls(
-            reason=str(json['reason']),
-            exception_id=int(json['exceptionId'])
+            reason=json['reason'],
+            exception_id=json['exceptionId']
         )
 
 
 @event_class('Runtime.exceptionThrown')
+@add_slots
 @dataclass
 class ExceptionThrown:
     '''
@@ -1339,15 +1363,18 @@ class ExceptionThrown:
     timestamp: Timestamp
     exception_details: ExceptionDetails
 
+    _json_names = ('timestamp', 'exceptionDetails')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionThrown:
         return cls(
-            timestamp=Timestamp.from_json(json['timestamp']),
+            timestamp=Timestamp(json['timestamp']),
             exception_details=ExceptionDetails.from_json(json['exceptionDetails'])
         )
 
 
 @event_class('Runtime.executionContextCreated')
+@add_slots
 @dataclass
 class ExecutionContextCreated:
     '''
@@ -1356,6 +1383,8 @@ class ExecutionContextCreated:
     #: A newly created execution context.
     context: ExecutionContextDescription
 
+    _json_names = ('context',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextCreated:
         return cls(
@@ -1364,6 +1393,7 @@ class ExecutionContextCreated:
 
 
 @event_class('Runtime.executionContextDestroyed')
+@add_slots
 @dataclass
 class ExecutionContextDestroyed:
     '''
@@ -1372,14 +1402,17 @@ class ExecutionContextDestroyed:
     #: Id of the destroyed context
     execution_context_id: ExecutionContextId
 
+    _json_names = ('executionContextId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDestroyed:
         return cls(
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId'])
+            execution_context_id=ExecutionContextId(json['executionContextId'])
         )
 
 
 @event_class('Runtime.executionContextsCleared')
+@add_slots
 @dataclass
 class ExecutionContextsCleared:
     '''
@@ -1387,6 +1420,8 @@ class ExecutionContextsCleared:
     '''
 
 
+    _json_names = ()
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextsCleared:
         return cls(
@@ -1395,6 +1430,7 @@ class ExecutionContextsCleared:
 
 
 @event_class('Runtime.inspectRequested')
+@add_slots
 @dataclass
 class InspectRequested:
     '''
@@ -1404,9 +1440,11 @@ class InspectRequested:
     object_: RemoteObject
     hints: dict
 
+    _json_names = ('object', 'hints')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectRequested:
         return cls(
             object_=RemoteObject.from_json(json['object']),
-            hints=dict(json['hints'])
+            hints=json['hints']
         )
@@ -6,12 +6,13 @@
 # CDP domain: Schema
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class Domain:
     '''
@@ -32,8 +33,8 @@ class Domain:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Domain:
         return cls(
-            name=str(json['name']),
-            version=str(json['version']),
+            name=json['name'],
+            version=json['version'],
         )
 
 
@@ -6,7 +6,7 @@
 # CDP domain: Security
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -44,7 +44,14 @@ class MixedContentType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class SecurityState(enum.Enum):
@@ -62,9 +69,17 @@ class SecurityState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecurityState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class SecurityStateExplanation:
     '''
@@ -107,15 +122,16 @@ class SecurityStateExplanation:
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateExplanation:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
-            title=str(json['title']),
-            summary=str(json['summary']),
-            description=str(json['description']),
+            title=json['title'],
+            summary=json['summary'],
+            description=json['description'],
             mixed_content_type=MixedContentType.from_json(json['mixedContentType']),
-            certificate=[str(i) for i in json['certificate']],
-            recommendations=[str(i) for i in json['recommendations']] if 'recommendations' in json else None,
+            certificate=json['certificate'],
+            recommendations=json.get('recommendations'),
         )
 
 
+@add_slots
 @dataclass
 class InsecureContentStatus:
     '''
@@ -156,11 +172,11 @@ class InsecureContentStatus:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InsecureContentStatus:
         return cls(
-            ran_mixed_content=bool(json['ranMixedContent']),
-            displayed_mixed_content=bool(json['displayedMixedContent']),
-            contained_mixed_form=bool(json['containedMixedForm']),
-            ran_content_with_cert_errors=bool(json['ranContentWithCertErrors']),
-            displayed_content_with_cert_errors=bool(json['displayedContentWithCertErrors']),
+            ran_mixed_content=json['ranMixedContent'],
+            displayed_mixed_content=json['displayedMixedContent'],
+            contained_mixed_form=json['containedMixedForm'],
+            ran_content_with_cert_errors=json['ranContentWithCertErrors'],
+            displayed_content_with_cert_errors=json['displayedContentWithCertErrors'],
             ran_insecure_content_style=SecurityState.from_json(json['ranInsecureContentStyle']),
             displayed_insecure_content_style=SecurityState.from_json(json['displayedInsecureContentStyle']),
         )
@@ -179,7 +195,14 @@ class CertificateErrorAction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateErrorAction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -267,6 +290,7 @@ def set_override_certificate_errors(
 
 @deprecated(version="1.3")
 @event_class('Security.certificateError')
+@add_slots
 @dataclass
 class CertificateError:
     '''
@@ -282,16 +306,19 @@ class CertificateError:
     #: The url that was requested.
     request_url: str
 
+    _json_names = ('eventId', 'errorType', 'requestURL')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CertificateError:
         return cls(
-            event_id=int(json['eventId']),
-            error_type=str(json['errorType']),
-            request_url=str(json['requestURL'])
+            event_id=json['eventId'],
+            error_type=json['errorType'],
+            request_url=json['requestURL']
         )
 
 
 @event_class('Security.securityStateChanged')
+@add_slots
 @dataclass
 class SecurityStateChanged:
     '''
@@ -309,12 +336,14 @@ class SecurityStateChanged:
     #: Overrides user-visible description of the state.
     summary: typing.Optional[str]
 
+    _json_names = ('securityState', 'schemeIsCryptographic', 'explanations', 'insecureContentStatus', 'summary')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateChanged:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
-            scheme_is_cryptographic=bool(json['schemeIsCryptographic']),
+            scheme_is_cryptographic=json['schemeIsCryptographic'],
             explanations=[SecurityStateExplanation.from_json(i) for i in json['explanations']],
             insecure_content_status=InsecureContentStatus.from_json(json['insecureContentStatus']),
-            summary=str(json['summary']) if 'summary' in json else None
+            summary=json.get('summary')
         )
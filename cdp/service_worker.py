@@ -6,7 +6,7 @@
 # CDP domain: ServiceWorker (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -26,6 +26,7 @@ class RegistrationID(str):
         return 'RegistrationID({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class ServiceWorkerRegistration:
     '''
@@ -47,9 +48,9 @@ class ServiceWorkerRegistration:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRegistration:
         return cls(
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            scope_url=str(json['scopeURL']),
-            is_deleted=bool(json['isDeleted']),
+            registration_id=RegistrationID(json['registrationId']),
+            scope_url=json['scopeURL'],
+            is_deleted=json['isDeleted'],
         )
 
 
@@ -64,7 +65,14 @@ class ServiceWorkerVersionRunningStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionRunningStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class ServiceWorkerVersionStatus(enum.Enum):
@@ -80,9 +88,17 @@ class ServiceWorkerVersionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
 
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
+
+@add_slots
 @dataclass
 class ServiceWorkerVersion:
     '''
@@ -129,18 +145,19 @@ class ServiceWorkerVersion:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerVersion:
         return cls(
-            version_id=str(json['versionId']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            script_url=str(json['scriptURL']),
+            version_id=json['versionId'],
+            registration_id=RegistrationID(json['registrationId']),
+            script_url=json['scriptURL'],
             running_status=ServiceWorkerVersionRunningStatus.from_json(json['runningStatus']),
             status=ServiceWorkerVersionStatus.from_json(json['status']),
             script_last_modified=float(json['scriptLastModified']) if 'scriptLastModified' in json else None,
             script_response_time=float(json['scriptResponseTime']) if 'scriptResponseTime' in json else None,
-            controlled_clients=[target.TargetID.from_json(i) for i in json['controlledClients']] if 'controlledClients' in json else None,
-            target_id=target.TargetID.from_json(json['targetId']) if 'targetId' in json else None,
+            controlled_clients=[target.TargetID(i) for i in json['controlledClients']] if 'controlledClients' in json else None,
+            target_id=target.TargetID(json['targetId']) if 'targetId' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class ServiceWorkerErrorMessage:
     '''
@@ -171,12 +188,12 @@ class ServiceWorkerErrorMessage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerErrorMessage:
         return cls(
-            error_message=str(json['errorMessage']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            version_id=str(json['versionId']),
-            source_url=str(json['sourceURL']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            error_message=json['errorMessage'],
+            registration_id=RegistrationID(json['registrationId']),
+            version_id=json['versionId'],
+            source_url=json['sourceURL'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
@@ -355,10 +372,13 @@ def update_registration(
 
 
 @event_class('ServiceWorker.workerErrorReported')
+@add_slots
 @dataclass
 class WorkerErrorReported:
     error_message: ServiceWorkerErrorMessage
 
+    _json_names = ('errorMessage',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerErrorReported:
         return cls(
@@ -367,10 +387,13 @@ class WorkerErrorReported:
 
 
 @event_class('ServiceWorker.workerRegistrationUpdated')
+@add_slots
 @dataclass
 class WorkerRegistrationUpdated:
     registrations: typing.List[ServiceWorkerRegistration]
 
+    _json_names = ('registrations',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerRegistrationUpdated:
         return cls(
@@ -379,10 +402,13 @@ class WorkerRegistrationUpdated:
 
 
 @event_class('ServiceWorker.workerVersionUpdated')
+@add_slots
 @dataclass
 class WorkerVersionUpdated:
     versions: typing.List[ServiceWorkerVersion]
 
+    _json_names = ('versions',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerVersionUpdated:
         return cls(
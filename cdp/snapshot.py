@@ -0,0 +1,893 @@
+'''
+Decode DOM snapshots into compact columns.
+
+``dom_snapshot.capture_snapshot()`` returns the nodes of each document as
+tables of columns, e.g. ``NodeTreeSnapshot.parent_index``, and the generated
+classes decode each column into a list with an object for every cell: a
+``StringIndex`` for every node name, a ``BackendNodeId`` for every node, and a
+``Rectangle`` for every layout box. A page with 50,000 nodes decodes to
+millions of objects.
+
+The classes in this module have the same fields as the generated ones, but
+each column is stored in an :class:`array.array`, so a column of 50,000
+integers is a single object of 200 kB. Columns whose cells are lists, such as
+attributes and bounds, are stored as a :class:`ListColumn`. Cells are plain
+``int`` and ``float`` values, and lists are created when they are accessed.
+
+.. code-block:: python
+
+    documents, strings = await conn.execute(snapshot.capture_snapshot([]))
+    nodes = documents[0].nodes
+    names = [strings[i] for i in nodes.node_name]
+
+Arrays support the buffer protocol, so NumPy can use them without copying,
+see :func:`as_numpy`.
+'''
+from __future__ import annotations
+import array
+from dataclasses import dataclass
+from itertools import accumulate, chain, compress, count, repeat
+import operator
+import sys
+import typing
+
+from cdp import dom_snapshot
+from cdp.util import add_slots, T_JSON_DICT
+
+
+#: The type code of integer columns: node indexes, string indexes, and
+#: backend node IDs are all 32-bit integers in the browser.
+INT = 'i'
+
+#: The type code of floating point columns.
+FLOAT = 'd'
+
+
+def _column(json: T_JSON_DICT, key: str,
+        typecode: str = INT) -> typing.Optional[array.array]:
+    values = json.get(key)
+    return None if values is None else array.array(typecode, values)
+
+
+class ListColumn:
+    '''
+    A column whose cells are lists, e.g. the attributes of each node or the
+    bounds of each layout object.
+
+    The cells are stored one after the other in ``values``. The cell at index
+    ``i`` is ``values[offsets[i]:offsets[i + 1]]``. If every cell has the same
+    length, there are no offsets, and ``values`` is a row-major matrix with
+    ``width`` columns, e.g. N×4 for rectangles.
+    '''
+    __slots__ = ('values', 'offsets', 'width', '_length', '_cell')
+
+    def __init__(self, values: array.array,
+            offsets: typing.Optional[array.array], width: int, length: int,
+            cell: typing.Callable[[typing.Any], typing.Any] = list):
+        '''
+        Constructor.
+
+        :param values: the concatenated cells
+        :param offsets: the offset of each cell in ``values`` followed by the
+            length of ``values``, or ``None`` if every cell has ``width``
+            values
+        :param width: the length of every cell if there are no offsets
+        :param length: the number of cells
+        :param cell: the type of the lists that are returned for cells
+        '''
+        self.values = values
+        self.offsets = offsets
+        self.width = width
+        self._length = length
+        self._cell = cell
+
+    @classmethod
+    def from_json(cls, json: typing.List[typing.List[typing.Any]],
+            typecode: str = INT,
+            cell: typing.Callable[[typing.Any], typing.Any] = list
+            ) -> ListColumn:
+        values = array.array(typecode, chain.from_iterable(json))
+        lengths = list(map(len, json))
+        if lengths and min(lengths) == max(lengths):
+            return cls(values, None, lengths[0], len(json), cell)
+        offsets = array.array(INT, [0])
+        offsets.extend(accumulate(lengths))
+        return cls(values, offsets, 0, len(json), cell)
+
+    def to_json(self) -> typing.List[typing.List[typing.Any]]:
+        return [list(self._slice(i)) for i in range(self._length)]
+
+    def _slice(self, index: int) -> array.array:
+        if self.offsets is None:
+            start = index * self.width
+            return self.values[start:start + self.width]
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+    def cell_length(self, index: int) -> int:
+        ''' Return the length of a cell without creating it. '''
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('ListColumn index out of range')
+        if self.offsets is None:
+            return self.width
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> typing.Any:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('ListColumn index out of range')
+        return self._cell(self._slice(index))
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for i in range(self._length):
+            yield self._cell(self._slice(i))
+
+    def __repr__(self):
+        return 'ListColumn(cells={}, values={})'.format(self._length,
+            len(self.values))
+
+
+def _list_column(json: T_JSON_DICT, key: str, typecode: str,
+        cell: typing.Callable[[typing.Any], typing.Any]
+        ) -> typing.Optional[ListColumn]:
+    values = json.get(key)
+    return None if values is None else ListColumn.from_json(values,
+        typecode, cell)
+
+
+@add_slots
+@dataclass
+class RareColumn:
+    '''
+    A column that is only set for a few nodes, which replaces
+    ``RareStringData``, ``RareIntegerData`` and ``RareBooleanData``.
+    '''
+    #: The indexes of the nodes that have a value.
+    index: array.array
+
+    #: The value of each of those nodes, or ``None`` for a boolean column,
+    #: which is true for exactly those nodes.
+    value: typing.Optional[array.array] = None
+
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+        json['index'] = self.index.tolist()
+        if self.value is not None:
+            json['value'] = self.value.tolist()
+        return json
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> RareColumn:
+        return cls(index=array.array(INT, json['index']),
+            value=_column(json, 'value'))
+
+
+def _rare_column(json: T_JSON_DICT, key: str) -> typing.Optional[RareColumn]:
+    return RareColumn.from_json(json[key]) if key in json else None
+
+
+@add_slots
+@dataclass
+class NodeColumns:
+    '''
+    The columns of a ``NodeTreeSnapshot``.
+    '''
+    #: Parent node index.
+    parent_index: typing.Optional[array.array] = None
+
+    #: ``Node``'s nodeType.
+    node_type: typing.Optional[array.array] = None
+
+    #: ``Node``'s nodeName.
+    node_name: typing.Optional[array.array] = None
+
+    #: ``Node``'s nodeValue.
+    node_value: typing.Optional[array.array] = None
+
+    #: ``Node``'s id, corresponds to DOM.Node.backendNodeId.
+    backend_node_id: typing.Optional[array.array] = None
+
+    #: Attributes of an ``Element`` node. Flatten name, value pairs.
+    attributes: typing.Optional[ListColumn] = None
+
+    #: Only set for textarea elements, contains the text value.
+    text_value: typing.Optional[RareColumn] = None
+
+    #: Only set for input elements, contains the input's associated text
+    #: value.
+    input_value: typing.Optional[RareColumn] = None
+
+    #: Only set for radio and checkbox input elements, indicates if the
+    #: element has been checked
+    input_checked: typing.Optional[RareColumn] = None
+
+    #: Only set for option elements, indicates if the element has been
+    #: selected
+    option_selected: typing.Optional[RareColumn] = None
+
+    #: The index of the document in the list of the snapshot documents.
+    content_document_index: typing.Optional[RareColumn] = None
+
+    #: Type of a pseudo element node.
+    pseudo_type: typing.Optional[RareColumn] = None
+
+    #: Whether this DOM node responds to mouse clicks.
+    is_clickable: typing.Optional[RareColumn] = None
+
+    #: The selected url for nodes with a srcset attribute.
+    current_source_url: typing.Optional[RareColumn] = None
+
+    #: The url of the script (if any) that generates this node.
+    origin_url: typing.Optional[RareColumn] = None
+
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+        for key, name in _NODE_COLUMNS:
+            value = getattr(self, name)
+            if value is not None:
+                json[key] = value.tolist()
+        if self.attributes is not None:
+            json['attributes'] = self.attributes.to_json()
+        for key, name in _NODE_RARE_COLUMNS:
+            value = getattr(self, name)
+            if value is not None:
+                json[key] = value.to_json()
+        return json
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> NodeColumns:
+        kwargs: typing.Dict[str, typing.Any] = dict()
+        for key, name in _NODE_COLUMNS:
+            kwargs[name] = _column(json, key)
+        kwargs['attributes'] = _list_column(json, 'attributes', INT,
+            dom_snapshot.ArrayOfStrings)
+        for key, name in _NODE_RARE_COLUMNS:
+            kwargs[name] = _rare_column(json, key)
+        return cls(**kwargs)
+
+
+_NODE_COLUMNS = [
+    ('parentIndex', 'parent_index'),
+    ('nodeType', 'node_type'),
+    ('nodeName', 'node_name'),
+    ('nodeValue', 'node_value'),
+    ('backendNodeId', 'backend_node_id'),
+]
+
+_NODE_RARE_COLUMNS = [
+    ('textValue', 'text_value'),
+    ('inputValue', 'input_value'),
+    ('inputChecked', 'input_checked'),
+    ('optionSelected', 'option_selected'),
+    ('contentDocumentIndex', 'content_document_index'),
+    ('pseudoType', 'pseudo_type'),
+    ('isClickable', 'is_clickable'),
+    ('currentSourceURL', 'current_source_url'),
+    ('originURL', 'origin_url'),
+]
+
+
+@add_slots
+@dataclass
+class LayoutColumns:
+    '''
+    The columns of a ``LayoutTreeSnapshot``.
+    '''
+    #: Index of the corresponding node in the ``NodeTreeSnapshot`` array
+    #: returned by ``captureSnapshot``.
+    node_index: array.array
+
+    #: Array of indexes specifying computed style strings, filtered
+    #: according to the ``computedStyles`` parameter passed to
+    #: ``captureSnapshot``.
+    styles: ListColumn
+
+    #: The absolute position bounding box.
+    bounds: ListColumn
+
+    #: Contents of the LayoutText, if any.
+    text: array.array
+
+    #: Stacking context information.
+    stacking_contexts: RareColumn
+
+    #: The offset rect of nodes. Only available when includeDOMRects is set
+    #: to true
+    offset_rects: typing.Optional[ListColumn] = None
+
+    #: The scroll rect of nodes. Only available when includeDOMRects is set
+    #: to true
+    scroll_rects: typing.Optional[ListColumn] = None
+
+    #: The client rect of nodes. Only available when includeDOMRects is set
+    #: to true
+    client_rects: typing.Optional[ListColumn] = None
+
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+        json['nodeIndex'] = self.node_index.tolist()
+        json['styles'] = self.styles.to_json()
+        json['bounds'] = self.bounds.to_json()
+        json['text'] = self.text.tolist()
+        json['stackingContexts'] = self.stacking_contexts.to_json()
+        if self.offset_rects is not None:
+            json['offsetRects'] = self.offset_rects.to_json()
+        if self.scroll_rects is not None:
+            json['scrollRects'] = self.scroll_rects.to_json()
+        if self.client_rects is not None:
+            json['clientRects'] = self.client_rects.to_json()
+        return json
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> LayoutColumns:
+        rectangle = dom_snapshot.Rectangle
+        return cls(
+            node_index=array.array(INT, json['nodeIndex']),
+            styles=ListColumn.from_json(json['styles'], INT,
+                dom_snapshot.ArrayOfStrings),
+            bounds=ListColumn.from_json(json['bounds'], FLOAT, rectangle),
+            text=array.array(INT, json['text']),
+            stacking_contexts=RareColumn.from_json(json['stackingContexts']),
+            offset_rects=_list_column(json, 'offsetRects', FLOAT, rectangle),
+            scroll_rects=_list_column(json, 'scrollRects', FLOAT, rectangle),
+            client_rects=_list_column(json, 'clientRects', FLOAT, rectangle),
+        )
+
+
+@add_slots
+@dataclass
+class TextBoxColumns:
+    '''
+    The columns of a ``TextBoxSnapshot``.
+    '''
+    #: Index of the layout tree node that owns this box collection.
+    layout_index: array.array
+
+    #: The absolute position bounding box.
+    bounds: ListColumn
+
+    #: The starting index in characters, for this post layout textbox
+    #: substring.
+    start: array.array
+
+    #: The number of characters in this post layout textbox substring.
+    length: array.array
+
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+        json['layoutIndex'] = self.layout_index.tolist()
+        json['bounds'] = self.bounds.to_json()
+        json['start'] = self.start.tolist()
+        json['length'] = self.length.tolist()
+        return json
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> TextBoxColumns:
+        return cls(
+            layout_index=array.array(INT, json['layoutIndex']),
+            bounds=ListColumn.from_json(json['bounds'], FLOAT,
+                dom_snapshot.Rectangle),
+            start=array.array(INT, json['start']),
+            length=array.array(INT, json['length']),
+        )
+
+
+@add_slots
+@dataclass
+class DocumentColumns:
+    '''
+    A ``DocumentSnapshot`` whose tables are stored in columns.
+    '''
+    #: Document URL that ``Document`` or ``FrameOwner`` node points to.
+    document_url: dom_snapshot.StringIndex
+
+    #: Base URL that ``Document`` or ``FrameOwner`` node uses for URL
+    #: completion.
+    base_url: dom_snapshot.StringIndex
+
+    #: Contains the document's content language.
+    content_language: dom_snapshot.StringIndex
+
+    #: Contains the document's character set encoding.
+    encoding_name: dom_snapshot.StringIndex
+
+    #: ``DocumentType`` node's publicId.
+    public_id: dom_snapshot.StringIndex
+
+    #: ``DocumentType`` node's systemId.
+    system_id: dom_snapshot.StringIndex
+
+    #: Frame ID for frame owner elements and also for the document node.
+    frame_id: dom_snapshot.StringIndex
+
+    #: A table with dom nodes.
+    nodes: NodeColumns
+
+    #: The nodes in the layout tree.
+    layout: LayoutColumns
+
+    #: The post-layout inline text nodes.
+    text_boxes: TextBoxColumns
+
+    #: Horizontal scroll offset.
+    scroll_offset_x: typing.Optional[float] = None
+
+    #: Vertical scroll offset.
+    scroll_offset_y: typing.Optional[float] = None
+
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+        json['documentURL'] = int(self.document_url)
+        json['baseURL'] = int(self.base_url)
+        json['contentLanguage'] = int(self.content_language)
+        json['encodingName'] = int(self.encoding_name)
+        json['publicId'] = int(self.public_id)
+        json['systemId'] = int(self.system_id)
+        json['frameId'] = int(self.frame_id)
+        json['nodes'] = self.nodes.to_json()
+        json['layout'] = self.layout.to_json()
+        json['textBoxes'] = self.text_boxes.to_json()
+        if self.scroll_offset_x is not None:
+            json['scrollOffsetX'] = self.scroll_offset_x
+        if self.scroll_offset_y is not None:
+            json['scrollOffsetY'] = self.scroll_offset_y
+        return json
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> DocumentColumns:
+        string_index = dom_snapshot.StringIndex
+        return cls(
+            document_url=string_index(json['documentURL']),
+            base_url=string_index(json['baseURL']),
+            content_language=string_index(json['contentLanguage']),
+            encoding_name=string_index(json['encodingName']),
+            public_id=string_index(json['publicId']),
+            system_id=string_index(json['systemId']),
+            frame_id=string_index(json['frameId']),
+            nodes=NodeColumns.from_json(json['nodes']),
+            layout=LayoutColumns.from_json(json['layout']),
+            text_boxes=TextBoxColumns.from_json(json['textBoxes']),
+            scroll_offset_x=float(json['scrollOffsetX'])
+                if 'scrollOffsetX' in json else None,
+            scroll_offset_y=float(json['scrollOffsetY'])
+                if 'scrollOffsetY' in json else None,
+        )
+
+
+def decode_snapshot(json: T_JSON_DICT) -> typing.Tuple[
+        typing.List[DocumentColumns], typing.List[str]]:
+    '''
+    Decode the result of ``DOMSnapshot.captureSnapshot`` into columns.
+
+    :param json: the result of the command
+    :returns: the documents, and the shared string table that their string
+        columns refer to
+    '''
+    return ([DocumentColumns.from_json(i) for i in json['documents']],
+        json['strings'])
+
+
+def capture_snapshot(
+        computed_styles: typing.List[str],
+        include_dom_rects: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, typing.Tuple[
+        typing.List[DocumentColumns], typing.List[str]]]:
+    '''
+    Like ``dom_snapshot.capture_snapshot()``, but the documents are decoded
+    into columns.
+
+    :param computed_styles: Whitelist of computed styles to return.
+    :param include_dom_rects: *(Optional)* Whether to include DOM rectangles
+        (offsetRects, clientRects, scrollRects) into the snapshot
+    :returns: the documents, and the shared string table that their string
+        columns refer to
+    '''
+    cmd = dom_snapshot.capture_snapshot(computed_styles, include_dom_rects)
+    json = yield next(cmd)
+    return decode_snapshot(json)
+
+
+def as_numpy(column: typing.Union[array.array, ListColumn]) -> typing.Any:
+    '''
+    Return a NumPy array that shares the memory of a column.
+
+    An :class:`array.array` becomes a one dimensional array. A
+    :class:`ListColumn` whose cells all have the same length, such as
+    bounds, becomes a two dimensional array with a row for each cell.
+
+    :raises ImportError: if NumPy isn't installed
+    :raises ValueError: if the cells of a ``ListColumn`` have different
+        lengths; convert its ``values`` and ``offsets`` instead
+    '''
+    import numpy  # type: ignore
+    if isinstance(column, ListColumn):
+        if column.offsets is not None:
+            raise ValueError('The cells of the column have different lengths')
+        values = numpy.frombuffer(column.values, dtype=column.values.typecode)
+        return values.reshape(len(column), column.width)
+    return numpy.frombuffer(column, dtype=column.typecode)
+
+
+class SnapshotStrings:
+    '''
+    A view of a snapshot's shared string table.
+
+    Every string column of a snapshot holds indexes into one table of
+    strings, so two cells are equal if their indexes are equal. Instead of
+    converting whole columns to strings, find the index of a string once and
+    compare indexes, and look up the strings that are actually read. Each
+    string is interned with :func:`sys.intern` the first time it is looked
+    up, so that the strings of repeated snapshots, e.g. ``'DIV'``, share one
+    object.
+
+    .. code-block:: python
+
+        strings = SnapshotStrings(strings)
+        links = strings.column(nodes.node_name).positions('A')
+        names = strings.column(nodes.node_name)
+        print(names[links[0]])
+    '''
+    __slots__ = ('_strings', '_cache', '_ids')
+
+    def __init__(self, strings: typing.List[str]):
+        '''
+        Constructor.
+
+        :param strings: the string table that ``capture_snapshot()`` returns,
+            which is used without copying it
+        '''
+        self._strings = strings
+        self._cache: typing.Dict[int, str] = dict()
+        self._ids: typing.Optional[typing.Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __getitem__(self, index: int) -> typing.Optional[str]:
+        '''
+        Return the string at an index, or ``None`` for -1, which snapshots
+        use for a missing string.
+        '''
+        try:
+            return self._cache[index]
+        except KeyError:
+            pass
+        if index < 0:
+            if index == -1:
+                return None
+            raise IndexError('String index out of range: {}'.format(index))
+        string = sys.intern(self._strings[index])
+        self._cache[index] = string
+        return string
+
+    def find(self, value: str) -> int:
+        '''
+        Return the index of a string, or -1 if the table doesn't contain it.
+        A column contains the string exactly where it contains this index.
+        '''
+        if self._ids is None:
+            self._ids = {string: i for i, string in enumerate(self._strings)}
+        return self._ids.get(value, -1)
+
+    def decode(self, indexes: typing.Iterable[int]
+            ) -> typing.List[typing.Optional[str]]:
+        ''' Return the strings at some indexes, e.g. a cell of attributes. '''
+        return [self[i] for i in indexes]
+
+    def column(self, indexes: typing.Sequence[int]) -> StringColumn:
+        '''
+        Return a view of a column of string indexes, e.g.
+        ``nodes.node_name``, which looks up each string when it is accessed.
+        '''
+        return StringColumn(self, indexes)
+
+
+class StringColumn:
+    '''
+    A column of string indexes that looks up strings when they are accessed.
+    Create one with :meth:`SnapshotStrings.column`.
+    '''
+    __slots__ = ('strings', 'indexes')
+
+    def __init__(self, strings: SnapshotStrings,
+            indexes: typing.Sequence[int]):
+        self.strings = strings
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, index: int) -> typing.Optional[str]:
+        return self.strings[self.indexes[index]]
+
+    def __iter__(self) -> typing.Iterator[typing.Optional[str]]:
+        strings = self.strings
+        for index in self.indexes:
+            yield strings[index]
+
+    def positions(self, value: str) -> array.array:
+        '''
+        Return the positions of the cells that contain a string, by comparing
+        each cell's index with the string's index.
+        '''
+        positions = array.array(INT)
+        string_id = self.strings.find(value)
+        if string_id < 0:
+            return positions
+        cells = self.indexes
+        if isinstance(cells, array.array) and sys.version_info < (3, 10):
+            # array.index() doesn't take a start position, so compare the
+            # cells with iterators that run in C instead.
+            positions.extend(compress(count(), map(operator.eq,
+                repeat(string_id), cells)))
+            return positions
+        # index() compares the cells in C, which is much faster than
+        # comparing each cell in Python, and it doesn't copy the column.
+        position = -1
+        try:
+            while True:
+                position = cells.index(string_id, position + 1)
+                positions.append(position)
+        except ValueError:
+            return positions
+
+    def count(self, value: str) -> int:
+        ''' Return the number of cells that contain a string. '''
+        string_id = self.strings.find(value)
+        return 0 if string_id < 0 else self.indexes.count(string_id)
+
+
+class SnapshotIndex:
+    '''
+    An index of a snapshot document, which answers queries about its tree
+    without scanning its columns.
+
+    The index is built once for each document, in time proportional to the
+    number of nodes, and then each query costs about as much as the size of
+    its answer:
+
+    * the children of each node are stored in one array, in document order,
+      with the offset of each node's children (compressed sparse rows);
+    * the layout object of each node is stored in an array with an entry for
+      each node;
+    * the nodes with each node name, and the values of rare columns such as
+      ``input_value`` and ``is_clickable``, are indexed the first time they
+      are queried.
+
+    Nodes are referred to by their index in the document's node table. The
+    document may be a :class:`DocumentColumns` or a generated
+    ``dom_snapshot.DocumentSnapshot``.
+
+    .. code-block:: python
+
+        index = SnapshotIndex(documents[0], strings)
+        for link in index.nodes_by_name('A'):
+            print(index.attributes(link).get('href'), index.bounds(link))
+    '''
+    def __init__(self, document: typing.Any, strings: typing.Union[
+            typing.List[str], SnapshotStrings]):
+        '''
+        Constructor.
+
+        :param document: a document from the snapshot
+        :param strings: the snapshot's string table, or a view of it that can
+            be shared with the indexes of the snapshot's other documents
+        '''
+        self.document = document
+        if not isinstance(strings, SnapshotStrings):
+            strings = SnapshotStrings(strings)
+        self.strings = strings
+        nodes = document.nodes
+        parents = nodes.parent_index or []
+        self._size = len(parents)
+        self._parents = parents
+
+        # Count the children of each node, turn the counts into offsets, and
+        # then put each child in the next free slot of its parent, which
+        # keeps the children of each node in document order.
+        counts = array.array(INT, [0]) * self._size
+        roots = array.array(INT)
+        for node, parent in enumerate(parents):
+            if parent < 0:
+                roots.append(node)
+            else:
+                counts[parent] += 1
+        self._roots = roots
+        self._child_offsets = array.array(INT, [0])
+        self._child_offsets.extend(accumulate(counts))
+        self._children = array.array(INT, [0]) * (self._size - len(roots))
+        free = self._child_offsets[:-1]
+        children = self._children
+        for node, parent in enumerate(parents):
+            if parent >= 0:
+                children[free[parent]] = node
+                free[parent] += 1
+
+        self._layout = array.array(INT, [-1]) * self._size
+        for layout_index, node in enumerate(document.layout.node_index):
+            self._layout[node] = layout_index
+
+        self._names: typing.Optional[typing.Dict[int, array.array]] = None
+        self._backend_ids: typing.Optional[typing.Dict[int, int]] = None
+        self._rare: typing.Dict[str, typing.Any] = dict()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _check(self, node: int) -> None:
+        if not 0 <= node < self._size:
+            raise IndexError('Node index out of range: {}'.format(node))
+
+    def string_id(self, value: str) -> int:
+        '''
+        Return the index of a string in the string table, or -1 if the
+        snapshot doesn't contain it.
+        '''
+        return self.strings.find(value)
+
+    @property
+    def roots(self) -> array.array:
+        ''' The nodes without a parent, i.e. the document node. '''
+        return self._roots
+
+    def parent(self, node: int) -> int:
+        ''' Return the parent of a node, or -1 for the document node. '''
+        self._check(node)
+        return self._parents[node]
+
+    def children(self, node: int) -> array.array:
+        ''' Return the children of a node in document order. '''
+        self._check(node)
+        return self._children[self._child_offsets[node]:
+            self._child_offsets[node + 1]]
+
+    def ancestors(self, node: int) -> typing.Iterator[int]:
+        ''' Yield the parent of a node, its parent, and so on to the root. '''
+        self._check(node)
+        parents = self._parents
+        node = parents[node]
+        while node >= 0:
+            yield node
+            node = parents[node]
+
+    def descendants(self, node: int) -> typing.Iterator[int]:
+        ''' Yield a node and its descendants in document order. '''
+        self._check(node)
+        children = self._children
+        offsets = self._child_offsets
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(children[offsets[node]:offsets[node + 1]]))
+
+    def node_name(self, node: int) -> str:
+        ''' Return the node name of a node, e.g. ``'DIV'``. '''
+        self._check(node)
+        return typing.cast(str,
+            self.strings[self.document.nodes.node_name[node]])
+
+    def nodes_by_name(self, name: str) -> array.array:
+        '''
+        Return the nodes with a node name in document order.
+
+        :param name: the node name as the browser reports it, which is upper
+            case for HTML elements, e.g. ``'DIV'``, and ``'#text'`` for text
+            nodes
+        '''
+        if self._names is None:
+            names: typing.Dict[int, array.array] = dict()
+            for node, string_id in enumerate(self.document.nodes.node_name):
+                try:
+                    names[string_id].append(node)
+                except KeyError:
+                    names[string_id] = array.array(INT, [node])
+            self._names = names
+        return self._names.get(self.string_id(name), array.array(INT))
+
+    def node_by_backend_id(self, backend_node_id: int) -> int:
+        ''' Return the node with a backend node ID, or -1 if there isn't one. '''
+        if self._backend_ids is None:
+            self._backend_ids = {backend_id: node for node, backend_id in
+                enumerate(self.document.nodes.backend_node_id or [])}
+        return self._backend_ids.get(backend_node_id, -1)
+
+    def attributes(self, node: int) -> typing.Dict[str, str]:
+        ''' Return the attributes of a node as a dict. '''
+        self._check(node)
+        attributes = self.document.nodes.attributes
+        if attributes is None:
+            return dict()
+        names_and_values = typing.cast(typing.List[str],
+            self.strings.decode(attributes[node]))
+        return dict(zip(names_and_values[::2], names_and_values[1::2]))
+
+    def layout_index(self, node: int) -> int:
+        ''' Return the index of a node's layout object, or -1 if it has none. '''
+        self._check(node)
+        return self._layout[node]
+
+    def bounds(self, node: int) -> typing.Optional[dom_snapshot.Rectangle]:
+        '''
+        Return the bounds of a node's layout object, or ``None`` if it has
+        none, e.g. because it isn't displayed.
+        '''
+        layout_index = self.layout_index(node)
+        if layout_index < 0:
+            return None
+        return dom_snapshot.Rectangle(self.document.layout.bounds[
+            layout_index])
+
+    def _rare_column(self, name: str) -> typing.Any:
+        try:
+            return self._rare[name]
+        except KeyError:
+            pass
+        column = getattr(self.document.nodes, name)
+        if column is None:
+            lookup: typing.Any = None
+        elif getattr(column, 'value', None) is None:
+            lookup = bytearray(self._size)
+            for node in column.index:
+                lookup[node] = 1
+        else:
+            lookup = dict(zip(column.index, column.value))
+        self._rare[name] = lookup
+        return lookup
+
+    def is_set(self, name: str, node: int) -> bool:
+        '''
+        Return the value of a rare boolean column for a node.
+
+        :param name: the name of the column, e.g. ``'is_clickable'``
+        :raises ValueError: if the column isn't a boolean column
+        '''
+        self._check(node)
+        lookup = self._rare_column(name)
+        if lookup is None:
+            return False
+        if not isinstance(lookup, bytearray):
+            raise ValueError('{} is not a rare boolean column'.format(name))
+        return bool(lookup[node])
+
+    def rare_value(self, name: str, node: int) -> typing.Optional[int]:
+        '''
+        Return the value of a rare string or integer column for a node, or
+        ``None`` if the node doesn't have one. The value of a string column
+        is an index into the string table.
+
+        :param name: the name of the column, e.g. ``'input_value'``
+        :raises ValueError: if the column is a boolean column
+        '''
+        self._check(node)
+        lookup = self._rare_column(name)
+        if lookup is None:
+            return None
+        if isinstance(lookup, bytearray):
+            raise ValueError('{} is a rare boolean column, use is_set() '
+                'instead'.format(name))
+        return lookup.get(node)
+
+    def text(self, node: int) -> str:
+        '''
+        Return the text that is displayed in a node and its descendants.
+
+        Only text nodes with a layout object count, so text that isn't
+        displayed, e.g. the contents of scripts, is skipped.
+        '''
+        node_type = self.document.nodes.node_type
+        layout_text = self.document.layout.text
+        strings = self.strings
+        pieces = list()
+        for descendant in self.descendants(node):
+            if node_type[descendant] != 3:
+                continue
+            layout_index = self._layout[descendant]
+            if layout_index >= 0 and layout_text[layout_index] >= 0:
+                pieces.append(strings[layout_text[layout_index]])
+        return ''.join(pieces)
@@ -6,7 +6,7 @@
 # CDP domain: Storage (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -33,9 +33,17 @@ class StorageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class UsageForType:
     '''
@@ -177,6 +185,7 @@ def untrack_indexed_db_for_origin(
 
 
 @event_class('Storage.cacheStorageContentUpdated')
+@add_slots
 @dataclass
 class CacheStorageContentUpdated:
     '''
@@ -187,15 +196,18 @@ class CacheStorageContentUpdated:
     #: Name of cache in origin.
     cache_name: str
 
+    _json_names = ('origin', 'cacheName')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            cache_name=str(json['cacheName'])
+            origin=json['origin'],
+            cache_name=json['cacheName']
         )
 
 
 @event_class('Storage.cacheStorageListUpdated')
+@add_slots
 @dataclass
 class CacheStorageListUpdated:
     '''
@@ -204,14 +216,17 @@ class CacheStorageListUpdated:
     #: Origin to update.
     origin: str
 
+    _json_names = ('origin',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageListUpdated:
         return cls(
-            origin=str(json['origin'])
+            origin=json['origin']
         )
 
 
 @event_class('Storage.indexedDBContentUpdated')
+@add_slots
 @dataclass
 class IndexedDBContentUpdated:
     '''
@@ -224,16 +239,19 @@ class IndexedDBContentUpdated:
     #: ObjectStore to update.
     object_store_name: str
 
+    _json_names = ('origin', 'databaseName', 'objectStoreName')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            database_name=str(json['databaseName']),
-            object_store_name=str(json['objectStoreName'])
+            origin=json['origin'],
+            database_name=json['databaseName'],
+            object_store_name=json['objectStoreName']
         )
 
 
 @event_class('Storage.indexedDBListUpdated')
+@add_slots
 @dataclass
 class IndexedDBListUpdated:
     '''
@@ -242,8 +260,10 @@ class IndexedDBListUpdated:
     #: Origin to update.
     origin: str
 
+    _json_names = ('origin',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBListUpdated:
         return cls(
-            origin=str(json['origin'])
+            origin=json['origin']
         )
@@ -0,0 +1,214 @@
+'''
+Read the streams that some commands return a handle to, e.g.
+``page.print_to_pdf(transfer_mode='ReturnAsStream')`` and the
+``tracing.TracingComplete`` event.
+
+A stream is read in chunks with ``io.read()``, and each chunk may be base64
+encoded. The helpers in this module decode each chunk as it arrives, so that
+reading a large stream never holds more than one chunk in memory on top of
+the result, and close the stream with ``io.close()`` when they are done.
+
+The helpers don't do any I/O themselves: they take an ``execute`` function
+that runs a command and returns its result, e.g.
+``cdp.connection.Connection.execute``.
+
+.. code-block:: python
+
+    with open('page.pdf', 'wb') as pdf:
+        await read_stream_into(conn.execute, handle, pdf)
+'''
+import asyncio
+import binascii
+import typing
+
+from cdp import io
+
+
+T_EXECUTE = typing.Callable[[typing.Generator], typing.Awaitable[typing.Any]]
+T_EXECUTE_SYNC = typing.Callable[[typing.Generator], typing.Any]
+
+
+class Base64Decoder:
+    '''
+    Decode base64 data that arrives in pieces whose lengths need not be
+    multiples of 4.
+    '''
+    def __init__(self):
+        self._rest = ''
+
+    def decode(self, data: str) -> bytes:
+        '''
+        Decode as much of the data as possible, and keep the rest until the
+        next call.
+        '''
+        if self._rest:
+            data = self._rest + data
+        end = len(data) - len(data) % 4
+        self._rest = data[end:]
+        return binascii.a2b_base64(data[:end])
+
+    def finish(self) -> None:
+        '''
+        Check that all of the data has been decoded.
+
+        :raises ValueError: if the data was cut off
+        '''
+        if self._rest:
+            raise ValueError('Truncated base64 data')
+
+
+class _Sink:
+    ''' Write chunks to a file-like object or into a buffer. '''
+    def __init__(self, sink: typing.Any):
+        self._write = getattr(sink, 'write', None)
+        self._view = None if self._write else memoryview(sink).cast('B')
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        if self._write is not None:
+            self._write(chunk)
+        else:
+            assert self._view is not None
+            end = self.size + len(chunk)
+            if end > len(self._view):
+                raise ValueError('The stream is larger than the buffer')
+            self._view[self.size:end] = chunk
+        self.size += len(chunk)
+
+
+def _decode(decoder: Base64Decoder, base64_encoded: typing.Optional[bool],
+        data: str) -> bytes:
+    if base64_encoded:
+        return decoder.decode(data)
+    return data.encode('utf8')
+
+
+async def read_stream(execute: T_EXECUTE, handle: io.StreamHandle,
+        size: typing.Optional[int] = None,
+        close: bool = True) -> typing.AsyncGenerator[bytes, None]:
+    '''
+    Read a stream and yield its decoded chunks.
+
+    The next chunk is requested as soon as the current one arrives, so the
+    browser reads the next chunk while the current one is decoded and
+    consumed.
+
+    :param execute: a function that runs a command, e.g.
+        ``Connection.execute``
+    :param handle: the stream to read
+    :param size: the maximum size of each chunk that is requested, or the
+        browser's default
+    :param close: if true, the stream is closed when it has been read, or
+        when the iterator is closed or fails
+    :raises ValueError: if the stream's base64 data is cut off
+    '''
+    decoder = Base64Decoder()
+    pending: typing.Optional[asyncio.Future] = asyncio.ensure_future(
+        execute(io.read(handle, size=size)))
+    complete = False
+    try:
+        while pending is not None:
+            base64_encoded, data, eof = await pending
+            pending = None
+            if not eof:
+                pending = asyncio.ensure_future(execute(io.read(handle,
+                    size=size)))
+            chunk = _decode(decoder, base64_encoded, data)
+            if chunk:
+                yield chunk
+        decoder.finish()
+        complete = True
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        if close:
+            try:
+                await execute(io.close(handle))
+            except Exception:
+                # If the read failed, e.g. because the connection was
+                # closed, closing the stream fails too; don't hide why.
+                if complete:
+                    raise
+
+
+async def read_stream_into(execute: T_EXECUTE, handle: io.StreamHandle,
+        sink: typing.Any, size: typing.Optional[int] = None,
+        close: bool = True) -> int:
+    '''
+    Read a stream into a file-like object or a buffer.
+
+    :param execute: a function that runs a command, e.g.
+        ``Connection.execute``
+    :param handle: the stream to read
+    :param sink: a binary file-like object with a ``write()`` method, or a
+        writable buffer such as a ``bytearray`` that is filled from the
+        start
+    :param size: the maximum size of each chunk that is requested, or the
+        browser's default
+    :param close: if true, the stream is closed when it has been read
+    :returns: the number of bytes that were read
+    :raises ValueError: if the stream is larger than the buffer, or its
+        base64 data is cut off
+    '''
+    writer = _Sink(sink)
+    stream = read_stream(execute, handle, size, close)
+    try:
+        async for chunk in stream:
+            writer.write(chunk)
+    finally:
+        await stream.aclose()
+    return writer.size
+
+
+def read_stream_sync(execute: T_EXECUTE_SYNC, handle: io.StreamHandle,
+        size: typing.Optional[int] = None,
+        close: bool = True) -> typing.Generator[bytes, None, None]:
+    '''
+    Read a stream and yield its decoded chunks, for a driver that runs
+    commands synchronously.
+
+    :param execute: a function that runs a command and returns its result
+    :param handle: the stream to read
+    :param size: the maximum size of each chunk that is requested, or the
+        browser's default
+    :param close: if true, the stream is closed when it has been read, or
+        when the iterator is closed or fails
+    :raises ValueError: if the stream's base64 data is cut off
+    '''
+    decoder = Base64Decoder()
+    complete = False
+    try:
+        eof = False
+        while not eof:
+            base64_encoded, data, eof = execute(io.read(handle, size=size))
+            chunk = _decode(decoder, base64_encoded, data)
+            if chunk:
+                yield chunk
+        decoder.finish()
+        complete = True
+    finally:
+        if close:
+            try:
+                execute(io.close(handle))
+            except Exception:
+                # Don't hide the error that stopped the read.
+                if complete:
+                    raise
+
+
+def read_stream_into_sync(execute: T_EXECUTE_SYNC, handle: io.StreamHandle,
+        sink: typing.Any, size: typing.Optional[int] = None,
+        close: bool = True) -> int:
+    '''
+    Read a stream into a file-like object or a buffer, for a driver that
+    runs commands synchronously. See :func:`read_stream_into`.
+    '''
+    writer = _Sink(sink)
+    stream = read_stream_sync(execute, handle, size, close)
+    try:
+        for chunk in stream:
+            writer.write(chunk)
+    finally:
+        stream.close()
+    return writer.size
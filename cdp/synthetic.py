@@ -0,0 +1,139 @@
+'''
+Synthesize JSON payloads for CDP types, events, and commands from the protocol
+specification.
+
+By default, the payloads follow the copy of the specification that is
+installed with the package (``cdp/protocol.json``, which the generator writes
+along with the domain modules). Pass the paths of other specification files,
+e.g. the ones in the ``generator/`` directory, to use those instead.
+
+Every field is filled in, including optional fields, so that decoding a payload
+exercises all of the generated code for a type. Recursive types are cut off at
+a fixed depth: below that depth optional fields are left out and arrays are
+empty.
+'''
+import importlib.resources
+import json
+from pathlib import Path
+import sys
+import typing
+
+from cdp.util import T_JSON_DICT
+
+
+#: The name of the specification that is installed in the ``cdp`` package.
+SCHEMA_RESOURCE = 'protocol.json'
+
+PRIMITIVES = {
+    'string': 'value',
+    'integer': 1,
+    'number': 1.5,
+    'boolean': True,
+    'object': {'key': 'value'},
+    'any': 'value',
+}
+
+
+T_SPEC = typing.Dict[str, typing.Any]
+
+
+class PayloadFactory:
+    ''' Create JSON payloads that match the CDP specification. '''
+    def __init__(self, schema_paths: typing.Optional[typing.Iterable[
+            typing.Union[str, Path]]] = None, max_depth: int = 3,
+            array_length: int = 2):
+        '''
+        Constructor.
+
+        :param schema_paths: paths to the CDP JSON specification files, or
+            ``None`` for the specification that is installed with the package
+        :param max_depth: the depth below which optional fields and array
+            items are omitted
+        :param array_length: the number of items in each array
+        '''
+        self.max_depth = max_depth
+        self.array_length = array_length
+        self.types: typing.Dict[str, typing.Tuple[str, T_SPEC]] = dict()
+        self.events: typing.Dict[str, typing.Tuple[str, T_SPEC]] = dict()
+        self.commands: typing.Dict[str, typing.Tuple[str, T_SPEC]] = dict()
+        if schema_paths is None:
+            schemas = [_installed_schema()]
+        else:
+            schemas = list()
+            for path in schema_paths:
+                with open(path) as schema_file:
+                    schemas.append(json.load(schema_file))
+        for schema in schemas:
+            for domain in schema['domains']:
+                name = domain['domain']
+                for type_ in domain.get('types', list()):
+                    self.types[f'{name}.{type_["id"]}'] = (name, type_)
+                for event in domain.get('events', list()):
+                    self.events[f'{name}.{event["name"]}'] = (name, event)
+                for command in domain.get('commands', list()):
+                    self.commands[f'{name}.{command["name"]}'] = (name,
+                        command)
+
+    def type_payload(self, ref: str, depth: int = 0) -> typing.Any:
+        '''
+        Return a payload for a type.
+
+        :param ref: a qualified type name, e.g. ``Network.Response``
+        '''
+        domain, type_ = self.types[ref]
+        return self._value(type_, domain, depth)
+
+    def event_payload(self, method: str) -> T_JSON_DICT:
+        '''
+        Return the ``params`` for an event.
+
+        :param method: an event name, e.g. ``Network.responseReceived``
+        '''
+        domain, event = self.events[method]
+        return self._properties(event.get('parameters', list()), domain, 0)
+
+    def command_result(self, method: str) -> T_JSON_DICT:
+        '''
+        Return the ``result`` for a command.
+
+        :param method: a command name, e.g. ``DOM.getDocument``
+        '''
+        domain, command = self.commands[method]
+        return self._properties(command.get('returns', list()), domain, 0)
+
+    def _properties(self, properties: typing.List[T_SPEC], domain: str,
+            depth: int) -> T_JSON_DICT:
+        payload: T_JSON_DICT = dict()
+        for prop in properties:
+            if prop.get('optional') and depth >= self.max_depth:
+                continue
+            payload[prop['name']] = self._value(prop, domain, depth)
+        return payload
+
+    def _value(self, spec: T_SPEC, domain: str, depth: int) -> typing.Any:
+        if '$ref' in spec:
+            ref = spec['$ref']
+            if '.' not in ref:
+                ref = f'{domain}.{ref}'
+            return self.type_payload(ref, depth)
+        if 'enum' in spec:
+            return spec['enum'][0]
+        type_ = spec['type']
+        if type_ == 'array':
+            if depth >= self.max_depth:
+                return list()
+            return [self._value(spec['items'], domain, depth + 1)
+                for _ in range(self.array_length)]
+        if type_ == 'object' and 'properties' in spec:
+            return self._properties(spec['properties'], domain, depth + 1)
+        return PRIMITIVES[type_]
+
+
+def _installed_schema() -> T_JSON_DICT:
+    ''' Load the specification that is installed with the package. '''
+    if sys.version_info >= (3, 9):
+        data = importlib.resources.files('cdp').joinpath(
+            SCHEMA_RESOURCE).read_bytes()
+    else:
+        data = importlib.resources.read_binary('cdp', SCHEMA_RESOURCE)
+    return json.loads(data)
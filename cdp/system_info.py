@@ -6,12 +6,13 @@
 # CDP domain: SystemInfo (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
 
 
+@add_slots
 @dataclass
 class GPUDevice:
     '''
@@ -50,13 +51,14 @@ class GPUDevice:
         return cls(
             vendor_id=float(json['vendorId']),
             device_id=float(json['deviceId']),
-            vendor_string=str(json['vendorString']),
-            device_string=str(json['deviceString']),
-            driver_vendor=str(json['driverVendor']),
-            driver_version=str(json['driverVersion']),
+            vendor_string=json['vendorString'],
+            device_string=json['deviceString'],
+            driver_vendor=json['driverVendor'],
+            driver_version=json['driverVersion'],
         )
 
 
+@add_slots
 @dataclass
 class Size:
     '''
@@ -77,11 +79,12 @@ class Size:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Size:
         return cls(
-            width=int(json['width']),
-            height=int(json['height']),
+            width=json['width'],
+            height=json['height'],
         )
 
 
+@add_slots
 @dataclass
 class VideoDecodeAcceleratorCapability:
     '''
@@ -107,12 +110,13 @@ class VideoDecodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoDecodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
+            profile=json['profile'],
             max_resolution=Size.from_json(json['maxResolution']),
             min_resolution=Size.from_json(json['minResolution']),
         )
 
 
+@add_slots
 @dataclass
 class VideoEncodeAcceleratorCapability:
     '''
@@ -143,10 +147,10 @@ class VideoEncodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoEncodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
+            profile=json['profile'],
             max_resolution=Size.from_json(json['maxResolution']),
-            max_framerate_numerator=int(json['maxFramerateNumerator']),
-            max_framerate_denominator=int(json['maxFramerateDenominator']),
+            max_framerate_numerator=json['maxFramerateNumerator'],
+            max_framerate_denominator=json['maxFramerateDenominator'],
         )
 
 
@@ -163,9 +167,17 @@ class SubsamplingFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SubsamplingFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class ImageDecodeAcceleratorCapability:
     '''
@@ -195,13 +207,14 @@ class ImageDecodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ImageDecodeAcceleratorCapability:
         return cls(
-            image_type=str(json['imageType']),
+            image_type=json['imageType'],
             max_dimensions=Size.from_json(json['maxDimensions']),
             min_dimensions=Size.from_json(json['minDimensions']),
             subsamplings=[SubsamplingFormat.from_json(i) for i in json['subsamplings']],
         )
 
 
+@add_slots
 @dataclass
 class GPUInfo:
     '''
@@ -245,15 +258,16 @@ class GPUInfo:
     def from_json(cls, json: T_JSON_DICT) -> GPUInfo:
         return cls(
             devices=[GPUDevice.from_json(i) for i in json['devices']],
-            driver_bug_workarounds=[str(i) for i in json['driverBugWorkarounds']],
+            driver_bug_workarounds=json['driverBugWorkarounds'],
             video_decoding=[VideoDecodeAcceleratorCapability.from_json(i) for i in json['videoDecoding']],
             video_encoding=[VideoEncodeAcceleratorCapability.from_json(i) for i in json['videoEncoding']],
             image_decoding=[ImageDecodeAcceleratorCapability.from_json(i) for i in json['imageDecoding']],
-            aux_attributes=dict(json['auxAttributes']) if 'auxAttributes' in json else None,
-            feature_status=dict(json['featureStatus']) if 'featureStatus' in json else None,
+            aux_attributes=json.get('auxAttributes'),
+            feature_status=json.get('featureStatus'),
         )
 
 
+@add_slots
 @dataclass
 class ProcessInfo:
     '''
@@ -279,8 +293,8 @@ class ProcessInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProcessInfo:
         return cls(
-            type_=str(json['type']),
-            id_=int(json['id']),
+            type_=json['type'],
+            id_=json['id'],
             cpu_time=float(json['cpuTime']),
         )
 
@@ -302,9 +316,9 @@ def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo,
     json = yield cmd_dict
     return (
         GPUInfo.from_json(json['gpu']),
-        str(json['modelName']),
-        str(json['modelVersion']),
-        str(json['commandLine'])
+        json['modelName'],
+        json['modelVersion'],
+        json['commandLine']
     )
 
 
@@ -6,7 +6,7 @@
 # CDP domain: Target
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -51,6 +51,7 @@ class BrowserContextID(str):
         return 'BrowserContextID({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class TargetInfo:
     target_id: TargetID
@@ -85,16 +86,17 @@ class TargetInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfo:
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            type_=str(json['type']),
-            title=str(json['title']),
-            url=str(json['url']),
-            attached=bool(json['attached']),
-            opener_id=TargetID.from_json(json['openerId']) if 'openerId' in json else None,
-            browser_context_id=BrowserContextID.from_json(json['browserContextId']) if 'browserContextId' in json else None,
+            target_id=TargetID(json['targetId']),
+            type_=json['type'],
+            title=json['title'],
+            url=json['url'],
+            attached=json['attached'],
+            opener_id=TargetID(json['openerId']) if 'openerId' in json else None,
+            browser_context_id=BrowserContextID(json['browserContextId']) if 'browserContextId' in json else None,
         )
 
 
+@add_slots
 @dataclass
 class RemoteLocation:
     host: str
@@ -110,8 +112,8 @@ class RemoteLocation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteLocation:
         return cls(
-            host=str(json['host']),
-            port=int(json['port']),
+            host=json['host'],
+            port=json['port'],
         )
 
 
@@ -152,7 +154,7 @@ def attach_to_target(
         'params': params,
     }
     json = yield cmd_dict
-    return SessionID.from_json(json['sessionId'])
+    return SessionID(json['sessionId'])
 
 
 def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SessionID]:
@@ -167,7 +169,7 @@ def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Sessi
         'method': 'Target.attachToBrowserTarget',
     }
     json = yield cmd_dict
-    return SessionID.from_json(json['sessionId'])
+    return SessionID(json['sessionId'])
 
 
 def close_target(
@@ -186,7 +188,7 @@ def close_target(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['success'])
+    return json['success']
 
 
 def expose_dev_tools_protocol(
@@ -232,7 +234,7 @@ def create_browser_context() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Browser
         'method': 'Target.createBrowserContext',
     }
     json = yield cmd_dict
-    return BrowserContextID.from_json(json['browserContextId'])
+    return BrowserContextID(json['browserContextId'])
 
 
 def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[BrowserContextID]]:
@@ -247,7 +249,7 @@ def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Li
         'method': 'Target.getBrowserContexts',
     }
     json = yield cmd_dict
-    return [BrowserContextID.from_json(i) for i in json['browserContextIds']]
+    return [BrowserContextID(i) for i in json['browserContextIds']]
 
 
 def create_target(
@@ -290,7 +292,7 @@ def create_target(
         'params': params,
     }
     json = yield cmd_dict
-    return TargetID.from_json(json['targetId'])
+    return TargetID(json['targetId'])
 
 
 def detach_from_target(
@@ -462,6 +464,7 @@ def set_remote_locations(
 
 
 @event_class('Target.attachedToTarget')
+@add_slots
 @dataclass
 class AttachedToTarget:
     '''
@@ -474,16 +477,19 @@ class AttachedToTarget:
     target_info: TargetInfo
     waiting_for_debugger: bool
 
+    _json_names = ('sessionId', 'targetInfo', 'waitingForDebugger')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttachedToTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
+            session_id=SessionID(json['sessionId']),
             target_info=TargetInfo.from_json(json['targetInfo']),
-            waiting_for_debugger=bool(json['waitingForDebugger'])
+            waiting_for_debugger=json['waitingForDebugger']
         )
 
 
 @event_class('Target.detachedFromTarget')
+@add_slots
 @dataclass
 class DetachedFromTarget:
     '''
@@ -497,15 +503,18 @@ class DetachedFromTarget:
     #: Deprecated.
     target_id: typing.Optional[TargetID]
 
+    _json_names = ('sessionId', 'targetId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DetachedFromTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            target_id=TargetID.from_json(json['targetId']) if 'targetId' in json else None
+            session_id=SessionID(json['sessionId']),
+            target_id=TargetID(json['targetId']) if 'targetId' in json else None
         )
 
 
 @event_class('Target.receivedMessageFromTarget')
+@add_slots
 @dataclass
 class ReceivedMessageFromTarget:
     '''
@@ -518,16 +527,19 @@ class ReceivedMessageFromTarget:
     #: Deprecated.
     target_id: typing.Optional[TargetID]
 
+    _json_names = ('sessionId', 'message', 'targetId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReceivedMessageFromTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            message=str(json['message']),
-            target_id=TargetID.from_json(json['targetId']) if 'targetId' in json else None
+            session_id=SessionID(json['sessionId']),
+            message=json['message'],
+            target_id=TargetID(json['targetId']) if 'targetId' in json else None
         )
 
 
 @event_class('Target.targetCreated')
+@add_slots
 @dataclass
 class TargetCreated:
     '''
@@ -535,6 +547,8 @@ class TargetCreated:
     '''
     target_info: TargetInfo
 
+    _json_names = ('targetInfo',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCreated:
         return cls(
@@ -543,6 +557,7 @@ class TargetCreated:
 
 
 @event_class('Target.targetDestroyed')
+@add_slots
 @dataclass
 class TargetDestroyed:
     '''
@@ -550,14 +565,17 @@ class TargetDestroyed:
     '''
     target_id: TargetID
 
+    _json_names = ('targetId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetDestroyed:
         return cls(
-            target_id=TargetID.from_json(json['targetId'])
+            target_id=TargetID(json['targetId'])
         )
 
 
 @event_class('Target.targetCrashed')
+@add_slots
 @dataclass
 class TargetCrashed:
     '''
@@ -569,16 +587,19 @@ class TargetCrashed:
     #: Termination error code.
     error_code: int
 
+    _json_names = ('targetId', 'status', 'errorCode')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            status=str(json['status']),
-            error_code=int(json['errorCode'])
+            target_id=TargetID(json['targetId']),
+            status=json['status'],
+            error_code=json['errorCode']
         )
 
 
 @event_class('Target.targetInfoChanged')
+@add_slots
 @dataclass
 class TargetInfoChanged:
     '''
@@ -587,6 +608,8 @@ class TargetInfoChanged:
     '''
     target_info: TargetInfo
 
+    _json_names = ('targetInfo',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfoChanged:
         return cls(
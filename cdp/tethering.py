@@ -6,7 +6,7 @@
 # CDP domain: Tethering (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -47,6 +47,7 @@ def unbind(
 
 
 @event_class('Tethering.accepted')
+@add_slots
 @dataclass
 class Accepted:
     '''
@@ -57,9 +58,11 @@ class Accepted:
     #: Connection id to be used.
     connection_id: str
 
+    _json_names = ('port', 'connectionId')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Accepted:
         return cls(
-            port=int(json['port']),
-            connection_id=str(json['connectionId'])
+            port=json['port'],
+            connection_id=json['connectionId']
         )
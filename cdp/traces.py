@@ -0,0 +1,142 @@
+'''
+Read trace events from a trace file in the JSON trace format, e.g. one that
+was saved by :class:`cdp.connection.TraceRecorder`.
+
+A trace can have millions of events, so the events are parsed one at a time
+as the file is read, and memory use is bounded by the size of the largest
+event rather than the size of the trace.
+'''
+import codecs
+import gzip
+import json
+from pathlib import Path
+import typing
+
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_WHITESPACE = ' \t\n\r'
+
+
+class _Parser:
+    ''' Decode JSON values one at a time from a stream of text. '''
+    def __init__(self, read: typing.Callable[[], str]):
+        self._read = read
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        ''' Read more text, and return false at the end of the stream. '''
+        if self._eof:
+            return False
+        text = self._read()
+        if not text:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        ''' Skip whitespace and return the next character, or ``''``. '''
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f'Expected {char!r} in trace at position '
+                f'{self._pos}')
+        self._pos += 1
+
+    def value(self) -> typing.Any:
+        ''' Decode the next value. '''
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may be cut off at the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next
+            # read.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _events(parser: _Parser) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    parser.expect('[')
+    if parser.peek() != ']':
+        while True:
+            yield parser.value()
+            if parser.peek() == ']':
+                break
+            parser.expect(',')
+    parser.expect(']')
+
+
+def iter_trace_events(source: typing.Union[str, Path, typing.BinaryIO],
+        chunk_size: int = 2 ** 16) -> typing.Iterator[typing.Dict[str,
+        typing.Any]]:
+    '''
+    Yield each event in a trace.
+
+    The trace may be an object with a ``traceEvents`` array, which is what
+    Chrome writes, or just the array of events, and it may be gzip
+    compressed. Other keys of the object are skipped.
+
+    :param source: the path to the trace, or a binary file to read it from
+    :param chunk_size: the number of bytes to read at a time
+    :raises ValueError: if the trace isn't valid JSON
+    '''
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as trace_file:
+            yield from iter_trace_events(trace_file, chunk_size)
+        return
+    stream: typing.BinaryIO = source
+    if hasattr(stream, 'peek'):
+        start = stream.peek(2)[:2]  # type: ignore
+    else:
+        start = stream.read(2)
+        stream.seek(-len(start), 1)
+    if start == _GZIP_MAGIC:
+        stream = typing.cast(typing.BinaryIO, gzip.GzipFile(fileobj=stream))
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def read() -> str:
+        while True:
+            data = stream.read(chunk_size)
+            text = decoder.decode(data, final=not data)
+            # The chunk may end in the middle of a character.
+            if text or not data:
+                return text
+
+    parser = _Parser(read)
+    if parser.peek() == '[':
+        yield from _events(parser)
+        return
+    parser.expect('{')
+    if parser.peek() == '}':
+        return
+    while True:
+        key = parser.value()
+        parser.expect(':')
+        if key == 'traceEvents':
+            yield from _events(parser)
+        else:
+            parser.value()
+        if parser.peek() == '}':
+            return
+        parser.expect(',')
@@ -6,7 +6,7 @@
 # CDP domain: Tracing (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -29,6 +29,7 @@ class MemoryDumpConfig(dict):
         return 'MemoryDumpConfig({})'.format(super().__repr__())
 
 
+@add_slots
 @dataclass
 class TraceConfig:
     #: Controls how the trace buffer stores data.
@@ -78,14 +79,14 @@ class TraceConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TraceConfig:
         return cls(
-            record_mode=str(json['recordMode']) if 'recordMode' in json else None,
-            enable_sampling=bool(json['enableSampling']) if 'enableSampling' in json else None,
-            enable_systrace=bool(json['enableSystrace']) if 'enableSystrace' in json else None,
-            enable_argument_filter=bool(json['enableArgumentFilter']) if 'enableArgumentFilter' in json else None,
-            included_categories=[str(i) for i in json['includedCategories']] if 'includedCategories' in json else None,
-            excluded_categories=[str(i) for i in json['excludedCategories']] if 'excludedCategories' in json else None,
-            synthetic_delays=[str(i) for i in json['syntheticDelays']] if 'syntheticDelays' in json else None,
-            memory_dump_config=MemoryDumpConfig.from_json(json['memoryDumpConfig']) if 'memoryDumpConfig' in json else None,
+            record_mode=json.get('recordMode'),
+            enable_sampling=json.get('enableSampling'),
+            enable_systrace=json.get('enableSystrace'),
+            enable_argument_filter=json.get('enableArgumentFilter'),
+            included_categories=json.get('includedCategories'),
+            excluded_categories=json.get('excludedCategories'),
+            synthetic_delays=json.get('syntheticDelays'),
+            memory_dump_config=MemoryDumpConfig(json['memoryDumpConfig']) if 'memoryDumpConfig' in json else None,
         )
 
 
@@ -102,7 +103,14 @@ class StreamFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class StreamCompression(enum.Enum):
@@ -117,7 +125,14 @@ class StreamCompression(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamCompression:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -140,7 +155,7 @@ def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str
         'method': 'Tracing.getCategories',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['categories']]
+    return json['categories']
 
 
 def record_clock_sync_marker(
@@ -174,8 +189,8 @@ def request_memory_dump() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tup
     }
     json = yield cmd_dict
     return (
-        str(json['dumpGuid']),
-        bool(json['success'])
+        json['dumpGuid'],
+        json['success']
     )
 
 
@@ -222,6 +237,7 @@ def start(
 
 
 @event_class('Tracing.bufferUsage')
+@add_slots
 @dataclass
 class BufferUsage:
     #: A number in range [0..1] that indicates the used size of event buffer as a fraction of its
@@ -233,6 +249,8 @@ class BufferUsage:
     #: total size.
     value: typing.Optional[float]
 
+    _json_names = ('percentFull', 'eventCount', 'value')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BufferUsage:
         return cls(
@@ -243,6 +261,7 @@ class BufferUsage:
 
 
 @event_class('Tracing.dataCollected')
+@add_slots
 @dataclass
 class DataCollected:
     '''
@@ -251,14 +270,17 @@ class DataCollected:
     '''
     value: typing.List[dict]
 
+    _json_names = ('value',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataCollected:
         return cls(
-            value=[dict(i) for i in json['value']]
+            value=json['value']
         )
 
 
 @event_class('Tracing.tracingComplete')
+@add_slots
 @dataclass
 class TracingComplete:
     '''
@@ -275,11 +297,13 @@ class TracingComplete:
     #: Compression format of returned stream.
     stream_compression: typing.Optional[StreamCompression]
 
+    _json_names = ('dataLossOccurred', 'stream', 'traceFormat', 'streamCompression')
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TracingComplete:
         return cls(
-            data_loss_occurred=bool(json['dataLossOccurred']),
-            stream=io.StreamHandle.from_json(json['stream']) if 'stream' in json else None,
+            data_loss_occurred=json['dataLossOccurred'],
+            stream=io.StreamHandle(json['stream']) if 'stream' in json else None,
             trace_format=StreamFormat.from_json(json['traceFormat']) if 'traceFormat' in json else None,
             stream_compression=StreamCompression.from_json(json['streamCompression']) if 'streamCompression' in json else None
         )
@@ -1,9 +1,103 @@
-import cdp
+import dataclasses
+import importlib
+from time import perf_counter
 import typing
 
+import cdp
+
 
 T_JSON_DICT = typing.Dict[str, typing.Any]
 _event_parsers = dict()
+_lazy_classes: typing.Dict[type, type] = dict()
+
+# The instrumentation that is enabled, see cdp.metrics.
+_instrumentation: typing.Any = None
+
+# The number of unknown values that are cached for each enum. Beyond this, a
+# new pseudo-member is created for each unknown value that is decoded.
+MAX_UNKNOWN_ENUM_VALUES = 64
+
+
+def add_slots(cls):
+    '''
+    A class decorator that adds ``__slots__`` to a dataclass.
+
+    Instances of a class with ``__slots__`` don't have a ``__dict__``, which
+    makes them a lot smaller. Dataclasses can't simply declare ``__slots__``
+    because the field defaults are class attributes, so this decorator
+    creates a new class without them. It must be applied after
+    ``@dataclass``. (This is equivalent to ``@dataclass(slots=True)`` on
+    Python 3.10+.)
+    '''
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # The defaults are already stored in the generated __init__().
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def id_type(name: str, base: type, module: str) -> typing.Any:
+    '''
+    Create a :func:`typing.NewType` for a CDP identifier such as
+    ``Network.RequestId``.
+
+    The generator only emits these if it is run with ``--newtype-ids``. Values
+    of the type are plain instances of ``base``, so no wrapper object is
+    allocated when an ID is decoded. ``to_json()`` and ``from_json()`` are
+    attached to the type and return their argument, so code that calls
+    ``RequestId.from_json(json)`` works with either kind of generated type.
+    Since values are plain instances of ``base``, they don't have a
+    ``to_json()`` method and the type can't be used with ``isinstance()``;
+    use :func:`is_id_type` to tell the two kinds of type apart.
+
+    :param name: the name of the type
+    :param base: ``str`` or ``int``
+    :param module: the name of the module that defines the type
+    '''
+    new_type = typing.NewType(name, base)
+    new_type.__module__ = module
+    new_type.to_json = _identity
+    new_type.from_json = _identity
+    return new_type
+
+
+def is_id_type(type_: typing.Any) -> bool:
+    '''
+    Return ``True`` if ``type_`` was created by :func:`id_type`, and
+    ``False`` if it is a class.
+    '''
+    return hasattr(type_, '__supertype__')
+
+
+def unknown_enum_member(cls, value):
+    '''
+    Return a pseudo-member of the enum ``cls`` for a value that isn't one of
+    its members.
+
+    Chrome adds enum values all the time, so the generated enums call this from
+    ``_missing_()`` instead of raising ``ValueError``. The pseudo-member has
+    the unknown value and its name is ``None``; it isn't included when
+    iterating over the enum. It is cached in the enum's value map, so decoding
+    the same unknown value again is a dict lookup.
+    '''
+    if isinstance(value, cls):
+        # Like ``cls(value)``, accept a member as well as its value.
+        return value
+    member = object.__new__(cls)
+    member._name_ = None
+    member._value_ = value
+    unknown = len(cls._value2member_map_) - len(cls._member_map_)
+    if unknown < MAX_UNKNOWN_ENUM_VALUES:
+        try:
+            cls._value2member_map_[value] = member
+        except TypeError:
+            # The value isn't hashable.
+            pass
+    return member
 
 
 def event_class(method):
@@ -14,6 +108,165 @@ def event_class(method):
     return decorate
 
 
-def parse_json_event(json: T_JSON_DICT) -> typing.Any:
-    ''' Parse a JSON dictionary into a CDP event. '''
-    return _event_parsers[json['method']].from_json(json['params'])
+def get_event_class(method: str) -> typing.Any:
+    '''
+    Return the class for the CDP event named ``method``.
+
+    Events are looked up in a static index that is generated along with the
+    domain modules, so the module that defines the event is only imported the
+    first time one of its events is requested.
+
+    :param method: an event name such as ``Network.requestWillBeSent``
+    :raises KeyError: if ``method`` is not a known event
+    '''
+    try:
+        return _event_parsers[method]
+    except KeyError:
+        module_name, class_name = cdp._event_classes[method]
+    module = importlib.import_module('cdp.' + module_name)
+    return getattr(module, class_name)
+
+
+def parse_json_event(json: T_JSON_DICT, lazy: bool = False) -> typing.Any:
+    '''
+    Parse a JSON dictionary into a CDP event.
+
+    Domain modules are imported lazily, so the module that defines the event
+    class is imported the first time an event from that domain is parsed.
+
+    :param json: a CDP event message with ``method`` and ``params`` keys
+    :param lazy: if true, return a lazy event that decodes each field the
+        first time it is read (see :func:`lazy_event_class`)
+    '''
+    method = json['method']
+    try:
+        parser = _event_parsers[method]
+    except KeyError:
+        parser = get_event_class(method)
+    if lazy:
+        parser = lazy_event_class(parser)
+    return decode_event(method, parser, json['params'])
+
+
+def decode_event(method: str, parser: typing.Any, params: T_JSON_DICT
+        ) -> typing.Any:
+    '''
+    Decode the ``params`` of an event with its class, and report the time
+    that it took, or the failure, to the instrumentation if it is enabled
+    (see :mod:`cdp.metrics`).
+
+    :param method: the event name
+    :param parser: the event class, or its lazy variant
+    :param params: the event's parameters
+    '''
+    if _instrumentation is None:
+        return parser.from_json(params)
+    start = perf_counter()
+    try:
+        event = parser.from_json(params)
+    except Exception:
+        _instrumentation.event_decode_failed(method)
+        raise
+    _instrumentation.event_decoded(method, perf_counter() - start)
+    return event
+
+
+class _LazyField:
+    '''
+    A descriptor that decodes one field of a lazy event.
+
+    This is a non-data descriptor: the decoded value is stored in the
+    instance's ``__dict__``, so later reads are ordinary attribute lookups.
+    (The lazy class adds a ``__dict__`` if the event class has slots.)
+    '''
+    def __init__(self, name, json_name, hint):
+        self.name = name
+        self.json_name = json_name
+        self.decode = _decoder_for(hint)
+        self.optional = getattr(hint, '__origin__', None) is typing.Union
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        json = instance._json
+        if self.optional and self.json_name not in json:
+            value = None
+        else:
+            value = self.decode(json[self.json_name])
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _identity(value):
+    return value
+
+
+def _decoder_for(hint) -> typing.Callable[[typing.Any], typing.Any]:
+    ''' Return a function that decodes JSON for the type ``hint``. '''
+    origin = getattr(hint, '__origin__', None)
+    if origin is typing.Union:
+        # This is an Optional[...] field. A missing value is handled by the
+        # caller.
+        hint = next(a for a in hint.__args__ if a is not type(None))
+        return _decoder_for(hint)
+    if origin is list:
+        decode_item = _decoder_for(hint.__args__[0])
+        return lambda json: [decode_item(i) for i in json]
+    if hint is typing.Any:
+        return _identity
+    return getattr(hint, 'from_json', hint)
+
+
+def lazy_event_class(event_cls: type) -> typing.Any:
+    '''
+    Return a lazy variant of an event class.
+
+    The lazy class is a subclass of ``event_cls`` with the same fields, but
+    its ``from_json()`` just keeps a reference to the JSON dictionary. Each
+    field is decoded the first time it is read and then cached on the
+    instance. This is useful when a handler only looks at a few fields of a
+    large event.
+
+    The JSON dictionary must not be modified while the event is in use.
+    '''
+    try:
+        return _lazy_classes[event_cls]
+    except KeyError:
+        pass
+    hints = typing.get_type_hints(event_cls)
+    if event_cls.__dictoffset__:
+        slots: typing.Tuple[str, ...] = ('_json',)
+    else:
+        slots = ('_json', '__dict__')
+    namespace: T_JSON_DICT = {
+        '__slots__': slots,
+        '__module__': event_cls.__module__,
+        '__qualname__': event_cls.__qualname__,
+        '__doc__': event_cls.__doc__,
+    }
+    names = [field.name for field in dataclasses.fields(event_cls)]
+    for name, json_name in zip(names, event_cls._json_names): # type: ignore
+        namespace[name] = _LazyField(name, json_name, hints[name])
+
+    def from_json(cls, json: T_JSON_DICT) -> typing.Any:
+        event = object.__new__(cls)
+        event._json = json
+        return event
+    namespace['from_json'] = classmethod(from_json)
+
+    # A lazy event is equal to an eager event with the same field values.
+    def __eq__(self, other):
+        if not isinstance(other, event_cls):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+    namespace['__eq__'] = __eq__
+
+    # Pickle and copy as an eager event, since the lazy class can't be found
+    # by name.
+    def __reduce__(self):
+        return (event_cls.from_json, (self._json,))
+    namespace['__reduce__'] = __reduce__
+
+    lazy_cls = type(event_cls.__name__, (event_cls,), namespace)
+    _lazy_classes[event_cls] = lazy_cls
+    return lazy_cls
@@ -6,7 +6,7 @@
 # CDP domain: WebAudio (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -39,7 +39,14 @@ class ContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class ContextState(enum.Enum):
@@ -55,9 +62,17 @@ class ContextState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
 
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
+
+@add_slots
 @dataclass
 class ContextRealtimeData:
     '''
@@ -95,6 +110,7 @@ class ContextRealtimeData:
         )
 
 
+@add_slots
 @dataclass
 class BaseAudioContext:
     '''
@@ -132,7 +148,7 @@ class BaseAudioContext:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BaseAudioContext:
         return cls(
-            context_id=ContextId.from_json(json['contextId']),
+            context_id=ContextId(json['contextId']),
             context_type=ContextType.from_json(json['contextType']),
             context_state=ContextState.from_json(json['contextState']),
             callback_buffer_size=float(json['callbackBufferSize']),
@@ -182,6 +198,7 @@ def get_realtime_data(
 
 
 @event_class('WebAudio.contextCreated')
+@add_slots
 @dataclass
 class ContextCreated:
     '''
@@ -189,6 +206,8 @@ class ContextCreated:
     '''
     context: BaseAudioContext
 
+    _json_names = ('context',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextCreated:
         return cls(
@@ -197,6 +216,7 @@ class ContextCreated:
 
 
 @event_class('WebAudio.contextDestroyed')
+@add_slots
 @dataclass
 class ContextDestroyed:
     '''
@@ -204,14 +224,17 @@ class ContextDestroyed:
     '''
     context_id: ContextId
 
+    _json_names = ('contextId',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextDestroyed:
         return cls(
-            context_id=ContextId.from_json(json['contextId'])
+            context_id=ContextId(json['contextId'])
         )
 
 
 @event_class('WebAudio.contextChanged')
+@add_slots
 @dataclass
 class ContextChanged:
     '''
@@ -219,6 +242,8 @@ class ContextChanged:
     '''
     context: BaseAudioContext
 
+    _json_names = ('context',)
+
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextChanged:
         return cls(
@@ -6,7 +6,7 @@
 # CDP domain: WebAuthn (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member,     T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -33,7 +33,14 @@ class AuthenticatorProtocol(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorProtocol:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
 class AuthenticatorTransport(enum.Enum):
@@ -48,9 +55,17 @@ class AuthenticatorTransport(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorTransport:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls._missing_(json)
+
+    @classmethod
+    def _missing_(cls, value):
+        return unknown_enum_member(cls, value)
 
 
+@add_slots
 @dataclass
 class VirtualAuthenticatorOptions:
     protocol: AuthenticatorProtocol
@@ -80,12 +95,13 @@ class VirtualAuthenticatorOptions:
         return cls(
             protocol=AuthenticatorProtocol.from_json(json['protocol']),
             transport=AuthenticatorTransport.from_json(json['transport']),
-            has_resident_key=bool(json['hasResidentKey']),
-            has_user_verification=bool(json['hasUserVerification']),
-            automatic_presence_simulation=bool(json['automaticPresenceSimulation']) if 'automaticPresenceSimulation' in json else None,
+            has_resident_key=json['hasResidentKey'],
+            has_user_verification=json['hasUserVerification'],
+            automatic_presence_simulation=json.get('automaticPresenceSimulation'),
         )
 
 
+@add_slots
 @dataclass
 class Credential:
     credential_id: str
@@ -114,10 +130,10 @@ class Credential:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Credential:
         return cls(
-            credential_id=str(json['credentialId']),
-            rp_id_hash=str(json['rpIdHash']),
-            private_key=str(json['privateKey']),
-            sign_count=int(json['signCount']),
+            credential_id=json['credentialId'],
+            rp_id_hash=json['rpIdHash'],
+            private_key=json['privateKey'],
+            sign_count=json['signCount'],
         )
 
 
@@ -158,7 +174,7 @@ def add_virtual_authenticator(
         'params': params,
     }
     json = yield cmd_dict
-    return AuthenticatorId.from_json(json['authenticatorId'])
+    return AuthenticatorId(json['authenticatorId'])
 
 
 def remove_virtual_authenticator(
@@ -1,3 +1,4 @@
+import argparse
 import builtins
 from dataclasses import dataclass
 from enum import Enum
@@ -25,14 +26,47 @@ SHARED_HEADER = '''# DO NOT EDIT THIS FILE!
 
 INIT_HEADER = '''{}
 
+import importlib
+import typing
+
+import cdp.util
+
 '''.format(SHARED_HEADER)
 
+INIT_FOOTER = """
+
+def __getattr__(name: str) -> typing.Any:
+    '''
+    Import a domain module the first time it is accessed as an attribute of
+    this package, e.g. ``cdp.network``.
+    '''
+    if name in _domain_modules.values():
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_domain_modules.values()))
+
+
+def import_all() -> None:
+    '''
+    Import every domain module.
+
+    Domain modules are normally imported lazily. Call this function to import
+    all of them up front, for example before forking worker processes.
+    '''
+    for module in _domain_modules.values():
+        importlib.import_module(f'{__name__}.{module}')
+"""
+
 MODULE_HEADER = '''{}
 #
 # CDP domain: {{}}{{}}
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
+from cdp.util import add_slots, event_class, id_type, unknown_enum_member, \
+    T_JSON_DICT
 from dataclasses import dataclass
 import enum
 import typing
@@ -41,6 +75,29 @@ import typing
 
 current_version = ''
 
+# If true, dataclasses are generated with ``__slots__``, which makes instances
+# much smaller but means that arbitrary attributes can't be set on them.
+use_slots = True
+
+# If true, decoders coerce every JSON value to its declared type, e.g.
+# ``str(json['url'])``, and call ``from_json()`` for every referenced type. By
+# default, values that the JSON decoder already produces with the right type
+# are used as is, and primitive types are constructed directly.
+strict_decoders = False
+
+# If true, string and integer types such as ``Network.RequestId`` are generated
+# as ``typing.NewType`` aliases instead of subclasses of ``str`` and ``int``, so
+# decoding an ID doesn't allocate a wrapper object.
+newtype_ids = False
+
+# All CDP types keyed by qualified name, e.g. ``Network.RequestId``, so that
+# the code for one type can depend on what kind of type another one is. This is
+# filled in before any code is generated.
+all_types: typing.Dict[str, 'CdpType'] = dict()
+
+# The domain that code is currently being generated for.
+current_domain = ''
+
 
 def indent(s: str, n: int):
     ''' A shortcut for ``textwrap.indent`` that always uses spaces. '''
@@ -84,6 +141,13 @@ def inline_doc(description) -> str:
     return '\n'.join(lines)
 
 
+def dataclass_decorators() -> str:
+    ''' Generate the decorators for a dataclass. '''
+    if use_slots:
+        return '@add_slots\n@dataclass'
+    return '@dataclass'
+
+
 def docstring(description: typing.Optional[str]) -> str:
     ''' Generate a docstring from a description. '''
     if not description:
@@ -111,6 +175,32 @@ def snake_case(name: str) -> str:
     return name
 
 
+def ref_type(ref: str) -> typing.Optional['CdpType']:
+    ''' Return the CDP type for a ``$ref``, or ``None`` if it isn't known. '''
+    qualified_ref = ref if '.' in ref else f'{current_domain}.{ref}'
+    return all_types.get(qualified_ref)
+
+
+def is_newtype_ref(ref: str) -> bool:
+    ''' Return true if a ``$ref`` is generated as a ``typing.NewType``. '''
+    type_ = ref_type(ref)
+    return type_ is not None and type_.is_newtype
+
+
+def ref_decoder(ref: str) -> str:
+    '''
+    Return the name of a function that decodes JSON for a CDP ``$ref``.
+
+    A primitive type's ``from_json()`` just calls the constructor, so the
+    constructor is called directly instead.
+    '''
+    py_ref = ref_to_python(ref)
+    type_ = ref_type(ref)
+    if not strict_decoders and type_ is not None and type_.is_primitive:
+        return py_ref
+    return f'{py_ref}.from_json'
+
+
 def ref_to_python(ref: str) -> str:
     '''
     Convert a CDP ``$ref`` to the name of a Python type.
@@ -144,6 +234,10 @@ class CdpPrimitiveType(Enum):
         ''' Return the code to construct a value for a given CDP type. '''
         if cdp_type == 'any':
             return val
+        elif not strict_decoders and cdp_type != 'number':
+            # The JSON decoder already produces str, int, bool, and dict. A
+            # number may be decoded as an int, so it is still converted.
+            return val
         else:
             cons = cls[cdp_type].value
             return f'{cons}({val})'
@@ -231,12 +325,12 @@ class CdpProperty:
         self_ref = 'self.' if use_self else ''
         assign = f"{dict_}['{self.name}'] = "
         if self.items:
-            if self.items.ref:
+            if self.items.ref and not is_newtype_ref(self.items.ref):
                 assign += f"[i.to_json() for i in {self_ref}{self.py_name}]"
             else:
                 assign += f"[i for i in {self_ref}{self.py_name}]"
         else:
-            if self.ref:
+            if self.ref and not is_newtype_ref(self.ref):
                 assign += f"{self_ref}{self.py_name}.to_json()"
             else:
                 assign += f"{self_ref}{self.py_name}"
@@ -251,22 +345,35 @@ class CdpProperty:
     def generate_from_json(self, dict_) -> str:
         ''' Generate the code that creates an instance from a JSON dict named
         ``dict_``. '''
+        value = f"{dict_}['{self.name}']"
+        items_type = self.items and self.items.type
+        type_ = self.type
+        # A NewType is decoded like the primitive type that it aliases.
+        if self.items and self.items.ref and is_newtype_ref(self.items.ref):
+            items_type = ref_type(self.items.ref).type
+        elif self.ref and is_newtype_ref(self.ref):
+            type_ = ref_type(self.ref).type
         if self.items:
-            if self.items.ref:
-                py_ref = ref_to_python(self.items.ref)
-                expr = f"[{py_ref}.from_json(i) for i in {dict_}['{self.name}']]"
+            if items_type is None:
+                decoder = ref_decoder(self.items.ref)
+                expr = f"[{decoder}(i) for i in {value}]"
             else:
-                cons = CdpPrimitiveType.get_constructor(self.items.type, 'i')
-                expr = f"[{cons} for i in {dict_}['{self.name}']]"
+                cons = CdpPrimitiveType.get_constructor(items_type, 'i')
+                if cons == 'i' and not strict_decoders:
+                    # The items don't need to be converted.
+                    expr = value
+                else:
+                    expr = f"[{cons} for i in {value}]"
         else:
-            if self.ref:
-                py_ref = ref_to_python(self.ref)
-                expr = f"{py_ref}.from_json({dict_}['{self.name}'])"
+            if type_ is None:
+                expr = f"{ref_decoder(self.ref)}({value})"
             else:
-                expr = CdpPrimitiveType.get_constructor(self.type,
-                    f"{dict_}['{self.name}']")
+                expr = CdpPrimitiveType.get_constructor(type_, value)
         if self.optional:
-            expr = f"{expr} if '{self.name}' in {dict_} else None"
+            if expr == value and not strict_decoders:
+                expr = f"{dict_}.get('{self.name}')"
+            else:
+                expr = f"{expr} if '{self.name}' in {dict_} else None"
         return expr
 
 
@@ -292,15 +399,28 @@ class CdpType:
             [CdpProperty.from_json(p) for p in type_.get('properties', list())],
         )
 
+    @property
+    def is_primitive(self) -> bool:
+        ''' True if this type is generated as a subclass of a built-in type. '''
+        return not self.enum and not self.properties
+
+    @property
+    def is_newtype(self) -> bool:
+        ''' True if this type is generated as a ``typing.NewType``. '''
+        return newtype_ids and self.is_primitive and \
+            self.type in ('string', 'integer')
+
     def generate_code(self) -> str:
         ''' Generate Python code for this type. '''
         logger.debug('Generating type %s: %s', self.id, self.type)
         if self.enum:
             return self.generate_enum_code()
-        elif self.properties:
-            return self.generate_class_code()
-        else:
+        elif self.is_newtype:
+            return self.generate_newtype_code()
+        elif self.is_primitive:
             return self.generate_primitive_code()
+        else:
+            return self.generate_class_code()
 
     def generate_primitive_code(self) -> str:
         ''' Generate code for a primitive type. '''
@@ -339,6 +459,21 @@ class CdpType:
 
         return code
 
+    def generate_newtype_code(self) -> str:
+        '''
+        Generate code for a primitive type as a ``typing.NewType``.
+
+        Values of the type are plain ``str`` or ``int`` objects, and the type's
+        ``to_json()`` and ``from_json()`` return their argument unchanged. See
+        :func:`cdp.util.id_type`.
+        '''
+        py_type = CdpPrimitiveType.get_annotation(self.type)
+        code = inline_doc(self.description)
+        if code:
+            code += '\n'
+        code += f"{self.id} = id_type('{self.id}', {py_type}, __name__)"
+        return code
+
     def generate_enum_code(self) -> str:
         '''
         Generate an "enum" type.
@@ -347,15 +482,33 @@ class CdpType:
         members. Each class member is upper snaked case, e.g.
         ``MyTypeClass.MY_ENUM_VALUE`` and is assigned a string value from the
         CDP metadata.
+
+        Unless ``strict_decoders`` is set, ``from_json()`` looks the value up
+        directly in the enum's value map, and values that aren't in the CDP
+        metadata are decoded to a pseudo-member instead of raising an error.
+        See :func:`cdp.util.unknown_enum_member`.
         '''
         def_to_json = dedent('''\
             def to_json(self) -> str:
                 return self.value''')
 
-        def_from_json = dedent(f'''\
-            @classmethod
-            def from_json(cls, json: str) -> {self.id}:
-                return cls(json)''')
+        if strict_decoders:
+            def_from_json = dedent(f'''\
+                @classmethod
+                def from_json(cls, json: str) -> {self.id}:
+                    return cls(json)''')
+        else:
+            def_from_json = dedent(f'''\
+                @classmethod
+                def from_json(cls, json: str) -> {self.id}:
+                    try:
+                        return cls._value2member_map_[json]
+                    except KeyError:
+                        return cls._missing_(json)
+
+                @classmethod
+                def _missing_(cls, value):
+                    return unknown_enum_member(cls, value)''')
 
         code = f'class {self.id}(enum.Enum):\n'
         doc = docstring(self.description)
@@ -378,9 +531,8 @@ class CdpType:
         dataclasses.
         '''
         # children = set()
-        code = dedent(f'''\
-            @dataclass
-            class {self.id}:\n''')
+        code = dataclass_decorators() + '\n'
+        code += f'class {self.id}:\n'
         doc = docstring(self.description)
         if doc:
             code += indent(doc, 4) + '\n'
@@ -698,10 +850,9 @@ class CdpEvent:
     def generate_code(self) -> str:
         ''' Generate code for a CDP event. '''
         global current_version
-        code = dedent(f'''\
-            @event_class('{self.domain}.{self.name}')
-            @dataclass
-            class {self.py_name}:''')
+        code = f"@event_class('{self.domain}.{self.name}')\n"
+        code += dataclass_decorators() + '\n'
+        code += f'class {self.py_name}:'
 
         if self.deprecated:
             code = f'@deprecated(version="{current_version}")\n' + code
@@ -720,6 +871,13 @@ class CdpEvent:
         code += indent(
             '\n'.join(p.generate_decl() for p in self.parameters), 4)
         code += '\n\n'
+        # The JSON names of the fields are needed to decode lazy events. See
+        # cdp.util.lazy_event_class().
+        json_names = ', '.join(f"'{p.name}'" for p in self.parameters)
+        if len(self.parameters) == 1:
+            json_names += ','
+        code += indent(f'_json_names = ({json_names})', 4)
+        code += '\n\n'
         def_from_json = dedent(f'''\
             @classmethod
             def from_json(cls, json: T_JSON_DICT) -> {self.py_name}:
@@ -781,6 +939,8 @@ class CdpDomain:
 
     def generate_code(self) -> str:
         ''' Generate the Python module code for a given CDP domain. '''
+        global current_domain
+        current_domain = self.domain
         exp = ' (experimental)' if self.experimental else ''
         code = MODULE_HEADER.format(self.domain, exp)
         import_code = self.generate_imports()
@@ -859,6 +1019,10 @@ class CdpDomain:
         else:
             docs += '*There are no types in this module.*\n'
         for type in self.types:
+            if type.is_newtype:
+                docs += f'\n.. autodata:: {type.id}\n'
+                docs += '      :annotation:\n'
+                continue
             docs += f'\n.. autoclass:: {type.id}\n'
             docs += '      :members:\n'
             docs += '      :undoc-members:\n'
@@ -923,15 +1087,65 @@ def generate_init(init_path, domains):
     '''
     Generate an ``__init__.py`` that exports the specified modules.
 
+    The domain modules are not imported by ``__init__.py``. Instead, each one
+    is imported the first time it is accessed as an attribute of the package.
+    The imports are only emitted for the benefit of type checkers. An index of
+    event names is also emitted so that events can be parsed without importing
+    every domain first.
+
     :param Path init_path: a file path to create the init file in
-    :param list[tuple] modules: a list of modules each represented as tuples
-        of (name, list_of_exported_symbols)
+    :param list[CdpDomain] domains: the domains to export
     '''
     with init_path.open('w') as init_file:
         init_file.write(INIT_HEADER)
-        init_file.write('import cdp.util\n\n')
+        init_file.write('if typing.TYPE_CHECKING:\n')
+        for domain in domains:
+            init_file.write('    from . import {}\n'.format(domain.module))
+        init_file.write('\n\n')
+        init_file.write('#: Maps each CDP domain name to the name of its Python '
+            'module.\n')
+        init_file.write('_domain_modules = {\n')
         for domain in domains:
-            init_file.write('import cdp.{}\n'.format(domain.module))
+            init_file.write("    '{}': '{}',\n".format(domain.domain,
+                domain.module))
+        init_file.write('}\n\n')
+        init_file.write('#: Maps each CDP event name to the module and class that '
+            'implement it.\n')
+        init_file.write('_event_classes = {\n')
+        for domain in domains:
+            for event in domain.events:
+                init_file.write("    '{}.{}': ('{}', '{}'),\n".format(
+                    domain.domain, event.name, domain.module, event.py_name))
+        init_file.write('}\n')
+        init_file.write(INIT_FOOTER)
+
+
+def generate_schema(schema_path, json_paths):
+    '''
+    Generate a compact copy of the CDP specification that is installed with
+    the package, for ``cdp.synthetic``.
+
+    The domains of all of the JSON files are merged, and descriptions are left
+    out since only the shape of each type, event and command is needed.
+
+    :param Path schema_path: a file path to create the schema in
+    :param list[Path] json_paths: paths to the JSON CDP schemas
+    '''
+    def strip(value):
+        if isinstance(value, dict):
+            return {key: strip(item) for key, item in value.items()
+                if key != 'description'}
+        if isinstance(value, list):
+            return [strip(item) for item in value]
+        return value
+
+    domains = list()
+    for json_path in json_paths:
+        with json_path.open() as json_file:
+            domains.extend(json.load(json_file)['domains'])
+    with schema_path.open('w') as schema_file:
+        json.dump({'domains': strip(domains)}, schema_file,
+            separators=(',', ':'))
 
 
 def generate_docs(docs_path, domains):
@@ -953,6 +1167,21 @@ def generate_docs(docs_path, domains):
 
 def main():
     ''' Main entry point. '''
+    global use_slots, strict_decoders, newtype_ids
+    parser = argparse.ArgumentParser(description='Generate the CDP modules '
+        'and their Sphinx documents from the CDP specification.')
+    parser.add_argument('--no-slots', action='store_true',
+        help='generate dataclasses without __slots__')
+    parser.add_argument('--strict', action='store_true',
+        help='generate decoders that coerce every value to its declared type')
+    parser.add_argument('--newtype-ids', action='store_true',
+        help='generate string and integer types such as Network.RequestId '
+        'as typing.NewType aliases')
+    args = parser.parse_args()
+    use_slots = not args.no_slots
+    strict_decoders = args.strict
+    newtype_ids = args.newtype_ids
+
     here = Path(__file__).parent.resolve()
     json_paths = [
         here / 'browser_protocol.json',
@@ -961,9 +1190,12 @@ def main():
     output_path = here.parent / 'cdp'
     output_path.mkdir(exist_ok=True)
 
-    # Remove generated code
-    for subpath in output_path.iterdir():
-        if subpath.is_file() and subpath.name not in ('py.typed', 'util.py'):
+    # Remove generated code. Hand-written modules (such as util.py) don't have
+    # the generated header, so they are left alone.
+    for subpath in output_path.glob('*.py'):
+        with subpath.open(encoding='utf8') as module_file:
+            header = module_file.read(len(SHARED_HEADER))
+        if header == SHARED_HEADER:
             subpath.unlink()
 
     # Parse domains
@@ -972,6 +1204,9 @@ def main():
         logger.info('Parsing JSON file %s', json_path)
         domains.extend(parse(json_path, output_path))
     domains.sort(key=operator.attrgetter('domain'))
+    for domain in domains:
+        for type_ in domain.types:
+            all_types[f'{domain.domain}.{type_.id}'] = type_
 
     # Patch up CDP errors. It's easier to patch that here than it is to modify
     # the generator code.
@@ -999,6 +1234,9 @@ def main():
     init_path = output_path / '__init__.py'
     generate_init(init_path, domains)
 
+    schema_path = output_path / 'protocol.json'
+    generate_schema(schema_path, json_paths)
+
     docs_path = here.parent / 'docs' / 'api'
     generate_docs(docs_path, domains)
 
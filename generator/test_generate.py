@@ -10,9 +10,12 @@ Pytest doesn't display stdout by default unless a test fails, and debugging
 codegen tests is almost always easier with the values displayed on stdout.
 '''
 
+import json
 from textwrap import dedent
 
-from generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring
+import generate
+from generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring, \
+    generate_init, generate_schema
 
 
 def test_docstring():
@@ -128,6 +131,37 @@ def test_cdp_enum_type():
             PLACEHOLDER = "placeholder"
             RELATED_ELEMENT = "relatedElement"
 
+            def to_json(self) -> str:
+                return self.value
+
+            @classmethod
+            def from_json(cls, json: str) -> AXValueSourceType:
+                try:
+                    return cls._value2member_map_[json]
+                except KeyError:
+                    return cls._missing_(json)
+
+            @classmethod
+            def _missing_(cls, value):
+                return unknown_enum_member(cls, value)""")
+
+    type = CdpType.from_json(json_type)
+    actual = type.generate_code()
+    assert expected == actual
+
+
+def test_cdp_enum_type_strict(monkeypatch):
+    monkeypatch.setattr(generate, 'strict_decoders', True)
+    json_type = {
+        "id": "AXValueSourceType",
+        "type": "string",
+        "enum": ["attribute", "implicit"]
+    }
+    expected = dedent("""\
+        class AXValueSourceType(enum.Enum):
+            ATTRIBUTE = "attribute"
+            IMPLICIT = "implicit"
+
             def to_json(self) -> str:
                 return self.value
 
@@ -178,6 +212,7 @@ def test_cdp_class_type():
         ]
     }
     expected = dedent("""\
+        @add_slots
         @dataclass
         class AXValue:
             '''
@@ -210,7 +245,7 @@ def test_cdp_class_type():
             def from_json(cls, json: T_JSON_DICT) -> AXValue:
                 return cls(
                     type_=AXValueType.from_json(json['type']),
-                    value=json['value'] if 'value' in json else None,
+                    value=json.get('value'),
                     related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if 'relatedNodes' in json else None,
                     sources=[AXValueSource.from_json(i) for i in json['sources']] if 'sources' in json else None,
                 )""")
@@ -220,6 +255,26 @@ def test_cdp_class_type():
     assert expected == actual
 
 
+def test_cdp_class_type_no_slots(monkeypatch):
+    monkeypatch.setattr(generate, 'use_slots', False)
+    json_type = {
+        "id": "Rect",
+        "type": "object",
+        "properties": [
+            {"name": "width", "type": "number"},
+        ]
+    }
+    expected = dedent("""\
+        @dataclass
+        class Rect:
+            width: float
+""")
+
+    type = CdpType.from_json(json_type)
+    actual = type.generate_code()
+    assert actual.startswith(expected)
+
+
 def test_cdp_command():
     json_cmd = {
         "name": "getPartialAXTree",
@@ -394,7 +449,7 @@ def test_cdp_command_return_array_of_primitive():
                 'method': 'Browser.getBrowserCommandLine',
             }
             json = yield cmd_dict
-            return [str(i) for i in json['arguments']]""")
+            return json['arguments']""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -567,9 +622,9 @@ def test_cdp_command_multiple_return():
             }
             json = yield cmd_dict
             return (
-                str(json['body']) if 'body' in json else None,
-                int(json['originalSize']),
-                int(json['encodedSize'])
+                json.get('body'),
+                json['originalSize'],
+                json['encodedSize']
             )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Audits')
@@ -650,6 +705,7 @@ def test_cdp_event():
     }
     expected = dedent("""\
         @event_class('BackgroundService.recordingStateChanged')
+        @add_slots
         @dataclass
         class RecordingStateChanged:
             '''
@@ -658,10 +714,12 @@ def test_cdp_event():
             is_recording: bool
             service: ServiceName
 
+            _json_names = ('isRecording', 'service')
+
             @classmethod
             def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
                 return cls(
-                    is_recording=bool(json['isRecording']),
+                    is_recording=json['isRecording'],
                     service=ServiceName.from_json(json['service'])
                 )""")
 
@@ -670,6 +728,93 @@ def test_cdp_event():
     assert expected == actual
 
 
+def test_cdp_event_decoders(monkeypatch):
+    ''' A known primitive type is constructed directly instead of calling its
+    ``from_json()``. '''
+    request_id = CdpType.from_json({"id": "RequestId", "type": "string"})
+    monkeypatch.setitem(generate.all_types, 'Network.RequestId', request_id)
+    monkeypatch.setattr(generate, 'current_domain', 'Network')
+    json_event = {
+        "name": "dataReceived",
+        "parameters": [
+            {"name": "requestId", "$ref": "RequestId"},
+            {"name": "frameId", "$ref": "Page.FrameId", "optional": True},
+            {"name": "dataLength", "type": "integer"},
+            {"name": "timestamps", "type": "array", "items": {"type": "number"}},
+        ]
+    }
+    expected = dedent("""\
+        request_id=RequestId(json['requestId']),
+        frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None,
+        data_length=json['dataLength'],
+        timestamps=[float(i) for i in json['timestamps']]""")
+    event = CdpEvent.from_json(json_event, 'Network')
+    actual = ',\n'.join(p.generate_from_json('json') for p in event.parameters)
+    assert expected == actual
+
+    monkeypatch.setattr(generate, 'strict_decoders', True)
+    expected = dedent("""\
+        request_id=RequestId.from_json(json['requestId']),
+        frame_id=page.FrameId.from_json(json['frameId']) if 'frameId' in json else None,
+        data_length=int(json['dataLength']),
+        timestamps=[float(i) for i in json['timestamps']]""")
+    actual = ',\n'.join(p.generate_from_json('json') for p in event.parameters)
+    assert expected == actual
+
+
+def test_cdp_newtype_type(monkeypatch):
+    monkeypatch.setattr(generate, 'newtype_ids', True)
+    json_type = {
+        "id": "NodeId",
+        "description": "Unique DOM node identifier.",
+        "type": "integer"
+    }
+    expected = dedent("""\
+        #: Unique DOM node identifier.
+        NodeId = id_type('NodeId', int, __name__)""")
+
+    type = CdpType.from_json(json_type)
+    assert type.is_newtype
+    actual = type.generate_code()
+    assert expected == actual
+
+    # Arrays and numbers are still generated as classes.
+    quad = CdpType.from_json({"id": "Quad", "type": "array",
+        "items": {"type": "number"}})
+    assert not quad.is_newtype
+    timestamp = CdpType.from_json({"id": "TimeSinceEpoch", "type": "number"})
+    assert not timestamp.is_newtype
+
+
+def test_cdp_newtype_parameters(monkeypatch):
+    ''' A NewType is encoded and decoded like the type that it aliases. '''
+    monkeypatch.setattr(generate, 'newtype_ids', True)
+    node_id = CdpType.from_json({"id": "NodeId", "type": "integer"})
+    monkeypatch.setitem(generate.all_types, 'DOM.NodeId', node_id)
+    monkeypatch.setattr(generate, 'current_domain', 'DOM')
+    json_cmd = {
+        "name": "pushNodesByBackendIdsToFrontend",
+        "parameters": [
+            {"name": "nodeId", "$ref": "NodeId"},
+            {"name": "parentId", "$ref": "NodeId", "optional": True},
+        ],
+        "returns": [
+            {"name": "nodeIds", "type": "array", "items": {"$ref": "NodeId"}},
+        ]
+    }
+    cmd = CdpCommand.from_json(json_cmd, 'DOM')
+    expected = dedent("""\
+        params['nodeId'] = node_id
+        if parent_id is not None:
+            params['parentId'] = parent_id""")
+    actual = '\n'.join(p.generate_to_json('params', use_self=False)
+        for p in cmd.parameters)
+    assert expected == actual
+    assert cmd.returns[0].generate_return('json') == "json['nodeIds']"
+    expected = "parent_id=json.get('parentId')"
+    assert cmd.parameters[1].generate_from_json('json') == expected
+
+
 def test_cdp_event_parameter_docs():
     json_event = {
         "name": "windowOpen",
@@ -702,6 +847,7 @@ def test_cdp_event_parameter_docs():
     }
     expected = dedent("""\
         @event_class('Page.windowOpen')
+        @add_slots
         @dataclass
         class WindowOpen:
             '''
@@ -717,13 +863,15 @@ def test_cdp_event_parameter_docs():
             #: Whether or not it was triggered by user gesture.
             user_gesture: bool
 
+            _json_names = ('url', 'windowName', 'windowFeatures', 'userGesture')
+
             @classmethod
             def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
                 return cls(
-                    url=str(json['url']),
-                    window_name=str(json['windowName']),
-                    window_features=[str(i) for i in json['windowFeatures']],
-                    user_gesture=bool(json['userGesture'])
+                    url=json['url'],
+                    window_name=json['windowName'],
+                    window_features=json['windowFeatures'],
+                    user_gesture=json['userGesture']
                 )""")
 
     cmd = CdpEvent.from_json(json_event, 'Page')
@@ -967,3 +1115,50 @@ def test_cdp_domain_sphinx():
     domain = CdpDomain.from_json(json_domain)
     actual = domain.generate_sphinx()
     assert expected == actual
+
+
+def test_generate_init(tmp_path):
+    ''' The package init should import domain modules lazily. '''
+    domains = [CdpDomain.from_json({"domain": name}) for name in ("DOM", "Input")]
+    domains[0].events.append(CdpEvent.from_json({"name": "documentUpdated"},
+        "DOM"))
+    init_path = tmp_path / '__init__.py'
+    generate_init(init_path, domains)
+    code = init_path.read_text()
+    print(code)
+    assert 'import cdp.dom' not in code
+    assert dedent("""\
+        if typing.TYPE_CHECKING:
+            from . import dom
+            from . import input_
+        """) in code
+    assert dedent("""\
+        _domain_modules = {
+            'DOM': 'dom',
+            'Input': 'input_',
+        }
+        """) in code
+    assert dedent("""\
+        _event_classes = {
+            'DOM.documentUpdated': ('dom', 'DocumentUpdated'),
+        }
+        """) in code
+    assert 'def __getattr__(name: str) -> typing.Any:' in code
+
+
+def test_generate_schema(tmp_path):
+    ''' The installed schema merges the domains without descriptions. '''
+    paths = [tmp_path / 'browser.json', tmp_path / 'js.json']
+    paths[0].write_text(json.dumps({'version': {}, 'domains': [{
+        'domain': 'DOM', 'description': 'The DOM.', 'types': [{'id': 'NodeId',
+        'description': 'A node.', 'type': 'integer'}]}]}))
+    paths[1].write_text(json.dumps({'version': {}, 'domains': [{
+        'domain': 'Runtime', 'events': [{'name': 'executionContextsCleared',
+        'description': 'Cleared.'}]}]}))
+    schema_path = tmp_path / 'protocol.json'
+    generate_schema(schema_path, paths)
+    assert json.loads(schema_path.read_text()) == {'domains': [
+        {'domain': 'DOM', 'types': [{'id': 'NodeId', 'type': 'integer'}]},
+        {'domain': 'Runtime', 'events': [
+            {'name': 'executionContextsCleared'}]},
+    ]}
@@ -23,7 +23,7 @@ setup(
     ],
     python_requires='>=3.7',
     keywords='chrome devtools protocol cdp',
-    package_data={'cdp': ['py.typed']},
+    package_data={'cdp': ['py.typed', 'protocol.json']},
     packages=find_packages(exclude=['build', 'docs', 'examples', 'generator']),
     install_requires=[
         'deprecated'
@@ -1,9 +1,19 @@
 '''
 Some basic tests for the generated CDP modules.
 '''
+import pickle
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+import cdp
 from cdp import dom, io, page, tracing, util
 
 
+@pytest.mark.skipif(util.is_id_type(page.FrameId),
+    reason='IDs are generated as NewTypes')
 def test_primitive_type():
     frame_id = page.FrameId('foo')
     assert repr(frame_id) == "FrameId('foo')"
@@ -11,6 +21,20 @@ def test_primitive_type():
     assert page.FrameId.from_json('foo') == frame_id
 
 
+def test_id_type():
+    node_id = util.id_type('NodeId', int, 'cdp.dom')
+    assert node_id(5) == 5
+    assert type(node_id(5)) is int
+    assert node_id.from_json(5) == 5
+    assert node_id.to_json(5) == 5
+    assert node_id.__supertype__ is int
+    assert node_id.__module__ == 'cdp.dom'
+    assert util.is_id_type(node_id)
+    assert not util.is_id_type(dom.Node)
+    # Either kind of generated type belongs to its domain module.
+    assert dom.NodeId.__module__ == 'cdp.dom'
+
+
 def test_enum_type():
     tran_type = page.TransitionType.ADDRESS_BAR
     assert tran_type.name == 'ADDRESS_BAR'
@@ -19,6 +43,17 @@ def test_enum_type():
     assert page.TransitionType.from_json('address_bar') == tran_type
 
 
+def test_enum_type_unknown_value():
+    unknown = page.TransitionType.from_json('new_transition')
+    assert isinstance(unknown, page.TransitionType)
+    assert unknown.name is None
+    assert unknown.to_json() == 'new_transition'
+    assert unknown not in list(page.TransitionType)
+    assert page.TransitionType.from_json('new_transition') is unknown
+    assert page.TransitionType('new_transition') is unknown
+    assert pickle.loads(pickle.dumps(unknown)) is unknown
+
+
 def test_class_type():
     blue = dom.RGBA(51, 153, 255)
     assert blue.a is None
@@ -51,8 +86,10 @@ def test_event_type_with_dependency():
         'traceFormat': tracing.StreamFormat.JSON,
         'dataLossOccurred': False,
     })
-    assert isinstance(event.stream, io.StreamHandle)
-    assert repr(event.stream) == "StreamHandle('Foo Stream')"
+    assert event.stream == io.StreamHandle('Foo Stream')
+    if not util.is_id_type(io.StreamHandle):
+        assert isinstance(event.stream, io.StreamHandle)
+        assert repr(event.stream) == "StreamHandle('Foo Stream')"
     assert event.trace_format.value == 'json'
     assert event.stream_compression is None
 
@@ -71,3 +108,96 @@ def test_event_dispatch():
     assert event.window_name == 'Window 1'
     assert event.window_features == ['feature1', 'feature2']
     assert not event.user_gesture
+
+
+def run_isolated(code):
+    ''' Run code in a fresh interpreter, so that no domains are imported. '''
+    subprocess.run([sys.executable, '-c', dedent(code)], check=True)
+
+
+def test_lazy_domain_import():
+    run_isolated('''
+        import sys
+        import cdp
+        assert 'cdp.network' not in sys.modules
+        assert 'network' in dir(cdp)
+        assert cdp.network.RequestId('1') == '1'
+        assert 'cdp.network' in sys.modules
+        assert 'cdp.web_audio' not in sys.modules
+    ''')
+
+
+def test_event_dispatch_imports_domain():
+    run_isolated('''
+        import sys
+        from cdp import util
+        event = util.parse_json_event({
+            'method': 'Tethering.accepted',
+            'params': {'port': 9222, 'connectionId': 'abc'},
+        })
+        assert 'cdp.tethering' in sys.modules
+        assert event.connection_id == 'abc'
+    ''')
+
+
+def test_get_event_class():
+    run_isolated('''
+        import sys
+        import pytest
+        from cdp import util
+        with pytest.raises(KeyError):
+            util.get_event_class('Target.noSuchEvent')
+        assert 'cdp.target' not in sys.modules
+        event_class = util.get_event_class('Target.attachedToTarget')
+        assert 'cdp.target' in sys.modules
+        import cdp.target
+        assert event_class is cdp.target.AttachedToTarget
+    ''')
+
+
+def test_lazy_event():
+    params = {
+        'frameId': 'frame1',
+        'reason': 'formSubmissionGet',
+        'url': 'https://foo.com',
+    }
+    event = util.parse_json_event({
+        'method': 'Page.frameRequestedNavigation',
+        'params': params,
+    }, lazy=True)
+    assert isinstance(event, page.FrameRequestedNavigation)
+    assert vars(event) == {}
+    assert event.reason == page.ClientNavigationReason.FORM_SUBMISSION_GET
+    assert vars(event) == {'reason': event.reason}
+    if not util.is_id_type(page.FrameId):
+        assert isinstance(event.frame_id, page.FrameId)
+    eager = page.FrameRequestedNavigation.from_json(params)
+    assert event == eager
+    assert eager == event
+    assert repr(event) == repr(eager)
+    assert pickle.loads(pickle.dumps(event)) == eager
+
+
+def test_lazy_event_optional_and_list():
+    event = util.lazy_event_class(dom.SetChildNodes).from_json({
+        'parentId': 1,
+        'nodes': [
+            {'nodeId': 2, 'backendNodeId': 3, 'nodeType': 1,
+            'nodeName': 'A', 'localName': 'a', 'nodeValue': ''},
+        ],
+    })
+    assert event.parent_id == dom.NodeId(1)
+    assert event.nodes[0].node_name == 'A'
+    assert event.nodes[0].children is None
+    tracing_event = util.lazy_event_class(tracing.TracingComplete).from_json({
+        'dataLossOccurred': False,
+    })
+    assert tracing_event.stream is None
+
+
+def test_lazy_event_class_for_every_event():
+    for method in cdp._event_classes:
+        event_class = util.get_event_class(method)
+        lazy_class = util.lazy_event_class(event_class)
+        assert issubclass(lazy_class, event_class)
+        assert util.lazy_event_class(event_class) is lazy_class
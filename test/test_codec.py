@@ -0,0 +1,66 @@
+'''
+Tests for the JSON codecs.
+'''
+import pytest
+
+from cdp import page
+from cdp.codec import available_codecs, encode_command, get_codec, \
+    parse_message, Response, set_default_codec
+
+
+FRAME = (b'{"method":"Page.frameStoppedLoading",'
+    b'"params":{"frameId":"\xe2\x9c\x93"}}')
+
+
+def test_json_codec():
+    codec = get_codec('json')
+    assert codec is get_codec()
+    assert codec.loads(FRAME) == codec.loads(FRAME.decode('utf8'))
+    assert codec.dumps({'a': '✓'}) == '{"a":"✓"}'.encode('utf8')
+    assert 'json' in available_codecs()
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_orjson_codec():
+    pytest.importorskip('orjson')
+    codec = get_codec('orjson')
+    assert codec.loads(FRAME) == get_codec('json').loads(FRAME)
+    assert get_codec('auto') is codec
+
+
+def test_set_default_codec():
+    try:
+        set_default_codec('auto')
+        assert get_codec() is get_codec(available_codecs()[0])
+    finally:
+        set_default_codec('json')
+
+
+def test_parse_event():
+    event = parse_message(FRAME)
+    assert isinstance(event, page.FrameStoppedLoading)
+    assert event.frame_id == page.FrameId('✓')
+
+
+def test_parse_response():
+    response = parse_message(b'{"id":3,"result":{"frameId":"abc"},'
+        b'"sessionId":"s1"}')
+    assert response == Response(3, {'frameId': 'abc'}, None, 's1')
+    error = parse_message('{"id":4,"error":{"code":-32601,"message":"x"}}')
+    assert error.result is None
+    assert error.error['code'] == -32601
+
+
+def test_encode_command():
+    gen = page.navigate('https://example.com')
+    data = encode_command(gen.send(None), 7, session_id='s1')
+    assert get_codec().loads(data) == {
+        'method': 'Page.navigate',
+        'params': {'url': 'https://example.com'},
+        'id': 7,
+        'sessionId': 's1',
+    }
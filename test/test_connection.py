@@ -0,0 +1,433 @@
+'''
+Tests for the asyncio connection layer.
+'''
+import asyncio
+import socket
+
+import pytest
+
+from cdp import browser, dom, page, runtime, target
+from cdp.connection import CommandError, Connection, ConnectionClosed, \
+    FakeBrowser, MemoryTransport, StreamTransport
+from cdp.connection.events import Listeners
+from cdp.dispatch import Overflow, QueuePolicy
+from cdp.synthetic import PayloadFactory
+
+
+VERSION = {
+    'protocolVersion': '1.3',
+    'product': 'HeadlessChrome/80.0.3987.0',
+    'revision': '@e2b4a8f2',
+    'userAgent': 'Mozilla/5.0',
+    'jsVersion': '8.0.426.1',
+}
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def make_browser():
+    fake = FakeBrowser()
+    fake.handle('Browser.getVersion', lambda params: VERSION)
+    return fake
+
+
+def test_execute():
+    async def main():
+        fake = make_browser()
+        async with Connection(fake.connect()) as conn:
+            version = await conn.execute(browser.get_version())
+        assert version[0] == '1.3'
+        assert version[1] == 'HeadlessChrome/80.0.3987.0'
+        assert conn.closed
+    run(main())
+
+
+def test_event_decode_error():
+    async def main():
+        errors = list()
+        asyncio.get_event_loop().set_exception_handler(
+            lambda loop, context: errors.append(context))
+        fake = make_browser()
+        async with Connection(fake.connect()) as conn:
+            events = conn.listen()
+            await fake.emit('Unknown.event', {})
+            await fake.emit('Page.loadEventFired', {})
+            await fake.emit('Page.loadEventFired', {'timestamp': 2})
+            event = await events.__anext__()
+            assert event == page.LoadEventFired(timestamp=2)
+        assert len(errors) == 1
+        assert errors[0]['message'] == \
+            'Failed to decode event Page.loadEventFired'
+        assert isinstance(errors[0]['exception'], KeyError)
+    run(main())
+
+
+def test_execute_concurrently():
+    async def main():
+        fake = FakeBrowser()
+        async def evaluate(params):
+            # Respond out of order.
+            await asyncio.sleep(0.001 * (10 - int(params['expression'])))
+            return {'result': {'type': 'number',
+                'value': int(params['expression'])}}
+        fake.handle('Runtime.evaluate', evaluate)
+        async with Connection(fake.connect()) as conn:
+            results = await asyncio.gather(*(conn.execute(
+                runtime.evaluate(str(i))) for i in range(10)))
+        assert [remote.value for remote, _ in results] == list(range(10))
+        assert fake.command_count == 10
+    run(main())
+
+
+def test_command_error():
+    async def main():
+        fake = make_browser()
+        def navigate(params):
+            raise CommandError({'code': -32000, 'message': 'Cannot navigate',
+                'data': params['url']})
+        fake.handle('Page.navigate', navigate)
+        fake.handle('Page.stopLoading', lambda params: params['missing'])
+        async with Connection(fake.connect()) as conn:
+            with pytest.raises(CommandError) as exc_info:
+                await conn.execute(page.navigate('foo'))
+            assert exc_info.value.code == -32000
+            assert exc_info.value.data == 'foo'
+            with pytest.raises(CommandError) as exc_info:
+                await conn.execute(page.reload())
+            assert exc_info.value.code == -32601
+            # A handler that fails is reported as an internal error.
+            with pytest.raises(CommandError) as exc_info:
+                await conn.execute(page.stop_loading())
+            assert exc_info.value.code == -32603
+            assert exc_info.value.message == "'missing'"
+            # The connection is still usable.
+            await conn.execute(browser.get_version())
+    run(main())
+
+
+def test_events():
+    async def main():
+        fake = make_browser()
+        async with Connection(fake.connect()) as conn:
+            loads = conn.listen(page.LoadEventFired)
+            everything = conn.listen()
+            await fake.emit('Page.domContentEventFired', {'timestamp': 1})
+            await fake.emit('Page.loadEventFired', {'timestamp': 2})
+            await fake.emit('Unknown.event', {})
+            event = await loads.__anext__()
+            assert event == page.LoadEventFired(timestamp=2)
+            event = await everything.__anext__()
+            assert isinstance(event, page.DomContentEventFired)
+        # The streams stop when the connection is closed.
+        assert [e async for e in loads] == []
+        assert len([e async for e in everything]) == 1
+    run(main())
+
+
+def test_closed():
+    async def main():
+        fake = FakeBrowser()
+        async def hang(params):
+            await asyncio.sleep(10)
+        fake.handle('Browser.getVersion', hang)
+        conn = Connection(fake.connect())
+        conn.start()
+        command = asyncio.ensure_future(conn.execute(browser.get_version()))
+        await asyncio.sleep(0)
+        await fake.close()
+        with pytest.raises(ConnectionClosed):
+            await command
+        assert conn.closed
+        with pytest.raises(ConnectionClosed):
+            await conn.execute(browser.get_version())
+        await conn.close()
+    run(main())
+
+
+def test_stream_transport():
+    async def main():
+        client_sock, server_sock = socket.socketpair()
+        transports = list()
+        for sock in (client_sock, server_sock):
+            # Use a small buffer so that messages are larger than it.
+            reader, writer = await asyncio.open_connection(sock=sock,
+                limit=16)
+            transports.append(StreamTransport(reader, writer))
+        fake = make_browser()
+        fake.serve(transports[1])
+        async with Connection(transports[0]) as conn:
+            version = await conn.execute(browser.get_version())
+            versions = await conn.execute_many(browser.get_version()
+                for _ in range(3))
+        assert version[4] == '8.0.426.1'
+        assert versions == [version] * 3
+        await fake.close()
+    run(main())
+
+
+def test_memory_transport_close():
+    async def main():
+        first, second = MemoryTransport.pair()
+        await first.send(b'{}')
+        await first.close()
+        assert await second.recv() == b'{}'
+        with pytest.raises(ConnectionClosed):
+            await second.recv()
+        with pytest.raises(ConnectionClosed):
+            await first.send(b'{}')
+    run(main())
+
+
+def target_info(target_id, type_):
+    return {'targetId': target_id, 'type': type_, 'title': '', 'url': '',
+        'attached': True, 'canAccessOpener': False}
+
+
+def make_browser_with_targets():
+    fake = make_browser()
+    async def attach_to_target(params):
+        target_id = params['targetId']
+        session_id = f'session-{target_id}'
+        await fake.emit('Target.attachedToTarget', {
+            'sessionId': session_id,
+            'targetInfo': target_info(target_id, 'page'),
+            'waitingForDebugger': False,
+        })
+        return {'sessionId': session_id}
+    fake.handle('Target.attachToTarget', attach_to_target)
+    return fake
+
+
+def test_sessions():
+    async def main():
+        fake = make_browser_with_targets()
+        async with Connection(fake.connect()) as conn:
+            root_events = conn.listen(page.LoadEventFired)
+            first = await conn.attach(target.TargetID('A'))
+            second = await conn.attach(target.TargetID('B'))
+            assert first.session_id == 'session-A'
+            assert first.target_info.target_id == 'A'
+            assert first.parent is None
+            assert dict(conn.sessions) == {'session-A': first,
+                'session-B': second}
+            first_events = first.listen(page.LoadEventFired)
+            second_events = second.listen()
+
+            await fake.emit('Page.loadEventFired', {'timestamp': 1},
+                session_id='session-B')
+            await fake.emit('Page.loadEventFired', {'timestamp': 2},
+                session_id='session-A')
+            await fake.emit('Page.loadEventFired', {'timestamp': 3},
+                session_id='unknown')
+            await fake.emit('Page.loadEventFired', {'timestamp': 4})
+            assert (await first_events.__anext__()).timestamp == 2
+            assert (await second_events.__anext__()).timestamp == 1
+            assert (await root_events.__anext__()).timestamp == 4
+
+            # Commands are tagged with the session ID.
+            requests = list()
+            fake.handle('Page.reload', requests.append)
+            await first.execute(page.reload())
+            assert len(requests) == 1
+            assert fake.command_count == 3
+    run(main())
+
+
+def test_auto_attach_tree():
+    async def main():
+        fake = make_browser_with_targets()
+        async with Connection(fake.connect()) as conn:
+            page_session = await conn.attach(target.TargetID('A'))
+            attached = page_session.listen(target.AttachedToTarget)
+            await fake.emit('Target.attachedToTarget', {
+                'sessionId': 'session-frame',
+                'targetInfo': target_info('frame', 'iframe'),
+                'waitingForDebugger': False,
+            }, session_id='session-A')
+            event = await attached.__anext__()
+            frame = conn.sessions[event.session_id]
+            assert frame.parent is page_session
+            assert page_session.children == {'session-frame': frame}
+            assert frame.target_info.type_ == 'iframe'
+
+            await fake.emit('Target.attachedToTarget', {
+                'sessionId': 'session-worker',
+                'targetInfo': target_info('worker', 'worker'),
+                'waitingForDebugger': False,
+            }, session_id='session-frame')
+            frame_events = frame.listen(page.LoadEventFired)
+            await fake.emit('Page.loadEventFired', {'timestamp': 1},
+                session_id='session-frame')
+
+            # Detaching the page detaches its descendants.
+            await fake.emit('Target.detachedFromTarget', {
+                'sessionId': 'session-A'})
+            assert (await frame_events.__anext__()).timestamp == 1
+            assert [e async for e in frame_events] == []
+            assert frame.detached
+            assert page_session.detached
+            assert conn.sessions == {}
+    run(main())
+
+
+def test_listeners():
+    async def main():
+        listeners = Listeners(lazy=False)
+        everything = listeners.listen([])
+        loads = listeners.listen([page.LoadEventFired,
+            'Page.domContentEventFired'])
+        late = listeners.listen([])
+        message = {'method': 'Page.loadEventFired',
+            'params': {'timestamp': 1}}
+        listeners.dispatch(message)
+        listeners.dispatch({'method': 'Page.frameResized', 'params': {}})
+        loads.close()
+        everything.close()
+        listeners.dispatch(message)
+        assert [e.timestamp async for e in loads] == [1]
+        assert len([e async for e in everything]) == 2
+        listeners.close()
+        assert len([e async for e in late]) == 3
+        assert [e async for e in listeners.listen([])] == []
+    run(main())
+
+
+def test_execute_many():
+    async def main():
+        fake = FakeBrowser(latency=0.01)
+        def describe_node(params):
+            if params['nodeId'] == 3:
+                raise CommandError({'code': -32000,
+                    'message': 'Could not find node with given id'})
+            return {'node': {'nodeId': params['nodeId'], 'backendNodeId': 1,
+                'nodeType': 1, 'nodeName': 'DIV', 'localName': 'div',
+                'nodeValue': ''}}
+        fake.handle('DOM.describeNode', describe_node)
+        async with Connection(fake.connect()) as conn:
+            results = await conn.execute_many(dom.describe_node(
+                node_id=dom.NodeId(i)) for i in range(5))
+            assert [r.node_id for r in results if isinstance(r, dom.Node)] \
+                == [0, 1, 2, 4]
+            assert isinstance(results[3], CommandError)
+            assert await conn.execute_many([]) == []
+        await fake.close()
+    run(main())
+
+
+def test_execute_many_bad_command():
+    def bad_command():
+        raise ValueError('bad argument')
+        yield
+    async def main():
+        fake = make_browser()
+        async with Connection(fake.connect()) as conn:
+            results = await conn.execute_many([browser.get_version(),
+                bad_command(), browser.get_version()])
+            assert isinstance(results[0], tuple)
+            assert isinstance(results[1], ValueError)
+            assert results[2] == results[0]
+            results = await conn.execute_many([bad_command()])
+            assert [type(r) for r in results] == [ValueError]
+        await fake.close()
+    run(main())
+
+
+def test_execute_many_closed():
+    async def main():
+        fake = FakeBrowser(latency=10)
+        conn = Connection(fake.connect())
+        conn.start()
+        batch = asyncio.ensure_future(conn.execute_many(
+            browser.get_version() for _ in range(2)))
+        await asyncio.sleep(0)
+        await conn.close()
+        results = await batch
+        assert [type(r) for r in results] == [ConnectionClosed] * 2
+        await fake.close()
+    run(main())
+
+
+def test_bounded_stream():
+    async def main():
+        fake = make_browser()
+        async with Connection(fake.connect()) as conn:
+            frames = conn.listen(page.ScreencastFrame, page.LoadEventFired,
+                policies={page.ScreencastFrame: QueuePolicy(1,
+                Overflow.COALESCE)}, default_policy=QueuePolicy(1))
+            metadata = {'offsetTop': 0, 'pageScaleFactor': 1,
+                'deviceWidth': 800, 'deviceHeight': 600, 'scrollOffsetX': 0,
+                'scrollOffsetY': 0}
+            for i in range(3):
+                await fake.emit('Page.screencastFrame', {'data': str(i),
+                    'metadata': metadata, 'sessionId': i})
+            await fake.emit('Page.loadEventFired', {'timestamp': 1})
+            # The stream is full, so the connection stops reading here.
+            await fake.emit('Page.loadEventFired', {'timestamp': 2})
+            await fake.emit('Page.loadEventFired', {'timestamp': 3})
+            await asyncio.sleep(0.01)
+            assert conn._transport._incoming.qsize() == 1
+
+            assert (await frames.__anext__()).data == '2'
+            assert frames.coalesced == {'Page.screencastFrame': 2}
+            assert (await frames.__anext__()).timestamp == 1
+            assert (await frames.__anext__()).timestamp == 2
+            assert (await frames.__anext__()).timestamp == 3
+            assert frames.dropped == {}
+    run(main())
+
+
+def test_synthetic_results():
+    async def main():
+        fake = FakeBrowser(payloads=PayloadFactory())
+        fake.handle('Browser.getVersion', lambda params: VERSION)
+        async with Connection(fake.connect()) as conn:
+            version, root = await conn.execute_many([browser.get_version(),
+                dom.get_document()])
+            assert version[1] == 'HeadlessChrome/80.0.3987.0'
+            assert isinstance(root, dom.Node)
+            with pytest.raises(CommandError) as exc_info:
+                await conn.execute(unknown_command())
+            assert exc_info.value.code == -32601
+    run(main())
+
+
+def unknown_command():
+    yield {'method': 'Unknown.command'}
+
+
+def test_server():
+    async def main():
+        fake = make_browser()
+        server = await fake.start_server()
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        async with Connection(StreamTransport(reader, writer)) as conn:
+            loads = conn.listen(page.LoadEventFired)
+            version = await conn.execute(browser.get_version())
+            assert version[0] == '1.3'
+            await fake.emit('Page.loadEventFired', {'timestamp': 1})
+            assert (await loads.__anext__()).timestamp == 1
+        server.close()
+        await server.wait_closed()
+        await fake.close()
+    run(main())
+
+
+def test_replay():
+    async def main():
+        fake = make_browser()
+        messages = [{'method': 'Page.loadEventFired', 'params': {'timestamp':
+            i}} for i in range(10)]
+        async with Connection(fake.connect()) as conn:
+            loads = conn.listen(page.LoadEventFired)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            assert await fake.replay(messages, rate=200) == 10
+            # The last event is due 9/200 of a second after the first.
+            assert loop.time() - start >= 0.045
+            for i in range(10):
+                assert (await loads.__anext__()).timestamp == i
+            assert await fake.replay(messages) == 10
+    run(main())
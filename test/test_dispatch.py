@@ -0,0 +1,152 @@
+'''
+Tests for filtering and dispatching events.
+'''
+import pytest
+
+from cdp import page
+from cdp.util import lazy_event_class
+from cdp.dispatch import EventDispatcher, EventFilter, event_method, \
+    EventQueue, Overflow, QueuePolicy
+
+
+WINDOW_OPEN = {
+    'method': 'Page.windowOpen',
+    'params': {
+        'url': 'https://foo.com',
+        'windowName': 'Window 1',
+        'windowFeatures': ['feature1', 'feature2'],
+        'userGesture': False
+    }
+}
+
+# This is not a valid event, so it would fail if it were decoded.
+BAD_FRAME_NAVIGATED = {
+    'method': 'Page.frameNavigated',
+    'params': {},
+}
+
+
+def test_event_method():
+    assert event_method(page.WindowOpen) == 'Page.windowOpen'
+    assert event_method('Page.windowOpen') == 'Page.windowOpen'
+    with pytest.raises(ValueError):
+        event_method(page.Frame)
+    assert event_method(lazy_event_class(page.WindowOpen)) == 'Page.windowOpen'
+
+
+def test_lazy_event_classes():
+    lazy_window_open = lazy_event_class(page.WindowOpen)
+    events = EventFilter([event_method(lazy_window_open)], lazy=True)
+    event = events.parse(WINDOW_OPEN)
+    assert type(event) is lazy_window_open
+    received = list()
+    dispatcher = EventDispatcher()
+    dispatcher.register(lazy_window_open, received.append, lazy=True)
+    assert dispatcher.methods == {'Page.windowOpen'}
+    dispatcher.dispatch(WINDOW_OPEN)
+    assert received == [event]
+    dispatcher.unregister(lazy_window_open)
+    assert dispatcher.methods == frozenset()
+
+
+def test_filter_by_name():
+    events = EventFilter({'Page.windowOpen'})
+    event = events.parse(WINDOW_OPEN)
+    assert isinstance(event, page.WindowOpen)
+    assert event.window_name == 'Window 1'
+    assert events.parse(BAD_FRAME_NAVIGATED) is None
+    assert events.accepts('Page.windowOpen')
+    assert not events.accepts('Page.frameNavigated')
+
+
+def test_filter_raw():
+    events = EventFilter({'Page.windowOpen'}, raw=True)
+    assert events.parse(WINDOW_OPEN) is WINDOW_OPEN['params']
+
+
+def test_filter_lazy():
+    events = EventFilter({'Page.windowOpen'}, lazy=True)
+    event = events.parse(WINDOW_OPEN)
+    assert isinstance(event, page.WindowOpen)
+    assert vars(event) == {}
+    assert event.window_features == ['feature1', 'feature2']
+
+
+def test_filter_predicate_is_cached():
+    calls = list()
+    def accept(method):
+        calls.append(method)
+        return method.startswith('Page.window')
+    events = EventFilter(accept)
+    for _ in range(3):
+        assert events.parse(WINDOW_OPEN).url == 'https://foo.com'
+        assert events.parse(BAD_FRAME_NAVIGATED) is None
+    assert calls == ['Page.windowOpen', 'Page.frameNavigated']
+
+
+def test_dispatcher():
+    received = list()
+    dispatcher = EventDispatcher()
+    dispatcher.register(page.WindowOpen, received.append)
+    dispatcher.register('Page.frameNavigated', received.append, raw=True)
+    assert dispatcher.methods == {'Page.windowOpen', 'Page.frameNavigated'}
+
+    dispatcher.dispatch(WINDOW_OPEN)
+    dispatcher.dispatch(BAD_FRAME_NAVIGATED)
+    assert dispatcher.dispatch({'method': 'Page.loadEventFired',
+        'params': {}}) is None
+    assert isinstance(received[0], page.WindowOpen)
+    assert received[1] == {}
+
+    dispatcher.unregister(page.WindowOpen)
+    dispatcher.dispatch(WINDOW_OPEN)
+    assert len(received) == 2
+
+
+def test_event_queue_policies():
+    queue = EventQueue({
+        page.ScreencastFrame: QueuePolicy(1, Overflow.COALESCE),
+        'Network.dataReceived': QueuePolicy(2, Overflow.DROP_OLDEST),
+        'Network': QueuePolicy(1, Overflow.DROP_NEWEST),
+        'Page.windowOpen': QueuePolicy(1, Overflow.BLOCK),
+    })
+    assert queue.policy('Network.loadingFinished').overflow is \
+        Overflow.DROP_NEWEST
+    assert queue.policy('Runtime.consoleAPICalled') == QueuePolicy()
+
+    assert queue.put('Page.screencastFrame', 'frame 1')
+    for i in range(3):
+        assert queue.put('Network.dataReceived', f'data {i}')
+    assert queue.put('Page.screencastFrame', 'frame 2')
+    assert queue.put('Network.loadingFinished', 'finished 1')
+    assert queue.put('Network.loadingFinished', 'finished 2')
+    assert queue.put('Page.windowOpen', 'window 1')
+    assert not queue.put('Page.windowOpen', 'window 2')
+    assert queue.put('Runtime.consoleAPICalled', 'console')
+
+    assert len(queue) == 6
+    assert [queue.get() for _ in range(6)] == ['frame 2', 'data 1', 'data 2',
+        'finished 1', 'window 1', 'console']
+    assert queue.dropped == {'Network.dataReceived': 1,
+        'Network.loadingFinished': 1}
+    assert queue.coalesced == {'Page.screencastFrame': 1}
+    with pytest.raises(IndexError):
+        queue.get()
+    # There is room again after the queued events are consumed.
+    assert queue.put('Page.windowOpen', 'window 2')
+    assert queue.get() == 'window 2'
+
+
+def test_event_queue_drop_oldest_is_bounded():
+    queue = EventQueue(default=QueuePolicy(10, Overflow.DROP_OLDEST))
+    for i in range(10000):
+        queue.put('Network.dataReceived', i)
+    assert len(queue) == 10
+    # Evicted events are released, not just hidden from the consumer.
+    assert len(queue._entries) <= 20
+    assert all(entry.live or entry.event is None
+        for entry in queue._entries)
+    assert queue.dropped == {'Network.dataReceived': 9990}
+    assert [queue.get() for _ in range(10)] == list(range(9990, 10000))
+    with pytest.raises(IndexError):
+        queue.get()
@@ -0,0 +1,84 @@
+'''
+Tests for interning repeated values in decoded events.
+'''
+import pytest
+
+from cdp import network, page
+from cdp.interning import disable_interning, enable_interning, InternTable
+from cdp.util import is_id_type
+
+
+@pytest.fixture
+def interner():
+    interner = enable_interning(maxsize=2)
+    yield interner
+    disable_interning()
+
+
+def make_request():
+    # Build new strings for each request, like a JSON decoder would.
+    return network.Request.from_json({
+        'url': ''.join(['https://', 'foo.com/']),
+        'method': ''.join(['G', 'ET']),
+        'headers': {''.join(['accept']): '*/*'},
+        'initialPriority': 'High',
+        'referrerPolicy': 'origin',
+    })
+
+
+def test_intern_table():
+    table = InternTable(maxsize=2)
+    first = ''.join(['a', 'b'])
+    assert table.intern(first) is first
+    assert table.intern(''.join(['a', 'b'])) is first
+    table.intern('c')
+    table.intern('d')
+    # The oldest value was evicted.
+    assert len(table) == 2
+    assert first not in table
+    assert 'd' in table
+
+
+def make_data_received():
+    return network.DataReceived.from_json({
+        'requestId': ''.join(['1000', '.1']),
+        'timestamp': 1.5,
+        'dataLength': 10,
+        'encodedDataLength': 10,
+    })
+
+
+def test_intern_types(interner):
+    assert interner.tables['network.RequestId'].maxsize == 2
+    frame_id = page.FrameId.from_json(''.join(['F', '1']))
+    assert page.FrameId.from_json(''.join(['F', '1'])) is frame_id
+    # The IDs in decoded events are shared, whichever kind of type the
+    # generator created for them.
+    first = make_data_received()
+    assert make_data_received().request_id is first.request_id
+    if not is_id_type(network.RequestId):
+        request_id = network.RequestId(''.join(['1000', '.1']))
+        assert request_id is first.request_id
+        assert repr(request_id) == "RequestId('1000.1')"
+
+
+def test_intern_fields(interner):
+    first = make_request()
+    second = make_request()
+    assert first == second
+    assert first.url is second.url
+    assert first.method is second.method
+    assert isinstance(second.headers, network.Headers)
+    assert list(first.headers)[0] is list(second.headers)[0]
+
+
+def test_disable_interning(interner):
+    disable_interning()
+    first = make_request()
+    second = make_request()
+    assert first.url is not second.url
+    assert network.RequestId.from_json(''.join(['1', '0'])) is not \
+        network.RequestId.from_json(''.join(['1', '0']))
+    assert make_data_received().request_id is not \
+        make_data_received().request_id
+    assert network.Headers({'a': 1}, b=2) == {'a': 1, 'b': 2}
@@ -0,0 +1,143 @@
+'''
+Tests for instrumentation.
+'''
+import asyncio
+
+import pytest
+
+from cdp import browser, dom, page
+from cdp.connection import CommandError, Connection, FakeBrowser
+from cdp.dispatch import EventDispatcher, EventFilter
+from cdp.metrics import disable_instrumentation, enable_instrumentation, \
+    Histogram, Instrumentation, Metrics
+from cdp.util import parse_json_event
+
+
+LOAD_EVENT = {'method': 'Page.loadEventFired', 'params': {'timestamp': 1}}
+
+
+@pytest.fixture
+def metrics():
+    metrics = enable_instrumentation(Metrics())
+    yield metrics
+    disable_instrumentation()
+
+
+def test_histogram():
+    histogram = Histogram([1, 10])
+    for value in (0.5, 1, 5, 20):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(1, 2), (10, 3), (float('inf'), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 26.5
+
+
+def test_parse_json_event(metrics):
+    parse_json_event(LOAD_EVENT)
+    parse_json_event(LOAD_EVENT, lazy=True)
+    events = metrics.snapshot()['events']
+    assert events['Page.loadEventFired']['decoded'] == 2
+    assert events['Page.loadEventFired']['received'] == 0
+
+    disable_instrumentation()
+    parse_json_event(LOAD_EVENT)
+    assert metrics.events['Page.loadEventFired'].decode_seconds.count == 2
+
+
+def test_dispatch(metrics):
+    EventFilter({'Page.loadEventFired'}).parse(LOAD_EVENT)
+    EventFilter({'Page.loadEventFired'}, lazy=True).parse(LOAD_EVENT)
+    dispatcher = EventDispatcher()
+    dispatcher.register(page.LoadEventFired, lambda event: None)
+    dispatcher.dispatch(LOAD_EVENT)
+    with pytest.raises(KeyError):
+        dispatcher.dispatch({'method': 'Page.loadEventFired', 'params': {}})
+    events = metrics.snapshot()['events']
+    assert events['Page.loadEventFired']['decoded'] == 3
+    assert events['Page.loadEventFired']['decode_errors'] == 1
+    assert 'cdp_event_decode_errors_total{method="Page.loadEventFired"} 1\n' \
+        in metrics.prometheus()
+
+    # Raw events aren't decoded.
+    EventFilter({'Page.loadEventFired'}, raw=True).parse(LOAD_EVENT)
+    assert metrics.events['Page.loadEventFired'].decode_seconds.count == 3
+
+
+def test_connection(metrics):
+    async def main():
+        fake = FakeBrowser(latency=0.01)
+        fake.handle('Browser.getVersion', lambda params: {
+            'protocolVersion': '1.3', 'product': 'Chrome', 'revision': '',
+            'userAgent': '', 'jsVersion': ''})
+        async with Connection(fake.connect()) as conn:
+            loads = conn.listen(page.LoadEventFired)
+            await conn.execute(browser.get_version())
+            with pytest.raises(CommandError):
+                await conn.execute(dom.get_document())
+            await conn.execute_many([browser.get_version(),
+                dom.get_document()])
+            await fake.emit('Page.loadEventFired', {'timestamp': 1})
+            await fake.emit('Page.domContentEventFired', {'timestamp': 1})
+            await loads.__anext__()
+            assert conn._timings == {}
+        await fake.close()
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    snapshot = metrics.snapshot()
+    version = snapshot['commands']['Browser.getVersion']
+    assert version['count'] == 2
+    assert version['errors'] == 0
+    assert version['seconds'] >= 0.02
+    assert version['sent_bytes'] == 2 * len(
+        b'{"id":0,"method":"Browser.getVersion"}')
+    assert version['received_bytes'] > 0
+    assert snapshot['commands']['DOM.getDocument']['errors'] == 2
+    assert snapshot['events']['Page.loadEventFired']['received'] == 1
+    assert snapshot['events']['Page.loadEventFired']['decoded'] == 1
+    # Nobody is listening for this event, so it isn't decoded.
+    assert snapshot['events']['Page.domContentEventFired']['received'] == 1
+    assert snapshot['events']['Page.domContentEventFired']['decoded'] == 0
+
+    text = metrics.prometheus()
+    assert '# TYPE cdp_command_duration_seconds histogram\n' in text
+    assert 'cdp_command_duration_seconds_bucket{method="Browser.getVersion",' \
+        'le="+Inf"} 2\n' in text
+    assert 'cdp_command_errors_total{method="DOM.getDocument"} 2\n' in text
+    assert 'cdp_events_received_total{method="Page.loadEventFired"} 1\n' in \
+        text
+    assert 'cdp_event_decode_seconds_count{method="Page.loadEventFired"} 1\n' \
+        in text
+    assert 'Page.domContentEventFired"' not in text.split(
+        'cdp_event_decode_seconds')[-1]
+
+    metrics.reset()
+    assert metrics.snapshot() == {'commands': {}, 'events': {}}
+
+
+def test_custom_instrumentation():
+    class SlowCommands(Instrumentation):
+        def __init__(self):
+            self.methods = list()
+
+        def command_completed(self, method, seconds, sent_bytes,
+                received_bytes, error):
+            self.methods.append(method)
+
+    async def main():
+        fake = FakeBrowser()
+        fake.handle('DOM.enable', lambda params: {})
+        async with Connection(fake.connect()) as conn:
+            await conn.execute(dom.enable())
+            await fake.emit('Page.loadEventFired', {'timestamp': 1})
+            enable_instrumentation(instrumentation)
+            try:
+                await conn.execute(dom.enable())
+                await fake.emit('Page.loadEventFired', {'timestamp': 1})
+            finally:
+                disable_instrumentation()
+            await conn.execute(dom.enable())
+        await fake.close()
+
+    instrumentation = SlowCommands()
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+    assert instrumentation.methods == ['DOM.enable']
@@ -0,0 +1,190 @@
+'''
+Tests for mirroring the DOM with DOM events.
+'''
+from cdp import dom, page
+from cdp.mirror import diff, DomMirror
+from cdp.util import lazy_event_class, parse_json_event
+
+
+def node_json(node_id, name, children=None, attributes=None, value='',
+        node_type=1, **extra):
+    json = {'nodeId': node_id, 'backendNodeId': node_id + 100,
+        'nodeType': node_type, 'nodeName': name, 'localName': name.lower(),
+        'nodeValue': value}
+    if children is not None:
+        json['childNodeCount'] = len(children)
+        json['children'] = children
+    if attributes is not None:
+        json['attributes'] = attributes
+    json.update(extra)
+    return json
+
+
+def text_json(node_id, value):
+    return node_json(node_id, '#text', value=value, node_type=3)
+
+
+def document():
+    ''' ``<html><body><p>hi</p><ul></ul></body></html>`` '''
+    return dom.Node.from_json(node_json(1, '#document', node_type=9,
+        children=[node_json(2, 'HTML', children=[node_json(3, 'BODY',
+        children=[
+            node_json(4, 'P', [text_json(5, 'hi')], ['class', 'intro']),
+            node_json(6, 'UL', childNodeCount=2),
+        ])])]))
+
+
+def names(node):
+    return [child.node_name for child in node.children()]
+
+
+def event(cls, **params):
+    return cls.from_json(params)
+
+
+def test_set_document():
+    mirror = DomMirror()
+    root = mirror.set_document(document())
+    assert mirror.root is root
+    assert len(mirror) == 6
+    assert 4 in mirror
+    body = mirror.node(3)
+    assert names(body) == ['P', 'UL']
+    assert body.parent is mirror.node(2)
+    assert body.child_node_count == 2
+    paragraph = mirror.node(4)
+    assert paragraph.attributes == {'class': 'intro'}
+    assert paragraph.next_sibling is mirror.node(6)
+    assert mirror.node_by_backend_id(104) is paragraph
+    assert mirror.node_by_backend_id(999) is None
+    assert mirror.get(99) is None
+    # The children of the list haven't been sent.
+    ul = mirror.node(6)
+    assert not ul.children_known
+    assert ul.child_node_count == 2
+    assert names(ul) == []
+
+
+def test_child_nodes():
+    mirror = DomMirror()
+    mirror.set_document(document())
+    assert mirror.apply(event(dom.SetChildNodes, parentId=6, nodes=[
+        node_json(7, 'LI', [text_json(8, 'one')]),
+        node_json(9, 'LI', [text_json(10, 'two')]),
+    ]))
+    ul = mirror.node(6)
+    assert ul.children_known
+    assert [child.node_id for child in ul.children()] == [7, 9]
+    assert mirror.node(10).node_value == 'two'
+
+    # Insert first, in the middle, and last.
+    mirror.apply(event(dom.ChildNodeInserted, parentNodeId=6,
+        previousNodeId=0, node=node_json(11, 'LI', childNodeCount=0)))
+    mirror.apply(event(dom.ChildNodeInserted, parentNodeId=6,
+        previousNodeId=7, node=node_json(12, 'LI', childNodeCount=0)))
+    mirror.apply(event(dom.ChildNodeInserted, parentNodeId=6,
+        previousNodeId=9, node=node_json(13, 'LI', childNodeCount=0)))
+    assert [child.node_id for child in ul.children()] == [11, 7, 12, 9, 13]
+    assert ul.child_node_count == 5
+    assert ul.last_child.node_id == 13
+
+    # Remove first, in the middle, and last, with their subtrees.
+    for node_id in (11, 9, 13):
+        mirror.apply(event(dom.ChildNodeRemoved, parentNodeId=6,
+            nodeId=node_id))
+    assert [child.node_id for child in ul.children()] == [7, 12]
+    assert ul.last_child.previous_sibling.node_id == 7
+    assert ul.child_node_count == 2
+    assert 10 not in mirror
+    assert mirror.node_by_backend_id(110) is None
+
+    # Setting the children again replaces them.
+    mirror.apply(event(dom.SetChildNodes, parentId=6, nodes=[
+        node_json(14, 'LI', childNodeCount=0)]))
+    assert names(ul) == ['LI']
+    assert 7 not in mirror and 8 not in mirror
+
+    mirror.apply(event(dom.ChildNodeCountUpdated, nodeId=14,
+        childNodeCount=3))
+    assert mirror.node(14).child_node_count == 3
+    # Events about unknown nodes are ignored.
+    mirror.apply(event(dom.ChildNodeRemoved, parentNodeId=6, nodeId=99))
+    mirror.apply(event(dom.AttributeModified, nodeId=99, name='a',
+        value='b'))
+
+
+def test_node_data():
+    mirror = DomMirror()
+    mirror.set_document(document())
+    mirror.apply(event(dom.AttributeModified, nodeId=4, name='id',
+        value='first'))
+    mirror.apply(event(dom.AttributeModified, nodeId=4, name='class',
+        value='lead'))
+    mirror.apply(event(dom.AttributeRemoved, nodeId=4, name='id'))
+    assert mirror.node(4).attributes == {'class': 'lead'}
+    mirror.apply(event(dom.CharacterDataModified, nodeId=5,
+        characterData='hello'))
+    assert mirror.node(5).node_value == 'hello'
+    assert not mirror.apply(page.FrameStoppedLoading(page.FrameId('f')))
+
+    mirror.apply(dom.DocumentUpdated())
+    assert mirror.root is None
+    assert len(mirror) == 0
+
+
+def test_lazy_events():
+    mirror = DomMirror()
+    mirror.set_document(document())
+    assert mirror.apply(parse_json_event({'method': 'DOM.attributeModified',
+        'params': {'nodeId': 4, 'name': 'id', 'value': 'first'}}, lazy=True))
+    assert mirror.node(4).attributes == {'class': 'intro', 'id': 'first'}
+    assert mirror.apply(event(lazy_event_class(dom.ChildNodeInserted),
+        parentNodeId=6, previousNodeId=0, node=node_json(7, 'LI')))
+    assert names(mirror.node(6)) == ['LI']
+    assert not mirror.apply(event(lazy_event_class(page.FrameStoppedLoading),
+        frameId='f'))
+
+
+def test_shadow_roots_and_pseudo_elements():
+    mirror = DomMirror()
+    mirror.set_document(document())
+    mirror.apply(event(dom.ShadowRootPushed, hostId=4, root=node_json(20,
+        '#document-fragment', node_type=11, shadowRootType='open',
+        children=[node_json(21, 'SLOT', children=[])])))
+    paragraph = mirror.node(4)
+    shadow_root, = paragraph.shadow_roots
+    assert shadow_root.parent is paragraph
+    assert shadow_root.shadow_root_type == dom.ShadowRootType.OPEN_
+    assert names(shadow_root) == ['SLOT']
+    # Shadow roots aren't children.
+    assert names(paragraph) == ['#text']
+    mirror.apply(event(dom.ShadowRootPopped, hostId=4, rootId=20))
+    assert paragraph.shadow_roots == []
+    assert 21 not in mirror
+
+    mirror.apply(event(dom.PseudoElementAdded, parentId=4,
+        pseudoElement=node_json(22, '::before', pseudoType='before')))
+    assert paragraph.pseudo_elements[0].pseudo_type == dom.PseudoType.BEFORE
+    mirror.apply(event(dom.PseudoElementRemoved, parentId=4,
+        pseudoElementId=22))
+    assert paragraph.pseudo_elements == []
+    assert 22 not in mirror
+
+
+def test_snapshot_diff():
+    mirror = DomMirror()
+    mirror.set_document(document())
+    before = mirror.snapshot()
+    assert before[104].parent == 103
+    assert before[104].attributes == (('class', 'intro'),)
+    assert not diff(before, mirror.snapshot())
+
+    mirror.apply(event(dom.ChildNodeRemoved, parentNodeId=4, nodeId=5))
+    mirror.apply(event(dom.ChildNodeInserted, parentNodeId=6,
+        previousNodeId=0, node=node_json(7, 'LI', children=[])))
+    mirror.apply(event(dom.AttributeModified, nodeId=6, name='class',
+        value='menu'))
+    changes = diff(before, mirror.snapshot())
+    assert changes.added == [107]
+    assert changes.removed == [105]
+    assert changes.changed == [106]
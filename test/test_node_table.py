@@ -0,0 +1,159 @@
+'''
+Tests for decoding DOM trees into a table of nodes.
+'''
+import pytest
+
+from cdp import dom
+from cdp.node_table import get_document, get_flattened_document, \
+    NodeRelation, NodeTable
+from cdp.util import is_id_type
+
+
+def node_json(node_id, name, node_type=1, value='', **extra):
+    json = {'nodeId': node_id, 'backendNodeId': node_id + 100,
+        'nodeType': node_type, 'nodeName': name, 'localName': name.lower()
+        if node_type == 1 else '', 'nodeValue': value}
+    json.update(extra)
+    return json
+
+
+def document_json():
+    ''' A document with an iframe, a template, and a shadow root. '''
+    return node_json(1, '#document', 9, childNodeCount=1,
+        documentURL='https://example.com/', baseURL='https://example.com/',
+        children=[node_json(2, 'HTML', parentId=1, childNodeCount=1,
+        attributes=[], children=[node_json(3, 'BODY', parentId=2,
+        childNodeCount=3, attributes=['class', 'main'], children=[
+            node_json(4, 'P', parentId=3, childNodeCount=1,
+                attributes=['id', 'intro', 'class', 'main'],
+                pseudoElements=[node_json(5, '::before', parentId=4,
+                    pseudoType='before', attributes=[])],
+                children=[node_json(6, '#text', 3, 'hello', parentId=4)]),
+            node_json(7, 'IFRAME', parentId=3, childNodeCount=0,
+                attributes=['src', '/frame'], frameId='F2',
+                contentDocument=node_json(8, '#document', 9,
+                documentURL='https://example.com/frame',
+                childNodeCount=0, children=[])),
+            node_json(9, 'TEMPLATE', parentId=3, childNodeCount=0,
+                attributes=[], children=[],
+                templateContent=node_json(10, '#document-fragment', 11,
+                childNodeCount=0),
+                shadowRoots=[node_json(11, '#document-fragment', 11,
+                    shadowRootType='open', childNodeCount=1,
+                    children=[node_json(12, 'SLOT', parentId=11,
+                    attributes=[], childNodeCount=0)])]),
+        ])])])
+
+
+def test_from_json():
+    json = document_json()
+    table = NodeTable.from_json(json)
+    assert len(table) == 12
+    # Rows are in document order.
+    assert list(table.node_id) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 10]
+    assert table.strings.count('#document') == 1
+    assert table.row(7) == 6
+
+    root = table.root
+    assert root.node_id == 1
+    if not is_id_type(dom.NodeId):
+        assert isinstance(root.node_id, dom.NodeId)
+    assert root.parent_id is None
+    assert root.document_url == 'https://example.com/'
+    body = root.children[0].children[0]
+    assert body.node_name == 'BODY'
+    assert body.parent_id == 2
+    assert [child.node_name for child in body.children] == ['P', 'IFRAME',
+        'TEMPLATE']
+    paragraph, iframe, template = body.children
+    assert paragraph.attributes == ['id', 'intro', 'class', 'main']
+    assert paragraph.children[0].node_value == 'hello'
+    assert paragraph.children[0].children is None
+    assert paragraph.children[0].attributes is None
+    assert paragraph.children[0].parent == paragraph
+    assert paragraph.pseudo_elements[0].pseudo_type == dom.PseudoType.BEFORE
+    assert paragraph.shadow_roots is None
+    assert iframe.frame_id == 'F2'
+    assert iframe.content_document.document_url == \
+        'https://example.com/frame'
+    assert iframe.document_url is None
+    assert template.template_content.node_id == 10
+    assert template.shadow_roots[0].children[0].node_name == 'SLOT'
+    assert table.relation[table.row(11)] == NodeRelation.SHADOW_ROOT
+    assert list(table.nested(table.row(9))) == [table.row(11),
+        table.row(10)]
+    assert list(table.nested(table.row(9), NodeRelation.CHILD)) == []
+    with pytest.raises(AttributeError):
+        root.missing
+    with pytest.raises(IndexError):
+        table.view(12)
+
+    # The same tree as dom.Node.
+    assert table.to_node() == dom.Node.from_json(json)
+    assert table.to_node().to_json() == json
+    assert body.to_node() == dom.Node.from_json(json['children'][0]
+        ['children'][0])
+
+
+def test_deep_tree():
+    # A tree this deep is beyond the recursion limit of dom.Node.
+    depth = 5000
+    root = node = node_json(1, 'DIV', childNodeCount=1)
+    for node_id in range(2, depth + 1):
+        child = node_json(node_id, 'DIV', parentId=node_id - 1)
+        node['children'] = [child]
+        node = child
+    with pytest.raises(RecursionError):
+        dom.Node.from_json(root)
+    table = NodeTable.from_json(root)
+    assert len(table) == depth
+    assert table.view(depth - 1).parent_id == depth - 1
+    assert table.to_node(depth - 10).node_id == depth - 9
+
+
+def test_from_flattened_json():
+    nodes = [
+        node_json(1, '#document', 9, childNodeCount=1),
+        node_json(2, 'HTML', parentId=1, childNodeCount=1, attributes=[]),
+        node_json(3, 'BODY', parentId=2, childNodeCount=2, attributes=[]),
+        node_json(4, 'P', parentId=3, childNodeCount=0, attributes=[]),
+        node_json(5, '::after', parentId=3, pseudoType='after'),
+        node_json(6, 'DIV', parentId=3, childNodeCount=0, attributes=[]),
+    ]
+    table = NodeTable.from_flattened_json(nodes)
+    body = table.view(table.row(3))
+    assert body.parent.node_name == 'HTML'
+    assert [child.node_name for child in body.children] == ['P', 'DIV']
+    assert list(table.nested(table.row(3), NodeRelation.CHILD)) == [3, 5]
+    assert [child.node_name for child in body.to_node().children] == \
+        ['P', 'DIV']
+    assert table.view(table.row(4)).children is None
+    assert body.pseudo_elements[0].node_name == '::after'
+    assert table.view(table.row(4)).parent_id == 3
+
+
+def test_subtree_parent_id():
+    # A subtree, e.g. an inserted node, refers to a parent outside the table.
+    table = NodeTable.from_json(node_json(7, 'DIV', parentId=3,
+        children=[node_json(8, 'SPAN', parentId=7)]))
+    assert table.root.parent is None
+    assert table.root.parent_id == 3
+    assert table.view(1).parent_id == 7
+    node = table.to_node()
+    assert node.parent_id == 3
+    assert node.children[0].parent_id == 7
+    assert NodeTable.from_json(node_json(9, 'DIV')).root.parent_id is None
+
+
+def test_commands():
+    cmd = get_document(depth=-1)
+    assert next(cmd) == {'method': 'DOM.getDocument', 'params': {'depth': -1}}
+    with pytest.raises(StopIteration) as exit:
+        cmd.send({'root': document_json()})
+    assert exit.value.value.root.node_name == '#document'
+
+    cmd = get_flattened_document(depth=-1, pierce=True)
+    assert next(cmd)['method'] == 'DOM.getFlattenedDocument'
+    with pytest.raises(StopIteration) as exit:
+        cmd.send({'nodes': [node_json(1, '#document', 9)]})
+    assert len(exit.value.value) == 1
@@ -0,0 +1,147 @@
+'''
+Tests for recording CDP traffic.
+'''
+import asyncio
+
+import pytest
+
+from cdp import browser, page
+from cdp.codec import Response
+from cdp.connection import Connection, FakeBrowser, RecordingTransport
+from cdp.recording import Direction, MAGIC, RecordingReader, RecordingWriter
+
+
+COMMAND = b'{"id":1,"method":"Page.navigate","params":{"url":"about:blank"}}'
+RESPONSE = b'{"id":1,"result":{"frameId":"F1","loaderId":"L1"}}'
+EVENT = b'{"method":"Page.loadEventFired","params":{"timestamp":2.5}}'
+
+
+def write_traffic(path, compression=None):
+    with RecordingWriter(path, compression) as writer:
+        writer.write(Direction.SENT, COMMAND, timestamp=1.0)
+        writer.write(Direction.RECEIVED, EVENT, timestamp=2.0)
+        writer.write(Direction.RECEIVED, RESPONSE.decode('utf8'),
+            timestamp=3.0)
+
+
+def check_traffic(path):
+    with RecordingReader(path) as reader:
+        records = list(reader)
+    assert [r.timestamp for r in records] == [1.0, 2.0, 3.0]
+    assert [r.direction for r in records] == [Direction.SENT,
+        Direction.RECEIVED, Direction.RECEIVED]
+    assert [r.data for r in records] == [COMMAND, EVENT, RESPONSE]
+
+
+def test_uncompressed(tmp_path):
+    path = tmp_path / 'traffic.cdprec'
+    write_traffic(path)
+    assert path.read_bytes().startswith(MAGIC)
+    check_traffic(path)
+
+    with RecordingReader(path) as reader:
+        assert list(reader.messages(Direction.SENT))[0]['method'] == \
+            'Page.navigate'
+        received = list(reader.received())
+        assert received[0] == page.LoadEventFired(timestamp=2.5)
+        assert received[1] == Response(1, {'frameId': 'F1',
+            'loaderId': 'L1'})
+        assert list(reader.events()) == received[:1]
+        # An uncompressed recording can be read more than once.
+        assert len(list(reader)) == 3
+
+
+def test_gzip(tmp_path):
+    path = tmp_path / 'traffic.cdprec.gz'
+    write_traffic(path, 'gzip')
+    assert not path.read_bytes().startswith(MAGIC)
+    check_traffic(path)
+
+
+def test_zstd(tmp_path):
+    pytest.importorskip('zstandard')
+    path = tmp_path / 'traffic.cdprec.zst'
+    write_traffic(path, 'zstd')
+    check_traffic(path)
+
+
+def test_append(tmp_path):
+    for compression in (None, 'gzip'):
+        path = tmp_path / f'traffic-{compression}'
+        with RecordingWriter(path, compression) as writer:
+            writer.write(Direction.SENT, COMMAND, timestamp=1.0)
+        with RecordingWriter(path, compression) as writer:
+            writer.write(Direction.RECEIVED, RESPONSE, timestamp=2.0)
+        with RecordingReader(path) as reader:
+            assert [r.data for r in reader] == [COMMAND, RESPONSE]
+
+
+def test_truncated(tmp_path):
+    path = tmp_path / 'traffic.cdprec'
+    write_traffic(path)
+    path.write_bytes(path.read_bytes()[:-5])
+    with RecordingReader(path) as reader:
+        assert [r.data for r in reader] == [COMMAND, EVENT]
+
+
+def test_not_a_recording(tmp_path):
+    path = tmp_path / 'traffic.json'
+    path.write_bytes(EVENT)
+    with pytest.raises(ValueError):
+        RecordingReader(path)
+    with pytest.raises(ValueError):
+        RecordingWriter(path, compression='bz2')
+
+
+def test_exchanges(tmp_path):
+    path = tmp_path / 'traffic.cdprec'
+    write_traffic(path)
+    with RecordingReader(path) as reader:
+        (command, response), = reader.exchanges()
+    cmd = page.navigate(url='about:blank')
+    assert next(cmd) == {'method': command['method'],
+        'params': command['params']}
+    with pytest.raises(StopIteration) as exc_info:
+        cmd.send(response['result'])
+    assert exc_info.value.value[0] == page.FrameId('F1')
+
+
+def test_record_and_replay(tmp_path):
+    path = tmp_path / 'traffic.cdprec'
+
+    async def record():
+        fake = FakeBrowser()
+        fake.handle('Browser.getVersion', lambda params: {
+            'protocolVersion': '1.3', 'product': 'Chrome', 'revision': '',
+            'userAgent': '', 'jsVersion': ''})
+        with RecordingWriter(path) as writer:
+            transport = RecordingTransport(fake.connect(), writer)
+            async with Connection(transport) as conn:
+                loads = conn.listen(page.LoadEventFired)
+                await conn.execute(browser.get_version())
+                for i in range(3):
+                    await fake.emit('Page.loadEventFired', {'timestamp': i})
+                    await loads.__anext__()
+                    await asyncio.sleep(0.02)
+        await fake.close()
+
+    async def replay(speed):
+        fake = FakeBrowser()
+        async with Connection(fake.connect()) as conn:
+            loads = conn.listen(page.LoadEventFired)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            with RecordingReader(path) as reader:
+                assert await fake.replay_recording(reader, speed) == 3
+            elapsed = loop.time() - start
+            assert [(await loads.__anext__()).timestamp for _ in range(3)] \
+                == [0, 1, 2]
+        return elapsed
+
+    asyncio.run(asyncio.wait_for(record(), timeout=5))
+    with RecordingReader(path) as reader:
+        assert [r.direction for r in reader] == [Direction.SENT] + \
+            [Direction.RECEIVED] * 4
+    # The events were recorded about 20ms apart.
+    assert asyncio.run(asyncio.wait_for(replay(1), timeout=5)) >= 0.035
+    asyncio.run(asyncio.wait_for(replay(None), timeout=5))
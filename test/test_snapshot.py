@@ -0,0 +1,243 @@
+'''
+Tests for decoding DOM snapshots into columns.
+'''
+import array
+import dataclasses
+import types
+
+import pytest
+
+from cdp import dom_snapshot, snapshot
+from cdp.util import is_id_type
+
+
+STRINGS = ['', '#document', 'HTML', 'BODY', '#text', 'hello', 'A', 'href',
+    '/about', 'class', 'nav', 'INPUT', 'value', 'block', 'inline',
+    'https://example.com/']
+
+
+def snapshot_result():
+    ''' A document with the nodes ``<html><body>hello<a><input>``. '''
+    return {'documents': [{
+        'documentURL': 15,
+        'baseURL': 15,
+        'contentLanguage': 0,
+        'encodingName': 0,
+        'publicId': 0,
+        'systemId': 0,
+        'frameId': 0,
+        'nodes': {
+            'parentIndex': [-1, 0, 1, 2, 2, 2],
+            'nodeType': [9, 1, 1, 3, 1, 1],
+            'nodeName': [1, 2, 3, 4, 6, 11],
+            'nodeValue': [0, 0, 0, 5, 0, 0],
+            'backendNodeId': [10, 11, 12, 13, 14, 15],
+            'attributes': [[], [], [], [], [7, 8, 9, 10], []],
+            'inputValue': {'index': [5], 'value': [12]},
+            'isClickable': {'index': [4]},
+        },
+        'layout': {
+            'nodeIndex': [0, 2, 3, 4],
+            'styles': [[13], [13], [14], [14]],
+            'bounds': [[0, 0, 800, 600], [8, 8, 784, 20], [8, 8, 40, 20],
+                [48, 8, 30.5, 20]],
+            'text': [-1, -1, 5, -1],
+            'stackingContexts': {'index': [0]},
+            'offsetRects': [[], [8, 8, 784, 20], [], [48, 8, 30.5, 20]],
+        },
+        'textBoxes': {
+            'layoutIndex': [2],
+            'bounds': [[8, 8, 40, 20]],
+            'start': [0],
+            'length': [5],
+        },
+        'scrollOffsetX': 0,
+        'scrollOffsetY': 12.5,
+    }], 'strings': STRINGS}
+
+
+def test_decode_snapshot():
+    documents, strings = snapshot.decode_snapshot(snapshot_result())
+    assert strings == STRINGS
+    document, = documents
+    generated = dom_snapshot.DocumentSnapshot.from_json(
+        snapshot_result()['documents'][0])
+    assert document.document_url == generated.document_url
+    if not is_id_type(dom_snapshot.StringIndex):
+        assert isinstance(document.frame_id, dom_snapshot.StringIndex)
+    assert document.scroll_offset_y == 12.5
+
+    # The columns are arrays with the same values as the generated lists.
+    nodes = document.nodes
+    assert isinstance(nodes.node_name, array.array)
+    for name in ['parent_index', 'node_type', 'node_name', 'node_value',
+            'backend_node_id']:
+        assert list(getattr(nodes, name)) == getattr(generated.nodes, name)
+    assert list(nodes.attributes) == generated.nodes.attributes
+    assert isinstance(nodes.attributes[4], dom_snapshot.ArrayOfStrings)
+    assert [strings[i] for i in nodes.attributes[4]] == ['href', '/about',
+        'class', 'nav']
+    assert list(nodes.input_value.index) == [5]
+    assert list(nodes.input_value.value) == [12]
+    assert list(nodes.is_clickable.index) == [4]
+    assert nodes.is_clickable.value is None
+    assert nodes.text_value is None
+
+    layout = document.layout
+    assert list(layout.bounds) == generated.layout.bounds
+    assert layout.bounds[-1] == dom_snapshot.Rectangle([48, 8, 30.5, 20])
+    assert list(layout.offset_rects) == generated.layout.offset_rects
+    assert layout.scroll_rects is None
+    assert list(layout.text) == generated.layout.text
+    assert list(document.text_boxes.bounds) == \
+        generated.text_boxes.bounds
+
+
+def test_round_trip():
+    result = snapshot_result()
+    documents, _ = snapshot.decode_snapshot(result)
+    assert documents[0].to_json() == result['documents'][0]
+    # String indexes are plain ints when IDs are generated as NewTypes.
+    document = dataclasses.replace(documents[0], document_url=15, base_url=15)
+    assert document.to_json() == result['documents'][0]
+
+
+def test_list_column():
+    # Cells of the same length are stored as a matrix without offsets.
+    bounds = snapshot.ListColumn.from_json([[0, 0, 1, 1], [1, 2, 3, 4]],
+        snapshot.FLOAT, dom_snapshot.Rectangle)
+    assert bounds.offsets is None
+    assert bounds.width == 4
+    assert list(bounds.values) == [0, 0, 1, 1, 1, 2, 3, 4]
+    assert bounds[-1] == [1, 2, 3, 4]
+    assert bounds.cell_length(1) == 4
+
+    attributes = snapshot.ListColumn.from_json([[1, 2], [], [3, 4, 5, 6]])
+    assert list(attributes.offsets) == [0, 2, 2, 6]
+    assert len(attributes) == 3
+    assert attributes[1] == []
+    assert attributes.cell_length(2) == 4
+    with pytest.raises(IndexError):
+        attributes[3]
+    with pytest.raises(IndexError):
+        attributes.cell_length(-4)
+
+    assert list(snapshot.ListColumn.from_json([])) == []
+
+
+def test_capture_snapshot():
+    cmd = snapshot.capture_snapshot(['display'], include_dom_rects=True)
+    request = next(cmd)
+    assert request == {'method': 'DOMSnapshot.captureSnapshot', 'params': {
+        'computedStyles': ['display'], 'includeDOMRects': True}}
+    with pytest.raises(StopIteration) as exit:
+        cmd.send(snapshot_result())
+    documents, strings = exit.value.value
+    assert isinstance(documents[0], snapshot.DocumentColumns)
+    assert strings == STRINGS
+
+
+def test_as_numpy():
+    numpy = pytest.importorskip('numpy')
+    documents, _ = snapshot.decode_snapshot(snapshot_result())
+    layout = documents[0].layout
+    bounds = snapshot.as_numpy(layout.bounds)
+    assert bounds.shape == (4, 4)
+    assert bounds[3, 2] == 30.5
+    assert numpy.array_equal(snapshot.as_numpy(layout.node_index),
+        [0, 2, 3, 4])
+    with pytest.raises(ValueError):
+        snapshot.as_numpy(layout.offset_rects)
+
+
+
+def test_string_column_positions(monkeypatch):
+    strings = snapshot.SnapshotStrings(STRINGS)
+    cells = [2, 3, 2, 6, 2]
+    for indexes in (cells, array.array('i', cells)):
+        column = strings.column(indexes)
+        assert list(column.positions('HTML')) == [0, 2, 4]
+        assert list(column.positions('A')) == [3]
+        assert column.count('HTML') == 3
+    # Before Python 3.10, array.index() doesn't take a start position.
+    monkeypatch.setattr(snapshot, 'sys', types.SimpleNamespace(
+        version_info=(3, 9)))
+    column = strings.column(array.array('i', cells))
+    assert list(column.positions('HTML')) == [0, 2, 4]
+    assert list(column.positions('TABLE')) == []
+
+def test_snapshot_index():
+    result = snapshot_result()
+    documents, strings = snapshot.decode_snapshot(result)
+    generated = dom_snapshot.DocumentSnapshot.from_json(
+        result['documents'][0])
+    # The index works with columns and with the generated classes.
+    for document in (documents[0], generated):
+        index = snapshot.SnapshotIndex(document, strings)
+        assert len(index) == 6
+        assert list(index.roots) == [0]
+        assert index.parent(0) == -1
+        assert list(index.children(2)) == [3, 4, 5]
+        assert list(index.children(3)) == []
+        assert list(index.ancestors(4)) == [2, 1, 0]
+        assert list(index.descendants(1)) == [1, 2, 3, 4, 5]
+        assert index.node_name(4) == 'A'
+        assert list(index.nodes_by_name('BODY')) == [2]
+        assert list(index.nodes_by_name('#text')) == [3]
+        assert list(index.nodes_by_name('TABLE')) == []
+        assert index.node_by_backend_id(14) == 4
+        assert index.node_by_backend_id(99) == -1
+        assert index.attributes(4) == {'href': '/about', 'class': 'nav'}
+        assert index.attributes(0) == {}
+        assert index.layout_index(4) == 3
+        assert index.layout_index(5) == -1
+        assert index.bounds(4) == [48, 8, 30.5, 20]
+        assert index.bounds(1) is None
+        assert index.is_set('is_clickable', 4)
+        assert not index.is_set('is_clickable', 5)
+        assert not index.is_set('input_checked', 5)
+        assert strings[index.rare_value('input_value', 5)] == 'value'
+        assert index.rare_value('input_value', 4) is None
+        assert index.rare_value('text_value', 4) is None
+        with pytest.raises(ValueError):
+            index.is_set('input_value', 5)
+        with pytest.raises(ValueError):
+            index.rare_value('is_clickable', 4)
+        assert index.text(0) == 'hello'
+        assert index.text(4) == ''
+        with pytest.raises(IndexError):
+            index.children(6)
+
+
+def test_snapshot_strings():
+    documents, table = snapshot.decode_snapshot(snapshot_result())
+    nodes = documents[0].nodes
+    strings = snapshot.SnapshotStrings(table)
+    assert len(strings) == len(STRINGS)
+    assert strings[2] == 'HTML'
+    assert strings[2] is strings[2]
+    assert strings[-1] is None
+    with pytest.raises(IndexError):
+        strings[-2]
+    with pytest.raises(IndexError):
+        strings[len(STRINGS)]
+    assert strings.find('A') == 6
+    assert strings.find('TABLE') == -1
+    assert strings.decode(nodes.attributes[4]) == ['href', '/about', 'class',
+        'nav']
+
+    names = strings.column(nodes.node_name)
+    assert len(names) == 6
+    assert names[4] == 'A'
+    assert list(names) == ['#document', 'HTML', 'BODY', '#text', 'A', 'INPUT']
+    assert list(names.positions('A')) == [4]
+    assert list(names.positions('TABLE')) == []
+    assert names.count('#text') == 1
+    assert names.count('TABLE') == 0
+    texts = strings.column(documents[0].layout.text)
+    assert list(texts) == [None, None, 'hello', None]
+
+    # An index can share the view with the indexes of other documents.
+    index = snapshot.SnapshotIndex(documents[0], strings)
+    assert index.strings is strings
+    assert index.node_name(5) == 'INPUT'
@@ -0,0 +1,180 @@
+'''
+Tests for reading IO streams.
+'''
+import asyncio
+import base64
+import io
+
+import pytest
+
+from cdp import io as cdp_io
+from cdp.connection import Connection, ConnectionClosed, FakeBrowser
+from cdp.streams import Base64Decoder, read_stream, read_stream_into, \
+    read_stream_into_sync, read_stream_sync
+
+
+DATA = bytes(range(256)) * 40
+
+
+class FakeStream:
+    '''
+    Serve ``DATA`` as a stream with ``IO.read``. The data is base64 encoded,
+    and each chunk is one character longer than the requested size, so the
+    chunks are cut in the middle of base64 groups.
+    '''
+    def __init__(self, data=DATA):
+        self.encoded = base64.b64encode(data).decode('ascii')
+        self.offset = 0
+        self.reads = list()
+        self.closed = False
+
+    def read(self, params):
+        assert params['handle'] == 'stream-1'
+        size = params.get('size', 1000)
+        self.reads.append(size)
+        data = self.encoded[self.offset:self.offset + size + 1]
+        self.offset += len(data)
+        return {'base64Encoded': True, 'data': data,
+            'eof': self.offset == len(self.encoded)}
+
+    def close(self, params):
+        self.closed = True
+        return {}
+
+    def execute(self, cmd):
+        request = next(cmd)
+        if request['method'] == 'IO.read':
+            result = self.read(request['params'])
+        else:
+            result = self.close(request['params'])
+        try:
+            cmd.send(result)
+        except StopIteration as exit:
+            return exit.value
+
+
+def serve(stream):
+    fake = FakeBrowser()
+    fake.handle('IO.read', stream.read)
+    fake.handle('IO.close', stream.close)
+    return fake
+
+
+HANDLE = cdp_io.StreamHandle('stream-1')
+
+
+def test_base64_decoder():
+    decoder = Base64Decoder()
+    encoded = base64.b64encode(b'hello, world').decode('ascii')
+    assert decoder.decode(encoded[:5]) + decoder.decode(encoded[5:11]) + \
+        decoder.decode(encoded[11:]) == b'hello, world'
+    decoder.finish()
+    decoder.decode('aGk')
+    with pytest.raises(ValueError):
+        decoder.finish()
+
+
+def test_read_stream():
+    async def main():
+        stream = FakeStream()
+        fake = serve(stream)
+        async with Connection(fake.connect()) as conn:
+            chunks = [chunk async for chunk in read_stream(conn.execute,
+                HANDLE, size=999)]
+        assert b''.join(chunks) == DATA
+        assert len(chunks) > 10
+        assert set(stream.reads) == {999}
+        assert stream.closed
+        await fake.close()
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+def test_read_stream_into():
+    async def main():
+        stream = FakeStream()
+        fake = serve(stream)
+        async with Connection(fake.connect()) as conn:
+            sink = io.BytesIO()
+            assert await read_stream_into(conn.execute, HANDLE, sink) == \
+                len(DATA)
+            assert sink.getvalue() == DATA
+            assert stream.closed
+
+            stream.__init__()
+            buffer = bytearray(len(DATA) + 10)
+            assert await read_stream_into(conn.execute, HANDLE, buffer) == \
+                len(DATA)
+            assert buffer[:len(DATA)] == DATA
+
+            stream.__init__()
+            with pytest.raises(ValueError):
+                await read_stream_into(conn.execute, HANDLE, bytearray(100))
+            # The stream is closed even though it wasn't read to the end.
+            assert stream.closed
+        await fake.close()
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+def test_read_stream_sync():
+    stream = FakeStream()
+    assert b''.join(read_stream_sync(stream.execute, HANDLE)) == DATA
+    assert stream.closed
+
+    stream = FakeStream()
+    buffer = bytearray(len(DATA))
+    assert read_stream_into_sync(stream.execute, HANDLE, memoryview(buffer),
+        size=4096) == len(DATA)
+    assert buffer == DATA
+
+    stream = FakeStream()
+    chunks = read_stream_sync(stream.execute, HANDLE, close=False)
+    next(chunks)
+    chunks.close()
+    assert not stream.closed
+
+
+
+class BrokenStream(FakeStream):
+    ''' A stream whose connection is closed after ``reads`` reads. '''
+    def __init__(self, reads):
+        super().__init__()
+        self.max_reads = reads
+
+    def read(self, params):
+        if len(self.reads) == self.max_reads:
+            raise ConnectionClosed()
+        return super().read(params)
+
+    def close(self, params):
+        raise ConnectionClosed('close failed')
+
+    async def execute_async(self, cmd):
+        return self.execute(cmd)
+
+
+def test_read_stream_errors():
+    async def main():
+        # The error that stopped the read isn't hidden by the failed close.
+        stream = BrokenStream(reads=1)
+        with pytest.raises(ConnectionClosed) as exc_info:
+            await read_stream_into(stream.execute_async, HANDLE, io.BytesIO())
+        assert str(exc_info.value) == ''
+        # If the read succeeded, the error from closing the stream is raised.
+        stream = BrokenStream(reads=100)
+        with pytest.raises(ConnectionClosed, match='close failed'):
+            await read_stream_into(stream.execute_async, HANDLE, io.BytesIO())
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    stream = BrokenStream(reads=1)
+    with pytest.raises(ConnectionClosed) as exc_info:
+        read_stream_into_sync(stream.execute, HANDLE, io.BytesIO())
+    assert str(exc_info.value) == ''
+    stream = BrokenStream(reads=100)
+    with pytest.raises(ConnectionClosed, match='close failed'):
+        read_stream_into_sync(stream.execute, HANDLE, io.BytesIO())
+
+def test_text_stream():
+    stream = FakeStream()
+    stream.read = lambda params: {'data': 'héllo', 'eof': True}
+    assert b''.join(read_stream_sync(stream.execute, HANDLE)) == \
+        'héllo'.encode('utf8')
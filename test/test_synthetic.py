@@ -0,0 +1,58 @@
+'''
+Tests for synthetic payloads.
+'''
+import importlib
+from pathlib import Path
+
+import cdp
+from cdp import dom, network, util
+from cdp.synthetic import PayloadFactory
+
+
+def test_installed_schema():
+    # The schema that is installed with the package is up to date.
+    generator = Path(__file__).resolve().parent.parent / 'generator'
+    source = PayloadFactory([generator / 'browser_protocol.json',
+        generator / 'js_protocol.json'])
+    installed = PayloadFactory()
+    assert installed.types.keys() == source.types.keys()
+    assert installed.events.keys() == source.events.keys()
+    assert installed.commands.keys() == source.commands.keys()
+    assert installed.event_payload('Network.responseReceived') == \
+        source.event_payload('Network.responseReceived')
+    assert installed.command_result('DOM.getDocument') == \
+        source.command_result('DOM.getDocument')
+
+
+def test_event_payloads():
+    factory = PayloadFactory()
+    for method in factory.events:
+        event_cls = util.get_event_class(method)
+        assert isinstance(event_cls.from_json(factory.event_payload(method)),
+            event_cls)
+
+
+def test_type_payloads():
+    factory = PayloadFactory()
+    for ref, (domain, spec) in factory.types.items():
+        module = importlib.import_module('cdp.' + cdp._domain_modules[domain])
+        payload = factory.type_payload(ref)
+        type_ = getattr(module, spec['id'])
+        value = type_.from_json(payload)
+        if util.is_id_type(type_):
+            # The value is a plain str or int.
+            assert type_.to_json(value) == payload
+        else:
+            assert value.to_json() == payload
+
+
+def test_payload_depth():
+    factory = PayloadFactory(array_length=3)
+    response = network.Response.from_json(factory.type_payload(
+        'Network.Response'))
+    assert response.security_details is not None
+
+    # Optional fields are left out below the maximum depth.
+    node = dom.Node.from_json(factory.command_result('DOM.getDocument')['root'])
+    assert len(node.children) == 3
+    assert node.children[0].children is None
@@ -0,0 +1,146 @@
+'''
+Tests for recording and reading traces.
+'''
+import asyncio
+import base64
+import gzip
+import io
+import json
+
+import pytest
+
+from cdp import tracing
+from cdp.connection import Connection, ConnectionClosed, FakeBrowser, \
+    TraceRecorder
+from cdp.traces import iter_trace_events
+
+
+EVENTS = [
+    {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 2,
+        'args': {'name': 'CrBrowserMain – \U0001f600'}},
+    {'name': 'RunTask', 'ph': 'X', 'ts': 1234567890123, 'dur': 12.5,
+        'pid': 1, 'tid': 2, 'args': {}},
+    {'name': 'Layout', 'ph': 'B', 'ts': 1234567890200, 'pid': 1, 'tid': 2},
+]
+
+
+def trace_text(events=EVENTS):
+    return json.dumps({'traceEvents': events, 'metadata': {
+        'trace-capture-datetime': '2026-10-17'}}, ensure_ascii=False,
+        indent=1)
+
+
+def test_iter_trace_events():
+    data = trace_text().encode('utf8')
+    # Every chunk size cuts the JSON, and the UTF-8, in different places.
+    for chunk_size in (1, 2, 3, 7, 64, 10000):
+        assert list(iter_trace_events(io.BytesIO(data), chunk_size)) == EVENTS
+    assert list(iter_trace_events(io.BytesIO(gzip.compress(data)), 5)) == \
+        EVENTS
+    array = json.dumps(EVENTS).encode('utf8')
+    assert list(iter_trace_events(io.BytesIO(array), 4)) == EVENTS
+    assert list(iter_trace_events(io.BytesIO(b'{"traceEvents": []}'))) == []
+    assert list(iter_trace_events(io.BytesIO(b' {} '))) == []
+
+    with pytest.raises(ValueError):
+        list(iter_trace_events(io.BytesIO(data[:-40]), 16))
+    with pytest.raises(ValueError):
+        list(iter_trace_events(io.BytesIO(b'{"traceEvents": [1 2]}')))
+
+
+def test_iter_trace_events_file(tmp_path):
+    path = tmp_path / 'trace.json.gz'
+    path.write_bytes(gzip.compress(trace_text().encode('utf8')))
+    assert list(iter_trace_events(path)) == EVENTS
+    assert list(iter_trace_events(str(path))) == EVENTS
+
+
+class FakeTracing:
+    ''' Handle the Tracing and IO commands of a fake browser. '''
+    def __init__(self, fake, data):
+        self.fake = fake
+        self.data = data
+        self.started = None
+        self.ended = False
+        self.closed = False
+        fake.handle('Tracing.start', self.start)
+        fake.handle('Tracing.end', self.end)
+        fake.handle('IO.read', self.read)
+        fake.handle('IO.close', self.close)
+
+    def start(self, params):
+        self.started = params
+        return {}
+
+    async def end(self, params):
+        self.ended = True
+        if self.started is not None:
+            asyncio.ensure_future(self.fake.emit('Tracing.tracingComplete', {
+                'dataLossOccurred': False, 'stream': 'trace-1',
+                'traceFormat': self.started['streamFormat'],
+                'streamCompression': self.started['streamCompression']}))
+        return {}
+
+    def read(self, params):
+        assert params == {'handle': 'trace-1', 'size': 100}
+        chunk, self.data = self.data[:100], self.data[100:]
+        return {'base64Encoded': True, 'eof': not self.data,
+            'data': base64.b64encode(chunk).decode('ascii')}
+
+    def close(self, params):
+        self.closed = True
+        return {}
+
+
+def test_trace_recorder(tmp_path):
+    path = tmp_path / 'trace.json.gz'
+    compressed = gzip.compress(trace_text().encode('utf8'))
+
+    async def main():
+        fake = FakeBrowser()
+        fake_tracing = FakeTracing(fake, compressed)
+        async with Connection(fake.connect()) as conn:
+            async with TraceRecorder(conn, path, chunk_size=100,
+                    trace_config=tracing.TraceConfig(
+                    included_categories=['devtools.timeline'])) as recorder:
+                assert fake_tracing.started == {
+                    'transferMode': 'ReturnAsStream',
+                    'streamFormat': 'json',
+                    'streamCompression': 'gzip',
+                    'traceConfig': {'includedCategories':
+                        ['devtools.timeline']},
+                }
+        assert recorder.complete.stream_compression == \
+            tracing.StreamCompression.GZIP
+        assert recorder.size == len(compressed)
+        assert fake_tracing.closed
+        await fake.close()
+
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+    # The trace is saved as the browser compressed it.
+    assert path.read_bytes() == compressed
+    assert list(iter_trace_events(path)) == EVENTS
+
+
+def test_trace_recorder_errors():
+    async def main():
+        fake = FakeBrowser()
+        fake_tracing = FakeTracing(fake, b'')
+        async with Connection(fake.connect()) as conn:
+            with pytest.raises(ZeroDivisionError):
+                async with TraceRecorder(conn, io.BytesIO()):
+                    1 / 0
+            assert fake_tracing.ended
+            # The trace isn't saved, but its stream is closed.
+            assert fake_tracing.closed
+
+            # Tracing isn't running, so the browser never completes it.
+            fake_tracing.started = None
+            recorder = TraceRecorder(conn, io.BytesIO())
+            stop = asyncio.ensure_future(recorder.stop())
+            await asyncio.sleep(0.01)
+        with pytest.raises(ConnectionClosed):
+            await stop
+        await fake.close()
+
+    asyncio.run(asyncio.wait_for(main(), timeout=5))